@@ -7,6 +7,8 @@
 steps to run script:
 1-	On mate terminal type – python3 (file_name) -t (your duration in minutes for how much time you want to run the script).
 2-	Example – python3 cpu_stat.py  -t 1
+	Sample at 10 Hz, with the rates of eth1 and the cpu of process 1234: python3 cpu_stats.py -t 1 -i 0.1 --interfaces eth1 --pid 1234
+	Every sample is also written to host_stats.csv (--csv).
 3-	Wait for the time provided to calculate statistics.
 4-	After the script ends check for log.html file.
 5-	Log.html file file show results in tab format selected.
@@ -14,24 +16,17 @@ steps to run script:
 '''
 
 import argparse
+import importlib
 import os
+import sys
 import matplotlib.pyplot as plt
 import datetime
 import base64
 import logging
-import threading
-import time
 
-fh = ''
-fh_1 = ''
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def cpu_percent(cmd):
-    global fh
-    fh = os.popen(cmd)
-
-def memory_percent(cmd):
-    global fh_1
-    fh_1 = os.popen(cmd)
+host_sampler = importlib.import_module("py-json.host_sampler")
 
 def htmlimage(data_4, data):
     html = open("log.html", 'w')
@@ -40,8 +35,15 @@ def htmlimage(data_4, data):
 
 def main():
     global duration
+    duration = 1
     parser = argparse.ArgumentParser()
     parser.add_argument("-t", "--duration", type=int, help="Enter the Time for which you want to run test (in minutes)")
+    parser.add_argument("-i", "--interval", type=float, default=1.0,
+                        help="Seconds between samples, 0.1 samples at 10 Hz (default 1)")
+    parser.add_argument("--pid", type=int, nargs='*', default=[], help="Also track cpu and rss of these processes")
+    parser.add_argument("--interfaces", nargs='*', default=None,
+                        help="Interfaces whose rx/tx rates are logged (default all but lo)")
+    parser.add_argument("--csv", default="host_stats.csv", help="Column log of every sample (default host_stats.csv)")
     try:
         args = parser.parse_args()
         if (args.duration is not None):
@@ -49,48 +51,18 @@ def main():
     except Exception as e:
         logging.exception(e)
         exit(2)
-    endTime = datetime.datetime.now() + datetime.timedelta(seconds=duration)
-    now = datetime.datetime.now()
-    starttime = datetime.datetime(now.year, now.month, now.day, now.hour, now.minute, now.second)
-    delta = datetime.timedelta(seconds=10)
-    cpu_stats_data = {"system": [], "kernel": []}
-    memory_stats_data = {"Total": [], "Used": []}
-    iterations = duration * 60
-
-    cmd_1 = "top -bn1 -d 1 -n " + str(iterations) + " | grep '%Cpu(s)' "
-    cmd_2 = "top -bn1 -d 1  -n " + str(iterations) + " | grep 'MiB Mem'"
-
-    t1 = threading.Thread(target=cpu_percent, args=(cmd_1,))
-    t2 = threading.Thread(target=memory_percent, args=(cmd_2,))
-
-    t1.start()
-    t2.start()
-    t1.join()
-    t2.join()
-    time.sleep(10)
-
-    output = fh.read() + fh.readline()
-    output_1 = fh_1.read() + fh_1.readline()
-    data = output.split('\n')
-    data_1 = output_1.split('\n')
-    for i in data:
-        # print(i.split(','))
-        if len(i) > 3:
-            cpu_stats_data["system"].append(float(i.split(',')[0].split()[1]))
-            cpu_stats_data["kernel"].append(float(i.split(',')[1].split()[0]))
-        # print(cpu_stats_data)
-
-    for i in data_1:
-        if len(i) > 3:
-            memory_stats_data["Total"].append(float(i.split(',')[0].split()[3]))
-            memory_stats_data["Used"].append(float(i.split(',')[2].split()[0]))
-     # print(memory_stats_data)
-    sample_times = [starttime + i * delta for i in range(len(cpu_stats_data["system"]))]
-    label_locations = [d for d in sample_times if d.minute % 1 == 0]
-    labels = [d.strftime('%Y-%m-%d %H:%M:%S') for d in label_locations]
-    # print(labels)
-    #print(sample_times)
-    # thread creation
+    # samples are read from /proc on a fixed schedule, see py-json/host_sampler.py
+    sampler = host_sampler.HostSampler(interval_sec=args.interval,
+                                       pids=args.pid,
+                                       interfaces=args.interfaces,
+                                       log_path=args.csv)
+    sampler.run(duration_sec=duration * 60)
+    sampler.stop()
+    logging.info("host_stats: %s" % sampler.summary())
+
+    cpu_stats_data = {"system": sampler.column("cpu_user_pct"), "kernel": sampler.column("cpu_system_pct")}
+    memory_stats_data = {"Total": sampler.column("mem_total_mb"), "Used": sampler.column("mem_used_mb")}
+    sample_times = [datetime.datetime.fromtimestamp(t) for t in sampler.column("time")]
 
     # graphs
     #plot1
@@ -0,0 +1,481 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+
+    Opt-in HTTP request statistics for the LANforge clients.
+
+    Both lanforge_client.lanforge_api.BaseLFJsonRequest and py-json LANforge.LFRequest
+    send their requests through timed_urlopen().  When statistics are enabled each
+    request is counted per method and URL pattern, where EIDs, port names and query
+    values are replaced by placeholders:
+
+        GET http://localhost:8080/port/1/1/sta0000?fields=alias,ip  ->  GET /port/{n}/{n}/{name}?fields
+        GET http://localhost:8080/cx/udp-1.1.3-A                    ->  GET /cx/{name}
+
+    For each pattern the count, HTTP status counts, retries and the time waited before
+    them, request and response bytes, total/min/max latency and a latency histogram
+    are kept.
+
+    Enable from a script with enable(), or for any script by exporting
+    LF_HTTP_STATS=/path/to/stats.json (or .csv), which writes the statistics at exit.
+    lf_check.py sets LF_HTTP_STATS for every test it runs and compares the result to
+    the test's "http_budget".
+
+    Exporting LF_HTTP_RECORD=/path/to/recording.jsonl (or calling record_to()) also
+    appends every request and its response to that file, one json object per line.
+    py-scripts/tools/lf_replay_gui.py serves such a recording in place of the GUI.
+
+    EXAMPLE:
+        from lanforge_client import http_stats
+        http_stats.enable(dump_path="/tmp/my_test_http.json")
+        ...
+        for row in http_stats.summary():
+            print(row["method"], row["pattern"], row["count"], row["p95_ms"])
+
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+import atexit
+import csv
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+import urllib.error
+import urllib.parse
+from typing import Optional
+
+LOGGER = logging.getLogger(__name__)
+
+# upper bounds of the latency histogram buckets in milliseconds, the last bucket is open
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+_NUMBER_RE = re.compile(r'^-?\d+$')
+_EID_RE = re.compile(r'^\d+(\.\d+)+$')
+_HEX_RE = re.compile(r'^(0x)?[0-9a-fA-F]{8,}$')
+# paths below these name a command, not an entity
+_COMMAND_PREFIXES = ("cli-json", "cli-form", "gui-json", "help")
+_KEYWORDS = ("all", "list", "since", "last")
+
+_enabled: bool = False
+_dump_path: Optional[str] = None
+_lock = threading.Lock()
+_stats: dict = {}
+_started: float = time.time()
+_record_file = None
+_record_lock = threading.Lock()
+# response headers worth keeping in a recording
+RECORD_HEADERS = ("Content-Type", "X-LFJson-Session")
+
+
+class PatternStats:
+    def __init__(self, method: str = None, pattern: str = None):
+        self.method = method
+        self.pattern = pattern
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.retry_ms = 0.0
+        self.statuses = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, status: int = 0, elapsed_ms: float = 0.0, bytes_sent: int = 0, bytes_received: int = 0):
+        self.count += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if (status == 0) or (status >= 400 and status != 404):
+            self.errors += 1
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+        self.total_ms += elapsed_ms
+        if self.min_ms is None or elapsed_ms < self.min_ms:
+            self.min_ms = elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS_MS) and elapsed_ms > LATENCY_BUCKETS_MS[bucket]:
+            bucket += 1
+        self.buckets[bucket] += 1
+
+    def percentile_ms(self, percentile: float = 50) -> float:
+        """
+        Upper bound of the histogram bucket holding the percentile, max_ms for the open bucket.
+        """
+        if self.count == 0:
+            return 0.0
+        wanted = percentile / 100.0 * self.count
+        seen = 0
+        for bucket, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= wanted and bucket_count:
+                if bucket < len(LATENCY_BUCKETS_MS):
+                    return float(min(LATENCY_BUCKETS_MS[bucket], self.max_ms))
+                return self.max_ms
+        return self.max_ms
+
+    def as_dict(self) -> dict:
+        return {
+            "method": self.method,
+            "pattern": self.pattern,
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "retry_ms": round(self.retry_ms, 3),
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min_ms or 0.0, 3),
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.percentile_ms(50), 3),
+            "p95_ms": round(self.percentile_ms(95), 3),
+            "p99_ms": round(self.percentile_ms(99), 3),
+            "histogram_ms": {("<=%d" % bound): count
+                             for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)},
+            "histogram_ms_over": self.buckets[-1],
+        }
+
+
+def normalize_pattern(url: str = None) -> str:
+    """
+    Reduce a request url to a pattern: no scheme or host, numbers and EIDs become {n}
+    and {eid}, names following them become {name}, and only the query keys are kept.
+    """
+    parsed = urllib.parse.urlsplit(url)
+    hunks = []
+    after_id = False
+    for hunk in parsed.path.split('/'):
+        if not hunk:
+            continue
+        hunk = urllib.parse.unquote_plus(hunk)
+        if _NUMBER_RE.match(hunk):
+            hunks.append("{n}")
+            after_id = True
+        elif _EID_RE.match(hunk) or _HEX_RE.match(hunk):
+            hunks.append("{eid}")
+            after_id = True
+        elif ',' in hunk:
+            hunks.append("{list}")
+        elif hunk in _KEYWORDS or (len(hunks) > 0 and hunks[0] in _COMMAND_PREFIXES):
+            hunks.append(hunk)
+        elif after_id or len(hunks) > 0:
+            # entity names: port, cx and endpoint names after the table
+            hunks.append("{name}")
+        else:
+            hunks.append(hunk)
+    pattern = "/" + "/".join(hunks)
+    if parsed.query:
+        keys = sorted({pair.split('=', 1)[0] for pair in parsed.query.split('&') if pair})
+        pattern += "?" + "&".join(keys)
+    return pattern
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(dump_path: str = None):
+    """
+    Start recording.  With dump_path the statistics are written there at exit, as csv
+    if the name ends in .csv, otherwise as json.
+    """
+    global _enabled, _dump_path
+    _enabled = True
+    if dump_path and not _dump_path:
+        atexit.register(_dump_at_exit)
+    if dump_path:
+        _dump_path = dump_path
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    global _started
+    with _lock:
+        _stats.clear()
+        _started = time.time()
+
+
+def _entry(method: str = None, url: str = None) -> PatternStats:
+    pattern = normalize_pattern(url)
+    key = (method, pattern)
+    entry = _stats.get(key)
+    if entry is None:
+        entry = PatternStats(method=method, pattern=pattern)
+        _stats[key] = entry
+    return entry
+
+
+def record(method: str = None,
+           url: str = None,
+           status: int = 0,
+           elapsed_ms: float = 0.0,
+           bytes_sent: int = 0,
+           bytes_received: int = 0):
+    if not _enabled:
+        return
+    with _lock:
+        _entry(method, url).add(status=status,
+                                elapsed_ms=elapsed_ms,
+                                bytes_sent=bytes_sent,
+                                bytes_received=bytes_received)
+
+
+def record_retry(method: str = None, url: str = None, wait_ms: float = 0.0):
+    """
+    Count a request that is about to be sent again after a failure.
+    :param wait_ms: time spent waiting before sending it again
+    """
+    if not _enabled:
+        return
+    with _lock:
+        entry = _entry(method, url)
+        entry.retries += 1
+        entry.retry_ms += wait_ms
+
+
+def _response_length(response) -> int:
+    length = getattr(response, "length", None)
+    if length is not None:
+        return length
+    try:
+        return int(response.getheader("Content-Length", 0) or 0)
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+class RecordedResponse:
+    """
+    Response whose body was read for the recording; provides the parts of
+    http.client.HTTPResponse that the LANforge clients use.
+    """
+
+    def __init__(self, response=None, body: bytes = b''):
+        self.url = getattr(response, "url", None)
+        self.status = getattr(response, "status", None)
+        self.code = self.status
+        self.reason = getattr(response, "reason", None)
+        self.headers = response.headers
+        self.msg = response.headers
+        self.length = len(body)
+        self.fp = io.BytesIO(body)
+
+    def read(self, amt: int = None) -> bytes:
+        return self.fp.read(amt) if amt is not None else self.fp.read()
+
+    def readline(self) -> bytes:
+        return self.fp.readline()
+
+    def getcode(self) -> int:
+        return self.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def getheaders(self) -> list:
+        return list(self.headers.items())
+
+    def getheader(self, name: str = None, default=None):
+        return self.headers.get(name, default)
+
+    def close(self):
+        self.fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def record_to(path: str = None):
+    """
+    Append every request and response to path as json lines, None stops recording.
+    """
+    global _record_file
+    with _record_lock:
+        if _record_file is not None:
+            _record_file.close()
+            _record_file = None
+        if path:
+            _record_file = open(path, "a")
+
+
+atexit.register(record_to, None)
+
+
+def _write_exchange(request_, status: int = 0, headers=None, body: bytes = None, elapsed_ms: float = 0.0):
+    parsed = urllib.parse.urlsplit(request_.full_url)
+    path = parsed.path + ("?" + parsed.query if parsed.query else "")
+    exchange = {
+        "method": request_.get_method(),
+        "url": path,
+        "request": request_.data.decode("utf-8", errors="replace") if request_.data else None,
+        "status": status,
+        "headers": {name: headers.get(name) for name in RECORD_HEADERS if headers and headers.get(name)},
+        "response": body.decode("utf-8", errors="replace") if body is not None else None,
+        "elapsed_ms": round(elapsed_ms, 3),
+    }
+    line = json.dumps(exchange) + "\n"
+    with _record_lock:
+        if _record_file is not None:
+            _record_file.write(line)
+            _record_file.flush()
+
+
+def timed_urlopen(send, request_, **kwargs):
+    """
+    Call send(request_, **kwargs), and record it when statistics or recording are on.
+    :param send: callable taking a urllib.request.Request, like urllib.request.urlopen
+    :param request_: urllib.request.Request
+    :return: whatever send returns, a RecordedResponse when recording;
+        exceptions are recorded and re-raised
+    """
+    if not _enabled and _record_file is None:
+        return send(request_, **kwargs)
+    method = request_.get_method()
+    url = request_.full_url
+    bytes_sent = len(request_.data) if request_.data else 0
+    start = time.perf_counter()
+    try:
+        response = send(request_, **kwargs)
+    except urllib.error.HTTPError as error:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        record(method, url, status=error.code, elapsed_ms=elapsed_ms, bytes_sent=bytes_sent)
+        if _record_file is not None:
+            _write_exchange(request_, status=error.code, headers=error.headers, elapsed_ms=elapsed_ms)
+        raise
+    except Exception:
+        record(method, url, status=0, elapsed_ms=(time.perf_counter() - start) * 1000,
+               bytes_sent=bytes_sent)
+        raise
+    if _record_file is not None:
+        body = response.read()
+        response = RecordedResponse(response, body)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    status = getattr(response, "status", 0) or 0
+    record(method, url,
+           status=status,
+           elapsed_ms=elapsed_ms,
+           bytes_sent=bytes_sent,
+           bytes_received=_response_length(response))
+    if _record_file is not None:
+        _write_exchange(request_, status=status, headers=response.headers, body=body, elapsed_ms=elapsed_ms)
+    return response
+
+
+def summary() -> list:
+    """
+    :return: list of per pattern dicts, most total time first
+    """
+    with _lock:
+        rows = [entry.as_dict() for entry in _stats.values()]
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return rows
+
+
+def totals() -> dict:
+    rows = summary()
+    return {
+        "requests": sum(row["count"] for row in rows),
+        "errors": sum(row["errors"] for row in rows),
+        "retries": sum(row["retries"] for row in rows),
+        "retry_ms": round(sum(row.get("retry_ms", 0.0) for row in rows), 3),
+        "bytes_sent": sum(row["bytes_sent"] for row in rows),
+        "bytes_received": sum(row["bytes_received"] for row in rows),
+        "total_ms": round(sum(row["total_ms"] for row in rows), 3),
+        "wall_sec": round(time.time() - _started, 3),
+        "patterns": len(rows),
+    }
+
+
+def dump_json(path: str = None):
+    with open(path, "w") as json_file:
+        json.dump({"totals": totals(), "patterns": summary()}, json_file, indent=2)
+
+
+CSV_COLUMNS = ("method", "pattern", "count", "errors", "retries", "retry_ms", "bytes_sent", "bytes_received",
+               "total_ms", "mean_ms", "min_ms", "max_ms", "p50_ms", "p95_ms", "p99_ms", "statuses")
+
+
+def dump_csv(path: str = None):
+    with open(path, "w", newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(CSV_COLUMNS)
+        for row in summary():
+            writer.writerow([json.dumps(row[column]) if column == "statuses" else row[column]
+                             for column in CSV_COLUMNS])
+
+
+def dump(path: str = None):
+    if path.endswith(".csv"):
+        dump_csv(path)
+    else:
+        dump_json(path)
+
+
+def _dump_at_exit():
+    if not _dump_path:
+        return
+    try:
+        dump(_dump_path)
+    except OSError as x:
+        LOGGER.error("unable to write http statistics to %s: %s" % (_dump_path, x))
+
+
+def load(path: str = None) -> dict:
+    """
+    Read a json dump back, as written by dump_json().
+    """
+    with open(path, "r") as json_file:
+        return json.load(json_file)
+
+
+def check_budget(stats: dict = None, budget: dict = None) -> list:
+    """
+    Compare a json dump (see load()) with a budget.
+    :param budget: dict with any of max_requests, max_errors, max_retries, max_retry_sec, max_total_sec,
+        max_bytes_received and per_pattern: {"GET /port/{n}/{n}/{name}?fields": {"max_requests": 100}}
+    :return: list of strings describing what went over budget, empty when within budget
+    """
+    violations = []
+    if not budget:
+        return violations
+    stats_totals = stats.get("totals", {})
+    limits = (("max_requests", "requests", stats_totals.get("requests", 0)),
+              ("max_errors", "errors", stats_totals.get("errors", 0)),
+              ("max_retries", "retries", stats_totals.get("retries", 0)),
+              ("max_retry_sec", "seconds waiting to retry", stats_totals.get("retry_ms", 0) / 1000.0),
+              ("max_total_sec", "seconds in requests", stats_totals.get("total_ms", 0) / 1000.0),
+              ("max_bytes_received", "bytes received", stats_totals.get("bytes_received", 0)))
+    for key, label, value in limits:
+        if key in budget and value > float(budget[key]):
+            violations.append("%s %s over budget of %s" % (round(value, 3), label, budget[key]))
+    patterns = {"%s %s" % (row["method"], row["pattern"]): row for row in stats.get("patterns", [])}
+    for pattern, pattern_budget in budget.get("per_pattern", {}).items():
+        row = patterns.get(pattern)
+        if row is None:
+            continue
+        if "max_requests" in pattern_budget and row["count"] > int(pattern_budget["max_requests"]):
+            violations.append("%s: %s requests over budget of %s"
+                              % (pattern, row["count"], pattern_budget["max_requests"]))
+        if "max_p95_ms" in pattern_budget and row["p95_ms"] > float(pattern_budget["max_p95_ms"]):
+            violations.append("%s: p95 %sms over budget of %sms"
+                              % (pattern, row["p95_ms"], pattern_budget["max_p95_ms"]))
+    return violations
+
+
+if os.environ.get("LF_HTTP_STATS"):
+    enable(dump_path=os.environ.get("LF_HTTP_STATS"))
+if os.environ.get("LF_HTTP_RECORD"):
+    record_to(os.environ.get("LF_HTTP_RECORD"))
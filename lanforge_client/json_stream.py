@@ -0,0 +1,191 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+
+    Incremental decoding of LANforge JSON API listings.
+
+    /port/all, /endp and /cx responses on a large system are several megabytes, and
+    json.loads() of the whole body keeps the text and every decoded record in memory
+    at once.  stream_records() reads the response a chunk at a time and decodes one
+    record at a time, so memory stays at about one chunk plus one record no matter
+    how many ports or endpoints the system has:
+
+        "interfaces": [{"1.1.sta0000": {...}}, ...]  ->  ("1.1.sta0000", {...}), ...
+        "endpoint":   [{"udp-A": {...}}, ...]          ->  ("udp-A", {...}), ...
+        "interface":  {...}                            ->  (port or alias, {...})
+        {"handler": ..., "cx-1": {...}, ...}           ->  ("cx-1", {...}), ...
+
+    Records can be reduced to some fields, and iteration can stop early: the rest of
+    the response is then not read at all.
+
+    EXAMPLE:
+        response = urllib.request.urlopen("http://localhost:8080/port/all?fields=alias,signal,channel")
+        for eid, record in stream_records(response, fields=("signal", "channel")):
+            print(eid, record["signal"])
+
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+import codecs
+import json
+
+# top level members that describe the response, not a record
+META_KEYS = ("handler", "uri", "warnings", "errors", "items", "status", "LAST", "empty")
+# top level members holding one record instead of a list
+SINGLE_KEYS = ("interface", "endpoint", "resource", "event", "alert", "cx")
+# record fields that identify a single record
+ID_FIELDS = ("eid", "port", "name", "entity id", "alias", "id")
+
+_WHITESPACE = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class JsonStreamReader:
+    """
+    Text buffer over a binary file-like object, decoding values as they are complete.
+    """
+
+    def __init__(self, fp=None, chunk_size: int = 65536):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.bytes_read = 0
+
+    def fill(self, wanted: int = None) -> bool:
+        """
+        Read another chunk, at least wanted characters if given.
+        :return: False at the end of the response
+        """
+        if self.eof:
+            return False
+        if self.pos > 0:
+            # drop what was consumed so the buffer does not grow with the response
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        size = max(self.chunk_size, wanted or 0)
+        chunk = self.fp.read(size)
+        if not chunk:
+            self.eof = True
+            self.buffer += self.decoder.decode(b"", final=True)
+            return False
+        self.bytes_read += len(chunk)
+        self.buffer += self.decoder.decode(chunk)
+        return True
+
+    def peek(self) -> str:
+        """
+        :return: next non-whitespace character without consuming it, "" at the end
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, characters: str = None) -> str:
+        found = self.peek()
+        if not found or found not in characters:
+            raise ValueError("json stream: expected one of [%s] at byte %d, found [%s]"
+                             % (characters, self.bytes_read, found))
+        self.pos += 1
+        return found
+
+    def value(self):
+        """
+        Decode the next complete JSON value, reading more of the response as needed.
+        """
+        self.peek()
+        while True:
+            try:
+                decoded, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # incomplete value: read at least as much again as is buffered, so long
+                # values are decoded a bounded number of times
+                if not self.fill(wanted=len(self.buffer) - self.pos):
+                    raise
+                continue
+            if end == len(self.buffer) and not self.eof and isinstance(decoded, (int, float)):
+                # a number may continue in the next chunk
+                if self.fill():
+                    continue
+            self.pos = end
+            return decoded
+
+
+def _filter(record=None, fields=None):
+    if fields is None or not isinstance(record, dict):
+        return record
+    return {field: record[field] for field in fields if field in record}
+
+
+def _record_id(record=None):
+    if isinstance(record, dict):
+        for field in ID_FIELDS:
+            if field in record:
+                return record[field]
+    return None
+
+
+def stream_records(fp=None, fields=None, limit: int = None, chunk_size: int = 65536, meta: dict = None):
+    """
+    Yield (eid, record) pairs from a LANforge JSON response as it is read.
+    :param fp: binary file-like object with read(size), such as an HTTP response
+    :param fields: optional list of record fields to keep, names as in the response ("rx rate")
+    :param limit: stop after this many records
+    :param chunk_size: bytes read at a time
+    :param meta: optional dict to fill with the handler/uri/errors/warnings members
+    """
+    if limit is not None and limit < 1:
+        return
+    if fields is not None:
+        fields = list(fields)
+    reader = JsonStreamReader(fp, chunk_size=chunk_size)
+    count = 0
+    if reader.peek() == "":
+        return
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        start = reader.peek()
+        if key in META_KEYS:
+            value = reader.value()
+            if meta is not None:
+                meta[key] = value
+        elif start == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    item = reader.value()
+                    if isinstance(item, dict) and len(item) == 1:
+                        # [{"1.1.sta0000": {...}}, ...]
+                        for eid, record in item.items():
+                            yield eid, _filter(record, fields)
+                    else:
+                        yield _record_id(item), _filter(item, fields)
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return
+                    if reader.expect(",]") == "]":
+                        break
+        elif start == "{":
+            record = reader.value()
+            if key in SINGLE_KEYS:
+                yield _record_id(record), _filter(record, fields)
+            else:
+                # /cx lists the connections as top level members
+                yield key, _filter(record, fields)
+            count += 1
+            if limit is not None and count >= limit:
+                return
+        else:
+            value = reader.value()
+            if meta is not None:
+                meta[key] = value
+        if reader.expect(",}") == "}":
+            return
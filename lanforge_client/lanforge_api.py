@@ -70,6 +70,23 @@
     not to be extracted. It is sourced during build by the JsonApiPythonGenerator
     class which appends subclasses to it.
 
+    HAND-MAINTAINED SECTIONS:
+    The generator and json_api.py are not part of this repository, so the
+    following changes were made directly to this file. They are not produced
+    by JsonApiPythonGenerator yet and will be lost when lanforge_api.py is
+    regenerated; port them into JsonApiPythonGenerator.java and json_api.py:
+    * BaseLFJsonRequest: stream_records() (json_stream.py), single-flight
+        GETs in get_as_json() (single_flight.py) and the retry policy used
+        by json_post(), json_delete(), get_as_json() and json_get()
+        (retry_policy.py, get_retry_policy()), along with the
+        retry_policy_ argument of BaseSession and LFSession.
+    * LazyClass and MethodRegistry, at the end of the json_api.py section.
+    * the @LazyClass factories wrapping each generated flag and enum class
+        of LFJsonCommand and LFJsonQuery.
+    * CLI_COMMAND_NAMES and QUERY_URL_NAMES after LFJsonQuery, and the
+        MethodRegistry that LFSession builds from them in place of the
+        generated method map.
+
 ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 import os.path
 import sys
@@ -98,9 +115,15 @@ import base64
 import string
 import re
 import random
+import threading
+from collections.abc import Mapping
 
 # - - - - deployed import references - - - - -
 from .strutil import nott, iss
+from . import http_stats
+from . import json_stream
+from . import single_flight
+from . import retry_policy
 
 SESSION_HEADER = 'X-LFJson-Session'
 # LOGGER = Logger('json_api')
@@ -266,6 +289,14 @@ class BaseLFJsonRequest:
         self.debug_on = debug
         self.receives_async_feedback = False
 
+    def get_retry_policy(self) -> retry_policy.RetryPolicy:
+        """
+        :return: the session's retry policy, or the default one (see retry_policy.py)
+        """
+        if self.session_instance is not None and getattr(self.session_instance, "retry_policy", None):
+            return self.session_instance.retry_policy
+        return retry_policy.default_policy()
+
     def get_corrected_url(self,
                           url: str = None,
                           debug: bool = False):
@@ -372,6 +403,7 @@ class BaseLFJsonRequest:
                   post_data: dict = None,
                   debug: bool = False,
                   die_on_error_: bool = False):
+        single_flight.invalidate()
         die_on_error_ |= self.die_on_error
         debug |= self.debug_on
         responses = []
@@ -398,7 +430,7 @@ class BaseLFJsonRequest:
         myrequest.headers['Content-type'] = 'application/x-www-form-urlencoded'
 
         try:
-            resp = urllib.request.urlopen(myrequest)
+            resp = http_stats.timed_urlopen(urllib.request.urlopen, myrequest)
             responses.append(resp)
             return responses[0]
 
@@ -457,6 +489,7 @@ class BaseLFJsonRequest:
         such as checking for port and endpoint existance before operating the commands
         :return: returns first set of http.client.HTTPResponse data
         """
+        single_flight.invalidate()
         debug |= self.debug_on
         die_on_error |= self.die_on_error
         if not self.session_instance:
@@ -571,10 +604,17 @@ class BaseLFJsonRequest:
         if not max_timeout_sec:
             max_timeout_sec = self.session_instance.max_timeout_sec
         finish_time_ms = (max_timeout_sec * 1000) + begin_time_ms
+        policy = self.get_retry_policy()
+        method = myrequest.get_method()
         attempt = 1
         while (time.time() * 1000) < finish_time_ms:
+            status = 0
+            if not policy.before_request(method, url):
+                LOGGER.error("json_post: failing fast, circuit open for %s" % url)
+                break
             try:
-                response = urllib.request.urlopen(myrequest)
+                response = http_stats.timed_urlopen(urllib.request.urlopen, myrequest)
+                policy.record_result(method, url, response.status)
                 resp_data = response.read().decode('utf-8')
                 if self.receives_async_feedback and (response_json_list is None and resp_data):
                     self.logger.warning("json_post: POST to URL has data: " + url)
@@ -638,39 +678,47 @@ class BaseLFJsonRequest:
                 return responses[0]
 
             except urllib.error.HTTPError as herror:
+                status = herror.code
+                policy.record_result(method, url, status)
                 # these error codes illustrate an error on the client that requires debugging
-                # and retrying them is never going to succeed
-                if herror.code in (400, 410, 411, 412, 413, 414, 415, 416, 417, 428, 429, 431, 451):
+                # and retrying them is never going to succeed; others (429 among them) are
+                # left to the retry policy, and die_on_error exits once it gives up
+                client_error = herror.code in (400, 410, 411, 412, 413, 414, 415, 416, 417, 428, 431, 451)
+                if client_error:
                     die_on_error = True
                 print_diagnostics(url_=url,
                                   request_=myrequest,
                                   responses_=responses,
                                   error_=herror,
                                   debug_=debug,
-                                  die_on_error_=die_on_error)
-                if die_on_error:
+                                  die_on_error_=client_error)
+                if client_error:
                     sys.exit(1)
 
             except urllib.error.URLError as uerror:
-                # this is a misformatted URL
-                die_on_error = True
+                # no connection: the request did not reach the GUI, the retry policy
+                # decides whether to send it again (status 0)
+                policy.record_result(method, url, 0)
                 if (url.endswith("endsession")):
                     logging.info("lfclient closed connection before script exit")
                     die_on_error = True
                     break
-                else:
-                    logging.error("Connection refused: "+url)
-                    print_diagnostics(url_=url,
-                                      request_=myrequest,
-                                      responses_=responses,
-                                      error_=uerror,
-                                      debug_=debug,
-                                      die_on_error_=die_on_error)
-                if die_on_error:
-                    sys.exit(1)
+                logging.error("Connection refused: "+url)
+                print_diagnostics(url_=url,
+                                  request_=myrequest,
+                                  responses_=responses,
+                                  error_=uerror,
+                                  debug_=debug)
             # ~while
-            LOGGER.error("json_post: request will try again in 2 sec")
-            time.sleep(2)
+            delay_sec = policy.retry_delay(method, url,
+                                           status=status,
+                                           attempt=attempt,
+                                           remaining_sec=(finish_time_ms - time.time() * 1000) / 1000)
+            if delay_sec is None:
+                break
+            LOGGER.error("json_post: request will try again in %.2f sec" % delay_sec)
+            policy.wait(method, url, delay_sec)
+            attempt += 1
         if die_on_error:
             sys.exit(1)
         return None
@@ -774,6 +822,28 @@ class BaseLFJsonRequest:
         :param connection_timeout_sec: number of seconds to have an outstanding request
         :return: returns an urllib.response or None
         """
+        return self.get_with_status(url=url,
+                                    debug=debug,
+                                    die_on_error=die_on_error,
+                                    method_=method_,
+                                    connection_timeout_sec=connection_timeout_sec)[0]
+
+    def get_with_status(self,
+                        url: str = None,
+                        debug: bool = False,
+                        die_on_error: bool = False,
+                        method_: str = 'GET',
+                        connection_timeout_sec: int = None) -> tuple:  # (Optional[HTTPResponse], int)
+        """
+        Makes a HTTP GET request with specified timeout, see get().
+        :param url: Fully qualified URL to request
+        :param debug: if true, print out diagnostic information
+        :param die_on_error: call exit() if query fails to connect, is a 400 or 500 response status.
+        Responses with 404 status are expected to be normal and will not cause an exit.
+        :param method_: Override the HTTP METHOD. Please do not override.
+        :param connection_timeout_sec: number of seconds to have an outstanding request
+        :return: (urllib.response or None, HTTP status or 0 when there was no response)
+        """
         debug |= self.debug_on
         die_on_error |= self.die_on_error
 
@@ -798,11 +868,22 @@ class BaseLFJsonRequest:
             myrequest.timeout = connection_timeout_sec
 
         myresponses: list = []  # list[HTTPResponse]
+        policy = self.get_retry_policy()
+        if not policy.before_request(method_, requested_url):
+            self.logger.error("get: failing fast, circuit open for %s" % requested_url)
+            self.error_list.append("circuit open: %s %s" % (method_, requested_url))
+            if die_on_error:
+                sys.exit(1)
+            return None, 0
+        status = 0
         try:
-            myresponses.append(request.urlopen(myrequest))
-            return myresponses[0]
+            myresponses.append(http_stats.timed_urlopen(request.urlopen, myrequest))
+            policy.record_result(method_, requested_url, myresponses[0].status)
+            return myresponses[0], myresponses[0].status
 
         except urllib.error.HTTPError as herror:
+            status = herror.code
+            policy.record_result(method_, requested_url, herror.code)
             print_diagnostics(url_=requested_url,
                               request_=myrequest,
                               responses_=myresponses,
@@ -813,6 +894,7 @@ class BaseLFJsonRequest:
             if die_on_error:
                 sys.exit(1)
         except urllib.error.URLError as uerror:
+            policy.record_result(method_, requested_url, 0)
             print_diagnostics(url_=requested_url,
                               request_=myrequest,
                               responses_=myresponses,
@@ -824,7 +906,7 @@ class BaseLFJsonRequest:
                 sys.exit(1)
         if die_on_error:
             sys.exit(1)
-        return None
+        return None, status
 
     def get_as_json(self,
                     url: str = None,
@@ -847,29 +929,53 @@ class BaseLFJsonRequest:
         :return: get response as a python object decoded from Json data
         This often is a dict, but it could be any primitive Python type such as str, int, float or list.
         """
-        begin_sec = time.time() * 1000
-        responses = []
-        while (time.time() * 1000) < (begin_sec + max_timeout_sec):
-            if wait_sec and (wait_sec > 0):
-                time.sleep(wait_sec)
-            responses = [self.get(url=url,
-                                  debug=debug,
-                                  die_on_error=die_on_error,
-                                  connection_timeout_sec=request_timeout_sec,
-                                  method_=method_)]
-            if (len(responses) > 0) and responses[0]:
-                break
+        if not max_timeout_sec:
+            max_timeout_sec = self.session_instance.max_timeout_sec
+        policy = self.get_retry_policy()
+
+        def fetch():
+            deadline_sec = time.time() + max_timeout_sec
+            responses = [None]
+            attempt = 1
+            while time.time() < deadline_sec:
+                if wait_sec and (wait_sec > 0):
+                    time.sleep(wait_sec)
+                response, status = self.get_with_status(url=url,
+                                                        debug=debug,
+                                                        die_on_error=die_on_error,
+                                                        connection_timeout_sec=request_timeout_sec,
+                                                        method_=method_)
+                responses = [response]
+                if response:
+                    break
+                # a 404 or other client error is the answer, only server failures are retried
+                if not policy.is_server_failure(status):
+                    break
+                delay_sec = policy.retry_delay(method_, url,
+                                               status=status,
+                                               attempt=attempt,
+                                               remaining_sec=deadline_sec - time.time())
+                if delay_sec is None:
+                    break
+                policy.wait(method_, url, delay_sec)
+                attempt += 1
 
-        if responses[0] is None:
-            if debug:
-                self.logger.debug(msg="No response from " + url)
+            if responses[0] is None:
+                if debug:
+                    self.logger.debug(msg="No response from " + url)
+                return None
+            return json.loads(responses[0].read().decode('utf-8'))
+
+        # identical GETs share one request when single_flight is enabled
+        if method_ != 'GET':
+            single_flight.invalidate()
+        json_data = single_flight.get(method_, url, fetch)
+        if json_data is None:
             return None
-
-        json_data = json.loads(responses[0].read().decode('utf-8'))
         if errors_warnings is not None:
             if "errors" in json_data:
                 errors_warnings.extend(json_data["errors"])
-            if "warnings" in responses[0]:
+            if "warnings" in json_data:
                 errors_warnings.extend(json_data["warnings"])
 
         return json_data
@@ -946,8 +1052,54 @@ class BaseLFJsonRequest:
                     # traceback.print_exception(ValueError, ve, ve.__traceback__, chain=True)
                 if self.die_on_error:
                     sys.exit(1)
+                policy = self.get_retry_policy()
+                delay_sec = policy.retry_delay("GET", url,
+                                               attempt=attempt_counter,
+                                               remaining_sec=deadline_sec - _now_sec())
+                if delay_sec is None:
+                    break
+                policy.wait("GET", url, delay_sec)
+                attempt_counter += 1
         return json_response
 
+    def stream_records(self,
+                       url: str = None,
+                       fields: list = None,
+                       limit: int = None,
+                       debug: bool = False,
+                       request_timeout_sec: float = None,
+                       errors_warnings: list = None):
+        """
+        Yields (eid, record) pairs from a GET request as the response is read. Use this
+        instead of json_get for /port/all, /endp or /cx on large systems: the response is
+        never decoded all at once, and breaking out of the loop stops reading it.
+        :param url: URL to make GET request to
+        :param fields: optional list of record fields to keep, such as ["alias", "rx rate"]
+        :param limit: stop after this many records
+        :param debug: print diagnostic information if true
+        :param request_timeout_sec: maximum time the request can take
+        :param errors_warnings: if present, fill this with error and warning messages from the response JSON
+        """
+        if nott(url):
+            raise ValueError("stream_records called without url")
+        response = self.get(url=self.get_corrected_url(url=url),
+                            debug=debug,
+                            die_on_error=False,
+                            connection_timeout_sec=request_timeout_sec)
+        if response is None:
+            if errors_warnings is not None:
+                errors_warnings.append("No response")
+                errors_warnings.extend(self.error_list)
+            return
+        meta = {}
+        try:
+            yield from json_stream.stream_records(response, fields=fields, limit=limit, meta=meta)
+        finally:
+            response.close()
+            if errors_warnings is not None:
+                errors_warnings.extend(meta.get("errors", []))
+                errors_warnings.extend(meta.get("warnings", []))
+
     # def set_post_data(self, data):
     #     """
     #     :param data: dictionary of parameters for post
@@ -1179,7 +1331,8 @@ class BaseSession:
                  retry_sec: float = Default_Retry_Sec,
                  stream_errors: bool = True,
                  stream_warnings: bool = False,
-                 exit_on_error: bool = False):
+                 exit_on_error: bool = False,
+                 retry_policy_: retry_policy.RetryPolicy = None):
         self.debug_on = debug
         # self.logger = Logg(name='json_api_session')
         self.logger = logging.getLogger(__name__)
@@ -1203,6 +1356,9 @@ class BaseSession:
         self.query_instance = None
         self.retry_sec: float
         self.retry_sec = retry_sec
+        # None uses retry_policy.default_policy()
+        self.retry_policy: retry_policy.RetryPolicy
+        self.retry_policy = retry_policy_
         self.session_error_list: list = []
         self.session_warnings_list: list = []
         self.stream_errors: bool
@@ -1387,6 +1543,81 @@ class BaseSession:
                               max_timeout_sec = 0.1,
                               session_id_=session_id_)
 
+# HAND-MAINTAINED: LazyClass and MethodRegistry are not in json_api.py yet, see MAINTENANCE above.
+class LazyClass:
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Class attribute that is built the first time it is accessed. The generated flag
+        and enum classes below are wrapped in a factory so importing this module does not
+        build all of them; a script pays only for the ones it uses:
+            @LazyClass
+            def AddStaFlags():
+                class AddStaFlags(IntFlag):
+                    ...
+                return AddStaFlags
+        After the first access the built class replaces the LazyClass on the owner, so
+        LFJsonCommand.AddStaFlags is a plain attribute lookup from then on.
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    _lock = threading.Lock()
+
+    def __init__(self, factory=None):
+        self.factory = factory
+        self.name = factory.__name__
+        self.owner = None
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        owner = self.owner or owner
+        with LazyClass._lock:
+            built = owner.__dict__.get(self.name)
+            if built is self:
+                built = self.factory()
+                built.__qualname__ = "%s.%s" % (owner.__qualname__, self.name)
+                setattr(owner, self.name, built)
+        return built
+
+
+class MethodRegistry(Mapping):
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Read-only map of CLI command names and query urls to the session's bound methods:
+            "add_sta"   -> session.command_instance.post_add_sta
+            "/arm-endp" -> session.query_instance.get_arm_endp
+        Methods are looked up when first requested instead of binding all of them up front.
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    def __init__(self,
+                 session_obj: object = None,
+                 cli_commands: tuple = (),
+                 query_urls: tuple = ()):
+        self.session_obj = session_obj
+        self.names = tuple(cli_commands) + tuple(query_urls)
+        self.name_set = frozenset(self.names)
+        self.resolved = {}
+
+    def __getitem__(self, name: str = None):
+        method = self.resolved.get(name)
+        if method is not None:
+            return method
+        if name not in self.name_set:
+            raise KeyError(name)
+        if name.startswith("/"):
+            method = getattr(self.session_obj.query_instance, "get_" + name[1:].replace("-", "_"))
+        else:
+            method = getattr(self.session_obj.command_instance, "post_" + name)
+        self.resolved[name] = method
+        return method
+
+    def __contains__(self, name) -> bool:
+        return name in self.name_set
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
 # End of json_api.py; subclasses defined below
 
 
@@ -1536,26 +1767,29 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#adb_gui
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AdbGuiFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AdbGuiFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        NO_AUDIO_SCRCPY = 0x2              # Disable scrcpy audio forwarding
-        OMX_H264_ENCODER_SCRCPY = 0x4      # Use non-default OMX.google.h264.encoder scrcpy video encoder
-        USE_SCRCPY = 0x1                   # Use scrcpy instead of MonkeyRemote
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AdbGuiFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AdbGuiFlags():
+        class AdbGuiFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AdbGuiFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            NO_AUDIO_SCRCPY = 0x2              # Disable scrcpy audio forwarding
+            OMX_H264_ENCODER_SCRCPY = 0x4      # Use non-default OMX.google.h264.encoder scrcpy video encoder
+            USE_SCRCPY = 0x1                   # Use scrcpy instead of MonkeyRemote
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AdbGuiFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AdbGuiFlags
 
     def post_adb_gui(self, 
                      adb_id: str = None,                       # Android device identifier.
@@ -1935,27 +2169,30 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_bgp_peer
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddBgpPeerFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddBgpPeerFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        ENABLE_PEER = 0x1             # Set this to zero if you don't want this peer enabled.
-        PEER_CLIENT = 0x2             # Sets corresponding Xorp flag in BGP Peer section.
-        PEER_CONFED_MEMBER = 0x4      # Sets corresponding Xorp flag in BGP Peer section.
-        PEER_UNICAST_V4 = 0x8         # Sets corresponding Xorp flag in BGP Peer section.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddBgpPeerFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddBgpPeerFlags():
+        class AddBgpPeerFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddBgpPeerFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            ENABLE_PEER = 0x1             # Set this to zero if you don't want this peer enabled.
+            PEER_CLIENT = 0x2             # Sets corresponding Xorp flag in BGP Peer section.
+            PEER_CONFED_MEMBER = 0x4      # Sets corresponding Xorp flag in BGP Peer section.
+            PEER_UNICAST_V4 = 0x8         # Sets corresponding Xorp flag in BGP Peer section.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddBgpPeerFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddBgpPeerFlags
 
     def post_add_bgp_peer(self, 
                           p_as: str = None,                         # BGP Peer Autonomous System number, 0-65535
@@ -2106,12 +2343,15 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_br
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddBrBrFlags(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        none = 0             # no features
-        stp_enabled = 1      # Enable Spanning Tree Protocol (STP)
+    @LazyClass
+    def AddBrBrFlags():
+        class AddBrBrFlags(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            none = 0             # no features
+            stp_enabled = 1      # Enable Spanning Tree Protocol (STP)
+        return AddBrBrFlags
 
     def post_add_br(self, 
                     br_aging_time: str = None,                # MAC aging time, in seconds, 32-bit number.
@@ -2196,12 +2436,15 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_cd
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddCdFlags(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        ERR = 2          # Set to kernel mode.
-        RUNNING = 1      # Set to running state.
+    @LazyClass
+    def AddCdFlags():
+        class AddCdFlags(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            ERR = 2          # Set to kernel mode.
+            RUNNING = 1      # Set to running state.
+        return AddCdFlags
 
     def post_add_cd(self, 
                     alias: str = None,                        # Name of Collision Domain. [W]
@@ -2446,49 +2689,55 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_chamber
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddChamberChamberFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddChamberChamberFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        OPEN = 0x4                # (3) Door is open, no real isolation right now.
-        PHANTOM = 0x1             # (1) Chamber is not actually here right now.
-        TT_OVERRIDE = 0x800       # (11) LANforge should override manual turntable control
-        TT_STOP_NOW = 0x400       # (10) Turntable must immediately stop all movement.
-        VIRTUAL = 0x2             # (2) No real chamber, open-air grouping of equipment.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddChamberChamberFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class AddChamberTurntableType(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddChamberTurntableType, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        COMXIM = 0x1      # ComXim stand-alone USB connected turn-table.
-        CT840A = 0x2      # Modbus API turntable in CT840A 2D chamber.
-        CT850A = 0x0      # TCP-IP Connected turntable in CT850A 2D chamber.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddChamberTurntableType has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddChamberChamberFlags():
+        class AddChamberChamberFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddChamberChamberFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            OPEN = 0x4                # (3) Door is open, no real isolation right now.
+            PHANTOM = 0x1             # (1) Chamber is not actually here right now.
+            TT_OVERRIDE = 0x800       # (11) LANforge should override manual turntable control
+            TT_STOP_NOW = 0x400       # (10) Turntable must immediately stop all movement.
+            VIRTUAL = 0x2             # (2) No real chamber, open-air grouping of equipment.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddChamberChamberFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddChamberChamberFlags
+
+    @LazyClass
+    def AddChamberTurntableType():
+        class AddChamberTurntableType(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddChamberTurntableType, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            COMXIM = 0x1      # ComXim stand-alone USB connected turn-table.
+            CT840A = 0x2      # Modbus API turntable in CT840A 2D chamber.
+            CT850A = 0x0      # TCP-IP Connected turntable in CT850A 2D chamber.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddChamberTurntableType has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddChamberTurntableType
 
     def post_add_chamber(self, 
                          chamber_type: str = None,                 # Chamber type, see above. Use 1 for Medium if uncertain.
@@ -2614,13 +2863,16 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_chamber_cx
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddChamberCxChamberCxFlags(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        CONNECTED = 1       # (1) Connected to something. If flag is not set, connection is open to the air
-        # +(maybe with antenna)
-        TERMINATED = 2      # (2) Connection is terminated, signal shall not pass!
+    @LazyClass
+    def AddChamberCxChamberCxFlags():
+        class AddChamberCxChamberCxFlags(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            CONNECTED = 1       # (1) Connected to something. If flag is not set, connection is open to the air
+            # +(maybe with antenna)
+            TERMINATED = 2      # (2) Connection is terminated, signal shall not pass!
+        return AddChamberCxChamberCxFlags
 
     def post_add_chamber_cx(self, 
                             a_id: str = None,                         # EidAntenna in string format for A side connection.
@@ -2772,23 +3024,26 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_channel_group
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddChannelGroupTypes(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        clear = "clear"          # Channel(s) are bundled into a single span. No conversion or
-        e_m = "e&amp;m"          # Channel(s) are signalled using E&amp;M signalling (specific
-        fcshdlc = "fcshdlc"      # The zapdel driver performs HDLC encoding and decoding on the
-        fxogs = "fxogs"          # Channel(s) are signalled using FXO Groundstart protocol.
-        fxoks = "fxoks"          # Channel(s) are signalled using FXO Koolstart protocol.
-        fxols = "fxols"          # Channel(s) are signalled using FXO Loopstart protocol.
-        fxsgs = "fxsgs"          # Channel(s) are signalled using FXS Groundstart protocol.
-        fxsks = "fxsks"          # Channel(s) are signalled using FXS Koolstart protocol.
-        fxsls = "fxsls"          # Channel(s) are signalled using FXS Loopstart protocol.
-        indclear = "indclear"    # Like 'clear' except all channels are treated individually and
-        nethdlc = "nethdlc"      # The zaptel driver bundles the channels together into an
-        rawhdlc = "rawhdlc"      # The zaptel driver performs HDLC encoding and decoding on the
-        unused = "unused"        # No signalling is performed, each channel in the list remains idle
+    @LazyClass
+    def AddChannelGroupTypes():
+        class AddChannelGroupTypes(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            clear = "clear"          # Channel(s) are bundled into a single span. No conversion or
+            e_m = "e&amp;m"          # Channel(s) are signalled using E&amp;M signalling (specific
+            fcshdlc = "fcshdlc"      # The zapdel driver performs HDLC encoding and decoding on the
+            fxogs = "fxogs"          # Channel(s) are signalled using FXO Groundstart protocol.
+            fxoks = "fxoks"          # Channel(s) are signalled using FXO Koolstart protocol.
+            fxols = "fxols"          # Channel(s) are signalled using FXO Loopstart protocol.
+            fxsgs = "fxsgs"          # Channel(s) are signalled using FXS Groundstart protocol.
+            fxsks = "fxsks"          # Channel(s) are signalled using FXS Koolstart protocol.
+            fxsls = "fxsls"          # Channel(s) are signalled using FXS Loopstart protocol.
+            indclear = "indclear"    # Like 'clear' except all channels are treated individually and
+            nethdlc = "nethdlc"      # The zaptel driver bundles the channels together into an
+            rawhdlc = "rawhdlc"      # The zaptel driver performs HDLC encoding and decoding on the
+            unused = "unused"        # No signalling is performed, each channel in the list remains idle
+        return AddChannelGroupTypes
 
     def post_add_channel_group(self, 
                                alias: str = None,                        # Name for this Channel Group. [R]
@@ -2925,36 +3180,39 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_dut
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddDutDutFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddDutDutFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        p_11r = 0x200            # Use .11r connection logic on all ssids, deprecated, see add_dut_ssid.
-        AP_MODE = 0x2            # (2) DUT acts as AP.
-        DHCPD_LAN = 0x40         # Provides DHCP server on LAN port
-        DHCPD_WAN = 0x80         # Provides DHCP server on WAN port
-        EAP_PEAP = 0x800         # Use EAP-PEAP connection logic on all ssids, deprecated, see add_dut_ssid.
-        EAP_TTLS = 0x400         # Use EAP-TTLS connection logic on all ssids, deprecated, see add_dut_ssid.
-        INACTIVE = 0x4           # (3) Ignore this in ChamberView, etc
-        NOT_DHCPCD = 0x1000      # Station/edge device that is NOT using DHCP.
-        STA_MODE = 0x1           # (1) DUT acts as Station.
-        WEP = 0x8                # Use WEP encryption on all ssids, deprecated, see add_dut_ssid.
-        WPA = 0x10               # Use WPA encryption on all ssids, deprecated, see add_dut_ssid.
-        WPA2 = 0x20              # Use WPA2 encryption on all ssids, deprecated, see add_dut_ssid.
-        WPA3 = 0x100             # Use WPA3 encryption on all ssids, deprecated, see add_dut_extras.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddDutDutFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddDutDutFlags():
+        class AddDutDutFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddDutDutFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            p_11r = 0x200            # Use .11r connection logic on all ssids, deprecated, see add_dut_ssid.
+            AP_MODE = 0x2            # (2) DUT acts as AP.
+            DHCPD_LAN = 0x40         # Provides DHCP server on LAN port
+            DHCPD_WAN = 0x80         # Provides DHCP server on WAN port
+            EAP_PEAP = 0x800         # Use EAP-PEAP connection logic on all ssids, deprecated, see add_dut_ssid.
+            EAP_TTLS = 0x400         # Use EAP-TTLS connection logic on all ssids, deprecated, see add_dut_ssid.
+            INACTIVE = 0x4           # (3) Ignore this in ChamberView, etc
+            NOT_DHCPCD = 0x1000      # Station/edge device that is NOT using DHCP.
+            STA_MODE = 0x1           # (1) DUT acts as Station.
+            WEP = 0x8                # Use WEP encryption on all ssids, deprecated, see add_dut_ssid.
+            WPA = 0x10               # Use WPA encryption on all ssids, deprecated, see add_dut_ssid.
+            WPA2 = 0x20              # Use WPA2 encryption on all ssids, deprecated, see add_dut_ssid.
+            WPA3 = 0x100             # Use WPA3 encryption on all ssids, deprecated, see add_dut_extras.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddDutDutFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddDutDutFlags
 
     def post_add_dut(self, 
                      antenna_count1: str = None,               # Antenna count for first radio.
@@ -3163,30 +3421,33 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_dut_ssid
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddDutSsidDutFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddDutSsidDutFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        p_11r = 0x200          # Use .11r connection logic
-        EAP_PEAP = 0x800       # Use EAP-PEAP connection logic
-        EAP_TTLS = 0x400       # Use EAP-TTLS connection logic
-        WEP = 0x8              # Use WEP encryption
-        WPA = 0x10             # Use WPA encryption
-        WPA2 = 0x20            # Use WPA2 encryption
-        WPA3 = 0x100           # Use WPA3 encryption
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddDutSsidDutFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddDutSsidDutFlags():
+        class AddDutSsidDutFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddDutSsidDutFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            p_11r = 0x200          # Use .11r connection logic
+            EAP_PEAP = 0x800       # Use EAP-PEAP connection logic
+            EAP_TTLS = 0x400       # Use EAP-TTLS connection logic
+            WEP = 0x8              # Use WEP encryption
+            WPA = 0x10             # Use WPA encryption
+            WPA2 = 0x20            # Use WPA2 encryption
+            WPA3 = 0x100           # Use WPA3 encryption
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddDutSsidDutFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddDutSsidDutFlags
 
     def post_add_dut_ssid(self, 
                           bssid: str = None,                        # BSSID for cooresponding SSID.
@@ -3258,38 +3519,44 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_endp
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddEndpPayloadPattern(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        PRBS_11_8_10 = "PRBS_11_8_10"    # PRBS (see above)
-        PRBS_15_0_14 = "PRBS_15_0_14"    # PRBS (see above)
-        PRBS_4_0_3 = "PRBS_4_0_3"        # Use linear feedback shift register to generate pseudo random sequence.
-        PRBS_7_0_6 = "PRBS_7_0_6"        # PRBS (see above)
-        custom = "custom"                # Enter your own payload with the set_endp_payload cmd.
-        decreasing = "decreasing"        # bytes start at FF and decrease, wrapping if needed
-        increasing = "increasing"        # bytes start at 00 and increase, wrapping if needed
-        ones = "ones"                    # payload is all ones (FF)
-        random = "random"                # generate a new random payload each time sent
-        random_fixed = "random_fixed"    # means generate one random payload, and send it over and over again.
-        zeros = "zeros"                  # payload is all zeros (00)
-
-    class AddEndpType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        custom_ether = "custom_ether"      # LF frames with custom options, use with playback
-        custom_mc_udp = "custom_mc_udp"    # LF Multicast UDP IPv4
-        custom_tcp = "custom_tcp"          # LF TCP IPv4 frame with custom options
-        custom_udp = "custom_udp"          # LF UDP IPv4 frame with custom options
-        lf = "lf"                          # LF protocol
-        lf_sctp = "lf_sctp"                # SCTP IPv4 protocol
-        lf_sctp6 = "lf_sctp6"              # SCTP IPv6 protocol
-        lf_tcp = "lf_tcp"                  # TCP IPv4 connection
-        lf_tcp6 = "lf_tcp6"                # TCP IPv6 connection
-        lf_udp = "lf_udp"                  # UDP IPv4 connection
-        lf_udp6 = "lf_udp6"                # UDP IPv6 connection
-        mc_udp = "mc_udp"                  # LF Multicast IPv4
+    @LazyClass
+    def AddEndpPayloadPattern():
+        class AddEndpPayloadPattern(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            PRBS_11_8_10 = "PRBS_11_8_10"    # PRBS (see above)
+            PRBS_15_0_14 = "PRBS_15_0_14"    # PRBS (see above)
+            PRBS_4_0_3 = "PRBS_4_0_3"        # Use linear feedback shift register to generate pseudo random sequence.
+            PRBS_7_0_6 = "PRBS_7_0_6"        # PRBS (see above)
+            custom = "custom"                # Enter your own payload with the set_endp_payload cmd.
+            decreasing = "decreasing"        # bytes start at FF and decrease, wrapping if needed
+            increasing = "increasing"        # bytes start at 00 and increase, wrapping if needed
+            ones = "ones"                    # payload is all ones (FF)
+            random = "random"                # generate a new random payload each time sent
+            random_fixed = "random_fixed"    # means generate one random payload, and send it over and over again.
+            zeros = "zeros"                  # payload is all zeros (00)
+        return AddEndpPayloadPattern
+
+    @LazyClass
+    def AddEndpType():
+        class AddEndpType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            custom_ether = "custom_ether"      # LF frames with custom options, use with playback
+            custom_mc_udp = "custom_mc_udp"    # LF Multicast UDP IPv4
+            custom_tcp = "custom_tcp"          # LF TCP IPv4 frame with custom options
+            custom_udp = "custom_udp"          # LF UDP IPv4 frame with custom options
+            lf = "lf"                          # LF protocol
+            lf_sctp = "lf_sctp"                # SCTP IPv4 protocol
+            lf_sctp6 = "lf_sctp6"              # SCTP IPv6 protocol
+            lf_tcp = "lf_tcp"                  # TCP IPv4 connection
+            lf_tcp6 = "lf_tcp6"                # TCP IPv6 connection
+            lf_udp = "lf_udp"                  # UDP IPv4 connection
+            lf_udp6 = "lf_udp6"                # UDP IPv6 connection
+            mc_udp = "mc_udp"                  # LF Multicast IPv4
+        return AddEndpType
 
     def post_add_endp(self, 
                       alias: str = None,                        # Name of endpoint. [R]
@@ -3468,76 +3735,85 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_file_endp
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddFileEndpFioFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddFileEndpFioFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        AUTO_MOUNT = 0x2                # (2) Attempt to mount with the provided information if not already
-        # +mounted.
-        AUTO_UNMOUNT = 0x4              # (4) Attempt to un-mount when stopping test.
-        CHECK_MOUNT = 0x1               # (1) Attempt to verify NFS and SMB mounts match the configured values.
-        DO_CRC = 0x400                  # calculate 32 bit crc for each read/write
-        O_APPEND = 0x200                # (512) Open files for writing with O_APPEND instead
-        O_DIRECT = 0x8                  # (8) Open file with O_DIRECT flag, disables caching. Must use block-size
-        # +read/write calls.
-        O_LARGEFILE = 0x20              # (32) Open files with O_LARGEFILE. This allows greater than 2GB files on
-        # +32-bit systems.
-        SYNC_AFTER_WRITE = 0x800        # call sync(2) after writing each block
-        SYNC_BEFORE_CLOSE = 0x1000      # call sync(2) before closing the file
-        UNLINK_BW = 0x10                # (16) Unlink file before writing. This works around issues with CIFS for
-        # +some file-servers.
-        UNMOUNT_FORCE = 0x40            # (64) Use -f flag when calling umount
-        UNMOUNT_LAZY = 0x80             # (128) Use -l flag when calling umount
-        USE_FSTATFS = 0x100             # (256) Use fstatfs system call to verify file-system type when opening
-        # +files.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddFileEndpFioFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class AddFileEndpPayloadPattern(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        PRBS_11_8_10 = "PRBS_11_8_10"    # PRBS (see above)
-        PRBS_15_0_14 = "PRBS_15_0_14"    # PRBS (see above)
-        PRBS_4_0_3 = "PRBS_4_0_3"        # Use linear feedback shift register to generate pseudo random sequence.
-        PRBS_7_0_6 = "PRBS_7_0_6"        # PRBS (see above)
-        custom = "custom"                # Enter your own payload with the set_endp_payload cmd.
-        decreasing = "decreasing"        # bytes start at FF and decrease, wrapping if needed.
-        increasing = "increasing"        # bytes start at 00 and increase, wrapping if needed.
-        ones = "ones"                    # Payload is all ones (FF).
-        random = "random"                # generate a new random payload each time sent.
-        random_fixed = "random_fixed"    # Means generate one random payload, and send it over
-        zeros = "zeros"                  # Payload is all zeros (00).
-
-    class AddFileEndpType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        fe_cifs = "fe_cifs"              # Does a CIFS (Samba) mount
-        fe_cifs_ip6 = "fe_cifs/ip6"      # Does an IPv6 CIFS mount
-        fe_generic = "fe_generic"        # Uses unspecified file protocol
-        fe_iscsi = "fe_iscsi"            # Does a ISCSI mount
-        fe_nfs = "fe_nfs"                # Does an NFSv3 mount
-        fe_nfs_ip6 = "fe_nfs/ip6"        # Does a NFSv3 IPv6 mount
-        fe_nfs4 = "fe_nfs4"              # Does an NFSv4 mount
-        fe_nfs4_ip6 = "fe_nfs4/ip6"      # Does a NFSv4 IPv6 mount
-        fe_smb2 = "fe_smb2"              # Does a SMB v2.0 mount
-        fe_smb2_ip6 = "fe_smb2/ip6"      # Does a SMB v2.0 IPv6 mount
-        fe_smb21 = "fe_smb21"            # Does a SMB v2.1 mount
-        fe_smb21_ip6 = "fe_smb21/ip6"    # Does a SMB v2.1 IPv6 mount
-        fe_smb30 = "fe_smb30"            # Does a SMB v3.0 mount
-        fe_smb30_ip6 = "fe_smb30/ip6"    # Does a SMB v3.0 IPv6 mount
+    @LazyClass
+    def AddFileEndpFioFlags():
+        class AddFileEndpFioFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddFileEndpFioFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            AUTO_MOUNT = 0x2                # (2) Attempt to mount with the provided information if not already
+            # +mounted.
+            AUTO_UNMOUNT = 0x4              # (4) Attempt to un-mount when stopping test.
+            CHECK_MOUNT = 0x1               # (1) Attempt to verify NFS and SMB mounts match the configured values.
+            DO_CRC = 0x400                  # calculate 32 bit crc for each read/write
+            O_APPEND = 0x200                # (512) Open files for writing with O_APPEND instead
+            O_DIRECT = 0x8                  # (8) Open file with O_DIRECT flag, disables caching. Must use block-size
+            # +read/write calls.
+            O_LARGEFILE = 0x20              # (32) Open files with O_LARGEFILE. This allows greater than 2GB files on
+            # +32-bit systems.
+            SYNC_AFTER_WRITE = 0x800        # call sync(2) after writing each block
+            SYNC_BEFORE_CLOSE = 0x1000      # call sync(2) before closing the file
+            UNLINK_BW = 0x10                # (16) Unlink file before writing. This works around issues with CIFS for
+            # +some file-servers.
+            UNMOUNT_FORCE = 0x40            # (64) Use -f flag when calling umount
+            UNMOUNT_LAZY = 0x80             # (128) Use -l flag when calling umount
+            USE_FSTATFS = 0x100             # (256) Use fstatfs system call to verify file-system type when opening
+            # +files.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddFileEndpFioFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddFileEndpFioFlags
+
+    @LazyClass
+    def AddFileEndpPayloadPattern():
+        class AddFileEndpPayloadPattern(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            PRBS_11_8_10 = "PRBS_11_8_10"    # PRBS (see above)
+            PRBS_15_0_14 = "PRBS_15_0_14"    # PRBS (see above)
+            PRBS_4_0_3 = "PRBS_4_0_3"        # Use linear feedback shift register to generate pseudo random sequence.
+            PRBS_7_0_6 = "PRBS_7_0_6"        # PRBS (see above)
+            custom = "custom"                # Enter your own payload with the set_endp_payload cmd.
+            decreasing = "decreasing"        # bytes start at FF and decrease, wrapping if needed.
+            increasing = "increasing"        # bytes start at 00 and increase, wrapping if needed.
+            ones = "ones"                    # Payload is all ones (FF).
+            random = "random"                # generate a new random payload each time sent.
+            random_fixed = "random_fixed"    # Means generate one random payload, and send it over
+            zeros = "zeros"                  # Payload is all zeros (00).
+        return AddFileEndpPayloadPattern
+
+    @LazyClass
+    def AddFileEndpType():
+        class AddFileEndpType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            fe_cifs = "fe_cifs"              # Does a CIFS (Samba) mount
+            fe_cifs_ip6 = "fe_cifs/ip6"      # Does an IPv6 CIFS mount
+            fe_generic = "fe_generic"        # Uses unspecified file protocol
+            fe_iscsi = "fe_iscsi"            # Does a ISCSI mount
+            fe_nfs = "fe_nfs"                # Does an NFSv3 mount
+            fe_nfs_ip6 = "fe_nfs/ip6"        # Does a NFSv3 IPv6 mount
+            fe_nfs4 = "fe_nfs4"              # Does an NFSv4 mount
+            fe_nfs4_ip6 = "fe_nfs4/ip6"      # Does a NFSv4 IPv6 mount
+            fe_smb2 = "fe_smb2"              # Does a SMB v2.0 mount
+            fe_smb2_ip6 = "fe_smb2/ip6"      # Does a SMB v2.0 IPv6 mount
+            fe_smb21 = "fe_smb21"            # Does a SMB v2.1 mount
+            fe_smb21_ip6 = "fe_smb21/ip6"    # Does a SMB v2.1 IPv6 mount
+            fe_smb30 = "fe_smb30"            # Does a SMB v3.0 mount
+            fe_smb30_ip6 = "fe_smb30/ip6"    # Does a SMB v3.0 IPv6 mount
+        return AddFileEndpType
 
     def post_add_file_endp(self, 
                            alias: str = None,                        # Name of endpoint. [R]
@@ -3804,24 +4080,27 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_group
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddGroupFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddGroupFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        group_total_rates = 0x4      # Set rates as total for group.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddGroupFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddGroupFlags():
+        class AddGroupFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddGroupFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            group_total_rates = 0x4      # Set rates as total for group.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddGroupFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddGroupFlags
 
     def post_add_group(self, 
                        flags: str = None,                        # Flags for this group, see above.
@@ -3879,81 +4158,90 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_l4_endp
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddL4EndpHttpAuthType(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddL4EndpHttpAuthType, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        BASIC = 0x1             # Basic authentication
-        DIGEST = 0x2            # Digest (MD5) authentication
-        GSSNEGOTIATE = 0x4      # GSS authentication
-        NTLM = 0x8              # NTLM authentication
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddL4EndpHttpAuthType has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class AddL4EndpProxyAuthType(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddL4EndpProxyAuthType, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        BASIC = 0x1                            # 1 Basic authentication
-        BIND_DNS = 0x200                       # 512 Make DNS requests go out endpoints Port.
-        DIGEST = 0x2                           # 2 Digest (MD5) authentication
-        DISABLE_EPSV = 0x1000                  # 4096 Disable FTP EPSV option
-        DISABLE_PASV = 0x800                   # 2048 Disable FTP PASV option (will use PORT command)
-        GSSNEGOTIATE = 0x4                     # 4 GSS authentication
-        HTTP3_ONLY = 0x20000                   # HTTP3 (aka QUIC) support. Requires https URL.
-        INCLUDE_HEADERS = 0x100                # 256 especially for IMAP
-        LF_L4_REAL_BROWSER_TEST = 0x2000       # 8192 Enable Real Browser Test
-        LF_L4_VIDEO_STREAM_TEST = 0x10000      # 65536 Enable Video Stream Test
-        MEDIA_PLAYBACKS_RANDOM = 0x4000        # Select random playback between 0 and media_playbacks
-        MEDIA_SEEKS_RANDOM = 0x8000            # Select random media seek count between 0 and media_random_seeks
-        NTLM = 0x8                             # 8 NTLM authentication
-        USE_DEFLATE_COMPRESSION = 0x80         # 128 Use deflate compression
-        USE_GZIP_COMPRESSION = 0x40            # 64 Use gzip compression
-        USE_IPV6 = 0x400                       # 1024 Resolve URL is IPv6. Will use IPv4 if not selected.
-        USE_PROXY_CACHE = 0x20                 # 32 Use proxy cache
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddL4EndpProxyAuthType has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class AddL4EndpType(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddL4EndpType, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        l4_generic = 0x0      # Layer 4 type
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddL4EndpType has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddL4EndpHttpAuthType():
+        class AddL4EndpHttpAuthType(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddL4EndpHttpAuthType, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            BASIC = 0x1             # Basic authentication
+            DIGEST = 0x2            # Digest (MD5) authentication
+            GSSNEGOTIATE = 0x4      # GSS authentication
+            NTLM = 0x8              # NTLM authentication
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddL4EndpHttpAuthType has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddL4EndpHttpAuthType
+
+    @LazyClass
+    def AddL4EndpProxyAuthType():
+        class AddL4EndpProxyAuthType(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddL4EndpProxyAuthType, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            BASIC = 0x1                            # 1 Basic authentication
+            BIND_DNS = 0x200                       # 512 Make DNS requests go out endpoints Port.
+            DIGEST = 0x2                           # 2 Digest (MD5) authentication
+            DISABLE_EPSV = 0x1000                  # 4096 Disable FTP EPSV option
+            DISABLE_PASV = 0x800                   # 2048 Disable FTP PASV option (will use PORT command)
+            GSSNEGOTIATE = 0x4                     # 4 GSS authentication
+            HTTP3_ONLY = 0x20000                   # HTTP3 (aka QUIC) support. Requires https URL.
+            INCLUDE_HEADERS = 0x100                # 256 especially for IMAP
+            LF_L4_REAL_BROWSER_TEST = 0x2000       # 8192 Enable Real Browser Test
+            LF_L4_VIDEO_STREAM_TEST = 0x10000      # 65536 Enable Video Stream Test
+            MEDIA_PLAYBACKS_RANDOM = 0x4000        # Select random playback between 0 and media_playbacks
+            MEDIA_SEEKS_RANDOM = 0x8000            # Select random media seek count between 0 and media_random_seeks
+            NTLM = 0x8                             # 8 NTLM authentication
+            USE_DEFLATE_COMPRESSION = 0x80         # 128 Use deflate compression
+            USE_GZIP_COMPRESSION = 0x40            # 64 Use gzip compression
+            USE_IPV6 = 0x400                       # 1024 Resolve URL is IPv6. Will use IPv4 if not selected.
+            USE_PROXY_CACHE = 0x20                 # 32 Use proxy cache
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddL4EndpProxyAuthType has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddL4EndpProxyAuthType
+
+    @LazyClass
+    def AddL4EndpType():
+        class AddL4EndpType(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddL4EndpType, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            l4_generic = 0x0      # Layer 4 type
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddL4EndpType has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddL4EndpType
 
     def post_add_l4_endp(self, 
                          alias: str = None,                        # Name of endpoint. [R]
@@ -4092,27 +4380,30 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_monitor
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddMonitorFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddMonitorFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        be320_enable = 0x4000000000000         # Enable 320Mhz mode.
-        disable_ht40 = 0x800                   # Disable HT-40 even if hardware and AP support it.
-        disable_ht80 = 0x8000000               # Disable HT80 (for AC chipset NICs only)
-        ht160_enable = 0x100000000             # Enable HT160 mode.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddMonitorFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddMonitorFlags():
+        class AddMonitorFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddMonitorFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            be320_enable = 0x4000000000000         # Enable 320Mhz mode.
+            disable_ht40 = 0x800                   # Disable HT-40 even if hardware and AP support it.
+            disable_ht80 = 0x8000000               # Disable HT80 (for AC chipset NICs only)
+            ht160_enable = 0x100000000             # Enable HT160 mode.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddMonitorFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddMonitorFlags
 
     def post_add_monitor(self, 
                          aid: str = None,                          # AID, may be used when sniffing on /AX radios.
@@ -4400,81 +4691,87 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_profile
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddProfileProfileFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddProfileProfileFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        p_11r = 0x40                        # Use 802.11r roaming setup.
-        ADMIN_UP = 0x4000                   # Request stations be created admin-up.
-        ALLOW_11W = 0x800                   # Set 11w (MFP/PMF) to optional.
-        BSS_TRANS = 0x400                   # Enable BSS Transition logic
-        DHCP_SERVER = 0x1                   # This should provide DHCP server.
-        DISABLE_MLO = 0x8000                # Sta created w/out MLO enabled.
-        EAP_PEAP = 0x200                    # Enable EAP-PEAP
-        EAP_TTLS = 0x80                     # Use 802.1x EAP-TTLS
-        ENABLE_POWERSAVE = 0x1000           # Enable power-save when creating stations.
-        NAT = 0x100                         # Enable NAT if this object is in a virtual router
-        RRM_IGNORE_BEACON_REQ = 0x2000      # Request station ignore RRM beacon measurement request.
-        SKIP_DHCP_ROAM = 0x10               # Ask station to not re-do DHCP on roam.
-        SPATIAL_REUSE = 0x10000             # VAP with spatial-reuse enabled (wifi-7 only).
-        WEP = 0x2                           # Use WEP encryption
-        WPA = 0x4                           # Use WPA encryption
-        WPA2 = 0x8                          # Use WPA2 encryption
-        WPA3 = 0x20                         # Use WPA3 encryption
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddProfileProfileFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class AddProfileWifiMode(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        p_802_11a = "802.11a"        # 802.11a
-        AUTO = "AUTO"                # Best Available
-        a7 = "a7"                    # 802.11a-BE (a-EHT: 6E disables /n and /ac)
-        aAX = "aAX"                  # 802.11a-AX (6E disables /n and /ac)
-        abg = "abg"                  # 802.11abg
-        abgn = "abgn"                # 802.11abgn
-        abgn7 = "abgn7"              # 802.11abgn-BE (abgn-EHT)
-        abgnAC = "abgnAC"            # 802.11abgn-AC
-        abgnAX = "abgnAX"            # 802.11abgn-AX
-        an = "an"                    # 802.11an
-        an7 = "an7"                  # 802.11an-BE (an-EHT)
-        anAC = "anAC"                # 802.11an-AC
-        anAX = "anAX"                # 802.11an-AX
-        as_is = "as_is"              # Make no changes to current configuration
-        b = "b"                      # 802.11b
-        bg = "bg"                    # 802.11bg
-        bgn = "bgn"                  # 802.11bgn
-        bgn7 = "bgn7"                # 802.11bgn-BE (bgn-EHT)
-        bgnAC = "bgnAC"              # 802.11bgn-AC
-        bgnAX = "bgnAX"              # 802.11bgn-AX
-        bond = "bond"                # Bonded pair of Ethernet ports.
-        bridged_ap = "bridged_ap"    # AP device in bridged mode. The EIDs may specify radio and bridged port.
-        client = "client"            # Client-side non-WiFi device (Ethernet port, for instance).
-        g = "g"                      # 802.11g
-        mobile_sta = "mobile_sta"    # Mobile station device. Expects to connect to DUT AP(s) and upstream
-        # +LANforge.
-        monitor = "monitor"          # Monitor device/sniffer. The EIDs may specify which radios to use.
-        peer = "peer"                # Edge device, client or server (Ethernet port, for instance).
-        rdd = "rdd"                  # Pair of redirect devices, typically associated with VR to act as traffic
-        # +endpoint
-        routed_ap = "routed_ap"      # AP in routed mode. The EIDs may specify radio and upstream port.
-        sta = "sta"                  # Station device, most likely non mobile. The EIDs may specify radio(s) to
-        # +use.
-        uplink = "uplink"            # Uplink towards rest of network (can go in virtual router and do NAT)
-        upstream = "upstream"        # Upstream server device. The EIDs may specify which ports to use.
-        vlan = "vlan"                # 802.1q VLAN. Specify VID with the 'freq' option.
+    @LazyClass
+    def AddProfileProfileFlags():
+        class AddProfileProfileFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddProfileProfileFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            p_11r = 0x40                        # Use 802.11r roaming setup.
+            ADMIN_UP = 0x4000                   # Request stations be created admin-up.
+            ALLOW_11W = 0x800                   # Set 11w (MFP/PMF) to optional.
+            BSS_TRANS = 0x400                   # Enable BSS Transition logic
+            DHCP_SERVER = 0x1                   # This should provide DHCP server.
+            DISABLE_MLO = 0x8000                # Sta created w/out MLO enabled.
+            EAP_PEAP = 0x200                    # Enable EAP-PEAP
+            EAP_TTLS = 0x80                     # Use 802.1x EAP-TTLS
+            ENABLE_POWERSAVE = 0x1000           # Enable power-save when creating stations.
+            NAT = 0x100                         # Enable NAT if this object is in a virtual router
+            RRM_IGNORE_BEACON_REQ = 0x2000      # Request station ignore RRM beacon measurement request.
+            SKIP_DHCP_ROAM = 0x10               # Ask station to not re-do DHCP on roam.
+            SPATIAL_REUSE = 0x10000             # VAP with spatial-reuse enabled (wifi-7 only).
+            WEP = 0x2                           # Use WEP encryption
+            WPA = 0x4                           # Use WPA encryption
+            WPA2 = 0x8                          # Use WPA2 encryption
+            WPA3 = 0x20                         # Use WPA3 encryption
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddProfileProfileFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddProfileProfileFlags
+
+    @LazyClass
+    def AddProfileWifiMode():
+        class AddProfileWifiMode(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            p_802_11a = "802.11a"        # 802.11a
+            AUTO = "AUTO"                # Best Available
+            a7 = "a7"                    # 802.11a-BE (a-EHT: 6E disables /n and /ac)
+            aAX = "aAX"                  # 802.11a-AX (6E disables /n and /ac)
+            abg = "abg"                  # 802.11abg
+            abgn = "abgn"                # 802.11abgn
+            abgn7 = "abgn7"              # 802.11abgn-BE (abgn-EHT)
+            abgnAC = "abgnAC"            # 802.11abgn-AC
+            abgnAX = "abgnAX"            # 802.11abgn-AX
+            an = "an"                    # 802.11an
+            an7 = "an7"                  # 802.11an-BE (an-EHT)
+            anAC = "anAC"                # 802.11an-AC
+            anAX = "anAX"                # 802.11an-AX
+            as_is = "as_is"              # Make no changes to current configuration
+            b = "b"                      # 802.11b
+            bg = "bg"                    # 802.11bg
+            bgn = "bgn"                  # 802.11bgn
+            bgn7 = "bgn7"                # 802.11bgn-BE (bgn-EHT)
+            bgnAC = "bgnAC"              # 802.11bgn-AC
+            bgnAX = "bgnAX"              # 802.11bgn-AX
+            bond = "bond"                # Bonded pair of Ethernet ports.
+            bridged_ap = "bridged_ap"    # AP device in bridged mode. The EIDs may specify radio and bridged port.
+            client = "client"            # Client-side non-WiFi device (Ethernet port, for instance).
+            g = "g"                      # 802.11g
+            mobile_sta = "mobile_sta"    # Mobile station device. Expects to connect to DUT AP(s) and upstream
+            # +LANforge.
+            monitor = "monitor"          # Monitor device/sniffer. The EIDs may specify which radios to use.
+            peer = "peer"                # Edge device, client or server (Ethernet port, for instance).
+            rdd = "rdd"                  # Pair of redirect devices, typically associated with VR to act as traffic
+            # +endpoint
+            routed_ap = "routed_ap"      # AP in routed mode. The EIDs may specify radio and upstream port.
+            sta = "sta"                  # Station device, most likely non mobile. The EIDs may specify radio(s) to
+            # +use.
+            uplink = "uplink"            # Uplink towards rest of network (can go in virtual router and do NAT)
+            upstream = "upstream"        # Upstream server device. The EIDs may specify which ports to use.
+            vlan = "vlan"                # 802.1q VLAN. Specify VID with the 'freq' option.
+        return AddProfileWifiMode
 
     def post_add_profile(self, 
                          alias_prefix: str = None,                 # Port alias prefix, aka hostname prefix.
@@ -4755,112 +5052,121 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_sta
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddStaFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddStaFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        p_80211r_pmska_cache = 0x4000000               # Enable oportunistic PMSKA caching for WPA2 (Related to
-        # +802.11r).
-        p_80211u_additional = 0x100000                 # AP requires additional step for access (802.11u
-        # +Interworking)
-        p_80211u_auto = 0x40000                        # Enable 802.11u (Interworking) Auto-internetworking
-        # +feature. Always enabled currently.
-        p_80211u_e911 = 0x200000                       # AP claims emergency services reachable (802.11u
-        # +Interworking)
-        p_80211u_e911_unauth = 0x400000                # AP provides Unauthenticated emergency services (802.11u
-        # +Interworking)
-        p_80211u_enable = 0x20000                      # Enable 802.11u (Interworking) feature.
-        p_80211u_gw = 0x80000                          # AP Provides access to internet (802.11u Interworking)
-        p_8021x_radius = 0x2000000                     # Use 802.1x (RADIUS for AP).
-        be320_enable = 0x4000000000000                 # Enable 320Mhz mode.
-        create_admin_down = 0x1000000000               # Station should be created admin-down.
-        custom_conf = 0x20                             # Use Custom wpa_supplicant config file.
-        disable_mlo = 0x8000000000000                  # Disable OFDMA
-        disable_obss_scan = 0x400000000000             # Disable OBSS SCAN feature in supplicant.
-        disable_ofdma = 0x200000000000                 # Disable OFDMA mode
-        disable_twt = 0x100000000000                   # Disable TWT mode
-        disable_fast_reauth = 0x200000000              # Disable fast_reauth option for virtual stations.
-        disable_gdaf = 0x1000000                       # AP: Disable DGAF (used by HotSpot 2.0).
-        disable_ht80 = 0x8000000                       # Disable HT80 (for AC chipset NICs only)
-        disable_roam = 0x80000000                      # Disable automatic station roaming based on scan results.
-        disable_sgi = 0x4000                           # Disable SGI (Short Guard Interval).
-        ft_roam_over_ds = 0x800000000000               # Roam over DS when AP supports it.
-        hs20_enable = 0x800000                         # Enable Hotspot 2.0 (HS20) feature. Requires WPA-2.
-        ht160_enable = 0x100000000                     # Enable HT160 mode.
-        ht40_disable = 0x800                           # Disable HT-40 even if hardware and AP support it.
-        ibss_mode = 0x20000000                         # Station should be in IBSS mode.
-        ignore_edca = 0x20000000000000                 # Request station to ignore EDCA settings
-        lf_sta_migrate = 0x8000                        # OK-To-Migrate (Allow station migration between LANforge
-        # +radios)
-        mesh_mode = 0x400000000                        # Station should be in MESH mode.
-        no_supp_op_class_ie = 0x4000000000             # Do not include supported-oper-class-IE in assoc
-        # +requests. May work around AP bugs.
-        osen_enable = 0x40000000                       # Enable OSEN protocol (OSU Server-only Authentication)
-        passive_scan = 0x2000                          # Use passive scanning (don't send probe requests).
-        power_save_enable = 0x800000000                # Station should enable power-save. May not work in all
-        # +drivers/configurations.
-        rrm_ignore_beacon_req = 0x1000000000000        # Ignore (reject) RRM Beacon measurement request.
-        scan_ssid = 0x1000                             # Enable SCAN-SSID flag in wpa_supplicant.
-        txo_enable = 0x8000000000                      # Enable/disable tx-offloads, typically managed by
-        # +set_wifi_txo command
-        use_bss_transition = 0x80000000000             # Enable BSS transition.
-        use_owe = 0x2000000000000                      # Enable OWE
-        use_wpa3 = 0x10000000000                       # Enable WPA-3 (SAE Personal) mode.
-        verbose = 0x10000                              # Verbose-Debug: Increase debug info in wpa-supplicant and
-        # +hostapd logs.
-        wds_mode = 0x2000000000                        # WDS station (sort of like a lame mesh), not supported on
-        # +ath10k
-        wep_enable = 0x200                             # Use wpa_supplicant configured for WEP encryption.
-        wpa2_enable = 0x400                            # Use wpa_supplicant configured for WPA2 encryption.
-        wpa_enable = 0x10                              # Enable WPA
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddStaFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class AddStaMode(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        p_802_11a = 1      # 802.11a
-        AUTO = 0           # 802.11g
-        a7 = 19            # 802.11a-EHT (6E disables /n and /ac)
-        aAX = 15           # 802.11a-AX (6E disables /n and /ac)
-        abg = 4            # 802.11abg
-        abgn = 5           # 802.11abgn
-        abgn7 = 16         # 802.11abgn-EHT
-        abgnAC = 8         # 802.11abgn-AC
-        abgnAX = 12        # 802.11abgn-AX
-        an = 10            # 802.11an
-        an7 = 18           # 802.11an-EHT
-        anAC = 9           # 802.11an-AC
-        anAX = 14          # 802.11an-AX
-        b = 2              # 802.11b
-        bg = 7             # 802.11bg
-        bgn = 6            # 802.11bgn
-        bgn7 = 17          # 802.11bgn-EHT
-        bgnAC = 11         # 802.11bgn-AC
-        bgnAX = 13         # 802.11bgn-AX
-        g = 3              # 802.11g
-
-    class AddStaRate(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        p_a_g = "/a/g"            # 6 Mbps, 9 Mbps, 12 Mbps, 18 Mbps, 24 Mbps, 36 Mbps, 48 Mbps, 54 Mbps
-        p_b = "/b"                # 1Mbps, 2Mbps, 5.5 Mbps, 11 Mbps
-        DEFAULT = "DEFAULT"       # Use maximum available speed
-        MCS0_76 = "MCS0-76"       # /n rates
-        p_bitmap_ = "[bitmap]"    # <b>'0xff 00 ...'</b> to directly specify the MCS bitmap.
+    @LazyClass
+    def AddStaFlags():
+        class AddStaFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddStaFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            p_80211r_pmska_cache = 0x4000000               # Enable oportunistic PMSKA caching for WPA2 (Related to
+            # +802.11r).
+            p_80211u_additional = 0x100000                 # AP requires additional step for access (802.11u
+            # +Interworking)
+            p_80211u_auto = 0x40000                        # Enable 802.11u (Interworking) Auto-internetworking
+            # +feature. Always enabled currently.
+            p_80211u_e911 = 0x200000                       # AP claims emergency services reachable (802.11u
+            # +Interworking)
+            p_80211u_e911_unauth = 0x400000                # AP provides Unauthenticated emergency services (802.11u
+            # +Interworking)
+            p_80211u_enable = 0x20000                      # Enable 802.11u (Interworking) feature.
+            p_80211u_gw = 0x80000                          # AP Provides access to internet (802.11u Interworking)
+            p_8021x_radius = 0x2000000                     # Use 802.1x (RADIUS for AP).
+            be320_enable = 0x4000000000000                 # Enable 320Mhz mode.
+            create_admin_down = 0x1000000000               # Station should be created admin-down.
+            custom_conf = 0x20                             # Use Custom wpa_supplicant config file.
+            disable_mlo = 0x8000000000000                  # Disable OFDMA
+            disable_obss_scan = 0x400000000000             # Disable OBSS SCAN feature in supplicant.
+            disable_ofdma = 0x200000000000                 # Disable OFDMA mode
+            disable_twt = 0x100000000000                   # Disable TWT mode
+            disable_fast_reauth = 0x200000000              # Disable fast_reauth option for virtual stations.
+            disable_gdaf = 0x1000000                       # AP: Disable DGAF (used by HotSpot 2.0).
+            disable_ht80 = 0x8000000                       # Disable HT80 (for AC chipset NICs only)
+            disable_roam = 0x80000000                      # Disable automatic station roaming based on scan results.
+            disable_sgi = 0x4000                           # Disable SGI (Short Guard Interval).
+            ft_roam_over_ds = 0x800000000000               # Roam over DS when AP supports it.
+            hs20_enable = 0x800000                         # Enable Hotspot 2.0 (HS20) feature. Requires WPA-2.
+            ht160_enable = 0x100000000                     # Enable HT160 mode.
+            ht40_disable = 0x800                           # Disable HT-40 even if hardware and AP support it.
+            ibss_mode = 0x20000000                         # Station should be in IBSS mode.
+            ignore_edca = 0x20000000000000                 # Request station to ignore EDCA settings
+            lf_sta_migrate = 0x8000                        # OK-To-Migrate (Allow station migration between LANforge
+            # +radios)
+            mesh_mode = 0x400000000                        # Station should be in MESH mode.
+            no_supp_op_class_ie = 0x4000000000             # Do not include supported-oper-class-IE in assoc
+            # +requests. May work around AP bugs.
+            osen_enable = 0x40000000                       # Enable OSEN protocol (OSU Server-only Authentication)
+            passive_scan = 0x2000                          # Use passive scanning (don't send probe requests).
+            power_save_enable = 0x800000000                # Station should enable power-save. May not work in all
+            # +drivers/configurations.
+            rrm_ignore_beacon_req = 0x1000000000000        # Ignore (reject) RRM Beacon measurement request.
+            scan_ssid = 0x1000                             # Enable SCAN-SSID flag in wpa_supplicant.
+            txo_enable = 0x8000000000                      # Enable/disable tx-offloads, typically managed by
+            # +set_wifi_txo command
+            use_bss_transition = 0x80000000000             # Enable BSS transition.
+            use_owe = 0x2000000000000                      # Enable OWE
+            use_wpa3 = 0x10000000000                       # Enable WPA-3 (SAE Personal) mode.
+            verbose = 0x10000                              # Verbose-Debug: Increase debug info in wpa-supplicant and
+            # +hostapd logs.
+            wds_mode = 0x2000000000                        # WDS station (sort of like a lame mesh), not supported on
+            # +ath10k
+            wep_enable = 0x200                             # Use wpa_supplicant configured for WEP encryption.
+            wpa2_enable = 0x400                            # Use wpa_supplicant configured for WPA2 encryption.
+            wpa_enable = 0x10                              # Enable WPA
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddStaFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddStaFlags
+
+    @LazyClass
+    def AddStaMode():
+        class AddStaMode(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            p_802_11a = 1      # 802.11a
+            AUTO = 0           # 802.11g
+            a7 = 19            # 802.11a-EHT (6E disables /n and /ac)
+            aAX = 15           # 802.11a-AX (6E disables /n and /ac)
+            abg = 4            # 802.11abg
+            abgn = 5           # 802.11abgn
+            abgn7 = 16         # 802.11abgn-EHT
+            abgnAC = 8         # 802.11abgn-AC
+            abgnAX = 12        # 802.11abgn-AX
+            an = 10            # 802.11an
+            an7 = 18           # 802.11an-EHT
+            anAC = 9           # 802.11an-AC
+            anAX = 14          # 802.11an-AX
+            b = 2              # 802.11b
+            bg = 7             # 802.11bg
+            bgn = 6            # 802.11bgn
+            bgn7 = 17          # 802.11bgn-EHT
+            bgnAC = 11         # 802.11bgn-AC
+            bgnAX = 13         # 802.11bgn-AX
+            g = 3              # 802.11g
+        return AddStaMode
+
+    @LazyClass
+    def AddStaRate():
+        class AddStaRate(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            p_a_g = "/a/g"            # 6 Mbps, 9 Mbps, 12 Mbps, 18 Mbps, 24 Mbps, 36 Mbps, 48 Mbps, 54 Mbps
+            p_b = "/b"                # 1Mbps, 2Mbps, 5.5 Mbps, 11 Mbps
+            DEFAULT = "DEFAULT"       # Use maximum available speed
+            MCS0_76 = "MCS0-76"       # /n rates
+            p_bitmap_ = "[bitmap]"    # <b>'0xff 00 ...'</b> to directly specify the MCS bitmap.
+        return AddStaRate
 
     def post_add_sta(self, 
                      ampdu_density: str = None,                # 0-7, or 0xFF to not set.
@@ -5005,27 +5311,33 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_t1_span
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddT1SpanBuildout(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        p_15db = 6        # -15db (CSU)
-        p_22_5db = 7      # -22.5db (CSU)
-        p_7_5db = 5       # -7.5db (CSU)
-        p_0db = 8         # 0db (CSU)
-        p_133_ft = 0      # 1-133 feet
-        p_266_ft = 1      # 122-266 feet
-        p_399_ft = 2      # 266-399 feet
-        p_533_ft = 3      # 399-533 feet
-        p_655_ft = 4      # 533-655 feet
-
-    class AddT1SpanType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        Digium_T1 = "Digium_T1"      #
-        Sangoma_E1 = "Sangoma_E1"    #
-        Sangoma_T1 = "Sangoma_T1"    #
+    @LazyClass
+    def AddT1SpanBuildout():
+        class AddT1SpanBuildout(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            p_15db = 6        # -15db (CSU)
+            p_22_5db = 7      # -22.5db (CSU)
+            p_7_5db = 5       # -7.5db (CSU)
+            p_0db = 8         # 0db (CSU)
+            p_133_ft = 0      # 1-133 feet
+            p_266_ft = 1      # 122-266 feet
+            p_399_ft = 2      # 266-399 feet
+            p_533_ft = 3      # 399-533 feet
+            p_655_ft = 4      # 533-655 feet
+        return AddT1SpanBuildout
+
+    @LazyClass
+    def AddT1SpanType():
+        class AddT1SpanType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            Digium_T1 = "Digium_T1"      #
+            Sangoma_E1 = "Sangoma_E1"    #
+            Sangoma_T1 = "Sangoma_T1"    #
+        return AddT1SpanType
 
     def post_add_t1_span(self, 
                          buildout: str = None,                     # Buildout, Integer, see above.
@@ -5228,26 +5540,32 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_threshold
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddThresholdThreshId(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        Delete_Marked = -3      # Delete any marked.
-        Mark_All = -2           # Mark all
-
-    class AddThresholdThreshType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        NO_RX_SINCE = 6              # Have not received any bytes/packets in specified time.
-        RX_BPS_RATE_OOR_1m = 5       # rx-bps over last 1 minute is out of range.
-        RX_BPS_RATE_OOR_30S = 3      # rx-bps over last 30 seconds is out of range.
-        RX_BPS_RATE_OOR_3S = 1       # rx-bps over last 3 seconds is out of range.
-        TT_RX_DROP_OOR = 8           # RX Drop percentage is out of range (per-million).
-        TT_RX_LAT_OOR = 7            # Latency running-average out of range.
-        TX_BPS_RATE_OOR_1m = 4       # tx-bps over last 1 minute is out of range.
-        TX_BPS_RATE_OOR_30S = 2      # tx-bps over last 30 seconds is out of range.
-        TX_BPS_RATE_OOR_3S = 0       # tx-bps over last 3 seconds is out of range.
+    @LazyClass
+    def AddThresholdThreshId():
+        class AddThresholdThreshId(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            Delete_Marked = -3      # Delete any marked.
+            Mark_All = -2           # Mark all
+        return AddThresholdThreshId
+
+    @LazyClass
+    def AddThresholdThreshType():
+        class AddThresholdThreshType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            NO_RX_SINCE = 6              # Have not received any bytes/packets in specified time.
+            RX_BPS_RATE_OOR_1m = 5       # rx-bps over last 1 minute is out of range.
+            RX_BPS_RATE_OOR_30S = 3      # rx-bps over last 30 seconds is out of range.
+            RX_BPS_RATE_OOR_3S = 1       # rx-bps over last 3 seconds is out of range.
+            TT_RX_DROP_OOR = 8           # RX Drop percentage is out of range (per-million).
+            TT_RX_LAT_OOR = 7            # Latency running-average out of range.
+            TX_BPS_RATE_OOR_1m = 4       # tx-bps over last 1 minute is out of range.
+            TX_BPS_RATE_OOR_30S = 2      # tx-bps over last 30 seconds is out of range.
+            TX_BPS_RATE_OOR_3S = 0       # tx-bps over last 3 seconds is out of range.
+        return AddThresholdThreshType
 
     def post_add_threshold(self, 
                            endp: str = None,                         # Endpoint name or ID. [R]
@@ -5358,38 +5676,44 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_traffic_profile
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddTrafficProfileTrafficProfileFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddTrafficProfileTrafficProfileFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        BI_DIRECTIONAL = 0x2      # Should we do bi-directional traffic?
-        IPERF_UDP = 0x4           # If Iperf, should use UDP. If not set, then will use TCP.
-        UP = 0x1                  # Upload direction (this not set means download)
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddTrafficProfileTrafficProfileFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class AddTrafficProfileWifiMode(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        Iperf3_Client = "Iperf3-Client"    # iperf3 client
-        Iperf3_Server = "Iperf3-Server"    # iperf3 server
-        as_is = "as_is"                    # Make no changes to current configuration
-        http = "http"                      # Not yet implemented
-        https = "https"                    # Not yet implemented
-        tcp = "tcp"                        #
-        udp = "udp"                        #
+    @LazyClass
+    def AddTrafficProfileTrafficProfileFlags():
+        class AddTrafficProfileTrafficProfileFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddTrafficProfileTrafficProfileFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            BI_DIRECTIONAL = 0x2      # Should we do bi-directional traffic?
+            IPERF_UDP = 0x4           # If Iperf, should use UDP. If not set, then will use TCP.
+            UP = 0x1                  # Upload direction (this not set means download)
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddTrafficProfileTrafficProfileFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddTrafficProfileTrafficProfileFlags
+
+    @LazyClass
+    def AddTrafficProfileWifiMode():
+        class AddTrafficProfileWifiMode(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            Iperf3_Client = "Iperf3-Client"    # iperf3 client
+            Iperf3_Server = "Iperf3-Server"    # iperf3 server
+            as_is = "as_is"                    # Make no changes to current configuration
+            http = "http"                      # Not yet implemented
+            https = "https"                    # Not yet implemented
+            tcp = "tcp"                        #
+            udp = "udp"                        #
+        return AddTrafficProfileWifiMode
 
     def post_add_traffic_profile(self, 
                                  instance_count: str = None,               # Number of connections per device
@@ -5525,85 +5849,91 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_vap
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddVapFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddVapFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        p_80211h_enable = 0x10000000              # Enable 802.11h (needed for running on DFS channels) Requires
-        # +802.11d.
-        p_80211r_pmska_cache = 0x4000000          # Enable oportunistic PMSKA caching for WPA2 (Related to
-        # +802.11r).
-        p_80211u_additional = 0x100000            # AP requires additional step for access (802.11u Interworking)
-        p_80211u_auto = 0x40000                   # Enable 802.11u (Interworking) Auto-internetworking feature.
-        # +Always enabled currently.
-        p_80211u_e911 = 0x200000                  # AP claims emergency services reachable (802.11u Interworking)
-        p_80211u_e911_unauth = 0x400000           # AP provides Unauthenticated emergency services (802.11u
-        # +Interworking)
-        p_80211u_enable = 0x20000                 # Enable 802.11u (Interworking) feature.
-        p_80211u_gw = 0x80000                     # AP Provides access to internet (802.11u Interworking)
-        p_8021x_radius = 0x2000000                # Use 802.1x (RADIUS for AP).
-        be320_enable = 0x4000000000000            # Enable 320Mhz mode.
-        create_admin_down = 0x1000000000          # Station should be created admin-down.
-        disable_dgaf = 0x1000000                  # AP Disable DGAF (used by HotSpot 2.0).
-        disable_ht40 = 0x800                      # Disable HT-40 (will use HT-20 if available).
-        disable_ht80 = 0x8000000                  # Disable HT80 (for AC chipset NICs only)
-        enable_80211d = 0x40                      # Enable 802.11D to broadcast country-code &amp; channels in
-        # +VAPs
-        enable_wpa = 0x10                         # Enable WPA
-        hostapd_config = 0x20                     # Use Custom hostapd config file.
-        hs20_enable = 0x800000                    # Enable Hotspot 2.0 (HS20) feature. Requires WPA-2.
-        ht160_enable = 0x100000000                # Enable HT160 mode.
-        mcast_to_ucast = 0x80000000               # Request AP to translate multicats to unicast before sending
-        # +to STAs
-        osen_enable = 0x40000000                  # Enable OSEN protocol (OSU Server-only Authentication)
-        pri_sec_ch_enable = 0x100                 # Enable Primary/Secondary channel switch.
-        short_preamble = 0x80                     # Allow short-preamble
-        use_bss_load = 0x20000000000              # Enable BSS Load IE in Beacons and Probe Responses (.11e).
-        use_bss_transition = 0x80000000000        # Enable BSS transition.
-        use_rrm_report = 0x40000000000            # Enable Radio measurements IE in beacon and probe responses.
-        use_wpa3 = 0x10000000000                  # Enable WPA-3 (SAE Personal) mode.
-        verbose = 0x10000                         # Verbose-Debug: Increase debug info in wpa-supplicant and
-        # +hostapd logs.
-        wep_enable = 0x200                        # Enable WEP Encryption
-        wpa2_enable = 0x400                       # Enable WPA2 Encryption
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddVapFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class AddVapMode(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        p_802_11a = 1      # 802.11a
-        AUTO = 0           # 802.11g
-        a7 = 19            # 802.11a-EHT (6E disables /n and /ac)
-        aAX = 15           # 802.11a-AX (6E disables /n and /ac)
-        abg = 4            # 802.11abg
-        abgn = 5           # 802.11abgn
-        abgn7 = 16         # 802.11abgn-EHT
-        abgnAC = 8         # 802.11abgn-AC
-        abgnAX = 12        # 802.11abgn-AX
-        an = 10            # 802.11an
-        an7 = 18           # 802.11an-EHT
-        anAC = 9           # 802.11an-AC
-        anAX = 14          # 802.11an-AX
-        b = 2              # 802.11b
-        bg = 7             # 802.11bg
-        bgn = 6            # 802.11bgn
-        bgn7 = 17          # 802.11bgn-EHT
-        bgnAC = 11         # 802.11bgn-AC
-        bgnAX = 13         # 802.11bgn-AX
-        g = 3              # 802.11g
+    @LazyClass
+    def AddVapFlags():
+        class AddVapFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddVapFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            p_80211h_enable = 0x10000000              # Enable 802.11h (needed for running on DFS channels) Requires
+            # +802.11d.
+            p_80211r_pmska_cache = 0x4000000          # Enable oportunistic PMSKA caching for WPA2 (Related to
+            # +802.11r).
+            p_80211u_additional = 0x100000            # AP requires additional step for access (802.11u Interworking)
+            p_80211u_auto = 0x40000                   # Enable 802.11u (Interworking) Auto-internetworking feature.
+            # +Always enabled currently.
+            p_80211u_e911 = 0x200000                  # AP claims emergency services reachable (802.11u Interworking)
+            p_80211u_e911_unauth = 0x400000           # AP provides Unauthenticated emergency services (802.11u
+            # +Interworking)
+            p_80211u_enable = 0x20000                 # Enable 802.11u (Interworking) feature.
+            p_80211u_gw = 0x80000                     # AP Provides access to internet (802.11u Interworking)
+            p_8021x_radius = 0x2000000                # Use 802.1x (RADIUS for AP).
+            be320_enable = 0x4000000000000            # Enable 320Mhz mode.
+            create_admin_down = 0x1000000000          # Station should be created admin-down.
+            disable_dgaf = 0x1000000                  # AP Disable DGAF (used by HotSpot 2.0).
+            disable_ht40 = 0x800                      # Disable HT-40 (will use HT-20 if available).
+            disable_ht80 = 0x8000000                  # Disable HT80 (for AC chipset NICs only)
+            enable_80211d = 0x40                      # Enable 802.11D to broadcast country-code &amp; channels in
+            # +VAPs
+            enable_wpa = 0x10                         # Enable WPA
+            hostapd_config = 0x20                     # Use Custom hostapd config file.
+            hs20_enable = 0x800000                    # Enable Hotspot 2.0 (HS20) feature. Requires WPA-2.
+            ht160_enable = 0x100000000                # Enable HT160 mode.
+            mcast_to_ucast = 0x80000000               # Request AP to translate multicats to unicast before sending
+            # +to STAs
+            osen_enable = 0x40000000                  # Enable OSEN protocol (OSU Server-only Authentication)
+            pri_sec_ch_enable = 0x100                 # Enable Primary/Secondary channel switch.
+            short_preamble = 0x80                     # Allow short-preamble
+            use_bss_load = 0x20000000000              # Enable BSS Load IE in Beacons and Probe Responses (.11e).
+            use_bss_transition = 0x80000000000        # Enable BSS transition.
+            use_rrm_report = 0x40000000000            # Enable Radio measurements IE in beacon and probe responses.
+            use_wpa3 = 0x10000000000                  # Enable WPA-3 (SAE Personal) mode.
+            verbose = 0x10000                         # Verbose-Debug: Increase debug info in wpa-supplicant and
+            # +hostapd logs.
+            wep_enable = 0x200                        # Enable WEP Encryption
+            wpa2_enable = 0x400                       # Enable WPA2 Encryption
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddVapFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddVapFlags
+
+    @LazyClass
+    def AddVapMode():
+        class AddVapMode(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            p_802_11a = 1      # 802.11a
+            AUTO = 0           # 802.11g
+            a7 = 19            # 802.11a-EHT (6E disables /n and /ac)
+            aAX = 15           # 802.11a-AX (6E disables /n and /ac)
+            abg = 4            # 802.11abg
+            abgn = 5           # 802.11abgn
+            abgn7 = 16         # 802.11abgn-EHT
+            abgnAC = 8         # 802.11abgn-AC
+            abgnAX = 12        # 802.11abgn-AX
+            an = 10            # 802.11an
+            an7 = 18           # 802.11an-EHT
+            anAC = 9           # 802.11an-AC
+            anAX = 14          # 802.11an-AX
+            b = 2              # 802.11b
+            bg = 7             # 802.11bg
+            bgn = 6            # 802.11bgn
+            bgn7 = 17          # 802.11bgn-EHT
+            bgnAC = 11         # 802.11bgn-AC
+            bgnAX = 13         # 802.11bgn-AX
+            g = 3              # 802.11g
+        return AddVapMode
 
     def post_add_vap(self, 
                      ap_name: str = None,                      # Name for this Virtual AP, for example: vap0
@@ -5735,72 +6065,78 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_venue
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddVenueFreq24(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddVenueFreq24, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        ALL = 0xffff       # ALL
-        Ch_1 = 0x1         # Channel 1
-        Ch_2 = 0x2         # Channel 2
-        Ch_3 = 0x4         # Channel 3
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddVenueFreq24 has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class AddVenueFreq5(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddVenueFreq5, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        Ch_100 = 0x800           # Channel 100 5500
-        Ch_104 = 0x1000          # Channel 104 5520
-        Ch_108 = 0x2000          # Channel 108 5540
-        Ch_112 = 0x4000          # Channel 112 5560
-        Ch_116 = 0x8000          # Channel 116 5580
-        Ch_120 = 0x10000         # Channel 120 5600
-        Ch_124 = 0x20000         # Channel 124 5620
-        Ch_128 = 0x40000         # Channel 128 5640
-        Ch_132 = 0x80000         # Channel 132 5660
-        Ch_136 = 0x100000        # Channel 136 5680
-        Ch_140 = 0x200000        # Channel 140 5700
-        Ch_149 = 0x400000        # Channel 149 5745
-        Ch_153 = 0x800000        # Channel 153 5765
-        Ch_157 = 0x1000000       # Channel 157 5785
-        Ch_161 = 0x2000000       # Channel 161 5805
-        Ch_165 = 0x4000000       # Channel 165 5825
-        Ch_36 = 0x1              # Channel 36 5180
-        Ch_38 = 0x2              # Channel 38 5190
-        Ch_40 = 0x4              # Channel 40 5200
-        Ch_42 = 0x8              # Channel 42 5210
-        Ch_44 = 0x10             # Channel 44 5220
-        Ch_46 = 0x20             # Channel 46 5230
-        Ch_48 = 0x40             # Channel 48 5240
-        Ch_52 = 0x80             # Channel 52 5260
-        Ch_56 = 0x100            # Channel 56 5280
-        Ch_60 = 0x200            # Channel 60 5300
-        Ch_64 = 0x400            # Channel 64 5320
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddVenueFreq5 has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddVenueFreq24():
+        class AddVenueFreq24(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddVenueFreq24, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            ALL = 0xffff       # ALL
+            Ch_1 = 0x1         # Channel 1
+            Ch_2 = 0x2         # Channel 2
+            Ch_3 = 0x4         # Channel 3
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddVenueFreq24 has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddVenueFreq24
+
+    @LazyClass
+    def AddVenueFreq5():
+        class AddVenueFreq5(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddVenueFreq5, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            Ch_100 = 0x800           # Channel 100 5500
+            Ch_104 = 0x1000          # Channel 104 5520
+            Ch_108 = 0x2000          # Channel 108 5540
+            Ch_112 = 0x4000          # Channel 112 5560
+            Ch_116 = 0x8000          # Channel 116 5580
+            Ch_120 = 0x10000         # Channel 120 5600
+            Ch_124 = 0x20000         # Channel 124 5620
+            Ch_128 = 0x40000         # Channel 128 5640
+            Ch_132 = 0x80000         # Channel 132 5660
+            Ch_136 = 0x100000        # Channel 136 5680
+            Ch_140 = 0x200000        # Channel 140 5700
+            Ch_149 = 0x400000        # Channel 149 5745
+            Ch_153 = 0x800000        # Channel 153 5765
+            Ch_157 = 0x1000000       # Channel 157 5785
+            Ch_161 = 0x2000000       # Channel 161 5805
+            Ch_165 = 0x4000000       # Channel 165 5825
+            Ch_36 = 0x1              # Channel 36 5180
+            Ch_38 = 0x2              # Channel 38 5190
+            Ch_40 = 0x4              # Channel 40 5200
+            Ch_42 = 0x8              # Channel 42 5210
+            Ch_44 = 0x10             # Channel 44 5220
+            Ch_46 = 0x20             # Channel 46 5230
+            Ch_48 = 0x40             # Channel 48 5240
+            Ch_52 = 0x80             # Channel 52 5260
+            Ch_56 = 0x100            # Channel 56 5280
+            Ch_60 = 0x200            # Channel 60 5300
+            Ch_64 = 0x400            # Channel 64 5320
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddVenueFreq5 has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddVenueFreq5
 
     def post_add_venue(self, 
                        description: str = None,                  # User-supplied description, ie: <tt>Big City Ball
@@ -6077,36 +6413,39 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_vr
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddVrFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddVrFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        p_4BYTE_AS_NUMBER = 0x40      # Sets corresponding Xorp flag.
-        BGP_CONFED = 0x100            # Configure BGP in a confederation.
-        BGP_DAMPING = 0x200           # Enable BGP damping section in Xorp configuration file.
-        ENABLE_BGP = 0x20             # Set this to zero if you don't want BGP on this VR.
-        RIP_ACCEPT_DR = 0x800         # Tell RIP to accept default-routes.
-        ROUTE_REFLECTOR = 0x80        # Act as BGP Route Reflector.
-        USE_IPV6 = 0x10               # Enable IPv6 OSPF routing for this virtual router.
-        USE_IPV6_RADVD = 0x8          # Enable IPv6 RADV Daemon for interfaces in this virtual router.
-        USE_RIP = 0x400               # Enable RIP routing protocol in Xorp.
-        USE_XORP_MCAST = 0x2          # Enable Xorp Multicast routing (requires OSPF to be enabled currently)
-        USE_XORP_OLSR = 0x1000        # Enable OLSR routing protocol in Xorp.
-        USE_XORP_OSPF = 0x1           # Enable Xorp router daemon with OSPF (IPv4) protocol
-        USE_XORP_SHA = 0x4            # Enable Telcordia's Xorp SHA option (requires OSPF to be enabled)
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddVrFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddVrFlags():
+        class AddVrFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddVrFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            p_4BYTE_AS_NUMBER = 0x40      # Sets corresponding Xorp flag.
+            BGP_CONFED = 0x100            # Configure BGP in a confederation.
+            BGP_DAMPING = 0x200           # Enable BGP damping section in Xorp configuration file.
+            ENABLE_BGP = 0x20             # Set this to zero if you don't want BGP on this VR.
+            RIP_ACCEPT_DR = 0x800         # Tell RIP to accept default-routes.
+            ROUTE_REFLECTOR = 0x80        # Act as BGP Route Reflector.
+            USE_IPV6 = 0x10               # Enable IPv6 OSPF routing for this virtual router.
+            USE_IPV6_RADVD = 0x8          # Enable IPv6 RADV Daemon for interfaces in this virtual router.
+            USE_RIP = 0x400               # Enable RIP routing protocol in Xorp.
+            USE_XORP_MCAST = 0x2          # Enable Xorp Multicast routing (requires OSPF to be enabled currently)
+            USE_XORP_OLSR = 0x1000        # Enable OLSR routing protocol in Xorp.
+            USE_XORP_OSPF = 0x1           # Enable Xorp router daemon with OSPF (IPv4) protocol
+            USE_XORP_SHA = 0x4            # Enable Telcordia's Xorp SHA option (requires OSPF to be enabled)
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddVrFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddVrFlags
 
     def post_add_vr(self, 
                     alias: str = None,                        # Name of virtual router. [R]
@@ -6192,28 +6531,31 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_vr_bgp
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddVrBgpFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddVrBgpFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        p_4BYTE_AS_NUMBER = 0x40      # Sets corresponding Xorp flag.
-        BGP_CONFED = 0x100            # Configure BGP in a confederation.
-        BGP_DAMPING = 0x200           # Enable BGP damping section in Xorp configuration file.
-        ENABLE_BGP = 0x20             # Set this to zero if you don't want BGP on this VR.
-        ROUTE_REFLECTOR = 0x80        # Act as BGP Route Reflector.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddVrBgpFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddVrBgpFlags():
+        class AddVrBgpFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddVrBgpFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            p_4BYTE_AS_NUMBER = 0x40      # Sets corresponding Xorp flag.
+            BGP_CONFED = 0x100            # Configure BGP in a confederation.
+            BGP_DAMPING = 0x200           # Enable BGP damping section in Xorp configuration file.
+            ENABLE_BGP = 0x20             # Set this to zero if you don't want BGP on this VR.
+            ROUTE_REFLECTOR = 0x80        # Act as BGP Route Reflector.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddVrBgpFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddVrBgpFlags
 
     def post_add_vr_bgp(self, 
                         bgp_id: str = None,                       # BGP Identifier: IPv4 Address
@@ -6307,37 +6649,40 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_vrcx
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddVrcxFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(AddVrcxFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        custom_dhcpd = 0x400        # Use custom DHCP config file
-        dhcpd_enabled = 0x200       # Serve IPv4 DHCP on this interface
-        ipv6_enabled = 0x2000       # Serve IPv6 DHCP on this interface
-        nat_enabled = 0x100         # This connection will NAT outgoing packets
-        subnet_0 = 0x1              # Specify subnet 0
-        subnet_1 = 0x2              # Specify subnet 1
-        subnet_2 = 0x4              # Specify subnet 2
-        subnet_3 = 0x8              # Specify subnet 3
-        subnet_4 = 0x10             # Specify subnet 4
-        subnet_5 = 0x20             # Specify subnet 5
-        subnet_6 = 0x40             # Specify subnet 6
-        subnet_7 = 0x80             # Specify subnet 7
-        use_multicast = 0x800       # Use this interface for multicast and-rp
-        use_vrrp = 0x1000           # Use this interface for VRRP
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("AddVrcxFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def AddVrcxFlags():
+        class AddVrcxFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(AddVrcxFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            custom_dhcpd = 0x400        # Use custom DHCP config file
+            dhcpd_enabled = 0x200       # Serve IPv4 DHCP on this interface
+            ipv6_enabled = 0x2000       # Serve IPv6 DHCP on this interface
+            nat_enabled = 0x100         # This connection will NAT outgoing packets
+            subnet_0 = 0x1              # Specify subnet 0
+            subnet_1 = 0x2              # Specify subnet 1
+            subnet_2 = 0x4              # Specify subnet 2
+            subnet_3 = 0x8              # Specify subnet 3
+            subnet_4 = 0x10             # Specify subnet 4
+            subnet_5 = 0x20             # Specify subnet 5
+            subnet_6 = 0x40             # Specify subnet 6
+            subnet_7 = 0x80             # Specify subnet 7
+            use_multicast = 0x800       # Use this interface for multicast and-rp
+            use_vrrp = 0x1000           # Use this interface for VRRP
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("AddVrcxFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return AddVrcxFlags
 
     def post_add_vrcx(self, 
                       dhcp_dns: str = None,                     # IP Address of DNS server.
@@ -6875,11 +7220,14 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#add_wl_endp
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class AddWlEndpWleFlags(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        SHOW_WP = 1      # Show WanPaths in wanlink endpoint table in GUI
+    @LazyClass
+    def AddWlEndpWleFlags():
+        class AddWlEndpWleFlags(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            SHOW_WP = 1      # Show WanPaths in wanlink endpoint table in GUI
+        return AddWlEndpWleFlags
 
     def post_add_wl_endp(self, 
                          alias: str = None,                        # Name of endpoint. [R]
@@ -7135,30 +7483,33 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#c_show_ports
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class CShowPortsProbeFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(CShowPortsProbeFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        BRIDGE = 0x8                 # 8 include bridges
-        EASY_IP_INFO = 0x10          # 16 Everything but gateway information, which is expensive to probe.
-        ETHTOOL = 0x4                # 4 include ethtool results
-        GW = 0x20                    # 32 include gateway information
-        GW_FORCE_REFRESH = 0x40      # 64 Force GW (re)probe. Otherwise, cached values *might* be used.
-        MII = 0x2                    # 2 include MII
-        WIFI = 0x1                   # 1 include wifi stations
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("CShowPortsProbeFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def CShowPortsProbeFlags():
+        class CShowPortsProbeFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(CShowPortsProbeFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            BRIDGE = 0x8                 # 8 include bridges
+            EASY_IP_INFO = 0x10          # 16 Everything but gateway information, which is expensive to probe.
+            ETHTOOL = 0x4                # 4 include ethtool results
+            GW = 0x20                    # 32 include gateway information
+            GW_FORCE_REFRESH = 0x40      # 64 Force GW (re)probe. Otherwise, cached values *might* be used.
+            MII = 0x2                    # 2 include MII
+            WIFI = 0x1                   # 1 include wifi stations
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("CShowPortsProbeFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return CShowPortsProbeFlags
 
     def post_c_show_ports(self, 
                           port: str = None,                         # Port number, or 'all'. [W]
@@ -7315,26 +7666,29 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#clear_cx_counters
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class ClearCxCountersClearFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(ClearCxCountersClearFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        MLO_LINKS_TOO = 0x4      # Clear MLO link counters even if not clearing port counters.
-        PORTS_TOO = 0x1          # Clear port and MLO Link counters this CX uses as well.
-        SEND_EVENT = 0x2         # Send event when clearing counters.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("ClearCxCountersClearFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def ClearCxCountersClearFlags():
+        class ClearCxCountersClearFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(ClearCxCountersClearFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            MLO_LINKS_TOO = 0x4      # Clear MLO link counters even if not clearing port counters.
+            PORTS_TOO = 0x1          # Clear port and MLO Link counters this CX uses as well.
+            SEND_EVENT = 0x2         # Send event when clearing counters.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("ClearCxCountersClearFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return ClearCxCountersClearFlags
 
     def post_clear_cx_counters(self, 
                                clear_flags: str = None,                  # Optional argument to control clear logic.
@@ -7387,26 +7741,29 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#clear_endp_counters
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class ClearEndpCountersClearFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(ClearEndpCountersClearFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        MLO_LINKS_TOO = 0x4      # Clear MLO link counters even if not clearing port counters.
-        PORTS_TOO = 0x1          # Clear this endpoint's port counters as well.
-        SEND_EVENT = 0x2         # Send event when clearing counters.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("ClearEndpCountersClearFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def ClearEndpCountersClearFlags():
+        class ClearEndpCountersClearFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(ClearEndpCountersClearFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            MLO_LINKS_TOO = 0x4      # Clear MLO link counters even if not clearing port counters.
+            PORTS_TOO = 0x1          # Clear this endpoint's port counters as well.
+            SEND_EVENT = 0x2         # Send event when clearing counters.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("ClearEndpCountersClearFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return ClearEndpCountersClearFlags
 
     def post_clear_endp_counters(self, 
                                  clear_flags: str = None,                  # Optional argument to control clear logic.
@@ -7470,12 +7827,15 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#clear_group
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class ClearGroupClearFlags(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        PORTS_TOO = 1       # Clear this endpoint's port counters as well.
-        SEND_EVENT = 2      # Send event when clearing counters.
+    @LazyClass
+    def ClearGroupClearFlags():
+        class ClearGroupClearFlags(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            PORTS_TOO = 1       # Clear this endpoint's port counters as well.
+            SEND_EVENT = 2      # Send event when clearing counters.
+        return ClearGroupClearFlags
 
     def post_clear_group(self, 
                          name: str = None,                         # The name of the connection group. [W]
@@ -7523,14 +7883,17 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#clear_port_counters
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class ClearPortCountersExtra(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        dhcp4_lease = "dhcp4_lease"    # Remove dhcp lease files for IPv4 DHCP
-        dhcp6_lease = "dhcp6_lease"    # Remove dhcp lease files for IPv6 DHCP
-        dhcp_leases = "dhcp_leases"    # Remove dhcp lease files for IPv4 and IPv6 DHCP
-        mlo_links = "mlo_links"        # Clear (just) the MLO link stats.
+    @LazyClass
+    def ClearPortCountersExtra():
+        class ClearPortCountersExtra(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            dhcp4_lease = "dhcp4_lease"    # Remove dhcp lease files for IPv4 DHCP
+            dhcp6_lease = "dhcp6_lease"    # Remove dhcp lease files for IPv6 DHCP
+            dhcp_leases = "dhcp_leases"    # Remove dhcp lease files for IPv4 and IPv6 DHCP
+            mlo_links = "mlo_links"        # Clear (just) the MLO link stats.
+        return ClearPortCountersExtra
 
     def post_clear_port_counters(self, 
                                  extra: str = None,                        # Clear something else instead: dhcp4_lease |
@@ -7812,19 +8175,22 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#diag
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class DiagType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        NA = "NA"                  # everything (default)
-        alerts = "alerts"          # alert messages
-        clients = "clients"        # connected clients
-        counters = "counters"      # endpoint counters
-        endpoints = "endpoints"    # list of endpoints
-        fds = "fds"                # file descriptors
-        iobuffer = "iobuffer"      #
-        license = "license"        # license contents
-        shelf = "shelf"            #
+    @LazyClass
+    def DiagType():
+        class DiagType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            NA = "NA"                  # everything (default)
+            alerts = "alerts"          # alert messages
+            clients = "clients"        # connected clients
+            counters = "counters"      # endpoint counters
+            endpoints = "endpoints"    # list of endpoints
+            fds = "fds"                # file descriptors
+            iobuffer = "iobuffer"      #
+            license = "license"        # license contents
+            shelf = "shelf"            #
+        return DiagType
 
     def post_diag(self, 
                   arg1: str = None,                         # Optional: Endpoint name to diag.
@@ -7980,11 +8346,14 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#file
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class FileFileFlags(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        UNLINK_WHEN_DL_COMPLETE = 1      # Remove the file once it has been downloaded.
+    @LazyClass
+    def FileFileFlags():
+        class FileFileFlags(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            UNLINK_WHEN_DL_COMPLETE = 1      # Remove the file once it has been downloaded.
+        return FileFileFlags
 
     def post_file(self, 
                   card: int = None,                         # Resource ID [W]
@@ -9094,15 +9463,18 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#log_capture
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class LogCaptureType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        adb = "adb"                  #
-        hostapd = "hostapd"          #
-        journalctl = "journalctl"    #
-        lflogs = "lflogs"            #
-        supplicant = "supplicant"    #
+    @LazyClass
+    def LogCaptureType():
+        class LogCaptureType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            adb = "adb"                  #
+            hostapd = "hostapd"          #
+            journalctl = "journalctl"    #
+            lflogs = "lflogs"            #
+            supplicant = "supplicant"    #
+        return LogCaptureType
 
     def post_log_capture(self, 
                          destination: str = None,                  # Where to save the file to on the LANforge resource. If
@@ -9179,40 +9551,43 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#log_level
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class LogLevelLevel(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(LogLevelLevel, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        ALL = 0xffffffff        # Log everything
-        CUST1 = 0x10000         # Cust-1, latency info (65536)
-        DB = 0x80               # Database related logging (128)
-        DBG = 0x20              # debug (32)
-        DBG2 = 0x1000           # very verbose logging (4096)
-        DIS = 0x1               # disasters (1)
-        ERR = 0x2               # errors (2)
-        INF = 0x8               # info (8)
-        LIO = 0x2000            # IO logging (8192)
-        LL_PROF = 0x8000        # Profiling information (32768)
-        OUT1 = 0x4000           # Some std-out logging (16384)
-        PARSE = 0x800           # PARSE specific (2048)
-        SCRIPT = 0x400          # Scripting specific stuff (1024)
-        SEC = 0x40              # log security violations (64)
-        TRC = 0x10              # function trace (16)
-        WRN = 0x4               # warnings (4)
-        XMT = 0x100             # Output going to clients (256)
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("LogLevelLevel has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def LogLevelLevel():
+        class LogLevelLevel(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(LogLevelLevel, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            ALL = 0xffffffff        # Log everything
+            CUST1 = 0x10000         # Cust-1, latency info (65536)
+            DB = 0x80               # Database related logging (128)
+            DBG = 0x20              # debug (32)
+            DBG2 = 0x1000           # very verbose logging (4096)
+            DIS = 0x1               # disasters (1)
+            ERR = 0x2               # errors (2)
+            INF = 0x8               # info (8)
+            LIO = 0x2000            # IO logging (8192)
+            LL_PROF = 0x8000        # Profiling information (32768)
+            OUT1 = 0x4000           # Some std-out logging (16384)
+            PARSE = 0x800           # PARSE specific (2048)
+            SCRIPT = 0x400          # Scripting specific stuff (1024)
+            SEC = 0x40              # log security violations (64)
+            TRC = 0x10              # function trace (16)
+            WRN = 0x4               # warnings (4)
+            XMT = 0x100             # Output going to clients (256)
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("LogLevelLevel has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return LogLevelLevel
 
     def post_log_level(self, 
                        level: str = None,                        # Integer corresponding to the logging flags. [W]
@@ -9600,30 +9975,33 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#nc_show_ports
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class NcShowPortsProbeFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(NcShowPortsProbeFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        BRIDGE = 0x8                 # 8 include bridges
-        EASY_IP_INFO = 0x10          # 16 Everything but gateway information, which is expensive to probe.
-        ETHTOOL = 0x4                # 4 include ethtool results
-        GW = 0x20                    # 32 include gateway information
-        GW_FORCE_REFRESH = 0x40      # 64 Force GW (re)probe. Otherwise, cached values *might* be used.
-        MII = 0x2                    # 2 include MII
-        WIFI = 0x1                   # 1 include wifi stations
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("NcShowPortsProbeFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def NcShowPortsProbeFlags():
+        class NcShowPortsProbeFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(NcShowPortsProbeFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            BRIDGE = 0x8                 # 8 include bridges
+            EASY_IP_INFO = 0x10          # 16 Everything but gateway information, which is expensive to probe.
+            ETHTOOL = 0x4                # 4 include ethtool results
+            GW = 0x20                    # 32 include gateway information
+            GW_FORCE_REFRESH = 0x40      # 64 Force GW (re)probe. Otherwise, cached values *might* be used.
+            MII = 0x2                    # 2 include MII
+            WIFI = 0x1                   # 1 include wifi stations
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("NcShowPortsProbeFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return NcShowPortsProbeFlags
 
     def post_nc_show_ports(self, 
                            port: str = None,                         # Port number, or 'all'. [W]
@@ -10376,13 +10754,16 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#reset_port
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class ResetPortPreIfdown(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        P_IN = "P-IN"      # Only call the portal login (do not reset drivers/supplicant/dhcp)
-        P_OUT = "P-OUT"    # Only call the portal logout (do not reset drivers/supplicant/dhcp)
-        YES = "YES"        # (include logout) Call portal-bot.pl ... <b>--logout</b> before going down.
+    @LazyClass
+    def ResetPortPreIfdown():
+        class ResetPortPreIfdown(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            P_IN = "P-IN"      # Only call the portal login (do not reset drivers/supplicant/dhcp)
+            P_OUT = "P-OUT"    # Only call the portal logout (do not reset drivers/supplicant/dhcp)
+            YES = "YES"        # (include logout) Call portal-bot.pl ... <b>--logout</b> before going down.
+        return ResetPortPreIfdown
 
     def post_reset_port(self, 
                         port: str = None,                         # Port number to reset, or ALL. [W]
@@ -12162,13 +12543,16 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#scan_wifi
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class ScanWifiExtra(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        NA = "NA"                                      # (or left blank) the system does a full scan
-        dump = "dump"                                  # then only cached values are returned
-        trigger_freq__freq_ = "trigger freq [freq]"    # scan exactly those frequencies
+    @LazyClass
+    def ScanWifiExtra():
+        class ScanWifiExtra(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            NA = "NA"                                      # (or left blank) the system does a full scan
+            dump = "dump"                                  # then only cached values are returned
+            trigger_freq__freq_ = "trigger freq [freq]"    # scan exactly those frequencies
+        return ScanWifiExtra
 
     def post_scan_wifi(self, 
                        extra: str = None,                        # Extra arguments to the scan script, see above.
@@ -12232,29 +12616,32 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_arm_info
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetArmInfoArmFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetArmInfoArmFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        random_payload = 0x10000      # Use random payload sizes instead of linear increase
-        rel_tstamp = 0x400            # Use Relative Timestamps. This will increase performance
-        slow_start = 0x2000           # Use slow-start logic. This ramps up
-        udp_checksum = 0x4000         # Use UDP Checksums.
-        use_gw_mac = 0x1000           # Use default gateway's MAC for destination MAC.
-        use_tcp = 0x8000              # Use TCP instead of UDP protocol. (Note this is NOT stateful TCP!)
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetArmInfoArmFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def SetArmInfoArmFlags():
+        class SetArmInfoArmFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetArmInfoArmFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            random_payload = 0x10000      # Use random payload sizes instead of linear increase
+            rel_tstamp = 0x400            # Use Relative Timestamps. This will increase performance
+            slow_start = 0x2000           # Use slow-start logic. This ramps up
+            udp_checksum = 0x4000         # Use UDP Checksums.
+            use_gw_mac = 0x1000           # Use default gateway's MAC for destination MAC.
+            use_tcp = 0x8000              # Use TCP instead of UDP protocol. (Note this is NOT stateful TCP!)
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetArmInfoArmFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetArmInfoArmFlags
 
     def post_set_arm_info(self, 
                           arm_flags: str = None,                    # Armageddon-related flags, see above for details.
@@ -12380,12 +12767,15 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_attenuator
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetAttenuatorMode(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        p_0 = "0"    # Normal
-        p_1 = "1"    # Pulse mode (API Tech 4205A modules directly connected via USB only)
+    @LazyClass
+    def SetAttenuatorMode():
+        class SetAttenuatorMode(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            p_0 = "0"    # Normal
+            p_1 = "1"    # Pulse mode (API Tech 4205A modules directly connected via USB only)
+        return SetAttenuatorMode
 
     def post_set_attenuator(self, 
                             atten_count: str = None,                  # For cases where we are creating/setting a phantom
@@ -12622,15 +13012,18 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_cx_state
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetCxStateCxState(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        DELETED = "DELETED"    # Deletes the CX(s).
-        QUIESCE = "QUIESCE"    # Stop transmitting and gracefully stop cross-connect.
-        RUNNING = "RUNNING"    # Sets the CX(s) in the running state.
-        STOPPED = "STOPPED"    # Sets the CX(s) in the stopped state.
-        SWITCH = "SWITCH"      # Sets the CX(s) in the running state, stopping any conflicting tests.
+    @LazyClass
+    def SetCxStateCxState():
+        class SetCxStateCxState(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            DELETED = "DELETED"    # Deletes the CX(s).
+            QUIESCE = "QUIESCE"    # Stop transmitting and gracefully stop cross-connect.
+            RUNNING = "RUNNING"    # Sets the CX(s) in the running state.
+            STOPPED = "STOPPED"    # Sets the CX(s) in the stopped state.
+            SWITCH = "SWITCH"      # Sets the CX(s) in the running state, stopping any conflicting tests.
+        return SetCxStateCxState
 
     def post_set_cx_state(self, 
                           cx_name: str = None,                      # Name of the cross-connect, or 'all'. [W]
@@ -12871,12 +13264,15 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_endp_file
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetEndpFilePlayback(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        OFF = "OFF"    # off
-        ON = "ON"      # on
+    @LazyClass
+    def SetEndpFilePlayback():
+        class SetEndpFilePlayback(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            OFF = "OFF"    # off
+            ON = "ON"      # on
+        return SetEndpFilePlayback
 
     def post_set_endp_file(self, 
                            file: str = None,                         # The file name to read the playback packets from.
@@ -12932,74 +13328,77 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_endp_flag
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetEndpFlagFlag(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        AdvLatency = "AdvLatency"                          # Enable Advanced Latency Reporting, only valid for L3
-        AdvLatencyOneWay = "AdvLatencyOneWay"              # Report Advanced Latency for one-way (Rx) traffic,
-        # +rather than round trip.
-        AutoHelper = "AutoHelper"                          # Automatically run on helper process
-        BindSIP = "BindSIP"                                # if SIP is in DUT, true. Default is false.
-        ClearPortOnStart = "ClearPortOnStart"              # clear stats on start
-        CoupledMode = "CoupledMode"                        # Reduces config on a specific endpoint on WANlink
-        DoChecksum = "DoChecksum"                          # Enable checksumming
-        DoNotAnswer = "DoNotAnswer"                        # Do not pick up
-        DoNotRegister = "DoNotRegister"                    # Used for peer-to-peer calling. If set, consider
-        # +setting
-        DropXthPkt = "DropXthPkt"                          # Drop every Nth packet on a WANpath endpoint. This
-        EnableConcurrentSrcIP = "EnableConcurrentSrcIP"    # Concurrent source IPs?
-        EnableLinearSrcIP = "EnableLinearSrcIP"            # linearized source IPs
-        EnableLinearSrcIPPort = "EnableLinearSrcIPPort"    # linearized IP ports
-        EnableRndSrcIP = "EnableRndSrcIP"                  # randomize source IP
-        EnableTcpNodelay = "EnableTcpNodelay"              # Enable no delay with TCP.
-        FollowBinomialDist = "FollowBinomialDist"          # Packet drop/ok burst lengths should follow a
-        # +binomial
-        ForcePktGap = "ForcePktGap"                        # Force packet gap. Used by WANlinks currently.
-        GetUrlsFromFile = "GetUrlsFromFile"                # Get URL's from file
-        HWPassthroughMode = "HWPassthroughMode"            # Uses hardware pass through similar to
-        # +PassthroughMode
-        IgnoreBandwidth = "IgnoreBandwidth"                # WANLink behavior replay
-        IgnoreDup = "IgnoreDup"                            # Ignore replay dup
-        IgnoreLatency = "IgnoreLatency"                    # Ignore replay latency
-        IgnoreLoss = "IgnoreLoss"                          # Ignore replay loss
-        KernelMode = "KernelMode"                          # Enable kernel mode
-        L4Enable404 = "L4Enable404"                        # Enable L4 Endpoint JSON return status 404
-        Mobile = "Mobile"                                  # Set to represent endpoint as cellular-call, hands
-        # +free API
-        NoBluetooth = "NoBluetooth"                        # If set, record and play audio options will be
-        # +through a
-        NoFastStart = "NoFastStart"                        # Set to disable h323 fast start
-        NoPlayAudioOverCall = "NoPlayAudioOverCall"        # if set, no audio will be played over call.
-        NoSendRtp = "NoSendRtp"                            # Set to not send RTP
-        NoTunneling = "NoTunneling"                        # Set to disable h323 tunneling
-        OverrideSdp = "OverrideSdp"                        # Set to override conneciton info in SDP
-        PESQ = "PESQ"                                      # Enable PESQ
-        PassthroughMode = "PassthroughMode"                # Disable and pass packets through one side of WANlink
-        PeerNotAuto = "PeerNotAuto"                        # Set if peer phone number is not auto
-        PingPong = "PingPong"                              # if set, audio will be played in pingpong manner over
-        # +Continuous call.
-        PlayAudio = "PlayAudio"                            # Enable to play sound to audio card
-        QuiesceAfterDuration = "QuiesceAfterDuration"      # quiesce after time period
-        QuiesceAfterRange = "QuiesceAfterRange"            # quiesce after range of bytes
-        RcvCallOnly = "RcvCallOnly"                        # Enable to receive calls only, do not originate calls
-        ReplayLoop = "ReplayLoop"                          # Replay loop.
-        ReplayOverwriteDstMac = "ReplayOverwriteDstMac"    # Overwrite the Destination MAC when replaying packets
-        ReplayWlCapture = "ReplayWlCapture"                # Use Replay Capture
-        ReuseSocket = "ReuseSocket"                        # Reuse current socket
-        SavePCM = "SavePCM"                                # Enable to save received bits to file
-        SingleCodec = "SingleCodec"                        # Set to only use specified Codec
-        SipPortAuto = "SipPortAuto"                        # Set local SIP port to auto
-        SyncAfterWrite = "SyncAfterWrite"                  # Sync after writing to a file
-        SyncBeforeClose = "SyncBeforeClose"                # Sync before closing a file
-        UdpBurst = "UdpBurst"                              # Use UDP Bursting
-        Unmanaged = "Unmanaged"                            # Set endpoint unmanaged
-        UseAutoNAT = "UseAutoNAT"                          # NAT friendly behavior
-        UseGRO = "UseGRO"                                  # Enable UDP GRO
-        UseMulticastSSM = "UseMulticastSSM"                # Use Source Specific Multicast.
-        UseProxy = "UseProxy"                              # Use Proxy IP if L4 Endpoint
-        VAD = "VAD"                                        # Enable VAD
-        VerifySSLServer = "VerifySSLServer"                # Veify the SSL sever
+    @LazyClass
+    def SetEndpFlagFlag():
+        class SetEndpFlagFlag(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            AdvLatency = "AdvLatency"                          # Enable Advanced Latency Reporting, only valid for L3
+            AdvLatencyOneWay = "AdvLatencyOneWay"              # Report Advanced Latency for one-way (Rx) traffic,
+            # +rather than round trip.
+            AutoHelper = "AutoHelper"                          # Automatically run on helper process
+            BindSIP = "BindSIP"                                # if SIP is in DUT, true. Default is false.
+            ClearPortOnStart = "ClearPortOnStart"              # clear stats on start
+            CoupledMode = "CoupledMode"                        # Reduces config on a specific endpoint on WANlink
+            DoChecksum = "DoChecksum"                          # Enable checksumming
+            DoNotAnswer = "DoNotAnswer"                        # Do not pick up
+            DoNotRegister = "DoNotRegister"                    # Used for peer-to-peer calling. If set, consider
+            # +setting
+            DropXthPkt = "DropXthPkt"                          # Drop every Nth packet on a WANpath endpoint. This
+            EnableConcurrentSrcIP = "EnableConcurrentSrcIP"    # Concurrent source IPs?
+            EnableLinearSrcIP = "EnableLinearSrcIP"            # linearized source IPs
+            EnableLinearSrcIPPort = "EnableLinearSrcIPPort"    # linearized IP ports
+            EnableRndSrcIP = "EnableRndSrcIP"                  # randomize source IP
+            EnableTcpNodelay = "EnableTcpNodelay"              # Enable no delay with TCP.
+            FollowBinomialDist = "FollowBinomialDist"          # Packet drop/ok burst lengths should follow a
+            # +binomial
+            ForcePktGap = "ForcePktGap"                        # Force packet gap. Used by WANlinks currently.
+            GetUrlsFromFile = "GetUrlsFromFile"                # Get URL's from file
+            HWPassthroughMode = "HWPassthroughMode"            # Uses hardware pass through similar to
+            # +PassthroughMode
+            IgnoreBandwidth = "IgnoreBandwidth"                # WANLink behavior replay
+            IgnoreDup = "IgnoreDup"                            # Ignore replay dup
+            IgnoreLatency = "IgnoreLatency"                    # Ignore replay latency
+            IgnoreLoss = "IgnoreLoss"                          # Ignore replay loss
+            KernelMode = "KernelMode"                          # Enable kernel mode
+            L4Enable404 = "L4Enable404"                        # Enable L4 Endpoint JSON return status 404
+            Mobile = "Mobile"                                  # Set to represent endpoint as cellular-call, hands
+            # +free API
+            NoBluetooth = "NoBluetooth"                        # If set, record and play audio options will be
+            # +through a
+            NoFastStart = "NoFastStart"                        # Set to disable h323 fast start
+            NoPlayAudioOverCall = "NoPlayAudioOverCall"        # if set, no audio will be played over call.
+            NoSendRtp = "NoSendRtp"                            # Set to not send RTP
+            NoTunneling = "NoTunneling"                        # Set to disable h323 tunneling
+            OverrideSdp = "OverrideSdp"                        # Set to override conneciton info in SDP
+            PESQ = "PESQ"                                      # Enable PESQ
+            PassthroughMode = "PassthroughMode"                # Disable and pass packets through one side of WANlink
+            PeerNotAuto = "PeerNotAuto"                        # Set if peer phone number is not auto
+            PingPong = "PingPong"                              # if set, audio will be played in pingpong manner over
+            # +Continuous call.
+            PlayAudio = "PlayAudio"                            # Enable to play sound to audio card
+            QuiesceAfterDuration = "QuiesceAfterDuration"      # quiesce after time period
+            QuiesceAfterRange = "QuiesceAfterRange"            # quiesce after range of bytes
+            RcvCallOnly = "RcvCallOnly"                        # Enable to receive calls only, do not originate calls
+            ReplayLoop = "ReplayLoop"                          # Replay loop.
+            ReplayOverwriteDstMac = "ReplayOverwriteDstMac"    # Overwrite the Destination MAC when replaying packets
+            ReplayWlCapture = "ReplayWlCapture"                # Use Replay Capture
+            ReuseSocket = "ReuseSocket"                        # Reuse current socket
+            SavePCM = "SavePCM"                                # Enable to save received bits to file
+            SingleCodec = "SingleCodec"                        # Set to only use specified Codec
+            SipPortAuto = "SipPortAuto"                        # Set local SIP port to auto
+            SyncAfterWrite = "SyncAfterWrite"                  # Sync after writing to a file
+            SyncBeforeClose = "SyncBeforeClose"                # Sync before closing a file
+            UdpBurst = "UdpBurst"                              # Use UDP Bursting
+            Unmanaged = "Unmanaged"                            # Set endpoint unmanaged
+            UseAutoNAT = "UseAutoNAT"                          # NAT friendly behavior
+            UseGRO = "UseGRO"                                  # Enable UDP GRO
+            UseMulticastSSM = "UseMulticastSSM"                # Use Source Specific Multicast.
+            UseProxy = "UseProxy"                              # Use Proxy IP if L4 Endpoint
+            VAD = "VAD"                                        # Enable VAD
+            VerifySSLServer = "VerifySSLServer"                # Veify the SSL sever
+        return SetEndpFlagFlag
 
     def post_set_endp_flag(self, 
                            flag: str = None,                         # The name of the flag. [R]
@@ -13055,21 +13454,24 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_endp_payload
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetEndpPayloadPayloadType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        PRBS_11_8_10 = "PRBS_11_8_10"    # PRBS (see above)
-        PRBS_15_0_14 = "PRBS_15_0_14"    # PRBS (see above)
-        PRBS_4_0_3 = "PRBS_4_0_3"        # Use linear feedback shift register to generate pseudo random sequence.
-        PRBS_7_0_6 = "PRBS_7_0_6"        # PRBS (see above)
-        custom = "custom"                # Enter your own payload with the set_endp_payload
-        decreasing = "decreasing"        # bytes start at FF and decrease, wrapping if needed.
-        increasing = "increasing"        # bytes start at 00 and increase, wrapping if needed.
-        ones = "ones"                    # Payload is all ones (FF).
-        random = "random"                # generate a new random payload each time sent.
-        random_fixed = "random_fixed"    # means generate one random payload, and send it over and over again.
-        zeros = "zeros"                  # Payload is all zeros (00).
+    @LazyClass
+    def SetEndpPayloadPayloadType():
+        class SetEndpPayloadPayloadType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            PRBS_11_8_10 = "PRBS_11_8_10"    # PRBS (see above)
+            PRBS_15_0_14 = "PRBS_15_0_14"    # PRBS (see above)
+            PRBS_4_0_3 = "PRBS_4_0_3"        # Use linear feedback shift register to generate pseudo random sequence.
+            PRBS_7_0_6 = "PRBS_7_0_6"        # PRBS (see above)
+            custom = "custom"                # Enter your own payload with the set_endp_payload
+            decreasing = "decreasing"        # bytes start at FF and decrease, wrapping if needed.
+            increasing = "increasing"        # bytes start at 00 and increase, wrapping if needed.
+            ones = "ones"                    # Payload is all ones (FF).
+            random = "random"                # generate a new random payload each time sent.
+            random_fixed = "random_fixed"    # means generate one random payload, and send it over and over again.
+            zeros = "zeros"                  # Payload is all zeros (00).
+        return SetEndpPayloadPayloadType
 
     def post_set_endp_payload(self, 
                               name: str = None,                         # The name of the endpoint we are configuring. [R]
@@ -13348,14 +13750,17 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_endp_tos
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetEndpTosTos(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        LOWCOST = "LOWCOST"            #
-        LOWDELAY = "LOWDELAY"          #
-        RELIABILITY = "RELIABILITY"    #
-        THROUGHPUT = "THROUGHPUT"      #
+    @LazyClass
+    def SetEndpTosTos():
+        class SetEndpTosTos(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            LOWCOST = "LOWCOST"            #
+            LOWDELAY = "LOWDELAY"          #
+            RELIABILITY = "RELIABILITY"    #
+            THROUGHPUT = "THROUGHPUT"      #
+        return SetEndpTosTos
 
     def post_set_endp_tos(self, 
                           name: str = None,                         # The name of the endpoint we are configuring. [R]
@@ -13470,110 +13875,119 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_event_interest
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetEventInterestEiFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetEventInterestEiFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        CLEAR = 0x0      # will clear interest
-        SET = 0x1        # set interest flag
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetEventInterestEiFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class SetEventInterestEvents1(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetEventInterestEvents1, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        BAD_TOS = 0x400000                        # Endpoint has bad ToS values configured.
-        Bad_MAC = 0x100000                        # Invalid MAC address configured.
-        Cleared = 0x2000                          # Counters were cleared for some entity.
-        Connect = 0x100                           # WiFi interface connected to AP.
-        Custom = 0x4                              # Custom event (generated by USER in GUI or CLI).
-        DHCP_Fail = 0x8000                        # DHCP Failed, maybe out of leases?
-        DHCP_Timeout = 0x10000                    # Timed out talking to DHCP server.
-        DHCP4_Error = 0x20000                     # DHCP gave out duplicated IP address.
-        DHCP6_Error = 0x40000                     # DHCPv6 gave out duplicated IPv6 address.
-        Disconnect = 0x80                         # WiFi interface disconnected from AP.
-        Endp_Started = 0x40                       # Endpoint was started.
-        Endp_Stopped = 0x20                       # Endpoint stopped for some reason.
-        Link_Down = 0x1                           # Notify when Interface Link goes DOWN.
-        Link_Errors = 0x4000                      # Port shows low-level link errors.
-        Link_Up = 0x2                             # Notify when Interface Link goes UP.
-        Login = 0x400                             # CLI/GUI user connected to LANforge.
-        Logout = 0x200                            # CLI/GUI user disconnected from LANforge.
-        Migrated = 0x200000                       # Port (station network interface) migrated.
-        NO_RX_SINCE = 0x800000                    # Endpoint threshold alert.
-        NO_RX_SINCE_CLEARED = 0x1000000           # Endpoint threshold alert cleared.
-        RX_BPS_OOR_1M = 0x20000000                # Endpoint threshold alert.
-        RX_BPS_OOR_1M_CLEARED = 0x40000000        # Endpoint threshold alert cleared.
-        RX_BPS_OOR_30S = 0x8000000                # Endpoint threshold alert.
-        RX_BPS_OOR_30S_CLEARED = 0x10000000       # Endpoint threshold alert cleared.
-        RX_BPS_OOR_3S = 0x2000000                 # Endpoint threshold alert.
-        RX_BPS_OOR_3S_CLEARED = 0x4000000         # Endpoint threshold alert cleared.
-        Resource_Down = 0x8                       # Resource has crashed, rebooted, etc.
-        Resource_Up = 0x10                        # Resource has connected to manager.
-        Start_Reports = 0x1000                    # Start saving report data files (CSV).
-        Stop_Reports = 0x800                      # Stop saving report data files (CSV).
-        TX_BPS_OOR_3S = 0x80000000                # Endpoint threshold alert.
-        WiFi_Config = 0x80000                     # WiFi Configuration Error.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetEventInterestEvents1 has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class SetEventInterestEvents2(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetEventInterestEvents2, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        FW_CRASH = 0x800                     # Firmware for entity has crashed.
-        FW_FAIL = 0x1000                     # Firmware failed powerup, may require reboot.
-        IFDOWN_FAIL = 0x8000                 # IFDOWN-PRE Script (ifup --logout) returned error code.
-        IFDOWN_OK = 0x10000                  # IFDOWN-PRE Script (ifup --logout) completed successfully.
-        IFUP_FAIL = 0x2000                   # IFUP-POST Script returned error code.
-        IFUP_OK = 0x4000                     # IFUP-POST Script completed successfully.
-        RX_DROP_OOR_1M = 0x200               # Endpoint threshold alert.
-        RX_DROP_OOR_1M_CLEARED = 0x400       # Endpoint threshold alert cleared.
-        RX_DROP_OOR_3S = 0x80                # Endpoint threshold alert.
-        RX_DROP_OOR_3S_CLEARED = 0x100       # Endpoint threshold alert cleared.
-        RX_LAT_OOR = 0x20                    # Endpoint threshold alert.
-        RX_LAT_OOR_CLEARED = 0x40            # Endpoint threshold alert cleared.
-        TX_BPS_OOR_1M = 0x8                  # Endpoint threshold alert.
-        TX_BPS_OOR_1M_CLEARED = 0x10         # Endpoint threshold alert cleared.
-        TX_BPS_OOR_30S = 0x2                 # Endpoint threshold alert.
-        TX_BPS_OOR_30S_CLEARED = 0x4         # Endpoint threshold alert cleared.
-        TX_BPS_OOR_3S_CLEARED = 0x1          # Endpoint threshold alert cleared.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetEventInterestEvents2 has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def SetEventInterestEiFlags():
+        class SetEventInterestEiFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetEventInterestEiFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            CLEAR = 0x0      # will clear interest
+            SET = 0x1        # set interest flag
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetEventInterestEiFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetEventInterestEiFlags
+
+    @LazyClass
+    def SetEventInterestEvents1():
+        class SetEventInterestEvents1(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetEventInterestEvents1, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            BAD_TOS = 0x400000                        # Endpoint has bad ToS values configured.
+            Bad_MAC = 0x100000                        # Invalid MAC address configured.
+            Cleared = 0x2000                          # Counters were cleared for some entity.
+            Connect = 0x100                           # WiFi interface connected to AP.
+            Custom = 0x4                              # Custom event (generated by USER in GUI or CLI).
+            DHCP_Fail = 0x8000                        # DHCP Failed, maybe out of leases?
+            DHCP_Timeout = 0x10000                    # Timed out talking to DHCP server.
+            DHCP4_Error = 0x20000                     # DHCP gave out duplicated IP address.
+            DHCP6_Error = 0x40000                     # DHCPv6 gave out duplicated IPv6 address.
+            Disconnect = 0x80                         # WiFi interface disconnected from AP.
+            Endp_Started = 0x40                       # Endpoint was started.
+            Endp_Stopped = 0x20                       # Endpoint stopped for some reason.
+            Link_Down = 0x1                           # Notify when Interface Link goes DOWN.
+            Link_Errors = 0x4000                      # Port shows low-level link errors.
+            Link_Up = 0x2                             # Notify when Interface Link goes UP.
+            Login = 0x400                             # CLI/GUI user connected to LANforge.
+            Logout = 0x200                            # CLI/GUI user disconnected from LANforge.
+            Migrated = 0x200000                       # Port (station network interface) migrated.
+            NO_RX_SINCE = 0x800000                    # Endpoint threshold alert.
+            NO_RX_SINCE_CLEARED = 0x1000000           # Endpoint threshold alert cleared.
+            RX_BPS_OOR_1M = 0x20000000                # Endpoint threshold alert.
+            RX_BPS_OOR_1M_CLEARED = 0x40000000        # Endpoint threshold alert cleared.
+            RX_BPS_OOR_30S = 0x8000000                # Endpoint threshold alert.
+            RX_BPS_OOR_30S_CLEARED = 0x10000000       # Endpoint threshold alert cleared.
+            RX_BPS_OOR_3S = 0x2000000                 # Endpoint threshold alert.
+            RX_BPS_OOR_3S_CLEARED = 0x4000000         # Endpoint threshold alert cleared.
+            Resource_Down = 0x8                       # Resource has crashed, rebooted, etc.
+            Resource_Up = 0x10                        # Resource has connected to manager.
+            Start_Reports = 0x1000                    # Start saving report data files (CSV).
+            Stop_Reports = 0x800                      # Stop saving report data files (CSV).
+            TX_BPS_OOR_3S = 0x80000000                # Endpoint threshold alert.
+            WiFi_Config = 0x80000                     # WiFi Configuration Error.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetEventInterestEvents1 has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetEventInterestEvents1
+
+    @LazyClass
+    def SetEventInterestEvents2():
+        class SetEventInterestEvents2(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetEventInterestEvents2, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            FW_CRASH = 0x800                     # Firmware for entity has crashed.
+            FW_FAIL = 0x1000                     # Firmware failed powerup, may require reboot.
+            IFDOWN_FAIL = 0x8000                 # IFDOWN-PRE Script (ifup --logout) returned error code.
+            IFDOWN_OK = 0x10000                  # IFDOWN-PRE Script (ifup --logout) completed successfully.
+            IFUP_FAIL = 0x2000                   # IFUP-POST Script returned error code.
+            IFUP_OK = 0x4000                     # IFUP-POST Script completed successfully.
+            RX_DROP_OOR_1M = 0x200               # Endpoint threshold alert.
+            RX_DROP_OOR_1M_CLEARED = 0x400       # Endpoint threshold alert cleared.
+            RX_DROP_OOR_3S = 0x80                # Endpoint threshold alert.
+            RX_DROP_OOR_3S_CLEARED = 0x100       # Endpoint threshold alert cleared.
+            RX_LAT_OOR = 0x20                    # Endpoint threshold alert.
+            RX_LAT_OOR_CLEARED = 0x40            # Endpoint threshold alert cleared.
+            TX_BPS_OOR_1M = 0x8                  # Endpoint threshold alert.
+            TX_BPS_OOR_1M_CLEARED = 0x10         # Endpoint threshold alert cleared.
+            TX_BPS_OOR_30S = 0x2                 # Endpoint threshold alert.
+            TX_BPS_OOR_30S_CLEARED = 0x4         # Endpoint threshold alert cleared.
+            TX_BPS_OOR_3S_CLEARED = 0x1          # Endpoint threshold alert cleared.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetEventInterestEvents2 has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetEventInterestEvents2
 
     def post_set_event_interest(self, 
                                 ei_flags: str = None,                     # Event Interest flags, see above. [W]
@@ -13645,43 +14059,49 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_event_priority
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetEventPriorityEvent(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        Bad_MAC = 20            # Invalid MAC address configured.
-        Cleared = 13            # Counters were cleared for some entity.
-        Connect = 8             # WiFi interface connected to AP.
-        Custom = 2              # Custom event (generated by USER in GUI or CLI).
-        DHCP_Fail = 15          # DHCP Failed, maybe out of leases?
-        DHCP_Timeout = 16       # Timed out talking to DHCP server.
-        DHCP4_Error = 17        # DHCP gave out duplicated IP address.
-        DHCP6_Error = 18        # DHCPv6 gave out duplicated IPv6 address.
-        Disconnect = 7          # WiFi interface disconnected from AP.
-        Endp_Started = 6        # Endpoint was started.
-        Endp_Stopped = 5        # Endpoint stopped for some reason.
-        Link_Down = 0           # Notify when Interface Link goes UP.
-        Link_Errors = 14        # Port shows low-level link errors.
-        Link_Up = 1             # Notify when Interface Link goes DOWN.
-        Login = 10              # CLI/GUI user connected to LANforge.
-        Logout = 9              # CLI/GUI user disconnected from LANforge.
-        Migrated = 21           # Port (station network interface) migrated.
-        Resource_Down = 3       # Resource has crashed, rebooted, etc.
-        Resource_Up = 4         # Resource has connected to manager.
-        Start_Reports = 12      # Start saving report data files (CSV).
-        Stop_Reports = 11       # Stop saving report data files (CSV).
-        WiFi_Config = 19        # WiFi Configuration Error.
-
-    class SetEventPriorityPriority(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        AUTO = "AUTO"            # Let event creator decide the priority.
-        CRITICAL = "CRITICAL"    #
-        DEBUG = "DEBUG"          #
-        FATAL = "FATAL"          #
-        INFO = "INFO"            #
-        WARNING = "WARNING"      #
+    @LazyClass
+    def SetEventPriorityEvent():
+        class SetEventPriorityEvent(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            Bad_MAC = 20            # Invalid MAC address configured.
+            Cleared = 13            # Counters were cleared for some entity.
+            Connect = 8             # WiFi interface connected to AP.
+            Custom = 2              # Custom event (generated by USER in GUI or CLI).
+            DHCP_Fail = 15          # DHCP Failed, maybe out of leases?
+            DHCP_Timeout = 16       # Timed out talking to DHCP server.
+            DHCP4_Error = 17        # DHCP gave out duplicated IP address.
+            DHCP6_Error = 18        # DHCPv6 gave out duplicated IPv6 address.
+            Disconnect = 7          # WiFi interface disconnected from AP.
+            Endp_Started = 6        # Endpoint was started.
+            Endp_Stopped = 5        # Endpoint stopped for some reason.
+            Link_Down = 0           # Notify when Interface Link goes UP.
+            Link_Errors = 14        # Port shows low-level link errors.
+            Link_Up = 1             # Notify when Interface Link goes DOWN.
+            Login = 10              # CLI/GUI user connected to LANforge.
+            Logout = 9              # CLI/GUI user disconnected from LANforge.
+            Migrated = 21           # Port (station network interface) migrated.
+            Resource_Down = 3       # Resource has crashed, rebooted, etc.
+            Resource_Up = 4         # Resource has connected to manager.
+            Start_Reports = 12      # Start saving report data files (CSV).
+            Stop_Reports = 11       # Stop saving report data files (CSV).
+            WiFi_Config = 19        # WiFi Configuration Error.
+        return SetEventPriorityEvent
+
+    @LazyClass
+    def SetEventPriorityPriority():
+        class SetEventPriorityPriority(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            AUTO = "AUTO"            # Let event creator decide the priority.
+            CRITICAL = "CRITICAL"    #
+            DEBUG = "DEBUG"          #
+            FATAL = "FATAL"          #
+            INFO = "INFO"            #
+            WARNING = "WARNING"      #
+        return SetEventPriorityPriority
 
     def post_set_event_priority(self, 
                                 event: str = None,                        # Number or name for the event, see above.
@@ -13817,17 +14237,20 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_flag
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetFlagFlag(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        brief = "brief"                              # Request more abbreviated output to various commands.
-        prompt_newlines = "prompt_newlines"          # Add a newline after every prompt. Can help with scripts
-        push_all_rpts = "push_all_rpts"              # If enabled, server will send port, endpoint, and other
-        push_endp_rpts = "push_endp_rpts"            # If enabled, server will send endpoint reports without
-        request_keyed_text = "request_keyed_text"    # Normally most keyed-text events are only sent to the GUI
-        stream_events = "stream_events"              # Normally the CLI will not show Events (as seen in the
-        # +Event
+    @LazyClass
+    def SetFlagFlag():
+        class SetFlagFlag(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            brief = "brief"                              # Request more abbreviated output to various commands.
+            prompt_newlines = "prompt_newlines"          # Add a newline after every prompt. Can help with scripts
+            push_all_rpts = "push_all_rpts"              # If enabled, server will send port, endpoint, and other
+            push_endp_rpts = "push_endp_rpts"            # If enabled, server will send endpoint reports without
+            request_keyed_text = "request_keyed_text"    # Normally most keyed-text events are only sent to the GUI
+            stream_events = "stream_events"              # Normally the CLI will not show Events (as seen in the
+            # +Event
+        return SetFlagFlag
 
     def post_set_flag(self, 
                       client: str = None,                       # Specify the user, if it is not the current user. Requires
@@ -14299,12 +14722,15 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_poll_mode
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetPollModeMode(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        polling = "polling"    #
-        push = "push"          #
+    @LazyClass
+    def SetPollModeMode():
+        class SetPollModeMode(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            polling = "polling"    #
+            push = "push"          #
+        return SetPollModeMode
 
     def post_set_poll_mode(self, 
                            mode: str = None,                         # 'polling' or 'push'. [R]
@@ -14352,191 +14778,212 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_port
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetPortCmdFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetPortCmdFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        abort_if_scripts = 0x400       # Forceably abort all ifup/down scripts on this Port.
-        force_MII_probe = 0x4          # Force MII probe
-        from_dhcp = 0x200              # Settings come from DHCP client.
-        from_user = 0x80               # from_user (Required to change Mgt Port config
-        new_gw_probe = 0x20            # Force new GW probe
-        new_gw_probe_dev = 0x40        # Force new GW probe for ONLY this interface
-        no_hw_probe = 0x8              # Don&apos;t probe hardware
-        probe_wifi = 0x10              # Probe WIFI
-        reset_transceiver = 0x1        # Reset transciever
-        restart_link_neg = 0x2         # Restart link negotiation
-        skip_port_bounce = 0x100       # skip-port-bounce (Don&apos;t ifdown/up
-        use_pre_ifdown = 0x800         # Call pre-ifdown script before bringing interface down.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetPortCmdFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class SetPortCurrentFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetPortCurrentFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        adv_100bt_fd = 0x800000                       # advert-100bt-FD
-        adv_100bt_hd = 0x400000                       # advert-100bt-HD
-        adv_10bt_fd = 0x200000                        # advert-10bt-FD
-        adv_10bt_hd = 0x100000                        # advert-10bt-HD
-        adv_10g_fd = 0x800000000                      # advert-10G-FD
-        adv_2_5g_fd = 0x400000000                     # advert-2.5G-FD
-        adv_5g_fd = 0x400000000000000                 # Advertise 5Gbps link speed.
-        adv_flow_ctl = 0x8000000                      # advert-flow-control
-        auto_neg = 0x100                              # auto-negotiate
-        aux_mgt = 0x800000000000                      # Enable Auxillary-Management flag for this port.
-        fixed_100bt_fd = 0x10                         # Fixed-100bt-FD
-        fixed_100bt_hd = 0x8                          # Fixed-100bt-HD
-        fixed_10bt_fd = 0x4                           # Fixed-10bt-FD
-        fixed_10bt_hd = 0x2                           # Fixed-10bt-HD (half duplex)
-        ftp_enabled = 0x400000000000                  # Enable FTP (vsftpd) service for this port.
-        gro_enabled = 0x4000000000                    # GRO-Enabled
-        gso_enabled = 0x10000000000                   # GSO-Enabled
-        http_enabled = 0x200000000000                 # Enable HTTP (nginx) service for this port.
-        if_down = 0x1                                 # Interface Down
-        ignore_dhcp = 0x2000000000000                 # Don&apos;t set DHCP acquired IP on interface,
-        ipsec_client = 0x40000000000000               # Enable client IPSEC xfrm on this port.
-        ipsec_concentrator = 0x80000000000000         # Enable concentrator (upstream) IPSEC xfrm on this port.
-        lro_enabled = 0x2000000000                    # LRO-Enabled
-        no_dhcp_rel = 0x80000000000                   # No-DHCP-Release
-        no_dhcp_restart = 0x1000000000000             # Disable restart of DHCP on link connect (ie, wifi).
-        no_ifup_post = 0x4000000000000                # Skip ifup-post script if we can detect that we
-        promisc = 0x10000000                          # PROMISC
-        radius_enabled = 0x20000000000000             # Enable RADIUS service (using hostapd as radius server)
-        rxfcs = 0x40000000000                         # RXFCS
-        service_dns = 0x100000000000000               # Enable DNS (dnsmasq) service on this port.
-        staged_ifup = 0x100000000000                  # Staged-IFUP
-        tso_enabled = 0x1000000000                    # TSO-Enabled
-        ufo_enabled = 0x8000000000                    # UFO-Enabled
-        use_dhcp = 0x80000000                         # USE-DHCP
-        use_dhcpv6 = 0x20000000000                    # USE-DHCPv6
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetPortCurrentFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class SetPortDhcpClientId(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        NA = "NA"                   # Do not change from current value.
-        NONE = "NONE"               # Do not use dhcp client ID.
-        p_string_ = "[string]"      # Use the string for the client ID.
-        p__DEVNAME = "__DEVNAME"    # Use the interface&apos;s name as the client ID.
-        p__MAC = "__MAC"            # Use interface&apos;s MAC address for the client ID.
-
-    class SetPortDhcpHostname(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        NA = "NA"                   # Do not change from current value.
-        NONE = "NONE"               # Do not use dhcp Hostname
-        p_string_ = "[string]"      # Use the string for the Hostname.
-        p__ALIAS__ = "__ALIAS__"    # Use alias if set, or EID behaviour if alias is not set..
-        p__EID__ = "__EID__"        # Use hostname 'CT-[resource-id].[port-name]'
-
-    class SetPortDhcpVendorId(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        NA = "NA"                 # Do not change from current value.
-        NONE = "NONE"             # Do not use dhcp vendor ID
-        p_string_ = "[string]"    # Use the string for the vendor ID.
-
-    class SetPortFlags2(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetPortFlags2, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        bypass_disconnect = 0x200      # Logically disconnect the cable (link-down)
-        bypass_enabled = 0x10          # Enable Bypass Device
-        bypass_power_down = 0x80       # Should bypass be on when we shutdown or loose power?
-        bypass_power_on = 0x100        # Should bypass be on when we first power up?
-        supports_bypass = 0x2          # Support Bypass Devices
-        use_stp = 0x1                  # Use Spanning Tree Protocol
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetPortFlags2 has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class SetPortInterest(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetPortInterest, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        alias = 0x1000                     # Port alias
-        aux_mgt = 0x20000000               # Enable/disable Auxillary-Management for a port
-        bridge = 0x10000                   # BRIDGE
-        bypass = 0x40000                   # Bypass
-        command_flags = 0x1                # apply command flags
-        cpu_mask = 0x100000                # CPU Mask, useful for pinning process to CPU core
-        current_flags = 0x2                # apply current flags
-        dhcp = 0x4000                      # including client-id.
-        dhcp_rls = 0x4000000               # DHCP release
-        dhcpv6 = 0x1000000                 # Use DHCPv6
-        gen_offload = 0x80000              # Generic offload flags, everything but LRO
-        ifdown = 0x800000                  # Down interface
-        interal_use_1 = 0x800              # (INTERNAL USE)
-        ip_Mask = 0x8                      # IP mask
-        ip_address = 0x4                   # IP address
-        ip_gateway = 0x10                  # IP gateway
-        ipv6_addrs = 0x20000               # IPv6 Address
-        link_speed = 0x80                  # Link speed
-        lro_offload = 0x200000             # LRO (Must be disabled when used in Wanlink,
-        mac_address = 0x20                 # MAC address
-        mtu = 0x100                        # MTU
-        no_apply_dhcp = 0x80000000         # Enable/disable NO-APPLY-DHCP flag for a port
-        no_dhcp_conn = 0x40000000          # Enable/disable NO-DHCP-ON-CONNECT flag for a port
-        promisc_mode = 0x400               # PROMISC mode
-        rpt_timer = 0x8000                 # Report Timer
-        rx_all = 0x2000                    # Rx-ALL
-        rxfcs = 0x2000000                  # RXFCS
-        skip_ifup_roam = 0x100000000       # Enable/disable SKIP-IFUP-ON-ROAM flag for a port
-        sta_br_id = 0x400000               # WiFi Bridge identifier. 0 means no bridging.
-        supported_flags = 0x40             # apply supported flags
-        svc_ftpd = 0x10000000              # Enable/disable FTP Service for a port
-        svc_httpd = 0x8000000              # Enable/disable HTTP Service for a port
-        tx_queue_length = 0x200            # TX Queue Length
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetPortInterest has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def SetPortCmdFlags():
+        class SetPortCmdFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetPortCmdFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            abort_if_scripts = 0x400       # Forceably abort all ifup/down scripts on this Port.
+            force_MII_probe = 0x4          # Force MII probe
+            from_dhcp = 0x200              # Settings come from DHCP client.
+            from_user = 0x80               # from_user (Required to change Mgt Port config
+            new_gw_probe = 0x20            # Force new GW probe
+            new_gw_probe_dev = 0x40        # Force new GW probe for ONLY this interface
+            no_hw_probe = 0x8              # Don&apos;t probe hardware
+            probe_wifi = 0x10              # Probe WIFI
+            reset_transceiver = 0x1        # Reset transciever
+            restart_link_neg = 0x2         # Restart link negotiation
+            skip_port_bounce = 0x100       # skip-port-bounce (Don&apos;t ifdown/up
+            use_pre_ifdown = 0x800         # Call pre-ifdown script before bringing interface down.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetPortCmdFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetPortCmdFlags
+
+    @LazyClass
+    def SetPortCurrentFlags():
+        class SetPortCurrentFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetPortCurrentFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            adv_100bt_fd = 0x800000                       # advert-100bt-FD
+            adv_100bt_hd = 0x400000                       # advert-100bt-HD
+            adv_10bt_fd = 0x200000                        # advert-10bt-FD
+            adv_10bt_hd = 0x100000                        # advert-10bt-HD
+            adv_10g_fd = 0x800000000                      # advert-10G-FD
+            adv_2_5g_fd = 0x400000000                     # advert-2.5G-FD
+            adv_5g_fd = 0x400000000000000                 # Advertise 5Gbps link speed.
+            adv_flow_ctl = 0x8000000                      # advert-flow-control
+            auto_neg = 0x100                              # auto-negotiate
+            aux_mgt = 0x800000000000                      # Enable Auxillary-Management flag for this port.
+            fixed_100bt_fd = 0x10                         # Fixed-100bt-FD
+            fixed_100bt_hd = 0x8                          # Fixed-100bt-HD
+            fixed_10bt_fd = 0x4                           # Fixed-10bt-FD
+            fixed_10bt_hd = 0x2                           # Fixed-10bt-HD (half duplex)
+            ftp_enabled = 0x400000000000                  # Enable FTP (vsftpd) service for this port.
+            gro_enabled = 0x4000000000                    # GRO-Enabled
+            gso_enabled = 0x10000000000                   # GSO-Enabled
+            http_enabled = 0x200000000000                 # Enable HTTP (nginx) service for this port.
+            if_down = 0x1                                 # Interface Down
+            ignore_dhcp = 0x2000000000000                 # Don&apos;t set DHCP acquired IP on interface,
+            ipsec_client = 0x40000000000000               # Enable client IPSEC xfrm on this port.
+            ipsec_concentrator = 0x80000000000000         # Enable concentrator (upstream) IPSEC xfrm on this port.
+            lro_enabled = 0x2000000000                    # LRO-Enabled
+            no_dhcp_rel = 0x80000000000                   # No-DHCP-Release
+            no_dhcp_restart = 0x1000000000000             # Disable restart of DHCP on link connect (ie, wifi).
+            no_ifup_post = 0x4000000000000                # Skip ifup-post script if we can detect that we
+            promisc = 0x10000000                          # PROMISC
+            radius_enabled = 0x20000000000000             # Enable RADIUS service (using hostapd as radius server)
+            rxfcs = 0x40000000000                         # RXFCS
+            service_dns = 0x100000000000000               # Enable DNS (dnsmasq) service on this port.
+            staged_ifup = 0x100000000000                  # Staged-IFUP
+            tso_enabled = 0x1000000000                    # TSO-Enabled
+            ufo_enabled = 0x8000000000                    # UFO-Enabled
+            use_dhcp = 0x80000000                         # USE-DHCP
+            use_dhcpv6 = 0x20000000000                    # USE-DHCPv6
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetPortCurrentFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetPortCurrentFlags
+
+    @LazyClass
+    def SetPortDhcpClientId():
+        class SetPortDhcpClientId(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            NA = "NA"                   # Do not change from current value.
+            NONE = "NONE"               # Do not use dhcp client ID.
+            p_string_ = "[string]"      # Use the string for the client ID.
+            p__DEVNAME = "__DEVNAME"    # Use the interface&apos;s name as the client ID.
+            p__MAC = "__MAC"            # Use interface&apos;s MAC address for the client ID.
+        return SetPortDhcpClientId
+
+    @LazyClass
+    def SetPortDhcpHostname():
+        class SetPortDhcpHostname(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            NA = "NA"                   # Do not change from current value.
+            NONE = "NONE"               # Do not use dhcp Hostname
+            p_string_ = "[string]"      # Use the string for the Hostname.
+            p__ALIAS__ = "__ALIAS__"    # Use alias if set, or EID behaviour if alias is not set..
+            p__EID__ = "__EID__"        # Use hostname 'CT-[resource-id].[port-name]'
+        return SetPortDhcpHostname
+
+    @LazyClass
+    def SetPortDhcpVendorId():
+        class SetPortDhcpVendorId(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            NA = "NA"                 # Do not change from current value.
+            NONE = "NONE"             # Do not use dhcp vendor ID
+            p_string_ = "[string]"    # Use the string for the vendor ID.
+        return SetPortDhcpVendorId
+
+    @LazyClass
+    def SetPortFlags2():
+        class SetPortFlags2(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetPortFlags2, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            bypass_disconnect = 0x200      # Logically disconnect the cable (link-down)
+            bypass_enabled = 0x10          # Enable Bypass Device
+            bypass_power_down = 0x80       # Should bypass be on when we shutdown or loose power?
+            bypass_power_on = 0x100        # Should bypass be on when we first power up?
+            supports_bypass = 0x2          # Support Bypass Devices
+            use_stp = 0x1                  # Use Spanning Tree Protocol
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetPortFlags2 has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetPortFlags2
+
+    @LazyClass
+    def SetPortInterest():
+        class SetPortInterest(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetPortInterest, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            alias = 0x1000                     # Port alias
+            aux_mgt = 0x20000000               # Enable/disable Auxillary-Management for a port
+            bridge = 0x10000                   # BRIDGE
+            bypass = 0x40000                   # Bypass
+            command_flags = 0x1                # apply command flags
+            cpu_mask = 0x100000                # CPU Mask, useful for pinning process to CPU core
+            current_flags = 0x2                # apply current flags
+            dhcp = 0x4000                      # including client-id.
+            dhcp_rls = 0x4000000               # DHCP release
+            dhcpv6 = 0x1000000                 # Use DHCPv6
+            gen_offload = 0x80000              # Generic offload flags, everything but LRO
+            ifdown = 0x800000                  # Down interface
+            interal_use_1 = 0x800              # (INTERNAL USE)
+            ip_Mask = 0x8                      # IP mask
+            ip_address = 0x4                   # IP address
+            ip_gateway = 0x10                  # IP gateway
+            ipv6_addrs = 0x20000               # IPv6 Address
+            link_speed = 0x80                  # Link speed
+            lro_offload = 0x200000             # LRO (Must be disabled when used in Wanlink,
+            mac_address = 0x20                 # MAC address
+            mtu = 0x100                        # MTU
+            no_apply_dhcp = 0x80000000         # Enable/disable NO-APPLY-DHCP flag for a port
+            no_dhcp_conn = 0x40000000          # Enable/disable NO-DHCP-ON-CONNECT flag for a port
+            promisc_mode = 0x400               # PROMISC mode
+            rpt_timer = 0x8000                 # Report Timer
+            rx_all = 0x2000                    # Rx-ALL
+            rxfcs = 0x2000000                  # RXFCS
+            skip_ifup_roam = 0x100000000       # Enable/disable SKIP-IFUP-ON-ROAM flag for a port
+            sta_br_id = 0x400000               # WiFi Bridge identifier. 0 means no bridging.
+            supported_flags = 0x40             # apply supported flags
+            svc_ftpd = 0x10000000              # Enable/disable FTP Service for a port
+            svc_httpd = 0x8000000              # Enable/disable HTTP Service for a port
+            tx_queue_length = 0x200            # TX Queue Length
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetPortInterest has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetPortInterest
 
     def post_set_port(self, 
                       alias: str = None,                        # A user-defined name for this interface. Can be BLANK or
@@ -14927,11 +15374,14 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_resource
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetResourceResourceFlags(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        skip_load_db_on_start = 1      # Should we skip loading the DB on start?
+    @LazyClass
+    def SetResourceResourceFlags():
+        class SetResourceResourceFlags(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            skip_load_db_on_start = 1      # Should we skip loading the DB on start?
+        return SetResourceResourceFlags
 
     def post_set_resource(self, 
                           device_profiles: str = None,              # List of profiles, see above
@@ -15034,29 +15484,32 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_rfgen
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetRfgenRfgenFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetRfgenRfgenFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        one_burst = 0x8           # Run for about 1 second and stop. Uses 5-sec sweep time for single pulse
-        # +train.
-        running = 0x2             # Should we start the RF Generator or not?
-        trials_center = 0x20      # FCC5 enable trials-center
-        trials_high = 0x40        # FCC5 enable trials-high
-        trials_low = 0x10         # FCC5 enable trials-low
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetRfgenRfgenFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def SetRfgenRfgenFlags():
+        class SetRfgenRfgenFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetRfgenRfgenFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            one_burst = 0x8           # Run for about 1 second and stop. Uses 5-sec sweep time for single pulse
+            # +train.
+            running = 0x2             # Should we start the RF Generator or not?
+            trials_center = 0x20      # FCC5 enable trials-center
+            trials_high = 0x40        # FCC5 enable trials-high
+            trials_low = 0x10         # FCC5 enable trials-low
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetRfgenRfgenFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetRfgenRfgenFlags
 
     def post_set_rfgen(self, 
                        bb_gain: str = None,                      # RX Gain, 0 - 62 in 2dB steps
@@ -15245,52 +15698,58 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_script
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetScriptFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetScriptFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        SCR_COMPLETED = 0x80                # Set automatically by LANforge.
-        SCR_HIDE_CONSTRAINTS = 0x2000       # Hide constraints messages.
-        SCR_HIDE_CSV = 0x20                 # Don't print the CSV data in the report.
-        SCR_HIDE_HUNT = 0x800               # Hide the individual hunt steps..just show results.
-        SCR_HIDE_ITER_DETAILS = 0x8         # Hide iteration detail reports.
-        SCR_HIDE_LAT = 0x1000               # Hide latency distribution reports.
-        SCR_HIDE_LEGEND = 0x10              # Don't print the legend in the report.
-        SCR_LOOP = 0x100                    # Loop script until manually stopped.
-        SCR_NO_KEYED_RPT = 0x2              # Script should NOT send reports to the CLI/GUI.
-        SCR_RUN_ON_MGR = 0x40               # Set automatically by LANforge.
-        SCR_SHOW_ATTENUATION = 0x4000       # Show attenuation packet stats.
-        SCR_SHOW_DUPS = 0x200               # Report duplicate packets.
-        SCR_SHOW_GOLDEN_3P = 0x20000        # Add 'golden' third-party AP graph for comparison (where available).
-        SCR_SHOW_GOLDEN_LF = 0x10000        # Add 'golden' LANforge graph for comparison (where available).
-        SCR_SHOW_OOO = 0x400                # Report out-of-order packets.
-        SCR_STOPPED = 0x1                   # Script should NOT have any affect on the endpoint.
-        SCR_SYMMETRIC = 0x4                 # This script should apply settings to the peer endpoing as well.
-        SCR_USE_MSS = 0x8000                # When setting packet size, set TCP MSS instead if endpoint supports
-        # +that.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetScriptFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class SetScriptType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        NONE = "NONE"                  # Delete any existing script.
-        Script2544 = "Script2544"      # For RFC 2544 type testing.
-        ScriptAtten = "ScriptAtten"    # For Attenuators only.
-        ScriptHunt = "ScriptHunt"      # Hunt for maximum speed with constraints.
-        ScriptWL = "ScriptWL"          # For iterating through WanLink settings
+    @LazyClass
+    def SetScriptFlags():
+        class SetScriptFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetScriptFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            SCR_COMPLETED = 0x80                # Set automatically by LANforge.
+            SCR_HIDE_CONSTRAINTS = 0x2000       # Hide constraints messages.
+            SCR_HIDE_CSV = 0x20                 # Don't print the CSV data in the report.
+            SCR_HIDE_HUNT = 0x800               # Hide the individual hunt steps..just show results.
+            SCR_HIDE_ITER_DETAILS = 0x8         # Hide iteration detail reports.
+            SCR_HIDE_LAT = 0x1000               # Hide latency distribution reports.
+            SCR_HIDE_LEGEND = 0x10              # Don't print the legend in the report.
+            SCR_LOOP = 0x100                    # Loop script until manually stopped.
+            SCR_NO_KEYED_RPT = 0x2              # Script should NOT send reports to the CLI/GUI.
+            SCR_RUN_ON_MGR = 0x40               # Set automatically by LANforge.
+            SCR_SHOW_ATTENUATION = 0x4000       # Show attenuation packet stats.
+            SCR_SHOW_DUPS = 0x200               # Report duplicate packets.
+            SCR_SHOW_GOLDEN_3P = 0x20000        # Add 'golden' third-party AP graph for comparison (where available).
+            SCR_SHOW_GOLDEN_LF = 0x10000        # Add 'golden' LANforge graph for comparison (where available).
+            SCR_SHOW_OOO = 0x400                # Report out-of-order packets.
+            SCR_STOPPED = 0x1                   # Script should NOT have any affect on the endpoint.
+            SCR_SYMMETRIC = 0x4                 # This script should apply settings to the peer endpoing as well.
+            SCR_USE_MSS = 0x8000                # When setting packet size, set TCP MSS instead if endpoint supports
+            # +that.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetScriptFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetScriptFlags
+
+    @LazyClass
+    def SetScriptType():
+        class SetScriptType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            NONE = "NONE"                  # Delete any existing script.
+            Script2544 = "Script2544"      # For RFC 2544 type testing.
+            ScriptAtten = "ScriptAtten"    # For Attenuators only.
+            ScriptHunt = "ScriptHunt"      # Hunt for maximum speed with constraints.
+            ScriptWL = "ScriptWL"          # For iterating through WanLink settings
+        return SetScriptType
 
     def post_set_script(self, 
                         endp: str = None,                         # Endpoint, Connection Group or Attenuator name or ID. [R]
@@ -15803,12 +16262,15 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_wanlink_pcap
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetWanlinkPcapCapture(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        OFF = "OFF"    # stop capturing
-        ON = "ON"      # start capturing
+    @LazyClass
+    def SetWanlinkPcapCapture():
+        class SetWanlinkPcapCapture(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            OFF = "OFF"    # stop capturing
+            ON = "ON"      # start capturing
+        return SetWanlinkPcapCapture
 
     def post_set_wanlink_pcap(self, 
                               capture: str = None,                      # Should we capture or not? ON or OFF. [R]
@@ -15865,29 +16327,32 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_wanpath_corruption
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetWanpathCorruptionFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetWanpathCorruptionFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        BIT_FLIP = 0x4              # Flip a random bit in a byte.
-        BIT_TRANSPOSE = 0x8         # Transpose two side-by-side bits in a byte.
-        DO_CHAIN_ON_HIT = 0x10      # Do next corruption if this corruption is applied.
-        OVERWRITE_FIXED = 0x2       # Write a fixed value to a byte.
-        OVERWRITE_RANDOM = 0x1      # Write a random value to a byte.
-        RECALC_CSUMS = 0x20         # Attempt to re-calculate UDP and TCP checksums.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetWanpathCorruptionFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def SetWanpathCorruptionFlags():
+        class SetWanpathCorruptionFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetWanpathCorruptionFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            BIT_FLIP = 0x4              # Flip a random bit in a byte.
+            BIT_TRANSPOSE = 0x8         # Transpose two side-by-side bits in a byte.
+            DO_CHAIN_ON_HIT = 0x10      # Do next corruption if this corruption is applied.
+            OVERWRITE_FIXED = 0x2       # Write a fixed value to a byte.
+            OVERWRITE_RANDOM = 0x1      # Write a random value to a byte.
+            RECALC_CSUMS = 0x20         # Attempt to re-calculate UDP and TCP checksums.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetWanpathCorruptionFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetWanpathCorruptionFlags
 
     def post_set_wanpath_corruption(self, 
                                     byte: str = None,                         # The byte to use for OVERWRITE_FIXED (or NA).
@@ -16044,13 +16509,16 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_wanpath_running
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetWanpathRunningRunning(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        AS_PARENT = "AS_PARENT"    # then it will be started and stopped as the parent WanLink is.
-        RUNNING = "RUNNING"        # then it will be running at all times
-        STOPPED = "STOPPED"        # then it will not be running at any time.
+    @LazyClass
+    def SetWanpathRunningRunning():
+        class SetWanpathRunningRunning(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            AS_PARENT = "AS_PARENT"    # then it will be started and stopped as the parent WanLink is.
+            RUNNING = "RUNNING"        # then it will be running at all times
+            STOPPED = "STOPPED"        # then it will not be running at any time.
+        return SetWanpathRunningRunning
 
     def post_set_wanpath_running(self, 
                                  running: str = None,                      # The state, one of: AS_PARENT, RUNNING, STOPPED.
@@ -16108,37 +16576,40 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_wifi_corruptions
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetWifiCorruptionsCorruptFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetWifiCorruptionsCorruptFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        MSG_TYPE_DEAUTH = 0x2                   # de-authentication message
-        MSG_TYPE_EAPOL = 0x1                    # Any EAPOL message
-        MSG_TYPE_EAPOL_1_OF_2 = 0x40            # EAPOL message 1/2
-        MSG_TYPE_EAPOL_1_OF_4 = 0x4             # EAPOL message 1/4
-        MSG_TYPE_EAPOL_2_OF_2 = 0x80            # EAPOL message 2/2
-        MSG_TYPE_EAPOL_2_OF_4 = 0x8             # EAPOL message 2/4
-        MSG_TYPE_EAPOL_3_OF_4 = 0x10            # EAPOL message 3/4
-        MSG_TYPE_EAPOL_4_OF_4 = 0x20            # EAPOL message 4/4
-        MSG_TYPE_EAPOL_ASSOC = 0x200            # EAP Association
-        MSG_TYPE_EAPOL_KEY_REQ = 0x100          # EAP Key Request (not sure if this works properly)
-        MST_TYPE_EAPOL_ID_REQ = 0x400           # EAP Identity request
-        MST_TYPE_EAPOL_ID_RESP = 0x800          # EAP Identity response
-        MST_TYPE_EAPOL_OTHER_REQ = 0x1000       # EAP Requests that do not match other things.
-        MST_TYPE_EAPOL_OTHER_RESP = 0x2000      # EAP Responses that do not match other things.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetWifiCorruptionsCorruptFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def SetWifiCorruptionsCorruptFlags():
+        class SetWifiCorruptionsCorruptFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetWifiCorruptionsCorruptFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            MSG_TYPE_DEAUTH = 0x2                   # de-authentication message
+            MSG_TYPE_EAPOL = 0x1                    # Any EAPOL message
+            MSG_TYPE_EAPOL_1_OF_2 = 0x40            # EAPOL message 1/2
+            MSG_TYPE_EAPOL_1_OF_4 = 0x4             # EAPOL message 1/4
+            MSG_TYPE_EAPOL_2_OF_2 = 0x80            # EAPOL message 2/2
+            MSG_TYPE_EAPOL_2_OF_4 = 0x8             # EAPOL message 2/4
+            MSG_TYPE_EAPOL_3_OF_4 = 0x10            # EAPOL message 3/4
+            MSG_TYPE_EAPOL_4_OF_4 = 0x20            # EAPOL message 4/4
+            MSG_TYPE_EAPOL_ASSOC = 0x200            # EAP Association
+            MSG_TYPE_EAPOL_KEY_REQ = 0x100          # EAP Key Request (not sure if this works properly)
+            MST_TYPE_EAPOL_ID_REQ = 0x400           # EAP Identity request
+            MST_TYPE_EAPOL_ID_RESP = 0x800          # EAP Identity response
+            MST_TYPE_EAPOL_OTHER_REQ = 0x1000       # EAP Requests that do not match other things.
+            MST_TYPE_EAPOL_OTHER_RESP = 0x2000      # EAP Responses that do not match other things.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetWifiCorruptionsCorruptFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetWifiCorruptionsCorruptFlags
 
     def post_set_wifi_corruptions(self, 
                                   corrupt_flags: str = None,                # Specify packet types to corrupt (see flags
@@ -16615,68 +17086,74 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_wifi_radio
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetWifiRadioFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetWifiRadioFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        allow_all_mcs = 0x400000         # Enable MCS otherwise disabled by firmware (ath10k only).
-        ct_sta_mode = 0x40000            # Enable CT-STA mode if radio supports it. Efficiently replaces sw-crypt
-        # +in some firmware.
-        extra_rxstatus = 0x2000000       # Enable increased packet rx-stats. May decrease performance. MTK radios
-        # +only.
-        extra_txstatus = 0x1000000       # Enable increased packet tx-stats. May decrease performance. MTK radios
-        # +only.
-        firmware_cfg = 0x80000           # Apply firmware config.
-        hw_sim = 0x1                     # Create hw-sim virtual radio if radio does not already exist.
-        ignore_radar = 0x200000          # Ignore RADAR events reported by firmware.
-        no_runtime_pm = 0x800000         # Disable runtime deep sleep mode (mtk7921k only at current)
-        no_scan_share = 0x40             # Disable sharing scan results.
-        no_sw_crypt = 0x20000            # Disable software-crypt for this radio. Disables some virtual-station
-        # +features.
-        ofdma_stats = 0x4000000          # Enable increased OFDMA statistics. May decrease performance. MTK
-        # +radios only.
-        txs_all_skb = 0x8000000          # Request TX status for every packet. May decrease performance. MTK
-        # +radios only.
-        use_syslog = 0x20000000          # Put supplicant logs in syslog instead of a file.
-        verbose = 0x10000                # Verbose-Debug: Increase debug info in wpa-supplicant and hostapd logs.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetWifiRadioFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
-
-    class SetWifiRadioMode(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        p_802_11a = 1      # 802.11a
-        AUTO = 0           # 802.11g
-        a7 = 19            # 802.11a-EHT (6E disables /n and /ac)
-        aAX = 15           # 802.11a-AX (6E disables /n and /ac)
-        abg = 4            # 802.11abg
-        abgn = 5           # 802.11abgn
-        abgn7 = 16         # 802.11abgn-EHT
-        abgnAC = 8         # 802.11abgn-AC
-        abgnAX = 12        # 802.11abgn-AX
-        an = 10            # 802.11an
-        an7 = 18           # 802.11an-EHT
-        anAC = 9           # 802.11an-AC
-        anAX = 14          # 802.11an-AX
-        b = 2              # 802.11b
-        bg = 7             # 802.11bg
-        bgn = 6            # 802.11bgn
-        bgn7 = 17          # 802.11bgn-EHT
-        bgnAC = 11         # 802.11bgn-AC
-        bgnAX = 13         # 802.11bgn-AX
-        g = 3              # 802.11g
+    @LazyClass
+    def SetWifiRadioFlags():
+        class SetWifiRadioFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetWifiRadioFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            allow_all_mcs = 0x400000         # Enable MCS otherwise disabled by firmware (ath10k only).
+            ct_sta_mode = 0x40000            # Enable CT-STA mode if radio supports it. Efficiently replaces sw-crypt
+            # +in some firmware.
+            extra_rxstatus = 0x2000000       # Enable increased packet rx-stats. May decrease performance. MTK radios
+            # +only.
+            extra_txstatus = 0x1000000       # Enable increased packet tx-stats. May decrease performance. MTK radios
+            # +only.
+            firmware_cfg = 0x80000           # Apply firmware config.
+            hw_sim = 0x1                     # Create hw-sim virtual radio if radio does not already exist.
+            ignore_radar = 0x200000          # Ignore RADAR events reported by firmware.
+            no_runtime_pm = 0x800000         # Disable runtime deep sleep mode (mtk7921k only at current)
+            no_scan_share = 0x40             # Disable sharing scan results.
+            no_sw_crypt = 0x20000            # Disable software-crypt for this radio. Disables some virtual-station
+            # +features.
+            ofdma_stats = 0x4000000          # Enable increased OFDMA statistics. May decrease performance. MTK
+            # +radios only.
+            txs_all_skb = 0x8000000          # Request TX status for every packet. May decrease performance. MTK
+            # +radios only.
+            use_syslog = 0x20000000          # Put supplicant logs in syslog instead of a file.
+            verbose = 0x10000                # Verbose-Debug: Increase debug info in wpa-supplicant and hostapd logs.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetWifiRadioFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetWifiRadioFlags
+
+    @LazyClass
+    def SetWifiRadioMode():
+        class SetWifiRadioMode(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            p_802_11a = 1      # 802.11a
+            AUTO = 0           # 802.11g
+            a7 = 19            # 802.11a-EHT (6E disables /n and /ac)
+            aAX = 15           # 802.11a-AX (6E disables /n and /ac)
+            abg = 4            # 802.11abg
+            abgn = 5           # 802.11abgn
+            abgn7 = 16         # 802.11abgn-EHT
+            abgnAC = 8         # 802.11abgn-AC
+            abgnAX = 12        # 802.11abgn-AX
+            an = 10            # 802.11an
+            an7 = 18           # 802.11an-EHT
+            anAC = 9           # 802.11an-AC
+            anAX = 14          # 802.11an-AX
+            b = 2              # 802.11b
+            bg = 7             # 802.11bg
+            bgn = 6            # 802.11bgn
+            bgn7 = 17          # 802.11bgn-EHT
+            bgnAC = 11         # 802.11bgn-AC
+            bgnAX = 13         # 802.11bgn-AX
+            g = 3              # 802.11g
+        return SetWifiRadioMode
 
     def post_set_wifi_radio(self, 
                             active_peer_count: str = None,            # Number of locally-cached peer objects for this
@@ -16870,29 +17347,32 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_wifi_txo
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetWifiTxoTxoFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetWifiTxoTxoFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        block_traffic = 0x2      # Disable all tx/rx traffic from entering/exiting the network stack.
-        enable_agg = 0x1         # Enable aggregation. This can only be enabled on Intel radios (feature disabled
-        # +for now).
-        enable_bf = 0x10         # Enable Beamforming.
-        enable_ldpc = 0x4        # Enable LDPC wifi feature, should help throughput.
-        enable_stbc = 0x8        # Enable STBC wifi feature.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetWifiTxoTxoFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def SetWifiTxoTxoFlags():
+        class SetWifiTxoTxoFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetWifiTxoTxoFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            block_traffic = 0x2      # Disable all tx/rx traffic from entering/exiting the network stack.
+            enable_agg = 0x1         # Enable aggregation. This can only be enabled on Intel radios (feature disabled
+            # +for now).
+            enable_bf = 0x10         # Enable Beamforming.
+            enable_ldpc = 0x4        # Enable LDPC wifi feature, should help throughput.
+            enable_stbc = 0x8        # Enable STBC wifi feature.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetWifiTxoTxoFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetWifiTxoTxoFlags
 
     def post_set_wifi_txo(self, 
                           port: str = None,                         # WiFi interface name or number. [W]
@@ -16994,29 +17474,32 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_wl_corruption
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetWlCorruptionFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SetWlCorruptionFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        BIT_FLIP = 0x4              # Flip a random bit in a byte.
-        BIT_TRANSPOSE = 0x8         # Transpose two side-by-side bits in a byte.
-        DO_CHAIN_ON_HIT = 0x10      # Do next corruption if this corruption is applied.
-        OVERWRITE_FIXED = 0x2       # Write a fixed value to a byte.
-        OVERWRITE_RANDOM = 0x1      # Write a random value to a byte.
-        RECALC_CSUMS = 0x20         # Attempt to re-calculate UDP and TCP checksums.
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SetWlCorruptionFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def SetWlCorruptionFlags():
+        class SetWlCorruptionFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SetWlCorruptionFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            BIT_FLIP = 0x4              # Flip a random bit in a byte.
+            BIT_TRANSPOSE = 0x8         # Transpose two side-by-side bits in a byte.
+            DO_CHAIN_ON_HIT = 0x10      # Do next corruption if this corruption is applied.
+            OVERWRITE_FIXED = 0x2       # Write a fixed value to a byte.
+            OVERWRITE_RANDOM = 0x1      # Write a random value to a byte.
+            RECALC_CSUMS = 0x20         # Attempt to re-calculate UDP and TCP checksums.
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SetWlCorruptionFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SetWlCorruptionFlags
 
     def post_set_wl_corruption(self, 
                                byte: str = None,                         # The byte to use for OVERWRITE_FIXED (or NA).
@@ -17091,12 +17574,15 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#set_wl_qdisc
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SetWlQdiscQdisc(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        FIFO = "FIFO"                                      # is the default queuing discipline, no arguments
-        WRR__queue_queue_____ = "WRR,[queue,queue,...]"    # Weighted Round Robbin is also available
+    @LazyClass
+    def SetWlQdiscQdisc():
+        class SetWlQdiscQdisc(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            FIFO = "FIFO"                                      # is the default queuing discipline, no arguments
+            WRR__queue_queue_____ = "WRR,[queue,queue,...]"    # Weighted Round Robbin is also available
+        return SetWlQdiscQdisc
 
     def post_set_wl_qdisc(self, 
                           name: str = None,                         # WanLink name [R]
@@ -17205,22 +17691,25 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#show_alerts
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class ShowAlertsType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        All = "All"                            #
-        CX = "CX"                              #
-        Card = "Card"                          #
-        Channel_Group = "Channel_Group"        #
-        CollisionDomain = "CollisionDomain"    #
-        Endp = "Endp"                          #
-        PESQ = "PESQ"                          #
-        PPP_Link = "PPP_Link"                  #
-        Port = "Port"                          #
-        Shelf = "Shelf"                        #
-        Span = "Span"                          #
-        Test_Mgr = "Test_Mgr"                  #
+    @LazyClass
+    def ShowAlertsType():
+        class ShowAlertsType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            All = "All"                            #
+            CX = "CX"                              #
+            Card = "Card"                          #
+            Channel_Group = "Channel_Group"        #
+            CollisionDomain = "CollisionDomain"    #
+            Endp = "Endp"                          #
+            PESQ = "PESQ"                          #
+            PPP_Link = "PPP_Link"                  #
+            Port = "Port"                          #
+            Shelf = "Shelf"                        #
+            Span = "Span"                          #
+            Test_Mgr = "Test_Mgr"                  #
+        return ShowAlertsType
 
     def post_show_alerts(self, 
                          card: int = None,                         # Alert resource filter.
@@ -17957,22 +18446,25 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#show_events
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class ShowEventsType(Enum):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            Example Usage: 
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-        All = "All"                            #
-        CX = "CX"                              #
-        Card = "Card"                          #
-        Channel_Group = "Channel_Group"        #
-        CollisionDomain = "CollisionDomain"    #
-        Endp = "Endp"                          #
-        PESQ = "PESQ"                          #
-        PPP_Link = "PPP_Link"                  #
-        Port = "Port"                          #
-        Shelf = "Shelf"                        #
-        Span = "Span"                          #
-        Test_Mgr = "Test_Mgr"                  #
+    @LazyClass
+    def ShowEventsType():
+        class ShowEventsType(Enum):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                Example Usage: 
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+            All = "All"                            #
+            CX = "CX"                              #
+            Card = "Card"                          #
+            Channel_Group = "Channel_Group"        #
+            CollisionDomain = "CollisionDomain"    #
+            Endp = "Endp"                          #
+            PESQ = "PESQ"                          #
+            PPP_Link = "PPP_Link"                  #
+            Port = "Port"                          #
+            Shelf = "Shelf"                        #
+            Span = "Span"                          #
+            Test_Mgr = "Test_Mgr"                  #
+        return ShowEventsType
 
     def post_show_events(self, 
                          card: int = None,                         # Event resource filter.
@@ -19179,28 +19671,31 @@ class LFJsonCommand(JsonCommand):
         https://www.candelatech.com/lfcli_ug.php#sniff_port
     ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
 
-    class SniffPortFlags(IntFlag):
-        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-            This class is stateless. It can do binary flag math, returning the integer value.
-            Example Usage: 
-                int:flag_val = 0
-                flag_val = LFPost.set_flags(SniffPortFlags, 0, flag_names=['bridge', 'dhcp'])
-        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
-
-        DUMPCAP = 0x2                 # Use command-line dumpcap, more efficient than tshark
-        MATE_KILL_DUMPCAP = 0x10      # Kill last dumpcap
-        MATE_TERMINAL = 0x4           # Launch tshark/dumpcap in mate-terminal
-        MATE_XTERM = 0x8              # Launch tshark/dumpcap in xterm
-        TSHARK = 0x1                  # Use command-line tshark instead of wireshark
-
-        # use to get in value of flag
-        @classmethod
-        def valueof(cls, name=None):
-            if name is None:
-                return name
-            if name not in cls.__members__:
-                raise ValueError("SniffPortFlags has no member:[%s]" % name)
-            return (cls[member].value for member in cls.__members__ if member == name)
+    @LazyClass
+    def SniffPortFlags():
+        class SniffPortFlags(IntFlag):
+            """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+                This class is stateless. It can do binary flag math, returning the integer value.
+                Example Usage: 
+                    int:flag_val = 0
+                    flag_val = LFPost.set_flags(SniffPortFlags, 0, flag_names=['bridge', 'dhcp'])
+            ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+
+            DUMPCAP = 0x2                 # Use command-line dumpcap, more efficient than tshark
+            MATE_KILL_DUMPCAP = 0x10      # Kill last dumpcap
+            MATE_TERMINAL = 0x4           # Launch tshark/dumpcap in mate-terminal
+            MATE_XTERM = 0x8              # Launch tshark/dumpcap in xterm
+            TSHARK = 0x1                  # Use command-line tshark instead of wireshark
+
+            # use to get in value of flag
+            @classmethod
+            def valueof(cls, name=None):
+                if name is None:
+                    return name
+                if name not in cls.__members__:
+                    raise ValueError("SniffPortFlags has no member:[%s]" % name)
+                return (cls[member].value for member in cls.__members__ if member == name)
+        return SniffPortFlags
 
     def post_sniff_port(self, 
                         display: str = None,                      # The DISPLAY option, for example: 192.168.1.5:0.0. Will
@@ -25141,6 +25636,315 @@ class LFJsonQuery(JsonQuery):
     #
 
 
+# CLI commands with a post_ method in LFJsonCommand, and urls with a get_ method in LFJsonQuery;
+# LFSession.find_method looks these up in a MethodRegistry.
+# HAND-MAINTAINED: not emitted by JsonApiPythonGenerator yet, see MAINTENANCE at the top of this file.
+CLI_COMMAND_NAMES = (
+    "adb",
+    "adb_bt",
+    "adb_gui",
+    "adb_timeout",
+    "adb_wifi_event",
+    "add_adb",
+    "add_arm_endp",
+    "add_bgp_peer",
+    "add_bond",
+    "add_br",
+    "add_cd",
+    "add_cd_endp",
+    "add_cd_vr",
+    "add_cell_emulator",
+    "add_chamber",
+    "add_chamber_cx",
+    "add_chamber_path",
+    "add_channel_group",
+    "add_cx",
+    "add_dut",
+    "add_dut_notes",
+    "add_dut_ssid",
+    "add_endp",
+    "add_event",
+    "add_file_endp",
+    "add_gen_endp",
+    "add_gre",
+    "add_group",
+    "add_l4_endp",
+    "add_monitor",
+    "add_mvlan",
+    "add_ppp_link",
+    "add_profile",
+    "add_profile_notes",
+    "add_rdd",
+    "add_sec_ip",
+    "add_sta",
+    "add_t1_span",
+    "add_text_blob",
+    "add_tgcx",
+    "add_threshold",
+    "add_tm",
+    "add_traffic_profile",
+    "add_traffic_profile_notes",
+    "add_vap",
+    "add_venue",
+    "add_vlan",
+    "add_voip_endp",
+    "add_vr",
+    "add_vr_bgp",
+    "add_vrcx",
+    "add_vrcx2",
+    "add_wanpath",
+    "add_wg",
+    "add_wl_endp",
+    "admin",
+    "apply_vr_cfg",
+    "blink_attenuator",
+    "c_show_ports",
+    "cancel_vr_cfg",
+    "clear_cd_counters",
+    "clear_cx_counters",
+    "clear_endp_counters",
+    "clear_group",
+    "clear_port_counters",
+    "clear_resource_counters",
+    "clear_wifi_profiles",
+    "clear_wp_counters",
+    "create_client",
+    "diag",
+    "discover",
+    "do_pesq",
+    "file",
+    "flash_attenuator",
+    "getavglatency",
+    "getinrxbps",
+    "getinrxrate",
+    "getintxrate",
+    "getipadd",
+    "getmac",
+    "getmask",
+    "getpktdrops",
+    "getrxendperrpkts",
+    "getrxpkts",
+    "getrxporterrpkts",
+    "gettxpkts",
+    "gossip",
+    "help",
+    "init_wiser",
+    "ios",
+    "licenses",
+    "load",
+    "log_capture",
+    "log_level",
+    "log_msg",
+    "login",
+    "motd",
+    "nc_show_cd",
+    "nc_show_channel_groups",
+    "nc_show_endpoints",
+    "nc_show_pesq",
+    "nc_show_ports",
+    "nc_show_ppp_links",
+    "nc_show_spans",
+    "nc_show_vr",
+    "nc_show_vrcx",
+    "notify_dhcp",
+    "port_reset_completed",
+    "probe_port",
+    "probe_ports",
+    "quiesce_endp",
+    "quiesce_group",
+    "quit",
+    "reboot_os",
+    "report",
+    "reset_port",
+    "reset_serial_span",
+    "rm_adb",
+    "rm_attenuator",
+    "rm_cd",
+    "rm_cd_endp",
+    "rm_cd_vr",
+    "rm_cell_emulator",
+    "rm_chamber",
+    "rm_chamber_path",
+    "rm_channel_group",
+    "rm_client",
+    "rm_cx",
+    "rm_db",
+    "rm_dut",
+    "rm_endp",
+    "rm_event",
+    "rm_group",
+    "rm_ppp_link",
+    "rm_profile",
+    "rm_resource",
+    "rm_rfgen",
+    "rm_sec_ip",
+    "rm_span",
+    "rm_test_mgr",
+    "rm_text_blob",
+    "rm_tgcx",
+    "rm_threshold",
+    "rm_traffic_profile",
+    "rm_venue",
+    "rm_vlan",
+    "rm_vr",
+    "rm_vrcx",
+    "rm_wanpath",
+    "rpt_script",
+    "scan_wifi",
+    "set_arm_info",
+    "set_attenuator",
+    "set_chamber",
+    "set_cx_report_timer",
+    "set_cx_state",
+    "set_endp_addr",
+    "set_endp_details",
+    "set_endp_file",
+    "set_endp_flag",
+    "set_endp_payload",
+    "set_endp_pld_bounds",
+    "set_endp_proxy",
+    "set_endp_quiesce",
+    "set_endp_report_timer",
+    "set_endp_tos",
+    "set_endp_tx_bounds",
+    "set_event_interest",
+    "set_event_priority",
+    "set_fe_info",
+    "set_flag",
+    "set_gen_cmd",
+    "set_gps_info",
+    "set_ifup_script",
+    "set_l4_endp",
+    "set_license",
+    "set_mc_endp",
+    "set_password",
+    "set_poll_mode",
+    "set_port",
+    "set_port2",
+    "set_port_alias",
+    "set_ppp_link_state",
+    "set_resource",
+    "set_rfgen",
+    "set_script",
+    "set_sec_ip",
+    "set_test_id",
+    "set_voip_info",
+    "set_vrcx_cost",
+    "set_wanlink_info",
+    "set_wanlink_pcap",
+    "set_wanpath_corruption",
+    "set_wanpath_filter",
+    "set_wanpath_running",
+    "set_wifi_corruptions",
+    "set_wifi_custom",
+    "set_wifi_extra",
+    "set_wifi_extra2",
+    "set_wifi_radio",
+    "set_wifi_txo",
+    "set_wl_corruption",
+    "set_wl_qdisc",
+    "show_adb",
+    "show_alerts",
+    "show_attenuators",
+    "show_cd",
+    "show_cell_emulator",
+    "show_chamber",
+    "show_channel_groups",
+    "show_clients",
+    "show_cx",
+    "show_cxe",
+    "show_dbs",
+    "show_dut",
+    "show_endp_payload",
+    "show_endpoints",
+    "show_err",
+    "show_event_interest",
+    "show_events",
+    "show_files",
+    "show_group",
+    "show_mlo_link",
+    "show_pesq",
+    "show_ports",
+    "show_ppp_links",
+    "show_profile",
+    "show_resources",
+    "show_rfgen",
+    "show_rt",
+    "show_script_results",
+    "show_spans",
+    "show_text_blob",
+    "show_tm",
+    "show_traffic_profile",
+    "show_venue",
+    "show_vr",
+    "show_vrcx",
+    "show_wanpaths",
+    "shutdown",
+    "shutdown_os",
+    "shutdown_resource",
+    "sniff_port",
+    "start_endp",
+    "start_group",
+    "start_ppp_link",
+    "stop_endp",
+    "stop_group",
+    "stop_ppp_link",
+    "tail",
+    "tm_register",
+    "tm_unregister",
+    "version",
+    "who",
+    "wifi_cli_cmd",
+    "wifi_event",
+    "wiser_reset",
+    "write",
+)
+
+QUERY_URL_NAMES = (
+    "/adb",
+    "/alerts",
+    "/arm",
+    "/arm-endp",
+    "/attenuator",
+    "/chamber",
+    "/control",
+    "/cx",
+    "/database",
+    "/dut",
+    "/endp",
+    "/endsession",
+    "/events",
+    "/fileio",
+    "/generic",
+    "/gui-cli",
+    "/layer4",
+    "/mlo",
+    "/newsession",
+    "/port",
+    "/probe",
+    "/profile",
+    "/profiles",
+    "/quit",
+    "/radiostatus",
+    "/resource",
+    "/rfgen",
+    "/scan",
+    "/stations",
+    "/status-msg",
+    "/test-group",
+    "/text",
+    "/voip",
+    "/voip-endp",
+    "/vr",
+    "/vrcx",
+    "/wifi-msg",
+    "/wifi-stats",
+    "/wl",
+    "/wl-endp",
+    "/ws-msg",
+)
+
+
 class LFSession(BaseSession):
     """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
         This subclass of BaseSession knows about LFJsonQuery and LFJsonCommand
@@ -25152,7 +25956,8 @@ class LFSession(BaseSession):
                  stream_errors: bool = True,
                  stream_warnings: bool = False,
                  require_session: bool = False,
-                 exit_on_error: bool = False):
+                 exit_on_error: bool = False,
+                 retry_policy_: retry_policy.RetryPolicy = None):
         """
         :param debug: turn on diagnostic information
         :param proxy_map: a dict with addresses of proxies to route requests through.
@@ -25165,6 +25970,7 @@ class LFSession(BaseSession):
         :param require_session: exit(1) if unable to establish a session_id
         :param exit_on_error: on requests failing HTTP requests on besides error 404,
         exit(1). This does not include failing to establish a session_id
+        :param retry_policy_: retry_policy.RetryPolicy for this session's requests, None for the default
         """
         super().__init__(lfclient_url=lfclient_url,
                          debug=debug,
@@ -25172,7 +25978,8 @@ class LFSession(BaseSession):
                          connection_timeout_sec=connection_timeout_sec,
                          stream_errors=stream_errors,
                          stream_warnings=stream_warnings,
-                         exit_on_error=exit_on_error)
+                         exit_on_error=exit_on_error,
+                         retry_policy_=retry_policy_)
         self.command_instance = LFJsonCommand(session_obj=self, debug=debug, exit_on_error=exit_on_error)
         self.session_connection_check = \
             self.command_instance.start_session(debug=debug,
@@ -25185,7 +25992,7 @@ class LFSession(BaseSession):
         if require_session and (not BaseSession.session_id):
             self.logger.error('LFSession failed to setup session_id correctly') 
         self.query_instance = LFJsonQuery(session_obj=self, debug=debug, exit_on_error=exit_on_error)
-        self.method_map : dict = {}
+        self.method_map : Mapping = {}
 
     def get_command(self) -> LFJsonCommand:
         """
@@ -25217,307 +26024,9 @@ class LFSession(BaseSession):
             to assembling method calls at runtime.
         ---- ---- ---- ---- """
         if not self.method_map or len(self.method_map) < 1:
-            self.method_map = {
-                "adb": self.command_instance.post_adb,
-                "adb_bt": self.command_instance.post_adb_bt,
-                "adb_gui": self.command_instance.post_adb_gui,
-                "adb_timeout": self.command_instance.post_adb_timeout,
-                "adb_wifi_event": self.command_instance.post_adb_wifi_event,
-                "add_adb": self.command_instance.post_add_adb,
-                "add_arm_endp": self.command_instance.post_add_arm_endp,
-                "add_bgp_peer": self.command_instance.post_add_bgp_peer,
-                "add_bond": self.command_instance.post_add_bond,
-                "add_br": self.command_instance.post_add_br,
-                "add_cd": self.command_instance.post_add_cd,
-                "add_cd_endp": self.command_instance.post_add_cd_endp,
-                "add_cd_vr": self.command_instance.post_add_cd_vr,
-                "add_cell_emulator": self.command_instance.post_add_cell_emulator,
-                "add_chamber": self.command_instance.post_add_chamber,
-                "add_chamber_cx": self.command_instance.post_add_chamber_cx,
-                "add_chamber_path": self.command_instance.post_add_chamber_path,
-                "add_channel_group": self.command_instance.post_add_channel_group,
-                "add_cx": self.command_instance.post_add_cx,
-                "add_dut": self.command_instance.post_add_dut,
-                "add_dut_notes": self.command_instance.post_add_dut_notes,
-                "add_dut_ssid": self.command_instance.post_add_dut_ssid,
-                "add_endp": self.command_instance.post_add_endp,
-                "add_event": self.command_instance.post_add_event,
-                "add_file_endp": self.command_instance.post_add_file_endp,
-                "add_gen_endp": self.command_instance.post_add_gen_endp,
-                "add_gre": self.command_instance.post_add_gre,
-                "add_group": self.command_instance.post_add_group,
-                "add_l4_endp": self.command_instance.post_add_l4_endp,
-                "add_monitor": self.command_instance.post_add_monitor,
-                "add_mvlan": self.command_instance.post_add_mvlan,
-                "add_ppp_link": self.command_instance.post_add_ppp_link,
-                "add_profile": self.command_instance.post_add_profile,
-                "add_profile_notes": self.command_instance.post_add_profile_notes,
-                "add_rdd": self.command_instance.post_add_rdd,
-                "add_sec_ip": self.command_instance.post_add_sec_ip,
-                "add_sta": self.command_instance.post_add_sta,
-                "add_t1_span": self.command_instance.post_add_t1_span,
-                "add_text_blob": self.command_instance.post_add_text_blob,
-                "add_tgcx": self.command_instance.post_add_tgcx,
-                "add_threshold": self.command_instance.post_add_threshold,
-                "add_tm": self.command_instance.post_add_tm,
-                "add_traffic_profile": self.command_instance.post_add_traffic_profile,
-                "add_traffic_profile_notes": self.command_instance.post_add_traffic_profile_notes,
-                "add_vap": self.command_instance.post_add_vap,
-                "add_venue": self.command_instance.post_add_venue,
-                "add_vlan": self.command_instance.post_add_vlan,
-                "add_voip_endp": self.command_instance.post_add_voip_endp,
-                "add_vr": self.command_instance.post_add_vr,
-                "add_vr_bgp": self.command_instance.post_add_vr_bgp,
-                "add_vrcx": self.command_instance.post_add_vrcx,
-                "add_vrcx2": self.command_instance.post_add_vrcx2,
-                "add_wanpath": self.command_instance.post_add_wanpath,
-                "add_wg": self.command_instance.post_add_wg,
-                "add_wl_endp": self.command_instance.post_add_wl_endp,
-                "admin": self.command_instance.post_admin,
-                "apply_vr_cfg": self.command_instance.post_apply_vr_cfg,
-                "blink_attenuator": self.command_instance.post_blink_attenuator,
-                "c_show_ports": self.command_instance.post_c_show_ports,
-                "cancel_vr_cfg": self.command_instance.post_cancel_vr_cfg,
-                "clear_cd_counters": self.command_instance.post_clear_cd_counters,
-                "clear_cx_counters": self.command_instance.post_clear_cx_counters,
-                "clear_endp_counters": self.command_instance.post_clear_endp_counters,
-                "clear_group": self.command_instance.post_clear_group,
-                "clear_port_counters": self.command_instance.post_clear_port_counters,
-                "clear_resource_counters": self.command_instance.post_clear_resource_counters,
-                "clear_wifi_profiles": self.command_instance.post_clear_wifi_profiles,
-                "clear_wp_counters": self.command_instance.post_clear_wp_counters,
-                "create_client": self.command_instance.post_create_client,
-                "diag": self.command_instance.post_diag,
-                "discover": self.command_instance.post_discover,
-                "do_pesq": self.command_instance.post_do_pesq,
-                "file": self.command_instance.post_file,
-                "flash_attenuator": self.command_instance.post_flash_attenuator,
-                "getavglatency": self.command_instance.post_getavglatency,
-                "getinrxbps": self.command_instance.post_getinrxbps,
-                "getinrxrate": self.command_instance.post_getinrxrate,
-                "getintxrate": self.command_instance.post_getintxrate,
-                "getipadd": self.command_instance.post_getipadd,
-                "getmac": self.command_instance.post_getmac,
-                "getmask": self.command_instance.post_getmask,
-                "getpktdrops": self.command_instance.post_getpktdrops,
-                "getrxendperrpkts": self.command_instance.post_getrxendperrpkts,
-                "getrxpkts": self.command_instance.post_getrxpkts,
-                "getrxporterrpkts": self.command_instance.post_getrxporterrpkts,
-                "gettxpkts": self.command_instance.post_gettxpkts,
-                "gossip": self.command_instance.post_gossip,
-                "help": self.command_instance.post_help,
-                "init_wiser": self.command_instance.post_init_wiser,
-                "ios": self.command_instance.post_ios,
-                "licenses": self.command_instance.post_licenses,
-                "load": self.command_instance.post_load,
-                "log_capture": self.command_instance.post_log_capture,
-                "log_level": self.command_instance.post_log_level,
-                "log_msg": self.command_instance.post_log_msg,
-                "login": self.command_instance.post_login,
-                "motd": self.command_instance.post_motd,
-                "nc_show_cd": self.command_instance.post_nc_show_cd,
-                "nc_show_channel_groups": self.command_instance.post_nc_show_channel_groups,
-                "nc_show_endpoints": self.command_instance.post_nc_show_endpoints,
-                "nc_show_pesq": self.command_instance.post_nc_show_pesq,
-                "nc_show_ports": self.command_instance.post_nc_show_ports,
-                "nc_show_ppp_links": self.command_instance.post_nc_show_ppp_links,
-                "nc_show_spans": self.command_instance.post_nc_show_spans,
-                "nc_show_vr": self.command_instance.post_nc_show_vr,
-                "nc_show_vrcx": self.command_instance.post_nc_show_vrcx,
-                "notify_dhcp": self.command_instance.post_notify_dhcp,
-                "port_reset_completed": self.command_instance.post_port_reset_completed,
-                "probe_port": self.command_instance.post_probe_port,
-                "probe_ports": self.command_instance.post_probe_ports,
-                "quiesce_endp": self.command_instance.post_quiesce_endp,
-                "quiesce_group": self.command_instance.post_quiesce_group,
-                "quit": self.command_instance.post_quit,
-                "reboot_os": self.command_instance.post_reboot_os,
-                "report": self.command_instance.post_report,
-                "reset_port": self.command_instance.post_reset_port,
-                "reset_serial_span": self.command_instance.post_reset_serial_span,
-                "rm_adb": self.command_instance.post_rm_adb,
-                "rm_attenuator": self.command_instance.post_rm_attenuator,
-                "rm_cd": self.command_instance.post_rm_cd,
-                "rm_cd_endp": self.command_instance.post_rm_cd_endp,
-                "rm_cd_vr": self.command_instance.post_rm_cd_vr,
-                "rm_cell_emulator": self.command_instance.post_rm_cell_emulator,
-                "rm_chamber": self.command_instance.post_rm_chamber,
-                "rm_chamber_path": self.command_instance.post_rm_chamber_path,
-                "rm_channel_group": self.command_instance.post_rm_channel_group,
-                "rm_client": self.command_instance.post_rm_client,
-                "rm_cx": self.command_instance.post_rm_cx,
-                "rm_db": self.command_instance.post_rm_db,
-                "rm_dut": self.command_instance.post_rm_dut,
-                "rm_endp": self.command_instance.post_rm_endp,
-                "rm_event": self.command_instance.post_rm_event,
-                "rm_group": self.command_instance.post_rm_group,
-                "rm_ppp_link": self.command_instance.post_rm_ppp_link,
-                "rm_profile": self.command_instance.post_rm_profile,
-                "rm_resource": self.command_instance.post_rm_resource,
-                "rm_rfgen": self.command_instance.post_rm_rfgen,
-                "rm_sec_ip": self.command_instance.post_rm_sec_ip,
-                "rm_span": self.command_instance.post_rm_span,
-                "rm_test_mgr": self.command_instance.post_rm_test_mgr,
-                "rm_text_blob": self.command_instance.post_rm_text_blob,
-                "rm_tgcx": self.command_instance.post_rm_tgcx,
-                "rm_threshold": self.command_instance.post_rm_threshold,
-                "rm_traffic_profile": self.command_instance.post_rm_traffic_profile,
-                "rm_venue": self.command_instance.post_rm_venue,
-                "rm_vlan": self.command_instance.post_rm_vlan,
-                "rm_vr": self.command_instance.post_rm_vr,
-                "rm_vrcx": self.command_instance.post_rm_vrcx,
-                "rm_wanpath": self.command_instance.post_rm_wanpath,
-                "rpt_script": self.command_instance.post_rpt_script,
-                "scan_wifi": self.command_instance.post_scan_wifi,
-                "set_arm_info": self.command_instance.post_set_arm_info,
-                "set_attenuator": self.command_instance.post_set_attenuator,
-                "set_chamber": self.command_instance.post_set_chamber,
-                "set_cx_report_timer": self.command_instance.post_set_cx_report_timer,
-                "set_cx_state": self.command_instance.post_set_cx_state,
-                "set_endp_addr": self.command_instance.post_set_endp_addr,
-                "set_endp_details": self.command_instance.post_set_endp_details,
-                "set_endp_file": self.command_instance.post_set_endp_file,
-                "set_endp_flag": self.command_instance.post_set_endp_flag,
-                "set_endp_payload": self.command_instance.post_set_endp_payload,
-                "set_endp_pld_bounds": self.command_instance.post_set_endp_pld_bounds,
-                "set_endp_proxy": self.command_instance.post_set_endp_proxy,
-                "set_endp_quiesce": self.command_instance.post_set_endp_quiesce,
-                "set_endp_report_timer": self.command_instance.post_set_endp_report_timer,
-                "set_endp_tos": self.command_instance.post_set_endp_tos,
-                "set_endp_tx_bounds": self.command_instance.post_set_endp_tx_bounds,
-                "set_event_interest": self.command_instance.post_set_event_interest,
-                "set_event_priority": self.command_instance.post_set_event_priority,
-                "set_fe_info": self.command_instance.post_set_fe_info,
-                "set_flag": self.command_instance.post_set_flag,
-                "set_gen_cmd": self.command_instance.post_set_gen_cmd,
-                "set_gps_info": self.command_instance.post_set_gps_info,
-                "set_ifup_script": self.command_instance.post_set_ifup_script,
-                "set_l4_endp": self.command_instance.post_set_l4_endp,
-                "set_license": self.command_instance.post_set_license,
-                "set_mc_endp": self.command_instance.post_set_mc_endp,
-                "set_password": self.command_instance.post_set_password,
-                "set_poll_mode": self.command_instance.post_set_poll_mode,
-                "set_port": self.command_instance.post_set_port,
-                "set_port2": self.command_instance.post_set_port2,
-                "set_port_alias": self.command_instance.post_set_port_alias,
-                "set_ppp_link_state": self.command_instance.post_set_ppp_link_state,
-                "set_resource": self.command_instance.post_set_resource,
-                "set_rfgen": self.command_instance.post_set_rfgen,
-                "set_script": self.command_instance.post_set_script,
-                "set_sec_ip": self.command_instance.post_set_sec_ip,
-                "set_test_id": self.command_instance.post_set_test_id,
-                "set_voip_info": self.command_instance.post_set_voip_info,
-                "set_vrcx_cost": self.command_instance.post_set_vrcx_cost,
-                "set_wanlink_info": self.command_instance.post_set_wanlink_info,
-                "set_wanlink_pcap": self.command_instance.post_set_wanlink_pcap,
-                "set_wanpath_corruption": self.command_instance.post_set_wanpath_corruption,
-                "set_wanpath_filter": self.command_instance.post_set_wanpath_filter,
-                "set_wanpath_running": self.command_instance.post_set_wanpath_running,
-                "set_wifi_corruptions": self.command_instance.post_set_wifi_corruptions,
-                "set_wifi_custom": self.command_instance.post_set_wifi_custom,
-                "set_wifi_extra": self.command_instance.post_set_wifi_extra,
-                "set_wifi_extra2": self.command_instance.post_set_wifi_extra2,
-                "set_wifi_radio": self.command_instance.post_set_wifi_radio,
-                "set_wifi_txo": self.command_instance.post_set_wifi_txo,
-                "set_wl_corruption": self.command_instance.post_set_wl_corruption,
-                "set_wl_qdisc": self.command_instance.post_set_wl_qdisc,
-                "show_adb": self.command_instance.post_show_adb,
-                "show_alerts": self.command_instance.post_show_alerts,
-                "show_attenuators": self.command_instance.post_show_attenuators,
-                "show_cd": self.command_instance.post_show_cd,
-                "show_cell_emulator": self.command_instance.post_show_cell_emulator,
-                "show_chamber": self.command_instance.post_show_chamber,
-                "show_channel_groups": self.command_instance.post_show_channel_groups,
-                "show_clients": self.command_instance.post_show_clients,
-                "show_cx": self.command_instance.post_show_cx,
-                "show_cxe": self.command_instance.post_show_cxe,
-                "show_dbs": self.command_instance.post_show_dbs,
-                "show_dut": self.command_instance.post_show_dut,
-                "show_endp_payload": self.command_instance.post_show_endp_payload,
-                "show_endpoints": self.command_instance.post_show_endpoints,
-                "show_err": self.command_instance.post_show_err,
-                "show_event_interest": self.command_instance.post_show_event_interest,
-                "show_events": self.command_instance.post_show_events,
-                "show_files": self.command_instance.post_show_files,
-                "show_group": self.command_instance.post_show_group,
-                "show_mlo_link": self.command_instance.post_show_mlo_link,
-                "show_pesq": self.command_instance.post_show_pesq,
-                "show_ports": self.command_instance.post_show_ports,
-                "show_ppp_links": self.command_instance.post_show_ppp_links,
-                "show_profile": self.command_instance.post_show_profile,
-                "show_resources": self.command_instance.post_show_resources,
-                "show_rfgen": self.command_instance.post_show_rfgen,
-                "show_rt": self.command_instance.post_show_rt,
-                "show_script_results": self.command_instance.post_show_script_results,
-                "show_spans": self.command_instance.post_show_spans,
-                "show_text_blob": self.command_instance.post_show_text_blob,
-                "show_tm": self.command_instance.post_show_tm,
-                "show_traffic_profile": self.command_instance.post_show_traffic_profile,
-                "show_venue": self.command_instance.post_show_venue,
-                "show_vr": self.command_instance.post_show_vr,
-                "show_vrcx": self.command_instance.post_show_vrcx,
-                "show_wanpaths": self.command_instance.post_show_wanpaths,
-                "shutdown": self.command_instance.post_shutdown,
-                "shutdown_os": self.command_instance.post_shutdown_os,
-                "shutdown_resource": self.command_instance.post_shutdown_resource,
-                "sniff_port": self.command_instance.post_sniff_port,
-                "start_endp": self.command_instance.post_start_endp,
-                "start_group": self.command_instance.post_start_group,
-                "start_ppp_link": self.command_instance.post_start_ppp_link,
-                "stop_endp": self.command_instance.post_stop_endp,
-                "stop_group": self.command_instance.post_stop_group,
-                "stop_ppp_link": self.command_instance.post_stop_ppp_link,
-                "tail": self.command_instance.post_tail,
-                "tm_register": self.command_instance.post_tm_register,
-                "tm_unregister": self.command_instance.post_tm_unregister,
-                "version": self.command_instance.post_version,
-                "who": self.command_instance.post_who,
-                "wifi_cli_cmd": self.command_instance.post_wifi_cli_cmd,
-                "wifi_event": self.command_instance.post_wifi_event,
-                "wiser_reset": self.command_instance.post_wiser_reset,
-                "write": self.command_instance.post_write,
-                "/adb": self.query_instance.get_adb,
-                "/alerts": self.query_instance.get_alerts,
-                "/arm": self.query_instance.get_arm,
-                "/arm-endp": self.query_instance.get_arm_endp,
-                "/attenuator": self.query_instance.get_attenuator,
-                "/chamber": self.query_instance.get_chamber,
-                "/control": self.query_instance.get_control,
-                "/cx": self.query_instance.get_cx,
-                "/database": self.query_instance.get_database,
-                "/dut": self.query_instance.get_dut,
-                "/endp": self.query_instance.get_endp,
-                "/endsession": self.query_instance.get_endsession,
-                "/events": self.query_instance.get_events,
-                "/fileio": self.query_instance.get_fileio,
-                "/generic": self.query_instance.get_generic,
-                "/gui-cli": self.query_instance.get_gui_cli,
-                "/layer4": self.query_instance.get_layer4,
-                "/mlo": self.query_instance.get_mlo,
-                "/newsession": self.query_instance.get_newsession,
-                "/port": self.query_instance.get_port,
-                "/probe": self.query_instance.get_probe,
-                "/profile": self.query_instance.get_profile,
-                "/profiles": self.query_instance.get_profiles,
-                "/quit": self.query_instance.get_quit,
-                "/radiostatus": self.query_instance.get_radiostatus,
-                "/resource": self.query_instance.get_resource,
-                "/rfgen": self.query_instance.get_rfgen,
-                "/scan": self.query_instance.get_scan,
-                "/stations": self.query_instance.get_stations,
-                "/status-msg": self.query_instance.get_status_msg,
-                "/test-group": self.query_instance.get_test_group,
-                "/text": self.query_instance.get_text,
-                "/voip": self.query_instance.get_voip,
-                "/voip-endp": self.query_instance.get_voip_endp,
-                "/vr": self.query_instance.get_vr,
-                "/vrcx": self.query_instance.get_vrcx,
-                "/wifi-msg": self.query_instance.get_wifi_msg,
-                "/wifi-stats": self.query_instance.get_wifi_stats,
-                "/wl": self.query_instance.get_wl,
-                "/wl-endp": self.query_instance.get_wl_endp,
-                "/ws-msg": self.query_instance.get_ws_msg,
-            }
+            self.method_map = MethodRegistry(session_obj=self,
+                                             cli_commands=CLI_COMMAND_NAMES,
+                                             query_urls=QUERY_URL_NAMES)
         if cli_name not in self.method_map:
             self.logger.error(f"LFSession::find_method: command '{cli_name}' not present")
             self.print_method_map()
@@ -25525,4 +26034,4 @@ class LFSession(BaseSession):
         return self.method_map[cli_name]
 
     def print_method_map(self):
-        pprint(["method_map keys:", self.method_map.keys()])
+        pprint(["method_map keys:", list(self.method_map.keys())])
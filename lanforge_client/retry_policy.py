@@ -0,0 +1,319 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+
+    Retry policy for the LANforge JSON API clients.
+
+    BaseLFJsonRequest.json_post, get and get_as_json ask a RetryPolicy whether and
+    when to send a failed request again, instead of pausing a fixed time:
+
+     * exponential backoff with jitter: base_sec * multiplier ** (attempt - 1), capped at
+       max_sec, of which the jitter fraction is random, so scripts polling the same GUI
+       do not retry in lock step;
+     * idempotency: GET, PUT and DELETE are retried after any failure; a POST to
+       /cli-json may already have run on the GUI, so it is retried only for statuses
+       that mean it was not processed (retry_post_statuses: no connection, 429, 502
+       and 503); json_post exits at once only for the client errors that retrying
+       cannot fix (400, 410-417, 428, 431, 451), and with die_on_error once the
+       policy gives up;
+     * a retry budget: retries may not exceed budget_ratio of the requests of the last
+       budget_window_sec (plus budget_min_retries), so a struggling GUI is not sent
+       a second wave of traffic;
+     * a circuit breaker per method and URL pattern (see http_stats.normalize_pattern):
+       after breaker_failures consecutive server failures (5xx, no connection) the
+       pattern fails fast for breaker_reset_sec, then one trial request is let through.
+       404 is not a server failure, it is how the GUI says an entity is not there yet.
+
+    The time spent waiting to retry is added to http_stats (retry_ms) when statistics
+    are enabled, and kept in RetryPolicy.counters().
+
+    EXAMPLE:
+        from lanforge_client import retry_policy
+        retry_policy.set_default_policy(retry_policy.RetryPolicy(base_sec=0.1, max_sec=2.0))
+        # or per session
+        session = LFSession(lfclient_url="http://localhost:8080",
+                            retry_policy_=retry_policy.RetryPolicy(breaker_failures=None))
+
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+import collections
+import logging
+import random
+import threading
+import time
+
+from . import http_stats
+
+LOGGER = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+# the request did not reach or was not processed by the GUI
+NOT_PROCESSED_STATUSES = (0, 429, 502, 503)
+
+
+class CircuitBreaker:
+    """
+    Consecutive failure counting per key; a key with failure_threshold failures in a row
+    is open (requests fail fast) for reset_sec, then half open: one request is let through
+    and its result closes or reopens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_sec: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_sec = reset_sec
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.opened_at = {}
+        self.trial_pending = set()
+        self.short_circuited = 0
+        self.opened = 0
+
+    def allow(self, key=None) -> bool:
+        if not self.failure_threshold:
+            return True
+        with self.lock:
+            opened_at = self.opened_at.get(key)
+            if opened_at is None:
+                return True
+            if (time.monotonic() - opened_at) >= self.reset_sec and key not in self.trial_pending:
+                # half open: let one request find out whether the GUI recovered
+                self.trial_pending.add(key)
+                return True
+            self.short_circuited += 1
+            return False
+
+    def is_open(self, key=None) -> bool:
+        """
+        Read-only: True while requests for key fail fast. A half open key whose trial request
+        has not been taken yet is not open; allow() is what takes the trial.
+        """
+        if not self.failure_threshold:
+            return False
+        with self.lock:
+            opened_at = self.opened_at.get(key)
+            if opened_at is None:
+                return False
+            return key in self.trial_pending or (time.monotonic() - opened_at) < self.reset_sec
+
+    def record_success(self, key=None):
+        if not self.failure_threshold:
+            return
+        with self.lock:
+            self.failures.pop(key, None)
+            self.opened_at.pop(key, None)
+            self.trial_pending.discard(key)
+
+    def record_failure(self, key=None):
+        if not self.failure_threshold:
+            return
+        with self.lock:
+            count = self.failures.get(key, 0) + 1
+            self.failures[key] = count
+            # a failed trial request reopens the circuit
+            if key in self.trial_pending or (count >= self.failure_threshold and key not in self.opened_at):
+                self.opened += 1
+                self.opened_at[key] = time.monotonic()
+                self.trial_pending.discard(key)
+                LOGGER.warning("circuit open for %s after %d failures, failing fast for %ss"
+                               % (key, count, self.reset_sec))
+
+    def open_keys(self) -> list:
+        with self.lock:
+            return sorted(self.opened_at.keys())
+
+
+class RetryBudget:
+    """
+    Allows retries up to ratio of the requests sent in the last window_sec, plus min_retries.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window_sec: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_sec = window_sec
+        self.lock = threading.Lock()
+        self.requests = collections.deque()
+        self.retries = collections.deque()
+        self.denied = 0
+
+    def _expire(self, now: float = 0.0):
+        horizon = now - self.window_sec
+        for stamps in (self.requests, self.retries):
+            while stamps and stamps[0] < horizon:
+                stamps.popleft()
+
+    def note_request(self):
+        if self.ratio is None:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self._expire(now)
+            self.requests.append(now)
+
+    def try_spend(self) -> bool:
+        if self.ratio is None:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self._expire(now)
+            if len(self.retries) >= self.min_retries + self.ratio * len(self.requests):
+                self.denied += 1
+                return False
+            self.retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again. See the module docstring.
+    :param base_sec: pause before the first retry, before jitter
+    :param max_sec: longest pause between retries
+    :param multiplier: growth of the pause per attempt
+    :param jitter: fraction of the pause that is random, 0.0 to 1.0
+    :param max_attempts: give up after this many attempts, None for until the caller's timeout
+    :param retry_post_statuses: HTTP statuses (0 for no connection) a POST is retried after
+    :param budget_ratio: retries allowed per request sent in the budget window, None for no budget
+    :param budget_min_retries: retries always allowed in the budget window
+    :param budget_window_sec: length of the budget window
+    :param breaker_failures: consecutive failures opening a pattern's circuit, None for no breaker
+    :param breaker_reset_sec: time a circuit stays open before a trial request
+    """
+
+    def __init__(self,
+                 base_sec: float = 0.25,
+                 max_sec: float = 4.0,
+                 multiplier: float = 2.0,
+                 jitter: float = 0.5,
+                 max_attempts: int = None,
+                 retry_post_statuses: tuple = NOT_PROCESSED_STATUSES,
+                 budget_ratio: float = 0.2,
+                 budget_min_retries: int = 10,
+                 budget_window_sec: float = 10.0,
+                 breaker_failures: int = 5,
+                 breaker_reset_sec: float = 10.0):
+        self.base_sec = base_sec
+        self.max_sec = max_sec
+        self.multiplier = multiplier
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.max_attempts = max_attempts
+        self.retry_post_statuses = tuple(retry_post_statuses or ())
+        self.budget = RetryBudget(ratio=budget_ratio,
+                                  min_retries=budget_min_retries,
+                                  window_sec=budget_window_sec)
+        self.breaker = CircuitBreaker(failure_threshold=breaker_failures, reset_sec=breaker_reset_sec)
+        self.lock = threading.Lock()
+        self.retries = 0
+        self.retry_sec = 0.0
+        self.gave_up = 0
+
+    @staticmethod
+    def endpoint_key(method: str = None, url: str = None) -> str:
+        return "%s %s" % (method, http_stats.normalize_pattern(url))
+
+    @staticmethod
+    def is_server_failure(status: int = 0) -> bool:
+        return status == 0 or status == 429 or status >= 500
+
+    def backoff_sec(self, attempt: int = 1) -> float:
+        """
+        :param attempt: the attempt that failed, 1 for the first request
+        """
+        pause = min(self.max_sec, self.base_sec * (self.multiplier ** max(attempt - 1, 0)))
+        return pause * (1.0 - self.jitter) + random.uniform(0.0, pause * self.jitter)
+
+    def before_request(self, method: str = None, url: str = None) -> bool:
+        """
+        Call before sending a request.
+        :return: False when the circuit for this endpoint is open and the request should not be sent
+        """
+        if not self.breaker.allow(self.endpoint_key(method, url)):
+            return False
+        self.budget.note_request()
+        return True
+
+    def record_result(self, method: str = None, url: str = None, status: int = 200):
+        """
+        Call with the HTTP status of a request, 0 when there was no response.
+        """
+        key = self.endpoint_key(method, url)
+        if self.is_server_failure(status):
+            self.breaker.record_failure(key)
+        else:
+            self.breaker.record_success(key)
+
+    def retry_delay(self,
+                    method: str = None,
+                    url: str = None,
+                    status: int = None,
+                    attempt: int = 1,
+                    remaining_sec: float = None):
+        """
+        :param status: HTTP status of the failed attempt, 0 for no response, None when unknown
+        :param attempt: the attempt that failed, 1 for the first request
+        :param remaining_sec: time left before the caller gives up
+        :return: seconds to wait before the next attempt, or None to give up
+        """
+        method = (method or "GET").upper()
+        reason = None
+        if method not in IDEMPOTENT_METHODS and status is not None \
+                and status not in self.retry_post_statuses:
+            reason = "%s is not idempotent and HTTP %s means it may have been processed" % (method, status)
+        elif self.max_attempts and attempt >= self.max_attempts:
+            reason = "%d attempts" % attempt
+        elif remaining_sec is not None and remaining_sec <= 0:
+            reason = "timeout"
+        elif self.breaker.is_open(self.endpoint_key(method, url)):
+            # before_request takes the half open trial, this only looks
+            reason = "circuit open"
+        elif not self.budget.try_spend():
+            reason = "retry budget exhausted"
+        if reason is not None:
+            with self.lock:
+                self.gave_up += 1
+            LOGGER.debug("not retrying %s %s: %s" % (method, url, reason))
+            return None
+        delay = self.backoff_sec(attempt)
+        if remaining_sec is not None:
+            delay = min(delay, remaining_sec)
+        return delay
+
+    def wait(self, method: str = None, url: str = None, delay_sec: float = 0.0):
+        """
+        Sleep before a retry and account for it.
+        """
+        if delay_sec > 0:
+            time.sleep(delay_sec)
+        with self.lock:
+            self.retries += 1
+            self.retry_sec += delay_sec
+        http_stats.record_retry(method, url, wait_ms=delay_sec * 1000)
+
+    def counters(self) -> dict:
+        with self.lock:
+            return {
+                "retries": self.retries,
+                "retry_sec": round(self.retry_sec, 3),
+                "gave_up": self.gave_up,
+                "budget_denied": self.budget.denied,
+                "short_circuited": self.breaker.short_circuited,
+                "circuits_opened": self.breaker.opened,
+                "open_circuits": self.breaker.open_keys(),
+            }
+
+
+_default_policy = None
+_default_lock = threading.Lock()
+
+
+def default_policy() -> RetryPolicy:
+    global _default_policy
+    if _default_policy is None:
+        with _default_lock:
+            if _default_policy is None:
+                _default_policy = RetryPolicy()
+    return _default_policy
+
+
+def set_default_policy(policy: RetryPolicy = None):
+    """
+    Use policy for sessions created without one; None restores the defaults.
+    """
+    global _default_policy
+    _default_policy = policy
@@ -0,0 +1,217 @@
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+
+    Coalescing of identical GET requests.
+
+    Monitoring loops often ask the GUI for the same listing several times per interval:
+    /port/all for the signal and again for the SSIDs, /resource/all from more than one
+    thread.  When coalescing is enabled, identical GETs share one request:
+
+     * a GET issued while the same GET is in flight (another thread) waits for that
+       request and gets its decoded result;
+     * with a window, a GET repeated within window_sec of a completed one gets that
+       result without a request.
+
+    Callers that share a request get the same decoded object, so treat GET results as
+    read-only while coalescing is on.  Any POST, PUT or DELETE through LFRequest or
+    lanforge_api drops the remembered results, so a GET after a command always sees its
+    effect.  Session requests (newsession, endsession, quit) are never coalesced.
+
+    Coalescing is off by default.  Enable it with enable(window_sec), or by setting
+    LF_COALESCE_SEC in the environment: 0 shares in-flight requests only, a positive
+    value also shares results that many seconds old.  counters() reports how many calls
+    were answered without a request.
+
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+LOGGER = logging.getLogger(__name__)
+
+# paths that change state on the GUI even though they are GETs
+UNCOALESCED_PATHS = ("/newsession", "/endsession", "/quit")
+
+
+class _Flight:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Shares the result of fn() among callers asking for the same key at the same time,
+    or within window_sec of each other.
+    """
+
+    def __init__(self, window_sec: float = 0.0, max_entries: int = 1024):
+        self.window_sec = window_sec
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.recent = OrderedDict()  # key -> (completed_at, result)
+        self.generation = 0
+        self.calls = 0
+        self.requests = 0
+        self.coalesced_in_flight = 0
+        self.coalesced_window = 0
+        self.invalidations = 0
+
+    def do(self, key=None, fn=None):
+        """
+        :param key: hashable identity of the request, such as (method, url)
+        :param fn: callable doing the request and returning the decoded result
+        :return: the result of fn(), possibly from a call made for another caller
+        """
+        with self.lock:
+            self.calls += 1
+            if self.window_sec > 0:
+                remembered = self.recent.get(key)
+                if remembered is not None:
+                    if time.monotonic() - remembered[0] <= self.window_sec:
+                        self.coalesced_window += 1
+                        return remembered[1]
+                    del self.recent[key]
+            flight = self.in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self.in_flight[key] = flight
+                self.requests += 1
+                generation = self.generation
+            else:
+                self.coalesced_in_flight += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self.lock:
+                if self.in_flight.get(key) is flight:
+                    del self.in_flight[key]
+                # results are not remembered across a command sent while they were requested,
+                # and failures (None) are retried by the next caller
+                if self.window_sec > 0 and flight.error is None and flight.result is not None \
+                        and generation == self.generation:
+                    self.recent[key] = (time.monotonic(), flight.result)
+                    self.recent.move_to_end(key)
+                    while len(self.recent) > self.max_entries:
+                        self.recent.popitem(last=False)
+            flight.event.set()
+        return flight.result
+
+    def invalidate(self):
+        """
+        Forget remembered results; GETs in flight finish for their callers, but later
+        callers do not join them.
+        """
+        with self.lock:
+            self.generation += 1
+            self.invalidations += 1
+            self.recent.clear()
+            self.in_flight.clear()
+
+    def counters(self) -> dict:
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "requests": self.requests,
+                "coalesced_in_flight": self.coalesced_in_flight,
+                "coalesced_window": self.coalesced_window,
+                "coalesced": self.coalesced_in_flight + self.coalesced_window,
+                "invalidations": self.invalidations,
+            }
+
+    def reset_counters(self):
+        with self.lock:
+            self.calls = 0
+            self.requests = 0
+            self.coalesced_in_flight = 0
+            self.coalesced_window = 0
+            self.invalidations = 0
+
+
+_flight = None
+
+
+def enable(window_sec: float = 0.0):
+    """
+    Coalesce identical GETs in this process.
+    :param window_sec: also share results this many seconds old; 0 shares only requests in flight
+    """
+    global _flight
+    if _flight is None:
+        _flight = SingleFlight(window_sec=window_sec)
+    else:
+        _flight.window_sec = window_sec
+        _flight.invalidate()
+
+
+def disable():
+    global _flight
+    _flight = None
+
+
+def is_enabled() -> bool:
+    return _flight is not None
+
+
+def get(method: str = 'GET', url: str = None, fn=None):
+    """
+    Call fn() for a GET of url, sharing the call with identical GETs when enabled.
+    """
+    flight = _flight
+    if flight is None or method != 'GET' or url is None:
+        return fn()
+    path = url.split("://", 1)[-1]
+    path = path[path.find("/"):] if "/" in path else "/"
+    if path.startswith(UNCOALESCED_PATHS):
+        return fn()
+    return flight.do(key=url, fn=fn)
+
+
+def invalidate():
+    """
+    Called when a command is sent: remembered GET results may be out of date.
+    """
+    flight = _flight
+    if flight is not None:
+        flight.invalidate()
+
+
+def counters() -> dict:
+    """
+    :return: dict of calls, requests, coalesced_in_flight, coalesced_window, coalesced, invalidations
+    """
+    flight = _flight
+    if flight is None:
+        return {"calls": 0, "requests": 0, "coalesced_in_flight": 0, "coalesced_window": 0,
+                "coalesced": 0, "invalidations": 0}
+    return flight.counters()
+
+
+def reset_counters():
+    flight = _flight
+    if flight is not None:
+        flight.reset_counters()
+
+
+if os.environ.get("LF_COALESCE_SEC") not in (None, ""):
+    try:
+        enable(window_sec=float(os.environ["LF_COALESCE_SEC"]))
+    except ValueError:
+        LOGGER.warning("LF_COALESCE_SEC=[%s] is not a number of seconds, not coalescing"
+                       % os.environ["LF_COALESCE_SEC"])
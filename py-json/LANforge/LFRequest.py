@@ -12,6 +12,7 @@ import urllib
 from urllib import request
 import json
 import http.client
+import importlib
 http.client._MAXHEADERS = 300
 
 
@@ -21,6 +22,11 @@ if sys.version_info[0] != 3:
 
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
 
+lf_transport = importlib.import_module("py-json.LANforge.lf_transport")
+http_stats = importlib.import_module("lanforge_client.http_stats")
+json_stream = importlib.import_module("lanforge_client.json_stream")
+single_flight = importlib.import_module("lanforge_client.single_flight")
+
 debug_printer = PrettyPrinter(indent=2)
 
 
@@ -66,37 +72,8 @@ class LFRequest:
         #         print("LFRequest: proxies: ")
         #         pprint.pprint(self.proxies)
 
-        if url and uri and (url.startswith("http:/") or url.startswith("https:/"))\
-                and (uri.startswith("http:/") or uri.startswith("https:/")):
-            raise ValueError("URL and PATH are both URLs: url[%s] uri[%s]" % (url, uri))
-        if url and uri and uri.startswith("http:/"):
-            raise ValueError("URL is present and PATH is an URL: url[%s] uri[%s]" % (url, uri))
-        if not url.startswith("http://") and not url.startswith("https://"):
-            self.logger.warning("No http:// or https:// found, prepending http:// to " + url)
-            url = "http://" + url
-        if uri is not None:
-            if not url.endswith('/') and not uri.startswith('/'):
-                url += '/'
-            if (uri.find("http:")>=0) or (uri.find("https:")>=0):
-                self.logger.warning("PATH contains an protocol that is not URL encoded: [%s]" % uri)
-            self.requested_url = url + uri
-        else:
-            self.requested_url = url
-
-        if self.requested_url is None:
-            raise Exception("Bad LFRequest of url[%s] uri[%s] -> None" % (url, uri))
-
-        if self.requested_url.find('//'):
-            protopos = self.requested_url.find("://")
-            self.requested_url = self.requested_url[:protopos + 2] + self.requested_url[protopos + 2:].replace("//",
-                                                                                                               "/")
-
-        # finding '#' prolly indicates a macvlan (eth1#0)
-        # finding ' ' prolly indicates a field name that should imply %20
-        if self.requested_url.find('#') >= 1:
-            self.requested_url = self.requested_url.replace('#', '%23')
-        if self.requested_url.find(' ') >= 1:
-            self.requested_url = self.requested_url.replace(' ', '+')
+        # normalization is cached per url/uri, connections are pooled by lf_transport
+        self.requested_url = lf_transport.normalize_url(url, uri)
         self.logger.debug("new LFRequest[%s]" % self.requested_url)
 
     # request first url on stack
@@ -104,18 +81,13 @@ class LFRequest:
         return self.form_post(show_error=show_error, debug=debug, die_on_error_=die_on_error_)
 
     def form_post(self, show_error=True, debug=False, die_on_error_=False):
+        single_flight.invalidate()
         if self.die_on_error:
             die_on_error_ = True
         if debug or self.debug:
             debug = True
         responses = []
         urlenc_data = ""
-        # https://stackoverflow.com/a/59635684/11014343
-        if (self.proxies is not None) and (len(self.proxies) > 0):
-            # https://stackoverflow.com/a/59635684/11014343
-            opener = request.build_opener(request.ProxyHandler(self.proxies))
-            request.install_opener(opener)
-
         self.logger.debug("formPost: url: " + self.requested_url)
         if (self.post_data is not None) and (self.post_data is not self.No_Data):
             urlenc_data = urllib.parse.urlencode(self.post_data).encode("utf-8")
@@ -132,7 +104,7 @@ class LFRequest:
 
         resp = ''
         try:
-            resp = urllib.request.urlopen(myrequest)
+            resp = http_stats.timed_urlopen(lf_transport.urlopen, myrequest, proxies=self.proxies)
             responses.append(resp)
             return responses[0]
 
@@ -161,14 +133,12 @@ class LFRequest:
                               response_json_list_=response_json_list_)
 
     def json_post(self, show_error=True, debug=False, die_on_error_=False, response_json_list_=None, method_='POST'):
+        single_flight.invalidate()
         if debug or self.debug:
             debug = True
         if self.die_on_error:
             die_on_error_ = True
         responses = []
-        if (self.proxies is not None) and (len(self.proxies) > 0):
-            opener = urllib.request.build_opener(request.ProxyHandler(self.proxies))
-            urllib.request.install_opener(opener)
 
         if (self.post_data is not None) and (self.post_data is not self.No_Data):
             myrequest = request.Request(url=self.requested_url,
@@ -181,10 +151,8 @@ class LFRequest:
 
         myrequest.headers['Content-type'] = 'application/json'
 
-        # https://stackoverflow.com/a/59635684/11014343
-
         try:
-            resp = urllib.request.urlopen(myrequest)
+            resp = http_stats.timed_urlopen(lf_transport.urlopen, myrequest, proxies=self.proxies)
             resp_data = resp.read().decode('utf-8')
             if debug or die_on_error_:
                 self.logger.debug("----- LFRequest::json_post:128 debug: --------------------------------------------")
@@ -235,22 +203,20 @@ class LFRequest:
     def json_delete(self, show_error=True, debug=False, die_on_error_=False, response_json_list_=None):
         return self.get_as_json(method_='DELETE')
 
-    def get(self, method_='GET'):
+    def get(self, method_='GET', stream=False):
+        """
+        :param stream: leave the body unread for the caller, who has to close() the response
+        """
         if self.debug:
             self.logger.debug("LFUtils.get: url: " + self.requested_url)
 
-        # https://stackoverflow.com/a/59635684/11014343
-        if (self.proxies is not None) and (len(self.proxies) > 0):
-            opener = request.build_opener(request.ProxyHandler(self.proxies))
-            # opener = urllib.request.build_opener(myrequest.ProxyHandler(self.proxies))
-            request.install_opener(opener)
-
         myrequest = request.Request(url=self.requested_url,
                                     headers=self.default_headers,
                                     method=method_)
         myresponses = []
+        send = lf_transport.urlopen_stream if stream else lf_transport.urlopen
         try:
-            myresponses.append(request.urlopen(myrequest))
+            myresponses.append(http_stats.timed_urlopen(send, myrequest, proxies=self.proxies))
             return myresponses[0]
 
         except urllib.error.HTTPError as error:
@@ -277,6 +243,15 @@ class LFRequest:
         return self.get_as_json()
 
     def get_as_json(self, method_='GET'):
+        """
+        Identical GETs share one request when lanforge_client.single_flight is enabled;
+        other methods make any shared results stale.
+        """
+        if method_ != 'GET':
+            single_flight.invalidate()
+        return single_flight.get(method_, self.requested_url, lambda: self._get_as_json(method_=method_))
+
+    def _get_as_json(self, method_='GET'):
         responses = list()
         responses.append(self.get(method_=method_))
         if len(responses) < 1:
@@ -289,6 +264,21 @@ class LFRequest:
         json_data = json.loads(responses[0].read().decode('utf-8'))
         return json_data
 
+    def stream_records(self, fields=None, limit=None):
+        """
+        GET the url and yield (eid, record) pairs as the response is read, instead of
+        decoding all of a large /port/all, /endp or /cx response at once.
+        :param fields: optional list of record fields to keep
+        :param limit: stop reading after this many records
+        """
+        response = self.get(stream=True)
+        if response is None:
+            return
+        try:
+            yield from json_stream.stream_records(response, fields=fields, limit=limit)
+        finally:
+            response.close()
+
     def addPostData(self, data):
         self.add_post_data(data=data)
 
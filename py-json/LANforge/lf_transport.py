@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Shared keep-alive transport for LFRequest.
+
+LFCliBase.json_get/json_post/json_put/json_delete create an LFRequest for every call,
+and each LFRequest used to open a new socket through urllib.request.urlopen (and, with
+proxies, install a new global opener).  Requests are now sent through a pool of
+http.client connections per scheme/host/port that is shared by every LFRequest in the
+process, so a script built on Realm keeps reusing the same few sockets to the GUI.
+
+ * normalize_url() caches the url + uri normalization LFRequest does for each request.
+ * urlopen() takes a urllib.request.Request and returns a response with the
+   read()/status/getheaders() interface urllib's has; errors are raised as
+   urllib.error.HTTPError and URLError so LFRequest's diagnostics are unchanged.
+ * urlopen_stream() is the same but leaves the body unread, for json_stream; its
+   connection goes back to the pool only if the body was read to the end.
+ * Explicit proxies, or proxies from the environment (http_proxy etc.), go through a
+   urllib opener that is built once per proxy setting instead of installed per request.
+
+Set LF_KEEPALIVE=0 in the environment, or call set_keepalive(False), to go back to one
+connection per request.
+"""
+import functools
+import http.client
+import io
+import logging
+import os
+import socket
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+# a connection dropped by the server while idle in the pool shows up as one of these
+STALE_ERRORS = (http.client.RemoteDisconnected,
+                http.client.BadStatusLine,
+                ConnectionResetError,
+                ConnectionAbortedError,
+                BrokenPipeError)
+
+_keepalive = os.environ.get("LF_KEEPALIVE", "1") not in ("0", "false", "no")
+_pools = {}
+_pools_lock = threading.Lock()
+_openers = {}
+_openers_lock = threading.Lock()
+
+
+def set_keepalive(enabled=True):
+    global _keepalive
+    _keepalive = enabled
+    if not enabled:
+        close_all()
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_url(url=None, uri=None):
+    """
+    Join and clean a base url and a path the way LFRequest always has:
+    prepend http:// if missing, collapse //, escape # and replace spaces by +.
+    """
+    if url and uri and (url.startswith("http:/") or url.startswith("https:/")) \
+            and (uri.startswith("http:/") or uri.startswith("https:/")):
+        raise ValueError("URL and PATH are both URLs: url[%s] uri[%s]" % (url, uri))
+    if url and uri and uri.startswith("http:/"):
+        raise ValueError("URL is present and PATH is an URL: url[%s] uri[%s]" % (url, uri))
+    if not url.startswith("http://") and not url.startswith("https://"):
+        logger.warning("No http:// or https:// found, prepending http:// to " + url)
+        url = "http://" + url
+    if uri is not None:
+        if not url.endswith('/') and not uri.startswith('/'):
+            url += '/'
+        if (uri.find("http:") >= 0) or (uri.find("https:") >= 0):
+            logger.warning("PATH contains an protocol that is not URL encoded: [%s]" % uri)
+        requested_url = url + uri
+    else:
+        requested_url = url
+
+    protopos = requested_url.find("://")
+    requested_url = requested_url[:protopos + 2] + requested_url[protopos + 2:].replace("//", "/")
+
+    # finding '#' prolly indicates a macvlan (eth1#0)
+    # finding ' ' prolly indicates a field name that should imply %20
+    if requested_url.find('#') >= 1:
+        requested_url = requested_url.replace('#', '%23')
+    if requested_url.find(' ') >= 1:
+        requested_url = requested_url.replace(' ', '+')
+    return requested_url
+
+
+def quick_ack(connection=None):
+    """
+    Ask for immediate ACKs on a reused connection.  Linux leaves quick-ack mode once a
+    connection is established, and a server that writes the response headers and body in
+    two segments then waits for the delayed ACK (~40ms) before sending the body.
+    """
+    if connection.sock is not None and hasattr(socket, "TCP_QUICKACK"):
+        try:
+            connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except OSError:
+            pass
+
+
+class LFHTTPConnection(http.client.HTTPConnection):
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class LFHTTPSConnection(http.client.HTTPSConnection):
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class PooledResponse:
+    """
+    Fully read response, so the connection can go back to the pool right away.
+    Provides the parts of http.client.HTTPResponse that LFRequest callers use.
+    """
+
+    def __init__(self, url=None, status=None, reason=None, headers=None, body=b''):
+        self.url = url
+        self.status = status
+        self.code = status
+        self.reason = reason
+        self.headers = headers
+        self.msg = headers
+        self.length = len(body)
+        self.fp = io.BytesIO(body)
+
+    def read(self, amt=None):
+        return self.fp.read(amt) if amt is not None else self.fp.read()
+
+    def readline(self):
+        return self.fp.readline()
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def getheaders(self):
+        return list(self.headers.items())
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def close(self):
+        self.fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class StreamingResponse:
+    """
+    Response whose body is read by the caller.  close() returns the connection to the pool
+    when the body was read to the end, and closes it when the caller stopped early.
+    """
+
+    def __init__(self, url=None, pool=None, connection=None, response=None):
+        self.url = url
+        self.pool = pool
+        self.connection = connection
+        self.response = response
+        self.status = response.status
+        self.code = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self.msg = response.headers
+        self.length = response.length
+
+    def read(self, amt=None):
+        return self.response.read(amt)
+
+    def readline(self):
+        return self.response.readline()
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def getheaders(self):
+        return list(self.headers.items())
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def close(self):
+        if self.connection is None:
+            return
+        connection, self.connection = self.connection, None
+        if self.response.isclosed() and not self.response.will_close:
+            self.pool.checkin(connection)
+        else:
+            self.response.close()
+            connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
+class HostPool:
+    """
+    Idle keep-alive connections to one scheme://host:port, shared by all threads.
+    """
+
+    def __init__(self, scheme="http", host=None, port=None, max_idle=8, timeout=None):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.idle = []
+        self.lock = threading.Lock()
+        self.connections_opened = 0
+        self.requests = 0
+
+    def new_connection(self):
+        self.connections_opened += 1
+        if self.scheme == "https":
+            return LFHTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return LFHTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def checkout(self):
+        with self.lock:
+            if self.idle:
+                return self.idle.pop(), True
+        return self.new_connection(), False
+
+    def checkin(self, connection=None):
+        with self.lock:
+            if len(self.idle) < self.max_idle:
+                self.idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for connection in idle:
+            connection.close()
+
+    def exchange(self, method=None, path=None, body=None, headers=None):
+        """
+        :return: (connection, http.client.HTTPResponse with the body not read yet)
+        """
+        self.requests += 1
+        connection, reused = self.checkout()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            quick_ack(connection)
+            response = connection.getresponse()
+        except STALE_ERRORS:
+            connection.close()
+            if not reused:
+                raise
+            # the server closed the idle connection, try once on a new one
+            connection = self.new_connection()
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+        except Exception:
+            connection.close()
+            raise
+        return connection, response
+
+    def send(self, method=None, path=None, body=None, headers=None):
+        """
+        :return: (http.client.HTTPResponse fully read, body bytes)
+        """
+        connection, response = self.exchange(method=method, path=path, body=body, headers=headers)
+        try:
+            data = response.read()
+        except Exception:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self.checkin(connection)
+        return response, data
+
+
+def get_pool(scheme="http", host=None, port=None):
+    if port is None:
+        port = 443 if scheme == "https" else 80
+    key = (scheme, host, port)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = HostPool(scheme=scheme, host=host, port=port)
+                _pools[key] = pool
+    return pool
+
+
+def close_all():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def get_opener(proxies=None):
+    """
+    urllib opener for a proxy setting, built once instead of installed for every request.
+    """
+    key = tuple(sorted(proxies.items())) if proxies else ()
+    opener = _openers.get(key)
+    if opener is None:
+        with _openers_lock:
+            opener = _openers.get(key)
+            if opener is None:
+                if proxies:
+                    opener = urllib.request.build_opener(urllib.request.ProxyHandler(proxies))
+                else:
+                    opener = urllib.request.build_opener()
+                _openers[key] = opener
+    return opener
+
+
+@functools.lru_cache(maxsize=256)
+def _env_proxy_for(scheme=None, host=None):
+    if urllib.request.proxy_bypass(host):
+        return False
+    return scheme in urllib.request.getproxies()
+
+
+def _pooled_request(request_=None, proxies=None):
+    """
+    :return: (parsed url, pool, path, headers) or None when the request has to go through urllib
+    """
+    parsed = urllib.parse.urlsplit(request_.full_url)
+    if proxies or not _keepalive or parsed.scheme not in ("http", "https") \
+            or _env_proxy_for(parsed.scheme, parsed.hostname):
+        return None
+    path = parsed.path or "/"
+    if parsed.query:
+        path += "?" + parsed.query
+    headers = dict(request_.header_items())
+    headers.setdefault("Accept-Encoding", "identity")
+    headers.setdefault("User-Agent", "Python-urllib/LANforge")
+    return parsed, get_pool(parsed.scheme, parsed.hostname, parsed.port), path, headers
+
+
+def urlopen(request_=None, proxies=None):
+    """
+    Send a urllib.request.Request, over a pooled keep-alive connection when no proxy applies.
+    :param request_: urllib.request.Request
+    :param proxies: dict like {'http': 'http://proxy:3128'} or None
+    :return: response with read(), status, reason, getheaders()
+    :raises urllib.error.HTTPError: for HTTP status >= 400
+    :raises urllib.error.URLError: when the server cannot be reached
+    """
+    pooled = _pooled_request(request_, proxies)
+    if pooled is None:
+        return get_opener(proxies).open(request_)
+    parsed, pool, path, headers = pooled
+    try:
+        response, data = pool.send(method=request_.get_method(), path=path, body=request_.data, headers=headers)
+    except (OSError, http.client.HTTPException) as x:
+        raise urllib.error.URLError(x)
+
+    if response.status in REDIRECT_CODES:
+        # let urllib follow redirects, the GUI does not normally send them
+        return get_opener(None).open(request_)
+    if response.status >= 400:
+        raise urllib.error.HTTPError(request_.full_url, response.status, response.reason,
+                                     response.headers, io.BytesIO(data))
+    return PooledResponse(url=request_.full_url,
+                          status=response.status,
+                          reason=response.reason,
+                          headers=response.headers,
+                          body=data)
+
+
+def urlopen_stream(request_=None, proxies=None):
+    """
+    Like urlopen(), but the body is left for the caller to read, so a large response can be
+    decoded as it arrives.  Close the response when done with it.
+    :return: response with read(amt), status, reason, getheaders() and close()
+    """
+    pooled = _pooled_request(request_, proxies)
+    if pooled is None:
+        return get_opener(proxies).open(request_)
+    parsed, pool, path, headers = pooled
+    try:
+        connection, response = pool.exchange(method=request_.get_method(), path=path,
+                                             body=request_.data, headers=headers)
+    except (OSError, http.client.HTTPException) as x:
+        raise urllib.error.URLError(x)
+
+    if response.status in REDIRECT_CODES or response.status >= 400:
+        # read the (short) body so the connection can be reused, and answer like urlopen()
+        try:
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            pool.checkin(connection)
+        if response.status in REDIRECT_CODES:
+            return get_opener(None).open(request_)
+        raise urllib.error.HTTPError(request_.full_url, response.status, response.reason,
+                                     response.headers, io.BytesIO(data))
+    return StreamingResponse(url=request_.full_url, pool=pool, connection=connection, response=response)
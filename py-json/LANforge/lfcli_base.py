@@ -333,7 +333,6 @@ class LFCliBase:
                         lf_r.print_errors()
                     else:
                         logger.debug("LFCliBase.json_get: no entity/response, check other errors")
-                        time.sleep(10)
                 return None
         except ValueError as ve:
             if debug_ or self.exit_on_error:
@@ -345,6 +344,28 @@ class LFCliBase:
 
         return json_response
 
+    def json_stream(self, _req_url, fields=None, limit=None, debug_=None):
+        """
+        Iterate over (eid, record) pairs of a /port, /endp or /cx listing as it is received.
+        Unlike json_get the whole response is never held in memory, so this is the call for
+        large systems; stop iterating early and the rest of the response is not read.
+            for eid, port in self.json_stream("/port/all?fields=alias,ip", fields=["ip"]): ...
+        """
+        if debug_ is None:
+            debug_ = self.debug
+        lf_r = LFRequest.LFRequest(url=self.lfclient_url,
+                                   uri=_req_url,
+                                   proxies_=self.proxy,
+                                   debug_=debug_,
+                                   die_on_error_=self.exit_on_error)
+        try:
+            yield from lf_r.stream_records(fields=fields, limit=limit)
+        except ValueError as ve:
+            logger.debug("json_stream asked for {_req_url} ".format(_req_url=_req_url))
+            logger.debug("Exception %s:" % ve)
+            if self.exit_on_error:
+                sys.exit(1)
+
     def json_delete(self, _req_url, debug_=False):
         debug_ |= self.debug
         if debug_:
@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Attenuation sweeps that wait for the radio to settle instead of sleeping.
+
+ATTENUATORProfile.create sleeps 10 seconds after every set_attenuator, and the roam
+test steps its attenuators one module at a time with a fixed wait of a few seconds
+before it looks at the stations.  A sweep of 70 steps over two attenuators therefore
+spends most of its time asleep, and still measures too early when the stations are
+slow to follow.
+
+AttenSweep runs a matrix of steps, each a list of (serial, module, value) changes:
+
+    apply     the changes of the step are sent together, up to max_in_flight at once;
+              a module already at its value is not sent again
+    settle    a settle condition is waited on: RssiSettle (the signal of every station
+              stays within tolerance_db over a few readings), BssidSettle (every station
+              is associated, optionally to an expected BSSID), EventSettle (an event such
+              as an association is logged) or FixedSettle (the old timer)
+    measure   called when the step has settled, for the quick sample of the state
+    collect   called with that sample on a background worker while the next step is
+              applied and settles, for the slower part (more queries, csv, reports)
+
+Serials are 'shelf.resource.serno' or just the serno, modules 0 to 7 or 'all', values
+in ddB (0 to 955).  RealmAttenBackend sends set_attenuator through Realm.set_atten;
+SimulatedAttenuators is an in-process model with a round trip per command and stations
+whose signal follows the attenuation with a lag, for trying sweeps and settle
+conditions without hardware (see py-scripts/lf_atten_sweep.py --simulate).
+
+Example:
+    steps = crossfade("1.1.2324", "1.1.2325", start=0, stop=700, step=10)
+    settle = RssiSettle(port_rssi_reader(local_realm, ["1.1.sta0000", "1.1.sta0001"]))
+    sweep = local_realm.new_atten_sweep(steps, settle=settle, measure=sample_ports, collect=write_row)
+    results = sweep.run()
+"""
+import importlib
+import logging
+import math
+import random
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+
+logger = logging.getLogger(__name__)
+
+MAX_MODULE = 7
+MAX_DDB = 955
+
+Change = namedtuple("Change", ["serno", "idx", "val"])
+
+
+def serial_eid(serno=None):
+    """
+    :return: 'shelf.resource.serno' for a serial given with or without shelf and resource
+    """
+    serno = str(serno)
+    if serno.count('.') >= 2:
+        return serno
+    if '.' in serno:
+        return "1." + serno
+    return "1.1." + serno
+
+
+def check_change(change=None):
+    """
+    :return: the change with the serial as an EID; ValueError for a module or value out of range
+    """
+    serno, idx, val = change
+    if idx != "all" and not 0 <= int(idx) <= MAX_MODULE:
+        raise ValueError("Attenuation idx value must be %d or less" % MAX_MODULE)
+    if not 0 <= int(val) <= MAX_DDB:
+        raise ValueError("Attenuation ddB value must be %d or less" % MAX_DDB)
+    return Change(serial_eid(serno), idx if idx == "all" else int(idx), int(val))
+
+
+def to_changes(step=None):
+    """
+    :param step: list of (serno, idx, val) or of dicts with serno, idx (or atten_idx) and val
+    :return: list of Change
+    """
+    changes = []
+    for change in step:
+        if isinstance(change, dict):
+            change = (change["serno"], change.get("idx", change.get("atten_idx", "all")), change["val"])
+        changes.append(check_change(change))
+    return changes
+
+
+def ramp(sernos=None, start=0, stop=700, step=10, idx="all"):
+    """
+    :return: steps setting idx of every serial in sernos from start to stop inclusive
+    """
+    step = abs(step) if stop >= start else -abs(step)
+    values = list(range(start, stop, step)) + [stop]
+    return [[(serno, idx, val) for serno in sernos] for val in values]
+
+
+def crossfade(serno_down=None, serno_up=None, start=0, stop=700, step=10, idx="all"):
+    """
+    :return: steps raising serno_up from start to stop while serno_down goes from stop to start,
+             the pattern of a roam between two attenuated APs
+    """
+    steps = []
+    for [(_serno, _idx, val)] in ramp([serno_up], start, stop, step, idx):
+        steps.append([(serno_down, idx, start + stop - val), (serno_up, idx, val)])
+    return steps
+
+
+def parse_signal(value=None):
+    """
+    :return: signal in dBm from a port 'signal' value such as '-41' or '-41 dBm', None if unknown
+    """
+    try:
+        return float(str(value).split()[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def port_rssi_reader(local_realm=None, stations=None, field="signal"):
+    """
+    :return: function returning dict of station EID -> signal, one /port query per resource
+    """
+    by_resource = OrderedDict()
+    for station in stations:
+        shelf, resource, name = LFUtils.name_to_eid(station)[:3]
+        by_resource.setdefault((shelf, resource), []).append(name)
+
+    def read():
+        readings = {}
+        for (shelf, resource), names in by_resource.items():
+            response = local_realm.json_get("/port/%s/%s/%s?fields=alias,%s"
+                                            % (shelf, resource, ",".join(names), field)) or {}
+            listing = response.get("interfaces", response.get("interface"))
+            if isinstance(listing, dict):
+                listing = [{"%s.%s.%s" % (shelf, resource, listing.get("alias")): listing}]
+            for item in listing or []:
+                for eid, record in item.items():
+                    readings[eid] = record.get(field) if field != "signal" else parse_signal(record.get(field))
+        return readings
+    return read
+
+
+def port_bssid_reader(local_realm=None, stations=None):
+    read = port_rssi_reader(local_realm, stations, field="ap")
+
+    def read_bssid():
+        return {eid: (None if not bssid or str(bssid).upper() in ("NA", "N/A") else str(bssid).lower())
+                for eid, bssid in read().items()}
+    return read_bssid
+
+
+class FixedSettle:
+    def __init__(self, settle_sec=4.0):
+        self.settle_sec = settle_sec
+
+    def begin(self, step=None):
+        pass
+
+    def __call__(self, step=None):
+        time.sleep(self.settle_sec)
+        return True
+
+
+class RssiSettle:
+    def __init__(self, read_rssi=None, tolerance_db=1.0, samples=3, interval_sec=0.25, timeout_sec=30,
+                 min_sec=0.0):
+        """
+        :param read_rssi: function returning dict of station -> signal in dBm
+        :param tolerance_db: largest spread of a station's last samples that counts as stable
+        :param samples: readings that must agree
+        :param min_sec: do not call the step settled before this long
+        """
+        self.read_rssi = read_rssi
+        self.tolerance_db = tolerance_db
+        self.samples = max(int(samples), 2)
+        self.interval_sec = interval_sec
+        self.timeout_sec = timeout_sec
+        self.min_sec = min_sec
+        self.readings = 0
+
+    def begin(self, step=None):
+        pass
+
+    def stable(self, history=None):
+        if len(history) < self.samples:
+            return False
+        for station in history[-1]:
+            values = [reading.get(station) for reading in history]
+            if any(value is None for value in values) or max(values) - min(values) > self.tolerance_db:
+                return False
+        return True
+
+    def __call__(self, step=None):
+        """
+        :return: the last reading once stable, None on timeout
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout_sec
+        history = deque(maxlen=self.samples)
+        next_read = started
+        while True:
+            history.append(self.read_rssi())
+            self.readings += 1
+            now = time.monotonic()
+            if now - started >= self.min_sec and self.stable(list(history)):
+                return history[-1]
+            if now >= deadline:
+                logger.warning("signal did not settle in %s seconds: %s" % (self.timeout_sec, history[-1]))
+                return None
+            # readings on a fixed schedule, however long a read takes
+            next_read += self.interval_sec
+            time.sleep(max(min(next_read, deadline) - time.monotonic(), 0.0))
+
+
+class BssidSettle:
+    def __init__(self, read_bssid=None, expected=None, samples=2, interval_sec=0.25, timeout_sec=30):
+        """
+        :param read_bssid: function returning dict of station -> BSSID, None while not associated
+        :param expected: BSSID every station must be on, None for any
+        """
+        self.read_bssid = read_bssid
+        self.expected = expected.lower() if expected else None
+        self.samples = max(int(samples), 1)
+        self.interval_sec = interval_sec
+        self.timeout_sec = timeout_sec
+
+    def begin(self, step=None):
+        pass
+
+    def __call__(self, step=None):
+        deadline = time.monotonic() + self.timeout_sec
+        history = deque(maxlen=self.samples)
+        while True:
+            reading = self.read_bssid()
+            history.append(reading)
+            associated = all(bssid is not None and (self.expected is None or bssid == self.expected)
+                             for bssid in reading.values())
+            if associated and len(history) == self.samples and all(seen == reading for seen in history):
+                return reading
+            if time.monotonic() >= deadline:
+                logger.warning("stations did not settle on a BSSID in %s seconds: %s" % (self.timeout_sec, reading))
+                return None
+            time.sleep(self.interval_sec)
+
+
+class EventSettle:
+    def __init__(self, event_waiter=None, predicate=None, timeout_sec=30):
+        """
+        :param event_waiter: EventWaiter, see event_waiter.py
+        :param predicate: accepts the event that ends the settle, such as an association
+        """
+        self.event_waiter = event_waiter
+        self.predicate = predicate
+        self.timeout_sec = timeout_sec
+
+    def begin(self, step=None):
+        # events logged while the step is applied count
+        self.event_waiter.mark()
+
+    def __call__(self, step=None):
+        event = self.event_waiter.wait_for(self.predicate, timeout_sec=self.timeout_sec)
+        if event is None:
+            logger.warning("no settle event in %s seconds" % self.timeout_sec)
+        return event
+
+
+class RealmAttenBackend:
+    def __init__(self, local_realm=None):
+        self.local_realm = local_realm
+
+    def set_attenuator(self, change=None):
+        self.local_realm.set_atten(change.serno, change.val, atten_idx=change.idx)
+        return True
+
+
+class SimulatedAttenuators:
+    def __init__(self,
+                 serials=("1.1.1001", "1.1.1002"),
+                 bssids=None,
+                 stations=None,
+                 latency_ms=5.0,
+                 tau_sec=0.3,
+                 base_rssi=-30.0,
+                 noise_db=0.2,
+                 hysteresis_db=3.0,
+                 seed=0):
+        """
+        :param serials: attenuators, each in front of one AP
+        :param bssids: BSSID of the AP behind each serial, default made up
+        :param stations: station EIDs that hear every AP
+        :param latency_ms: round trip of a set_attenuator
+        :param tau_sec: time constant of the signal following the attenuation
+        :param hysteresis_db: a station roams when another AP is this much stronger
+        """
+        self.serials = [serial_eid(serno) for serno in serials]
+        self.bssids = list(bssids) if bssids else ["00:0e:8e:00:00:%02x" % n for n in range(len(self.serials))]
+        self.stations = list(stations) if stations else ["1.1.sta%04d" % n for n in range(4)]
+        self.latency_ms = latency_ms
+        self.tau_sec = tau_sec
+        self.base_rssi = base_rssi
+        self.noise_db = noise_db
+        self.hysteresis_db = hysteresis_db
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        now = time.monotonic()
+        # serial -> module -> value; serial -> (time of change, signal then, target)
+        self.values = {serno: [0] * (MAX_MODULE + 1) for serno in self.serials}
+        self.paths = {serno: (now, base_rssi, base_rssi) for serno in self.serials}
+        self.associated = {station: 0 for station in self.stations}
+        self.commands = 0
+
+    def path_signal(self, serno=None, now=None):
+        changed, start, target = self.paths[serno]
+        return target + (start - target) * math.exp(-(now - changed) / self.tau_sec)
+
+    def set_attenuator(self, change=None):
+        time.sleep(self.latency_ms / 1000.0)
+        with self.lock:
+            self.commands += 1
+            now = time.monotonic()
+            modules = range(MAX_MODULE + 1) if change.idx == "all" else [change.idx]
+            for module in modules:
+                self.values[change.serno][module] = change.val
+            # the AP is heard through every module, the signal drops with the mean attenuation
+            target = self.base_rssi - sum(self.values[change.serno]) / len(self.values[change.serno]) / 10.0
+            self.paths[change.serno] = (now, self.path_signal(change.serno, now), target)
+        return True
+
+    def read_rssi(self):
+        with self.lock:
+            now = time.monotonic()
+            signals = [self.path_signal(serno, now) for serno in self.serials]
+            readings = {}
+            for station in self.stations:
+                current = self.associated[station]
+                best = max(range(len(signals)), key=signals.__getitem__)
+                if best != current and signals[best] - signals[current] >= self.hysteresis_db:
+                    self.associated[station] = current = best
+                readings[station] = round(signals[current] + self.random.gauss(0, self.noise_db), 1)
+            return readings
+
+    def read_bssid(self):
+        self.read_rssi()
+        with self.lock:
+            return {station: self.bssids[ap] for station, ap in self.associated.items()}
+
+
+class AttenSweep:
+    def __init__(self,
+                 backend=None,
+                 steps=None,
+                 settle=None,
+                 measure=None,
+                 collect=None,
+                 max_in_flight=8,
+                 overlap=True,
+                 skip_unchanged=True,
+                 debug=False):
+        """
+        :param backend: RealmAttenBackend or SimulatedAttenuators
+        :param steps: list of steps, each a list of (serno, idx, val) or dicts
+        :param settle: settle condition called after each step, None to go on at once
+        :param measure: measure(index, changes) -> sample, when the step has settled
+        :param collect: collect(index, changes, sample) -> result, on a background worker
+        :param overlap: run collect while the next step is applied; False runs it in line
+        :param skip_unchanged: do not send modules already at their value
+        """
+        self.backend = backend
+        self.steps = [to_changes(step) for step in (steps or [])]
+        self.settle = settle
+        self.measure = measure
+        self.collect = collect
+        self.max_in_flight = max(int(max_in_flight), 1)
+        self.overlap = overlap
+        self.skip_unchanged = skip_unchanged
+        self.debug = debug
+        self.current = {}
+        self.results = []
+        self.wall_ms = None
+
+    def pending(self, changes=None):
+        """
+        :return: the changes of a step that differ from what was last sent
+        """
+        if not self.skip_unchanged:
+            return list(changes)
+        pending = []
+        for change in changes:
+            if change.idx == "all":
+                known = [self.current.get((change.serno, module)) for module in range(MAX_MODULE + 1)]
+                if all(value == change.val for value in known):
+                    continue
+            elif self.current.get((change.serno, change.idx)) == change.val:
+                continue
+            pending.append(change)
+        return pending
+
+    def apply(self, changes=None, pool=None):
+        """
+        Send the changes of one step together.
+        :return: number of commands sent
+        """
+        pending = self.pending(changes)
+        if len(pending) > 1 and pool is not None:
+            list(pool.map(self.backend.set_attenuator, pending))
+        else:
+            for change in pending:
+                self.backend.set_attenuator(change)
+        for change in pending:
+            modules = range(MAX_MODULE + 1) if change.idx == "all" else [change.idx]
+            for module in modules:
+                self.current[(change.serno, module)] = change.val
+        return len(pending)
+
+    def run(self):
+        """
+        :return: list of one dict per step: index, changes, sent, settled, sample, result and
+                 the apply/settle/measure/collect times in ms
+        """
+        self.results = []
+        started = time.perf_counter()
+        collecting = None
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="atten_sweep") as pool, \
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="atten_collect") as collector:
+            for index, changes in enumerate(self.steps):
+                result = OrderedDict([("index", index), ("changes", changes)])
+                if self.settle is not None:
+                    self.settle.begin(changes)
+                mark = time.perf_counter()
+                result["sent"] = self.apply(changes, pool)
+                result["apply_ms"] = round((time.perf_counter() - mark) * 1000, 3)
+
+                mark = time.perf_counter()
+                settled = self.settle(changes) if self.settle is not None else True
+                result["settled"] = settled is not None and settled is not False
+                result["settle_ms"] = round((time.perf_counter() - mark) * 1000, 3)
+
+                mark = time.perf_counter()
+                result["sample"] = self.measure(index, changes) if self.measure is not None else settled
+                result["measure_ms"] = round((time.perf_counter() - mark) * 1000, 3)
+                self.results.append(result)
+                if self.debug:
+                    logger.debug("step %d: %d sent, settled %s in %.1f ms"
+                                 % (index, result["sent"], result["settled"], result["settle_ms"]))
+
+                if self.collect is not None:
+                    # one collection at a time, so results are written in step order
+                    if collecting is not None:
+                        collecting.result()
+                    collecting = collector.submit(self.run_collect, result)
+                    if not self.overlap:
+                        collecting.result()
+            if collecting is not None:
+                collecting.result()
+        self.wall_ms = round((time.perf_counter() - started) * 1000, 3)
+        return self.results
+
+    def run_collect(self, result=None):
+        mark = time.perf_counter()
+        try:
+            result["result"] = self.collect(result["index"], result["changes"], result["sample"])
+        except Exception as e:
+            logger.error("collect of step %d failed: %s" % (result["index"], e))
+            result["result"] = None
+        result["collect_ms"] = round((time.perf_counter() - mark) * 1000, 3)
+
+    def summary(self):
+        """
+        :return: dict of totals over the steps
+        """
+        totals = OrderedDict([("steps", len(self.results)),
+                              ("sent", sum(result["sent"] for result in self.results)),
+                              ("unsettled", sum(1 for result in self.results if not result["settled"]))])
+        for stage in ("apply_ms", "settle_ms", "measure_ms", "collect_ms"):
+            totals[stage] = round(sum(result.get(stage, 0.0) for result in self.results), 3)
+        totals["wall_ms"] = self.wall_ms
+        return totals
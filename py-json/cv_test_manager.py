@@ -239,28 +239,13 @@ class cv_test(Realm):
         self.run_cv_cmd(cmd)
 
         # It can take a while, some test rebuild the old scenario upon exit, for instance.
-        tries = 0
-        while True:
-            if self.get_exists(instance):
-                logger.info("Waiting %i/60 for test instance: %s to be deleted." % (tries, instance))
-                tries += 1
-                if tries > 60:
-                    break
-                time.sleep(1)
-            else:
-                break
+        waiter = self.new_event_waiter()
+        if not waiter.wait_for(check=lambda: not self.get_exists(instance), timeout_sec=60):
+            logger.info("Waited 60 seconds for test instance: %s to be deleted." % instance)
 
         # And make sure chamber-view is properly re-built
-        tries = 0
-        while True:
-            if not self.get_cv_is_built():
-                logger.info("Waiting %i/60 for Chamber-View to be built." % tries)
-                tries += 1
-                if tries > 60:
-                    break
-                time.sleep(1)
-            else:
-                break
+        if not waiter.wait_for(check=self.get_cv_is_built, timeout_sec=60):
+            logger.info("Waited 60 seconds for Chamber-View to be built.")
 
     # Get port listing
     def get_ports(self, url="/ports/"):
@@ -322,17 +307,34 @@ class cv_test(Realm):
         for r in raw_lines:
             cfg_options.append(r[0])
 
+    def text_records_updated_ms(self):
+        """
+        :return: when the GUI last updated its text blob listing, None for GUIs not reporting it
+        """
+        status = self.json_get("/")
+        if status and "text_records_last_updated_ms" in status:
+            return int(status["text_records_last_updated_ms"])
+        return None
+
     def build_cfg(self, config_name, blob_test, cfg_options):
+        blobs_updated_ms = self.text_records_updated_ms()
         for value in cfg_options:
             self.create_test_config(config_name, blob_test, value)
 
         # Request GUI update its text blob listing.
         self.show_text_blob(config_name, blob_test, False)
 
-        # Hack, not certain if the above show returns before the action has been completed
-        # or not, so we sleep here until we have better idea how to query if GUI knows about
-        # the text blob.
-        time.sleep(5)
+        # The show may return before the GUI knows about the text blob.  Newer GUIs
+        # report when the listing was updated, wait for that for up to 5 seconds;
+        # otherwise sleep the 5 seconds.
+        if blobs_updated_ms is None:
+            time.sleep(5)
+            return
+        waiter = self.new_event_waiter(max_interval_sec=0.5)
+        if not waiter.wait_for(check=lambda: (self.text_records_updated_ms() or 0) > blobs_updated_ms,
+                               timeout_sec=5,
+                               check_interval_sec=0.25):
+            logger.info("text blob listing not updated after 5 seconds")
 
     # load_old_config is boolean
     # test_name is specific to the type of test being launched (Dataplane, tr398, etc)
@@ -407,6 +409,9 @@ class cv_test(Realm):
 
         not_running = 0
         ok_status = 1
+        # status is asked at most once a second; while the event log is quiet the
+        # pause between status queries grows to 4 seconds, unless the test stopped
+        waiter = self.new_event_waiter()
         while True:
             cmd = "cv get_and_close_dialog"
             dialog = self.run_cv_cmd(cmd)
@@ -467,7 +472,7 @@ class cv_test(Realm):
                 if not_running > 5:
                     break
 
-            time.sleep(1)
+            waiter.pause(min_sec=1.0, max_sec=1.0 if not_running else 4.0)
         self.report_name = self.get_report_location(instance_name)
         # Ensure test is closed and cleaned up
         self.delete_instance(instance_name)
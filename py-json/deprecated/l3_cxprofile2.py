@@ -671,7 +671,7 @@ class L3CXProfile2(BaseProfile):
         #create lf data object
         lf_data_collection = LFDataCollection(local_realm=self.local_realm,debug=self.debug)
         while datetime.datetime.now() < end_time:
-            csvwriter.writerow(lf_data_collection.monitor_interval(start_time_=start_time,sta_list_=sta_list_edit, created_cx_=created_cx, layer3_fields_=layer3_fields,port_mgr_fields_=",".join(port_mgr_cols)))
+            csvwriter.writerows(lf_data_collection.monitor_interval(header_row_=header_row,start_time_=start_time,sta_list_=sta_list_edit, created_cx_=created_cx, layer3_fields_=layer3_fields,port_mgr_fields_=",".join(port_mgr_cols) if port_mgr_cols is not None else None))
             time.sleep(monitor_interval_ms)
         csvfile.close()
 
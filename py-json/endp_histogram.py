@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Aggregation of Layer 3 endpoint distribution payloads (rx-silence, latency, jitter).
+
+LFUtils.expand_endp_histogram() labels a single endpoint histogram. This module
+loads the same payloads from many endpoints into one numpy matrix (one row per
+endpoint, one column per bucket) so that histograms can be merged per port, radio
+or arbitrary group, approximate percentiles can be computed for every row at once,
+and consecutive polls can be differenced into per-interval histograms.
+
+Example:
+    response = realm.json_get("/endp/all?fields=name,eid,rt-latency-5m")
+    hist = EndpHistogram.from_endp_response(response, column="rt-latency-5m")
+    per_port = hist.merge(hist.port_groups())
+    logger.info(per_port.percentile_table())
+"""
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+def bucket_bounds(histo_category_width=1, num_buckets=16):
+    """
+    Compute the [low, high] edges of the roughly power-of-two histogram categories,
+    matching the category names produced by LFUtils.expand_endp_histogram().
+    :param histo_category_width: multiplier reported as 'histo_category_width'
+    :param num_buckets: length of the 'histogram' list
+    :return: numpy array of shape (num_buckets, 2)
+    """
+    multiplier = int(histo_category_width)
+    exponents = np.arange(num_buckets, dtype=np.float64)
+    low = (2 ** exponents) * multiplier
+    high = (2 ** (exponents + 1)) * multiplier
+    low[0] = 0
+    return np.column_stack((low, high))
+
+
+def payload_bounds(distribution_payload=None):
+    """
+    Return the bucket edges for a distribution payload. Advanced latency payloads
+    carry explicit 'item_bounds', older payloads only carry 'histo_category_width'.
+    :param distribution_payload: dictionary from an endpoint distribution column
+    :return: numpy array of shape (num_buckets, 2)
+    """
+    if (distribution_payload is None) or ("histogram" not in distribution_payload):
+        logger.critical("Unexpected histogram format.")
+        raise ValueError("Unexpected histogram format.")
+    if "item_bounds" in distribution_payload:
+        return np.asarray(distribution_payload["item_bounds"], dtype=np.float64).reshape(-1, 2)
+    if "histo_category_width" not in distribution_payload:
+        logger.critical("Unexpected histogram format.")
+        raise ValueError("Unexpected histogram format.")
+    return bucket_bounds(distribution_payload["histo_category_width"],
+                         len(distribution_payload["histogram"]))
+
+
+def port_eid_of(endp_eid=None):
+    """
+    Reduce an endpoint EID like 1.1.3.4 to the port EID 1.1.3
+    :param endp_eid: endpoint EID string
+    :return: port EID string, or None if it cannot be determined
+    """
+    if not endp_eid:
+        return None
+    hunks = str(endp_eid).split('.')
+    if len(hunks) < 3:
+        return None
+    return '.'.join(hunks[:3])
+
+
+def percentiles_of(counts=None, bounds=None, percentiles=DEFAULT_PERCENTILES):
+    """
+    Estimate percentiles for every row of a count matrix by linear interpolation
+    within the bucket that contains the requested rank.
+    :param counts: numpy array of shape (rows, buckets)
+    :param bounds: numpy array of shape (buckets, 2)
+    :param percentiles: sequence of percentiles between 0 and 100
+    :return: numpy array of shape (rows, len(percentiles)); rows without samples are NaN
+    """
+    counts = np.atleast_2d(np.asarray(counts, dtype=np.float64))
+    bounds = np.asarray(bounds, dtype=np.float64)
+    num_rows, num_buckets = counts.shape
+    fractions = np.asarray(percentiles, dtype=np.float64) / 100.0
+
+    cumulative = np.cumsum(counts, axis=1)
+    totals = cumulative[:, -1]
+    # rank each percentile falls on, per row
+    targets = totals[:, None] * fractions[None, :]
+    # first bucket whose cumulative count reaches the target rank
+    bucket_idx = (cumulative[:, None, :] < targets[:, :, None]).sum(axis=2)
+    bucket_idx = np.minimum(bucket_idx, num_buckets - 1)
+
+    rows = np.arange(num_rows)[:, None]
+    below = np.where(bucket_idx > 0,
+                     cumulative[rows, np.maximum(bucket_idx - 1, 0)],
+                     0.0)
+    in_bucket = counts[rows, bucket_idx]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        position = np.where(in_bucket > 0, (targets - below) / in_bucket, 0.0)
+    position = np.clip(position, 0.0, 1.0)
+    low = bounds[bucket_idx, 0]
+    high = bounds[bucket_idx, 1]
+    result = low + (high - low) * position
+    result[totals <= 0, :] = np.nan
+    return result
+
+
+class EndpHistogram:
+    """
+    Matrix of endpoint histograms sharing one bucket layout.
+    Rows are keyed by name; row_info carries per-row metadata such as the endpoint EID.
+    """
+
+    def __init__(self, names=None, counts=None, bounds=None, column=None, row_info=None):
+        self.names = list(names) if names is not None else []
+        self.bounds = np.asarray(bounds, dtype=np.float64) if bounds is not None else bucket_bounds()
+        if counts is None:
+            counts = np.zeros((len(self.names), len(self.bounds)), dtype=np.int64)
+        self.counts = np.atleast_2d(np.asarray(counts, dtype=np.int64))
+        if self.counts.shape != (len(self.names), len(self.bounds)):
+            if len(self.names) == 0 and self.counts.size == 0:
+                self.counts = np.zeros((0, len(self.bounds)), dtype=np.int64)
+            else:
+                raise ValueError("histogram matrix shape %s does not match %d names and %d buckets"
+                                 % (self.counts.shape, len(self.names), len(self.bounds)))
+        self.column = column
+        self.row_info = row_info if row_info is not None else [{} for _ in self.names]
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_payloads(cls, payloads=None, column=None, row_info=None):
+        """
+        Build a matrix from a dictionary of name -> distribution payload.
+        Payloads whose bucket layout differs from the first one are logged and skipped.
+        :param payloads: dict of name to distribution payload
+        :param column: name of the distribution column, kept for reporting
+        :param row_info: optional dict of name to metadata dict
+        :return: EndpHistogram
+        """
+        names = []
+        rows = []
+        infos = []
+        bounds = None
+        for name, payload in (payloads or {}).items():
+            if not payload or ("histogram" not in payload):
+                logger.debug("endpoint %s has no %s histogram" % (name, column))
+                continue
+            these_bounds = payload_bounds(payload)
+            if bounds is None:
+                bounds = these_bounds
+            elif (these_bounds.shape != bounds.shape) or not np.array_equal(these_bounds, bounds):
+                logger.warning("endpoint %s %s histogram has a different bucket layout, skipping"
+                               % (name, column))
+                continue
+            names.append(name)
+            rows.append(payload["histogram"])
+            infos.append((row_info or {}).get(name, {}))
+        if bounds is None:
+            return cls(names=[], counts=None, bounds=None, column=column)
+        return cls(names=names,
+                   counts=np.asarray(rows, dtype=np.int64),
+                   bounds=bounds,
+                   column=column,
+                   row_info=infos)
+
+    @classmethod
+    def from_endp_response(cls, json_response=None, column="rt-latency-5m"):
+        """
+        Build a matrix from a /endp response, eg: /endp/all?fields=name,eid,rx-silence-5m
+        :param json_response: decoded json from the /endp URL
+        :param column: distribution column to load
+        :return: EndpHistogram
+        """
+        if json_response is None:
+            logger.critical("No endpoint response to load histograms from.")
+            raise ValueError("No endpoint response to load histograms from.")
+        endpoint_list = json_response.get("endpoint", [])
+        if isinstance(endpoint_list, dict):
+            # a single endpoint is not wrapped in a list
+            if "name" in endpoint_list:
+                endpoint_list = [{endpoint_list["name"]: endpoint_list}]
+            else:
+                endpoint_list = [endpoint_list]
+        payloads = {}
+        row_info = {}
+        for endpoint in endpoint_list:
+            for name, record in endpoint.items():
+                payloads[name] = record.get(column)
+                row_info[name] = {"eid": record.get("eid"),
+                                  "port": port_eid_of(record.get("eid"))}
+        return cls.from_payloads(payloads=payloads, column=column, row_info=row_info)
+
+    def bucket_labels(self):
+        """
+        :return: list of category names in the LFUtils.expand_endp_histogram() format
+        """
+        labels = []
+        for i, (low, high) in enumerate(self.bounds):
+            if i == 0:
+                labels.append("{:-05.0f} <= x <= {:-05.0f}".format(low, high))
+            else:
+                labels.append("{:-05.0f} < x <= {:-05.0f}".format(low, high))
+        return labels
+
+    def port_groups(self):
+        """
+        :return: dict of row name to port EID, for use with merge()
+        """
+        return {name: info.get("port") for name, info in zip(self.names, self.row_info)}
+
+    def merge(self, groups=None):
+        """
+        Sum rows into groups.
+        :param groups: dict of row name -> group name, or a callable taking the row name.
+            Rows that map to None are dropped.  A radio grouping can be built from a
+            port -> radio map: {name: radio_map.get(port) for name, port in hist.port_groups().items()}
+        :return: EndpHistogram with one row per group
+        """
+        if groups is None:
+            groups = {name: "all" for name in self.names}
+        if callable(groups):
+            labels = [groups(name) for name in self.names]
+        else:
+            labels = [groups.get(name) for name in self.names]
+        keep = [i for i, label in enumerate(labels) if label is not None]
+        if len(keep) == 0:
+            return EndpHistogram(names=[], bounds=self.bounds, column=self.column)
+        group_names = sorted(set(labels[i] for i in keep), key=str)
+        group_index = {name: i for i, name in enumerate(group_names)}
+        merged = np.zeros((len(group_names), len(self.bounds)), dtype=np.int64)
+        np.add.at(merged, np.asarray([group_index[labels[i]] for i in keep]), self.counts[keep])
+        return EndpHistogram(names=group_names,
+                             counts=merged,
+                             bounds=self.bounds,
+                             column=self.column,
+                             row_info=[{"members": sum(1 for i in keep if labels[i] == name)}
+                                       for name in group_names])
+
+    def totals(self):
+        """
+        :return: numpy array of sample counts per row
+        """
+        return self.counts.sum(axis=1)
+
+    def percentiles(self, percentiles=DEFAULT_PERCENTILES):
+        """
+        :param percentiles: sequence of percentiles between 0 and 100
+        :return: numpy array of shape (rows, len(percentiles))
+        """
+        return percentiles_of(counts=self.counts, bounds=self.bounds, percentiles=percentiles)
+
+    def percentile_table(self, percentiles=DEFAULT_PERCENTILES):
+        """
+        :param percentiles: sequence of percentiles between 0 and 100
+        :return: dict of row name -> {"samples": n, "p50": x, ...}
+        """
+        values = self.percentiles(percentiles=percentiles)
+        totals = self.totals()
+        table = {}
+        for i, name in enumerate(self.names):
+            row = {"samples": int(totals[i])}
+            for j, pct in enumerate(percentiles):
+                row["p%s" % pct] = None if np.isnan(values[i, j]) else float(values[i, j])
+            table[name] = row
+        return table
+
+    def expand(self, name):
+        """
+        :param name: row name
+        :return: dict of category name -> count, like LFUtils.expand_endp_histogram()
+        """
+        return dict(zip(self.bucket_labels(), self.counts[self.index[name]].tolist()))
+
+
+class EndpHistogramTracker:
+    """
+    Keeps the previous poll of a distribution column so each new poll can be
+    differenced into a per-interval histogram. Counts that go backwards (endpoint
+    cleared, or samples aged out of the window) are treated as a restart and the
+    new counts are used as-is for that row.
+    """
+
+    def __init__(self, column="rt-latency-5m"):
+        self.column = column
+        self.previous = None
+
+    def update(self, current=None):
+        """
+        :param current: EndpHistogram from the latest poll
+        :return: EndpHistogram of counts accumulated since the previous poll
+        """
+        if current is None:
+            return None
+        if self.previous is None or not np.array_equal(self.previous.bounds, current.bounds):
+            self.previous = current
+            return EndpHistogram(names=current.names,
+                                 counts=np.zeros_like(current.counts),
+                                 bounds=current.bounds,
+                                 column=current.column,
+                                 row_info=current.row_info)
+        prior = np.zeros_like(current.counts)
+        known = [(i, self.previous.index[name]) for i, name in enumerate(current.names)
+                 if name in self.previous.index]
+        if known:
+            cur_rows, prev_rows = (np.asarray(x) for x in zip(*known))
+            prior[cur_rows] = self.previous.counts[prev_rows]
+        delta = current.counts - prior
+        restarted = (delta < 0).any(axis=1)
+        delta[restarted] = current.counts[restarted]
+        self.previous = current
+        return EndpHistogram(names=current.names,
+                             counts=delta,
+                             bounds=current.bounds,
+                             column=current.column,
+                             row_info=current.row_info)
+
+    def poll(self, local_realm=None, endp_list="all", extra_fields="name,eid"):
+        """
+        Query the endpoint table for the tracked column and difference it against the last poll.
+        :param local_realm: Realm (or LFCliBase) used for json_get
+        :param endp_list: 'all' or a list of endpoint names
+        :param extra_fields: other fields to request along with the distribution column
+        :return: EndpHistogram of counts accumulated since the previous poll
+        """
+        if isinstance(endp_list, (list, tuple)):
+            endp_list = ",".join(endp_list)
+        response = local_realm.json_get("/endp/%s?fields=%s,%s" % (endp_list, extra_fields, self.column))
+        if response is None:
+            logger.warning("no response polling %s" % self.column)
+            return None
+        return self.update(EndpHistogram.from_endp_response(response, column=self.column))
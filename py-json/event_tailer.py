@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Incremental, indexed copy of the LANforge event log.
+
+Scripts that look for events (DHCP leases, roams, disassociations) used to fetch
+/events/since/<bookmark> again for every lookup and walk the whole response with
+Realm.get_events.  EventTailer keeps a cursor (see event_waiter.EventWaiter), so each
+tail() transfers only the events logged since the previous one, decodes them into
+EventRecord tuples and indexes them in memory:
+
+    by entity       'entity id' -> [(time_sec, id), ...] sorted
+    by event        'event' (the kind: Connect, Disconnect, DHCP-Lease, ...) -> same
+    by time         all events
+
+query() picks the narrowest index and bisects it to the time range, so "disassociation
+events of port X since T" costs O(log n) plus the matches instead of a scan of the log.
+
+At most max_events are kept in memory, the oldest are dropped first.  With sqlite_path
+they are written to an SQLite file instead of dropped (indexed the same way), queries
+reaching back before the oldest event in memory read the file as well, and the cursor
+is stored there, so a tailer opened on the same file later continues where this one
+stopped.
+
+Example:
+    tailer = local_realm.new_event_tailer()     # cursor at the newest event
+    ...
+    tailer.tail()
+    for event in tailer.query(entity="1.1.sta0000", event="Disconnect", since=start_sec):
+        print(event.timestamp, event.description)
+"""
+import bisect
+import datetime
+import importlib
+import logging
+import sqlite3
+import time
+from collections import namedtuple, OrderedDict
+
+event_waiter = importlib.import_module("py-json.event_waiter")
+EventWaiter = event_waiter.EventWaiter
+
+logger = logging.getLogger(__name__)
+
+EventRecord = namedtuple("EventRecord",
+                         "id time_sec timestamp entity event description priority type")
+
+# record member -> GUI field
+GUI_FIELDS = OrderedDict([
+    ("id", "id"),
+    ("timestamp", "time-stamp"),
+    ("entity", "entity id"),
+    ("event", "event"),
+    ("description", "event description"),
+    ("priority", "priority"),
+    ("type", "type"),
+])
+TIMESTAMP_FORMATS = ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S")
+
+
+def parse_time_sec(value=None, default=None):
+    """
+    :param value: 'time-stamp' of an event: text, or seconds or milliseconds since the epoch
+    :return: seconds since the epoch, default when the value is not understood
+    """
+    if isinstance(value, (int, float)):
+        # the GUI reports most times in milliseconds
+        return value / 1000.0 if value > 1e11 else float(value)
+    if value:
+        text = str(value).strip()
+        for time_format in TIMESTAMP_FORMATS:
+            try:
+                return datetime.datetime.strptime(text, time_format).timestamp()
+            except ValueError:
+                continue
+        try:
+            return parse_time_sec(float(text), default)
+        except ValueError:
+            pass
+    return default
+
+
+def to_record(event_id=None, record=None, received_sec=None):
+    """
+    :return: EventRecord for an event record of a /events response
+    """
+    timestamp = record.get("time-stamp")
+    time_sec = parse_time_sec(timestamp, received_sec if received_sec is not None else time.time())
+    # older GUIs only report the text, as 'event'
+    description = record.get("event description")
+    kind = record.get("event")
+    if description is None:
+        description, kind = kind, None
+    return EventRecord(id=event_id,
+                       time_sec=time_sec,
+                       timestamp=timestamp,
+                       entity=record.get("entity id"),
+                       event=kind,
+                       description=description or "",
+                       priority=record.get("priority"),
+                       type=record.get("type"))
+
+
+def as_gui_record(event=None):
+    """
+    :return: the event as a record of a /events response, for code written against those
+    """
+    return {gui_field: getattr(event, member) for member, gui_field in GUI_FIELDS.items()}
+
+
+class EventTailer:
+    def __init__(self,
+                 local_realm=None,
+                 start_id=None,
+                 max_events=50000,
+                 sqlite_path=None,
+                 debug=False):
+        """
+        :param local_realm: Realm used for the event queries
+        :param start_id: keep events after this id; None continues from sqlite_path or starts at the newest event
+        :param max_events: events kept in memory
+        :param sqlite_path: optional SQLite file to spill older events to
+        """
+        self.local_realm = local_realm
+        self.max_events = max(int(max_events), 1)
+        self.debug = debug
+        self.db = None
+        # events in the database
+        self.spilled = 0
+        if sqlite_path:
+            self.db = sqlite3.connect(sqlite_path)
+            self.create_tables()
+            self.spilled = self.db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            if start_id is None:
+                start_id = self.stored_cursor()
+        self.waiter = EventWaiter(local_realm=local_realm, start_id=start_id, debug=debug)
+
+        self.events = OrderedDict()  # id -> EventRecord, oldest first
+        self.by_time = []
+        self.by_entity = {}
+        self.by_event = {}
+        self.next_local_id = -1
+
+    # ----- ----- indexing ----- -----
+    @staticmethod
+    def index_add(index=None, key=None, entry=None):
+        entries = index.setdefault(key, [])
+        if not entries or entries[-1] <= entry:
+            entries.append(entry)
+        else:
+            # event times are not always in id order
+            bisect.insort(entries, entry)
+
+    def add(self, event=None):
+        if event.id is None:
+            # without an id the event can still be indexed, it just cannot be spilled twice
+            event = event._replace(id=self.next_local_id)
+            self.next_local_id -= 1
+        if event.id in self.events:
+            return event
+        self.events[event.id] = event
+        entry = (event.time_sec, event.id)
+        if not self.by_time or self.by_time[-1] <= entry:
+            self.by_time.append(entry)
+        else:
+            bisect.insort(self.by_time, entry)
+        self.index_add(self.by_entity, event.entity, entry)
+        self.index_add(self.by_event, event.event, entry)
+        return event
+
+    def tail(self):
+        """
+        Fetch and index the events logged since the last tail().
+        :return: list of the new EventRecords, oldest first
+        """
+        received_sec = time.time()
+        new_events = [self.add(to_record(event_id, record, received_sec))
+                      for event_id, record in self.waiter.poll_records()]
+        if len(self.events) > self.max_events:
+            self.evict()
+        return new_events
+
+    def evict(self):
+        """
+        Drop the oldest events beyond max_events, in batches of a tenth, spilling them when
+        there is a database.
+        """
+        excess = len(self.events) - self.max_events
+        if excess <= 0:
+            return
+        count = max(excess, self.max_events // 10)
+        evicted = [self.events.popitem(last=False)[1] for _ in range(min(count, len(self.events)))]
+        if self.db is not None:
+            self.spill(evicted)
+        gone = set(event.id for event in evicted)
+        self.by_time = [entry for entry in self.by_time if entry[1] not in gone]
+        for index, member in ((self.by_entity, "entity"), (self.by_event, "event")):
+            for key in set(getattr(event, member) for event in evicted):
+                kept = [entry for entry in index.get(key, ()) if entry[1] not in gone]
+                if kept:
+                    index[key] = kept
+                else:
+                    index.pop(key, None)
+        if self.debug:
+            logger.debug("evicted %d events, %d in memory" % (len(evicted), len(self.events)))
+
+    # ----- ----- queries ----- -----
+    def oldest_time_sec(self):
+        return self.by_time[0][0] if self.by_time else None
+
+    def query(self,
+              entity=None,
+              event=None,
+              since=None,
+              until=None,
+              description_prefix=None,
+              predicate=None,
+              limit=None):
+        """
+        Events matching all of the given conditions, oldest first.  Call tail() first to
+        include the latest events.
+        :param entity: 'entity id' of the events, such as a port EID
+        :param event: kind of event, 'event' in the GUI records
+        :param since: events at or after this time, seconds since the epoch
+        :param until: events at or before this time
+        :param description_prefix: text the description starts with
+        :param predicate: optional callable taking an EventRecord
+        :param limit: return at most this many, the oldest
+        :return: list of EventRecord
+        """
+        candidates = []
+        if entity is not None:
+            candidates.append(self.by_entity.get(entity, []))
+        if event is not None:
+            candidates.append(self.by_event.get(event, []))
+        entries = min(candidates, key=len) if candidates else self.by_time
+        start = 0 if since is None else bisect.bisect_left(entries, (since,))
+        end = len(entries) if until is None else bisect.bisect_right(entries, (until, float("inf")))
+
+        def accepts(record):
+            if entity is not None and record.entity != entity:
+                return False
+            if event is not None and record.event != event:
+                return False
+            if description_prefix is not None and not record.description.startswith(description_prefix):
+                return False
+            return predicate is None or predicate(record)
+
+        found = []
+        oldest = self.oldest_time_sec()
+        if self.db is not None and self.spilled and (since is None or oldest is None or since < oldest):
+            found = [record for record in self.query_db(entity, event, since, until, description_prefix)
+                     if predicate is None or predicate(record)]
+        for _time_sec, event_id in entries[start:end]:
+            if limit is not None and len(found) >= limit:
+                break
+            record = self.events[event_id]
+            if accepts(record):
+                found.append(record)
+        return found[:limit] if limit is not None else found
+
+    def last(self, entity=None, event=None, description_prefix=None):
+        """
+        :return: the newest matching EventRecord in memory, or None
+        """
+        candidates = []
+        if entity is not None:
+            candidates.append(self.by_entity.get(entity, []))
+        if event is not None:
+            candidates.append(self.by_event.get(event, []))
+        entries = min(candidates, key=len) if candidates else self.by_time
+        for _time_sec, event_id in reversed(entries):
+            record = self.events[event_id]
+            if (entity is None or record.entity == entity) \
+                    and (event is None or record.event == event) \
+                    and (description_prefix is None or record.description.startswith(description_prefix)):
+                return record
+        return None
+
+    def counters(self):
+        result = self.waiter.counters()
+        result.update({"in_memory": len(self.events),
+                       "entities": len(self.by_entity),
+                       "spilled": self.spilled})
+        return result
+
+    # ----- ----- sqlite ----- -----
+    def create_tables(self):
+        self.db.executescript('''
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY,
+                time_sec REAL,
+                timestamp TEXT,
+                entity TEXT,
+                event TEXT,
+                description TEXT,
+                priority TEXT,
+                type TEXT);
+            CREATE INDEX IF NOT EXISTS events_time ON events (time_sec);
+            CREATE INDEX IF NOT EXISTS events_entity ON events (entity, time_sec);
+            CREATE INDEX IF NOT EXISTS events_event ON events (event, time_sec);
+            CREATE TABLE IF NOT EXISTS tailer (key TEXT PRIMARY KEY, value TEXT);
+        ''')
+        self.db.commit()
+
+    def stored_cursor(self):
+        row = self.db.execute("SELECT value FROM tailer WHERE key = 'cursor'").fetchone()
+        return int(row[0]) if row else None
+
+    def spill(self, events=None):
+        rows = [(event.id, event.time_sec, None if event.timestamp is None else str(event.timestamp),
+                 event.entity, event.event, event.description, event.priority, event.type)
+                for event in events]
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            if self.waiter.cursor is not None and not self.events:
+                self.db.execute("INSERT OR REPLACE INTO tailer VALUES ('cursor', ?)", (str(self.waiter.cursor),))
+        self.spilled += len(rows)
+
+    def query_db(self, entity=None, event=None, since=None, until=None, description_prefix=None):
+        clauses, values = [], []
+        for column, value in (("entity", entity), ("event", event)):
+            if value is not None:
+                clauses.append("%s = ?" % column)
+                values.append(value)
+        if since is not None:
+            clauses.append("time_sec >= ?")
+            values.append(since)
+        if until is not None:
+            clauses.append("time_sec <= ?")
+            values.append(until)
+        if self.events:
+            # what is still in memory is answered from memory
+            clauses.append("id < ?")
+            values.append(next(iter(self.events)))
+        if description_prefix is not None:
+            clauses.append("substr(description, 1, ?) = ?")
+            values.extend([len(description_prefix), description_prefix])
+        sql = "SELECT id, time_sec, timestamp, entity, event, description, priority, type FROM events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY time_sec, id"
+        return [EventRecord(*row) for row in self.db.execute(sql, values)]
+
+    def close(self):
+        """
+        With a database, write the events still in memory and the cursor to it.
+        """
+        if self.db is None:
+            return
+        events = list(self.events.values())
+        self.events.clear()
+        self.by_time, self.by_entity, self.by_event = [], {}, {}
+        self.spill(events)
+        self.db.close()
+        self.db = None
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Completion waits driven by the LANforge event log.
+
+Loading a scenario, building Chamber View and running a Chamber View test used to
+be waited for by asking the GUI every second: scenario.py fetched every event since
+the start of the load each time, create_chamberview.py asked 'cv is_built', and
+cv_test_manager.py sent four cv commands per second for the whole test.
+
+EventWaiter keeps a cursor on the event log: each poll asks for
+/events/since/<last id seen> (Realm.find_new_events), so only new events are
+transferred and matched, and the cursor moves to the newest id.  The poll interval
+adapts: it starts at min_interval_sec, grows by backoff while the log is quiet, up to
+max_interval_sec, and drops back to min_interval_sec as soon as new events arrive,
+since that is when a completion is likely.
+
+    wait_for(predicate)     returns the first new event the predicate accepts
+    wait_for(check=fn)      for conditions that are not logged: fn() is called when new
+                            events arrived (at most every check_min_sec), or
+                            check_interval_sec after the last call
+    pause(min_sec, max_sec) waits between the iterations of a status loop, ending early
+                            (but not before min_sec) when the log shows activity
+
+Predicates take an event record, such as description_startswith('LOAD COMPLETED').
+
+Example:
+    waiter = local_realm.new_event_waiter()     # cursor at the newest event
+    local_realm.json_post("/cli-json/load", {"name": "BLANK", "action": "overwrite"})
+    event = waiter.wait_for(SCENARIO_LOADED, timeout_sec=120)
+    if event is None:
+        print("load did not complete")
+"""
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+DESCRIPTION = "event description"
+
+
+def event_description(record=None):
+    """
+    :return: the text of an event record, '' when it has none
+    """
+    if not isinstance(record, dict):
+        return ""
+    # the GUI reports the text as 'event description'; older builds only as 'event'
+    return record.get(DESCRIPTION) or record.get("event") or ""
+
+
+def description_is(*texts):
+    def predicate(record):
+        return event_description(record) in texts
+    return predicate
+
+
+def description_startswith(*prefixes):
+    def predicate(record):
+        return event_description(record).startswith(prefixes)
+    return predicate
+
+
+def description_contains(*fragments):
+    def predicate(record):
+        description = event_description(record)
+        return any(fragment in description for fragment in fragments)
+    return predicate
+
+
+def any_of(*predicates):
+    def predicate(record):
+        return any(accepts(record) for accepts in predicates)
+    return predicate
+
+
+def any_event(record):
+    return True
+
+
+SCENARIO_LOADED = any_of(description_is('LOAD-DB:  Load attempt has been completed.'),
+                         description_startswith('LOAD COMPLETED'))
+TEST_FINISHED = description_contains('test finished', 'Test finished', 'TEST FINISHED')
+
+
+class EventWaiter:
+    def __init__(self,
+                 local_realm=None,
+                 start_id=None,
+                 min_interval_sec=0.25,
+                 max_interval_sec=1.0,
+                 backoff=1.5,
+                 debug=False):
+        """
+        :param local_realm: Realm used for the event queries
+        :param start_id: only events after this id are seen; None starts at the newest event
+        :param min_interval_sec: poll interval while events are arriving
+        :param max_interval_sec: longest poll interval while the event log is quiet
+        :param backoff: growth of the poll interval per quiet poll
+        """
+        self.local_realm = local_realm
+        self.min_interval_sec = min_interval_sec
+        self.max_interval_sec = max(max_interval_sec, min_interval_sec)
+        self.backoff = max(backoff, 1.0)
+        self.debug = debug
+        self.interval_sec = min_interval_sec
+        self.pause_sec = None
+        self.requests = 0
+        self.events_seen = 0
+        self.checks = 0
+        self.cursor = None
+        if start_id is None:
+            self.mark()
+        else:
+            self.cursor = int(start_id)
+
+    def mark(self):
+        """
+        Move the cursor to the newest event, so older events are not matched.  When the
+        log cannot be read the cursor is left unset and the next poll marks again, rather
+        than starting from 0 and matching the whole history.
+        :return: the event id, 0 when the log is empty, None when it could not be read
+        """
+        self.requests += 1
+        response = self.local_realm.json_get('/events/last/1')
+        event_id = None
+        if response:
+            event_id = 0
+            if isinstance(response.get('event'), dict):
+                event_id = self.to_id(response['event'].get('id'))
+        self.cursor = event_id
+        if event_id is None:
+            logger.warning("could not read the newest event id, marking again on the next poll")
+        else:
+            self.interval_sec = self.min_interval_sec
+        return event_id
+
+    @staticmethod
+    def to_id(value=None):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def records(response=None):
+        """
+        :return: list of (event id, record) in a /events response
+        """
+        if not response:
+            return []
+        listing = response.get('events')
+        if listing is None:
+            listing = response.get('event')
+        if isinstance(listing, dict):
+            # a single event is not wrapped in a list
+            listing = [{listing.get('id'): listing}] if 'id' in listing else [listing]
+        found = []
+        for item in listing or []:
+            if not isinstance(item, dict):
+                continue
+            for key, record in item.items():
+                if not isinstance(record, dict):
+                    continue
+                event_id = EventWaiter.to_id(record.get('id', key))
+                found.append((event_id, record))
+        return found
+
+    def poll_records(self):
+        """
+        Fetch the events logged since the last poll and adapt the poll interval.
+        :return: list of (event id, record) of the new events, oldest first
+        """
+        if self.cursor is None and self.mark() is None:
+            self.interval_sec = min(self.interval_sec * self.backoff, self.max_interval_sec)
+            return []
+        self.requests += 1
+        response = self.local_realm.find_new_events(self.cursor)
+        new_records = []
+        for event_id, record in self.records(response):
+            # the GUI may repeat the cursor event itself
+            if event_id is not None and self.cursor is not None and event_id <= self.cursor:
+                continue
+            new_records.append((event_id, record))
+            if event_id is not None and (self.cursor is None or event_id > self.cursor):
+                self.cursor = event_id
+        self.events_seen += len(new_records)
+        if new_records:
+            self.interval_sec = self.min_interval_sec
+        else:
+            self.interval_sec = min(self.interval_sec * self.backoff, self.max_interval_sec)
+        if self.debug and new_records:
+            logger.debug("%d new events, cursor at %s" % (len(new_records), self.cursor))
+        return new_records
+
+    def poll(self):
+        """
+        :return: list of the records of the events logged since the last poll, oldest first
+        """
+        return [record for _event_id, record in self.poll_records()]
+
+    def wait_for(self,
+                 predicate=None,
+                 timeout_sec=120,
+                 check=None,
+                 check_interval_sec=1.0,
+                 check_min_sec=0.5):
+        """
+        Wait until a new event matches predicate, or check() returns a true value.
+        :param predicate: callable taking an event record, None to only use check
+        :param timeout_sec: give up after this long
+        :param check: optional callable for a condition that is not logged as an event
+        :param check_interval_sec: call check at least this often
+        :param check_min_sec: call check at most this often, however many events arrive
+        :return: the matching event record, the value returned by check, or None on timeout
+        """
+        started = time.monotonic()
+        deadline = started + timeout_sec
+        next_check = started
+        last_check = None
+        while True:
+            new_events = self.poll()
+            if predicate is not None:
+                for record in new_events:
+                    if predicate(record):
+                        return record
+            now = time.monotonic()
+            if check is not None and (now >= next_check
+                                      or (new_events and now - last_check >= check_min_sec)):
+                self.checks += 1
+                result = check()
+                if result:
+                    return result
+                last_check = now = time.monotonic()
+                next_check = now + check_interval_sec
+            if now >= deadline:
+                return None
+            wake = min(now + self.interval_sec, deadline)
+            if check is not None:
+                wake = min(wake, next_check)
+            time.sleep(max(wake - now, 0.0))
+
+    def pause(self, min_sec=1.0, max_sec=4.0):
+        """
+        Wait between iterations of a status loop: at least min_sec, then until new
+        events arrive.  The longest pause grows by backoff while nothing is logged,
+        up to max_sec.
+        :return: list of the new event records
+        """
+        if self.pause_sec is None:
+            self.pause_sec = min_sec
+        started = time.monotonic()
+        earliest = started + min_sec
+        latest = started + max(min(self.pause_sec, max_sec), min_sec)
+        new_events = []
+        while True:
+            new_events.extend(self.poll())
+            now = time.monotonic()
+            if (new_events and now >= earliest) or now >= latest:
+                break
+            if new_events:
+                time.sleep(earliest - now)
+            else:
+                time.sleep(min(self.interval_sec, latest - now))
+        if new_events:
+            self.pause_sec = min_sec
+        else:
+            self.pause_sec = min(self.pause_sec * self.backoff, max_sec)
+        return new_events
+
+    def counters(self):
+        return {
+            "requests": self.requests,
+            "events_seen": self.events_seen,
+            "checks": self.checks,
+            "cursor": self.cursor,
+        }
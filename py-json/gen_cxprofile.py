@@ -11,6 +11,7 @@ import time
 import datetime
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
@@ -18,6 +19,7 @@ LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
 pandas_extensions = importlib.import_module("py-json.LANforge.pandas_extensions")
+generic_stats = importlib.import_module("py-json.generic_stats")
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,8 @@ class GenCXProfile(LFCliBase):
         self.speedtest_min_dl = 0
         self.speedtest_min_up = 0
         self.speedtest_max_ping = 0
+        # (url, data) waiting for flush_commands()
+        self.command_queue = []
 
     # setting endpoint report timer
     def set_report_timer(self, endp_name=None, timer=5000):
@@ -463,9 +467,180 @@ class GenCXProfile(LFCliBase):
             })
         return True
 
+    def get_last_results(self):
+        """
+        One generic/list query, to pass to several choose_*_command calls.
+        """
+        return self.json_get("generic/list?fields=name,last+results", debug_=self.debug)
+
+    # ----- ----- batched creation ----- -----
+    def queue_command(self, url, data):
+        self.command_queue.append((url, data))
+
+    def flush_commands(self, max_in_flight=8, debug_=False, suppress_related_commands_=None):
+        """
+        Send every queued command, up to max_in_flight at once.  Commands queued
+        together must not depend on each other.
+        :return: number of commands that got no response
+        """
+        queued, self.command_queue = self.command_queue, []
+        if not queued:
+            return 0
+
+        def send(command):
+            url, data = command
+            return self.json_post(url, data, debug_=debug_ or self.debug,
+                                  suppress_related_commands_=suppress_related_commands_)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_in_flight, len(queued)))) as pool:
+            responses = list(pool.map(send, queued))
+        failed = sum(1 for response in responses if response is None)
+        if failed:
+            logger.warning("{failed} of {count} commands got no response".format(failed=failed, count=len(queued)))
+        return failed
+
+    def wait_until_generic_appear(self, names=None, timeout=60, interval_sec=0.25):
+        """
+        Poll generic/list until every endpoint in names is listed.
+        """
+        wanted = set(names)
+        deadline = time.monotonic() + timeout
+        while True:
+            response = self.json_get("generic/list?fields=name", debug_=self.debug) or {}
+            listing = response.get("endpoints", response.get("endpoint", []))
+            if isinstance(listing, dict):
+                listing = [{listing.get("name"): listing}]
+            found = set()
+            for item in listing:
+                for name, record in item.items():
+                    found.add(record.get("name", name) if isinstance(record, dict) else name)
+            missing = wanted - found
+            if not missing:
+                return True
+            if time.monotonic() >= deadline:
+                logger.error("generic endpoints did not appear: {missing}".format(missing=sorted(missing)))
+                return False
+            time.sleep(interval_sec)
+
+    def create_batched(self, ports=None, max_in_flight=8, timeout=60, debug_=False,
+                       suppress_related_commands_=None, real_client_os_types=None):
+        """
+        Same endpoints and CXs as create(), queued per stage and flushed together:
+        add_gen_endp for every port, then the flags and commands, then add_cx.
+        The sleeps between stages are replaced by waiting for the endpoints and CXs
+        to be listed.
+        """
+        if ports and real_client_os_types is not None and len(real_client_os_types) == 0:
+            logging.error('Real client operating systems types is empty list')
+            raise ValueError('Real client operating systems types is empty list')
+        if not ports:
+            ports = []
+
+        endp_tpls = []
+        for port_name in ports:
+            shelf, resource, name = self.local_realm.name_to_eid(port_name)[:3]
+            # real clients are named by their whole EID, as in create()
+            label = port_name if real_client_os_types else name
+            endp_tpls.append((shelf, resource, name, "%s-%s" % (self.name_prefix, label), label))
+
+        for shelf, resource, name, gen_name_a, _label in endp_tpls:
+            self.queue_command("cli-json/add_gen_endp", {
+                "alias": gen_name_a,
+                "shelf": shelf,
+                "resource": resource,
+                "port": name,
+                "type": "gen_generic"
+            })
+        self.flush_commands(max_in_flight, debug_, suppress_related_commands_)
+        self.local_realm.json_post("/cli-json/nc_show_endpoints", {"endpoint": "all"})
+        gen_names = [endp_tpl[3] for endp_tpl in endp_tpls]
+        if gen_names and not self.wait_until_generic_appear(gen_names, timeout=timeout):
+            return False
+
+        port_ips = {}
+        if real_client_os_types:
+            # one port query for every client instead of one each
+            response = self.json_get('/port/all?fields=ip', debug_=self.debug) or {}
+            for item in response.get('interfaces', []):
+                for eid, record in item.items():
+                    port_ips[eid] = record.get('ip')
+        for ix, (shelf, resource, name, gen_name_a, _label) in enumerate(endp_tpls):
+            self.queue_command("cli-json/set_endp_flag", {"name": gen_name_a, "flag": "ClearPortOnStart", "val": 1})
+            if real_client_os_types:
+                current_device_ip = port_ips.get("%s.%s.%s" % (shelf, resource, name)) or None
+                if current_device_ip is None:
+                    logger.critical('IP Address not found for the Client {}'.format(ports[ix]))
+                self.parse_command(name, gen_name_a, client_type=real_client_os_types[ix], ip=current_device_ip)
+            else:
+                self.parse_command(name, gen_name_a)
+            self.queue_command("cli-json/set_gen_cmd", {"name": gen_name_a, "command": self.cmd})
+        self.flush_commands(max_in_flight, debug_, suppress_related_commands_)
+
+        cx_names = []
+        for _shelf, _resource, _name, gen_name_a, label in endp_tpls:
+            cx_name = "CX_%s-%s" % (self.name_prefix, label)
+            self.queue_command("/cli-json/add_cx", {
+                "alias": cx_name,
+                "test_mgr": "default_tm",
+                "tx_endp": gen_name_a
+            })
+            cx_names.append(cx_name)
+            self.created_cx.append(cx_name)
+            self.created_endp.append(gen_name_a)
+        self.flush_commands(max_in_flight, debug_, suppress_related_commands_)
+        if cx_names and not self.local_realm.wait_until_cxs_appear(cx_names, debug=debug_, timeout=timeout):
+            return False
+        self.local_realm.json_post("/cli-json/show_cx", {"test_mgr": "default_tm", "cross_connect": "all"})
+        return True
+
+    def new_stats(self, fields=None):
+        """
+        :return: GenericStats for the endpoints of this profile
+        """
+        stats = generic_stats.GenericStats(local_realm=self.local_realm,
+                                           fields=fields,
+                                           endpoints=list(self.created_endp) or None,
+                                           debug=self.debug)
+        stats.register_profile(self)
+        return stats
+
+    def monitor_results(self, duration_sec=60, monitor_interval=2, report_file=None, fields=None):
+        """
+        Poll the endpoints of this profile once per interval, one /generic query per tick,
+        and write the decoded last results (see generic_stats.py) of every endpoint to report_file.
+        :return: the GenericStats of the last tick
+        """
+        stats = self.new_stats(fields)
+        end_time = time.monotonic() + duration_sec
+        csvfile = None
+        csvwriter = None
+        if report_file:
+            csvfile = open(str(report_file), 'w')
+            csvwriter = csv.writer(csvfile, delimiter=",")
+            csvwriter.writerow(['Timestamp seconds epoch', 'name', 'kind', 'ok'] + stats.columns)
+        try:
+            while True:
+                tick_sec = int(time.time())
+                if stats.poll() and csvwriter is not None:
+                    for name in stats.names:
+                        row = stats.row(name)
+                        csvwriter.writerow([tick_sec, name, row['kind'], row['ok']]
+                                           + ["" if row[column] is None else row[column] for column in stats.columns])
+                if time.monotonic() + monitor_interval >= end_time:
+                    break
+                time.sleep(monitor_interval)
+        finally:
+            if csvfile is not None:
+                csvfile.close()
+        failed = stats.failed(stats.mask(owned_only=True))
+        if failed:
+            logger.warning("generic endpoints reporting failures: {failed}".format(failed=failed))
+        return stats
+
     # Looks incorrect to me. --Ben
-    def choose_ping_command(self):
-        gen_results = self.json_get("generic/list?fields=name,last+results", debug_=self.debug)
+    def choose_ping_command(self, gen_results=None):
+        if gen_results is None:
+            gen_results = self.get_last_results()
         logger.debug(pformat(gen_results))
         if gen_results['endpoints']:
             for name in gen_results['endpoints']:
@@ -477,8 +652,9 @@ class GenCXProfile(LFCliBase):
                         else:
                             return False, v['name']
 
-    def choose_lfcurl_command(self):
-        gen_results = self.json_get("generic/list?fields=name,last+results", debug_=self.debug)
+    def choose_lfcurl_command(self, gen_results=None):
+        if gen_results is None:
+            gen_results = self.get_last_results()
         logger.debug(pformat(gen_results))
         if gen_results['endpoints']:
             for name in gen_results['endpoints']:
@@ -492,8 +668,9 @@ class GenCXProfile(LFCliBase):
                             else:
                                 return False, v['name']
 
-    def choose_iperf3_command(self):
-        gen_results = self.json_get("generic/list?fields=name,last+results", debug_=self.debug)
+    def choose_iperf3_command(self, gen_results=None):
+        if gen_results is None:
+            gen_results = self.get_last_results()
         if gen_results['endpoints']:
             logger.info(gen_results['endpoints'])
             # for name in gen_results['endpoints']:
@@ -501,8 +678,9 @@ class GenCXProfile(LFCliBase):
             # for k,v in name.items():
         exit(1)
 
-    def choose_speedtest_command(self):
-        gen_results = self.json_get("generic/list?fields=name,last+results", debug_=self.debug)
+    def choose_speedtest_command(self, gen_results=None):
+        if gen_results is None:
+            gen_results = self.get_last_results()
         if gen_results['endpoints']:
             for name in gen_results['endpoints']:
                 for k, v in name.items():
@@ -515,8 +693,9 @@ class GenCXProfile(LFCliBase):
                                 last_results['ping'] <= self.speedtest_max_ping:
                             return True, v['name']
 
-    def choose_generic_command(self):
-        gen_results = self.json_get("generic/list?fields=name,last+results", debug_=self.debug)
+    def choose_generic_command(self, gen_results=None):
+        if gen_results is None:
+            gen_results = self.get_last_results()
         if gen_results['endpoints']:
             for name in gen_results['endpoints']:
                 for k, v in name.items():
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Columnar generic endpoint stats, one /generic query per tick.
+
+GenCXProfile.monitor asks for its endpoints every interval and copies the raw
+'last results' text into a csv, and the choose_*_command helpers fetch
+generic/list?fields=name,last+results again for every check, each parsing the
+text its own way.  GenericStats fetches /generic once per tick and decodes the
+'last results' of every endpoint in one pass, whatever ran in it, into NumPy
+columns (NaN where a value does not apply):
+
+    kind            KIND_PING, KIND_IPERF3, KIND_SPEEDTEST, KIND_LFCURL, KIND_OTHER, from
+                    the command (or from the text when the command was not fetched)
+    ok              1 when the last results show success, 0 for failure, -1 when unknown
+    rtt_ms          latest ping reply time
+    rtt_min_ms, rtt_avg_ms, rtt_max_ms    ping summary line
+    loss_pct        ping packet loss
+    bps             iperf3 rate of the latest interval
+    download_bps, upload_bps, ping_ms     speedtest json
+    urls_done, urls_total                 lf_curl 'Finished n/ m'
+    tx pkts, rx pkts, dropped, ...        the numeric fields requested
+
+Example:
+    stats = local_realm.new_generic_stats()
+    stats.register_profile(gen_cx_profile)
+    if stats.poll():
+        mask = stats.mask(owned_only=True) & stats.kind_mask(stats.KIND_PING)
+        print(np.nanmean(stats.column('rtt_avg_ms')[mask]), stats.failed(mask))
+"""
+import json
+import logging
+import re
+import urllib.parse
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+KIND_OTHER = 0
+KIND_PING = 1
+KIND_IPERF3 = 2
+KIND_SPEEDTEST = 3
+KIND_LFCURL = 4
+KIND_NAMES = {KIND_OTHER: "generic", KIND_PING: "ping", KIND_IPERF3: "iperf3",
+              KIND_SPEEDTEST: "speedtest", KIND_LFCURL: "lfcurl"}
+
+# columns decoded from 'last results'
+RESULT_COLUMNS = ("rtt_ms", "rtt_min_ms", "rtt_avg_ms", "rtt_max_ms", "loss_pct", "bps",
+                  "download_bps", "upload_bps", "ping_ms", "urls_done", "urls_total")
+
+PING_TIME = re.compile(r"time[=<]\s*([\d.]+)\s*ms")
+# linux 'rtt min/avg/max/mdev = 1/2/3/0.1 ms', lfping 'min/avg/max = 1/2/3', windows with commas
+PING_SUMMARY = re.compile(r"min/avg/max\S*\s*[=:]\s*([\d.,]+)/([\d.,]+)/([\d.,]+)")
+PING_LOSS = re.compile(r"([\d.]+)%\s*packet loss")
+IPERF3_RATE = re.compile(r"([\d.]+)\s*([KMG]?)bits/sec")
+LFCURL_FINISHED = re.compile(r"Finished\s+(\d+)\D?\s+(\d+)")
+RATE_SCALE = {"": 1.0, "K": 1e3, "M": 1e6, "G": 1e9}
+
+
+def kind_of(command=None, text=None):
+    """
+    :return: KIND_ constant for a generic endpoint running command, or from its output
+    """
+    probe = command or ""
+    if not probe and text:
+        if text.lstrip().startswith("{"):
+            return KIND_SPEEDTEST
+        probe = text
+    if "speedtest" in probe:
+        return KIND_SPEEDTEST
+    if "iperf3" in probe or "bits/sec" in probe:
+        return KIND_IPERF3
+    if "lf_curl" in probe or "Finished" in probe:
+        return KIND_LFCURL
+    if "ping" in probe or "icmp_seq" in probe:
+        return KIND_PING
+    return KIND_OTHER
+
+
+def _float(text=None):
+    try:
+        return float(text.replace(",", ""))
+    except (AttributeError, ValueError):
+        return np.nan
+
+
+def parse_last_results(kind=None, text=None):
+    """
+    Decode the 'last results' of a generic endpoint.
+    :return: (ok, dict of RESULT_COLUMNS member -> value) with only the values found
+    """
+    values = {}
+    if not text:
+        return -1, values
+    if kind == KIND_PING:
+        found = PING_TIME.findall(text)
+        if found:
+            values["rtt_ms"] = _float(found[-1])
+        summary = PING_SUMMARY.findall(text)
+        if summary:
+            values["rtt_min_ms"], values["rtt_avg_ms"], values["rtt_max_ms"] = (_float(v) for v in summary[-1])
+        loss = PING_LOSS.findall(text)
+        if loss:
+            values["loss_pct"] = _float(loss[-1])
+        if "Unreachable" in text or "unreachable" in text or "not known" in text:
+            return 0, values
+        # nothing came back: no reply time and no summary line to go by
+        if values.get("loss_pct") == 100:
+            return 0, values
+        return (1 if found or summary else -1), values
+    if kind == KIND_IPERF3:
+        found = IPERF3_RATE.findall(text)
+        if found:
+            number, scale = found[-1]
+            values["bps"] = _float(number) * RATE_SCALE[scale]
+            return 1, values
+        return (0 if "error" in text else -1), values
+    if kind == KIND_SPEEDTEST:
+        try:
+            result = json.loads(text)
+        except ValueError:
+            return -1, values
+        for column, member in (("download_bps", "download"), ("upload_bps", "upload"), ("ping_ms", "ping")):
+            if isinstance(result.get(member), (int, float)):
+                values[column] = float(result[member])
+        if not (result.get("download") or result.get("upload") or result.get("ping")):
+            return 0, values
+        return 1, values
+    if kind == KIND_LFCURL:
+        found = LFCURL_FINISHED.findall(text)
+        if found:
+            done, total = found[-1]
+            values["urls_done"], values["urls_total"] = float(done), float(total)
+            return (1 if done == total else 0), values
+        return -1, values
+    return (0 if "not known" in text else 1), values
+
+
+class GenericStats:
+    KIND_OTHER = KIND_OTHER
+    KIND_PING = KIND_PING
+    KIND_IPERF3 = KIND_IPERF3
+    KIND_SPEEDTEST = KIND_SPEEDTEST
+    KIND_LFCURL = KIND_LFCURL
+
+    DEFAULT_FIELDS = ("name", "command", "last results", "tx pkts", "rx pkts", "dropped")
+    NON_NUMERIC_FIELDS = ("name", "eid", "command", "last results", "type", "status")
+
+    def __init__(self, local_realm=None, fields=None, endpoints=None, debug=False):
+        """
+        :param fields: /generic fields to fetch; name, command and last results are always fetched
+        :param endpoints: names to query, default all generic endpoints
+        """
+        self.local_realm = local_realm
+        self.fields = list(fields) if fields is not None else list(self.DEFAULT_FIELDS)
+        for required in ("name", "command", "last results"):
+            if required not in self.fields:
+                self.fields.append(required)
+        self.numeric_fields = [field for field in self.fields if field not in self.NON_NUMERIC_FIELDS]
+        self.columns = list(RESULT_COLUMNS) + self.numeric_fields
+        self.column_index = {column: j for j, column in enumerate(self.columns)}
+        self.endpoints = list(endpoints) if endpoints else None
+        self.debug = debug
+        self.owned_names = set()
+
+        # latest tick, in response order
+        self.names = []
+        self.index = {}
+        self.commands = []
+        self.texts = []
+        self.kind = np.zeros(0, dtype=np.int8)
+        self.ok = np.zeros(0, dtype=np.int8)
+        self.owned = np.zeros(0, dtype=bool)
+        self.values = np.zeros((0, len(self.columns)), dtype=np.float64)
+        self.tick_count = 0
+
+    @property
+    def url(self):
+        fields = ",".join(urllib.parse.quote_plus(field) for field in self.fields)
+        if self.endpoints:
+            return "/generic/%s?fields=%s" % (",".join(self.endpoints), fields)
+        return "/generic/all?fields=%s" % fields
+
+    def register(self, name=None):
+        self.owned_names.add(name)
+
+    def register_profile(self, gen_cx_profile=None):
+        """
+        Mark the endpoints of a GenCXProfile as owned.
+        """
+        self.owned_names.update(gen_cx_profile.created_endp)
+
+    def poll(self, debug_=False):
+        """
+        Fetch /generic and store it as the current tick.
+        :return: True if endpoints were read
+        """
+        response = self.local_realm.json_get(self.url, debug_=debug_ or self.debug)
+        return self.ingest(response)
+
+    def ingest(self, response=None):
+        """
+        Store a /generic response as the current tick.
+        :return: True if the response held endpoints
+        """
+        if not response or ("endpoints" not in response and "endpoint" not in response):
+            logger.warning("generic response has no endpoint list: {}".format(response))
+            return False
+        listing = response.get("endpoints", response.get("endpoint"))
+        if isinstance(listing, dict):
+            # a single endpoint is not wrapped in a list or keyed by name
+            listing = [{listing.get("name"): listing}] if "name" in listing else [listing]
+
+        records = []
+        for item in listing:
+            for name, record in item.items():
+                if isinstance(record, dict):
+                    records.append((record.get("name", name), record))
+        size = len(records)
+        self.names = [name for name, _record in records]
+        self.index = {name: row for row, name in enumerate(self.names)}
+        self.commands = [record.get("command") or "" for _name, record in records]
+        self.texts = [record.get("last results") or "" for _name, record in records]
+        self.kind = np.zeros(size, dtype=np.int8)
+        self.ok = np.full(size, -1, dtype=np.int8)
+        self.owned = np.fromiter((name in self.owned_names for name in self.names), dtype=bool, count=size)
+        self.values = np.full((size, len(self.columns)), np.nan, dtype=np.float64)
+
+        column_index = self.column_index
+        numeric_offset = len(RESULT_COLUMNS)
+        for row, (_name, record) in enumerate(records):
+            kind = kind_of(self.commands[row], self.texts[row])
+            self.kind[row] = kind
+            ok, found = parse_last_results(kind, self.texts[row])
+            self.ok[row] = ok
+            for column, value in found.items():
+                self.values[row, column_index[column]] = value
+            for j, field in enumerate(self.numeric_fields):
+                value = record.get(field)
+                if isinstance(value, (int, float)):
+                    self.values[row, numeric_offset + j] = value
+                elif value not in (None, ""):
+                    self.values[row, numeric_offset + j] = _float(str(value))
+        self.tick_count += 1
+        return True
+
+    def column(self, column=None):
+        return self.values[:, self.column_index[column]]
+
+    def mask(self, owned_only=True):
+        if owned_only and self.owned_names:
+            return self.owned.copy()
+        return np.ones(len(self.names), dtype=bool)
+
+    def kind_mask(self, *kinds):
+        return np.isin(self.kind, kinds)
+
+    def failed(self, mask=None):
+        """
+        :return: names of the endpoints whose last results show a failure
+        """
+        selected = self.ok == 0
+        if mask is not None:
+            selected &= mask
+        return [self.names[row] for row in np.flatnonzero(selected)]
+
+    def passed(self, mask=None):
+        selected = self.ok == 1
+        if mask is not None:
+            selected &= mask
+        return [self.names[row] for row in np.flatnonzero(selected)]
+
+    def first_result(self, kind=None, owned_only=True, skip_suffix=None):
+        """
+        (passed, name) of the first endpoint with results, as the choose_*_command helpers return it.
+        :return: (bool, name), or None when no endpoint has results
+        """
+        selected = self.mask(owned_only) & (self.ok >= 0)
+        if kind is not None:
+            selected &= self.kind == kind
+        for row in np.flatnonzero(selected):
+            name = self.names[row]
+            if skip_suffix and name.endswith(skip_suffix):
+                continue
+            return bool(self.ok[row] == 1), name
+        return None
+
+    def row(self, name=None):
+        """
+        :return: dict of the decoded values of one endpoint
+        """
+        row = self.index[name]
+        result = {"name": name,
+                  "kind": KIND_NAMES[int(self.kind[row])],
+                  "ok": int(self.ok[row]),
+                  "last results": self.texts[row]}
+        for column, j in self.column_index.items():
+            value = self.values[row, j]
+            result[column] = None if np.isnan(value) else float(value)
+        return result
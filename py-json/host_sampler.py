@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Host CPU, memory, process and network sampling from /proc, without forking.
+
+cpu_stats.py ran 'top -bn1' twice per sample through os.popen and parsed the
+'%Cpu(s)' and 'MiB Mem' lines of its text output, which costs two processes per
+sample, depends on top's layout and locale, and cannot keep up with sub-second
+intervals.  HostSampler keeps these files open and reads them again each tick:
+
+    /proc/stat          cpu time by state, as user/system/iowait/irq/busy percent of
+                        the time since the previous tick
+    /proc/meminfo       total, available and used memory in MiB
+    /proc/<pid>/stat    cpu percent (of one core) and rss in MiB of the processes watched
+    /proc/net/dev       rx and tx bits per second of the interfaces watched
+
+Ticks are on a fixed schedule (start + n * interval_sec), so the sampling does not
+drift with the time a read takes; ticks that could not be taken in time are counted
+in 'missed' rather than taken late.  Samples are kept as columns (one list per
+metric) and appended to a csv log, a header row then one row per tick, every
+flush_every ticks.  graph_data() gives the columns in the form
+lf_graph.lf_line_graph takes, and load_log() reads a log back.
+
+Example:
+    sampler = HostSampler(interval_sec=0.1, pids=[os.getpid()], interfaces=["eth0"],
+                          log_path="/tmp/host.csv")
+    sampler.start()
+    ...                                 # run the test
+    sampler.stop()
+    x, data_set, labels = sampler.graph_data(["cpu_busy_pct", "pid%d_cpu_pct" % os.getpid()])
+"""
+import csv
+import logging
+import math
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CPU_COLUMNS = ("cpu_user_pct", "cpu_system_pct", "cpu_iowait_pct", "cpu_irq_pct", "cpu_busy_pct")
+MEM_COLUMNS = ("mem_total_mb", "mem_used_mb", "mem_available_mb")
+
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def parse_cpu(text=None):
+    """
+    :return: (user, system, iowait, irq, idle, total) jiffies of the 'cpu' line of /proc/stat
+    """
+    line = text[:text.index("\n")]
+    values = [int(value) for value in line.split()[1:]]
+    # user nice system idle iowait irq softirq steal [guest guest_nice, already in user and nice]
+    values += [0] * (8 - len(values))
+    user, nice, system, idle, iowait, irq, softirq, steal = values[:8]
+    total = user + nice + system + idle + iowait + irq + softirq + steal
+    return user + nice, system, iowait, irq + softirq, idle, total
+
+
+def parse_meminfo(text=None):
+    """
+    :return: dict of MemTotal, MemAvailable, MemFree, Buffers, Cached in kB
+    """
+    wanted = ("MemTotal:", "MemAvailable:", "MemFree:", "Buffers:", "Cached:")
+    found = {}
+    for line in text.splitlines():
+        key, _, rest = line.partition(" ")
+        if key in wanted:
+            found[key[:-1]] = int(rest.split()[0])
+            if len(found) == len(wanted):
+                break
+    if "MemAvailable" not in found:
+        # kernels before 3.14
+        found["MemAvailable"] = found.get("MemFree", 0) + found.get("Buffers", 0) + found.get("Cached", 0)
+    return found
+
+
+def parse_pid_stat(text=None):
+    """
+    :return: (utime + stime jiffies, rss pages) from /proc/<pid>/stat
+    """
+    # the command name may hold spaces and parentheses, the fields start after the last ')'
+    fields = text[text.rindex(")") + 2:].split()
+    return int(fields[11]) + int(fields[12]), int(fields[21])
+
+
+def parse_net_dev(text=None):
+    """
+    :return: dict of interface -> (rx bytes, tx bytes)
+    """
+    counters = {}
+    for line in text.splitlines()[2:]:
+        name, _, rest = line.partition(":")
+        values = rest.split()
+        if len(values) >= 9:
+            counters[name.strip()] = (int(values[0]), int(values[8]))
+    return counters
+
+
+class ProcFile:
+    """
+    A /proc file kept open and read again from the start each time.
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self.handle = None
+
+    def read(self):
+        """
+        :return: the content, None when the file is gone (such as a process that exited)
+        """
+        try:
+            if self.handle is None:
+                self.handle = open(self.path, "r")
+            else:
+                self.handle.seek(0)
+            return self.handle.read()
+        except (OSError, ValueError):
+            self.close()
+            return None
+
+    def close(self):
+        if self.handle is not None:
+            try:
+                self.handle.close()
+            except OSError:
+                pass
+            self.handle = None
+
+
+class HostSampler:
+    def __init__(self,
+                 interval_sec=1.0,
+                 pids=None,
+                 interfaces=None,
+                 log_path=None,
+                 flush_every=50,
+                 proc_root="/proc"):
+        """
+        :param interval_sec: time between ticks, 0.1 for 10 Hz
+        :param pids: process ids to watch
+        :param interfaces: interfaces to watch; None for every interface but lo, [] for none
+        :param log_path: csv log the ticks are appended to
+        :param flush_every: ticks buffered before they are written to the log
+        """
+        self.interval_sec = float(interval_sec)
+        self.pids = [int(pid) for pid in (pids or [])]
+        self.log_path = log_path
+        self.flush_every = max(int(flush_every), 1)
+        self.stat_file = ProcFile(os.path.join(proc_root, "stat"))
+        self.meminfo_file = ProcFile(os.path.join(proc_root, "meminfo"))
+        self.net_file = ProcFile(os.path.join(proc_root, "net", "dev"))
+        self.pid_files = {pid: ProcFile(os.path.join(proc_root, str(pid), "stat")) for pid in self.pids}
+        if interfaces is None:
+            interfaces = [name for name in parse_net_dev(self.net_file.read() or "") if name != "lo"]
+        self.interfaces = list(interfaces)
+
+        self.columns = ["time", "elapsed_sec"] + list(CPU_COLUMNS) + list(MEM_COLUMNS)
+        for pid in self.pids:
+            self.columns += ["pid%d_cpu_pct" % pid, "pid%d_rss_mb" % pid]
+        for name in self.interfaces:
+            self.columns += ["%s_rx_bps" % name, "%s_tx_bps" % name]
+        self.data = {column: [] for column in self.columns}
+
+        self.previous = None
+        self.started = None
+        self.ticks = 0
+        self.missed = 0
+        self.sample_sec = 0.0
+        self.max_sample_sec = 0.0
+        self.flushed = 0
+        self.log_header = False
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+
+    def read(self):
+        """
+        :return: raw counters at this moment
+        """
+        now = time.time()
+        counters = {"time": now, "monotonic": time.monotonic()}
+        stat = self.stat_file.read()
+        counters["cpu"] = parse_cpu(stat) if stat else None
+        meminfo = self.meminfo_file.read()
+        counters["mem"] = parse_meminfo(meminfo) if meminfo else None
+        counters["pids"] = {}
+        for pid, pid_file in self.pid_files.items():
+            text = pid_file.read()
+            counters["pids"][pid] = parse_pid_stat(text) if text else None
+        if self.interfaces:
+            net = self.net_file.read()
+            counters["net"] = parse_net_dev(net) if net else {}
+        return counters
+
+    def sample(self):
+        """
+        Read the counters and add a row computed against the previous read; the first
+        read only sets the baseline.
+        :return: dict of column -> value of the new row, None for the baseline
+        """
+        started = time.perf_counter()
+        current = self.read()
+        previous, self.previous = self.previous, current
+        if previous is None:
+            self.started = current["time"]
+            return None
+        elapsed = current["monotonic"] - previous["monotonic"]
+        row = {"time": round(current["time"], 3), "elapsed_sec": round(current["time"] - self.started, 3)}
+
+        nan = float("nan")
+        if current["cpu"] and previous["cpu"]:
+            delta = [now - before for now, before in zip(current["cpu"], previous["cpu"])]
+            total = delta[5] or 1
+            row["cpu_user_pct"] = round(100.0 * delta[0] / total, 2)
+            row["cpu_system_pct"] = round(100.0 * delta[1] / total, 2)
+            row["cpu_iowait_pct"] = round(100.0 * delta[2] / total, 2)
+            row["cpu_irq_pct"] = round(100.0 * delta[3] / total, 2)
+            row["cpu_busy_pct"] = round(100.0 * (total - delta[4] - delta[2]) / total, 2)
+        mem = current["mem"]
+        if mem:
+            row["mem_total_mb"] = round(mem["MemTotal"] / 1024.0, 1)
+            row["mem_available_mb"] = round(mem["MemAvailable"] / 1024.0, 1)
+            row["mem_used_mb"] = round((mem["MemTotal"] - mem["MemAvailable"]) / 1024.0, 1)
+        for pid in self.pids:
+            now_pid, before_pid = current["pids"].get(pid), previous["pids"].get(pid)
+            if now_pid and before_pid and elapsed > 0:
+                row["pid%d_cpu_pct" % pid] = round(100.0 * (now_pid[0] - before_pid[0]) / CLK_TCK / elapsed, 2)
+            if now_pid:
+                row["pid%d_rss_mb" % pid] = round(now_pid[1] * PAGE_SIZE / 1048576.0, 1)
+        for name in self.interfaces:
+            now_net, before_net = current["net"].get(name), previous["net"].get(name)
+            if now_net and before_net and elapsed > 0:
+                row["%s_rx_bps" % name] = round((now_net[0] - before_net[0]) * 8 / elapsed)
+                row["%s_tx_bps" % name] = round((now_net[1] - before_net[1]) * 8 / elapsed)
+
+        with self.lock:
+            for column in self.columns:
+                self.data[column].append(row.get(column, nan))
+            self.ticks += 1
+        spent = time.perf_counter() - started
+        self.sample_sec += spent
+        self.max_sample_sec = max(self.max_sample_sec, spent)
+        if self.log_path and self.ticks - self.flushed >= self.flush_every:
+            self.flush()
+        return row
+
+    def flush(self):
+        """
+        Append the ticks not yet written to the log.
+        """
+        if not self.log_path:
+            return
+        with self.lock:
+            rows = list(zip(*(self.data[column][self.flushed:] for column in self.columns)))
+            self.flushed += len(rows)
+        with open(self.log_path, "w" if not self.log_header else "a", newline="") as log_file:
+            writer = csv.writer(log_file)
+            if not self.log_header:
+                writer.writerow(self.columns)
+                self.log_header = True
+            writer.writerows(["" if isinstance(value, float) and math.isnan(value) else value for value in row]
+                             for row in rows)
+
+    def run(self, duration_sec=None):
+        """
+        Sample every interval_sec until duration_sec has passed or stop() is called.
+        """
+        self.sample()
+        start = time.monotonic()
+        tick = 0
+        while not self.stop_event.is_set():
+            tick += 1
+            deadline = start + tick * self.interval_sec
+            if duration_sec is not None and deadline - start > duration_sec:
+                break
+            now = time.monotonic()
+            if now > deadline + self.interval_sec:
+                # a read took longer than a tick: skip to the next slot, do not bunch up
+                skipped = int((now - deadline) / self.interval_sec)
+                self.missed += skipped
+                tick += skipped
+                deadline = start + tick * self.interval_sec
+            if self.stop_event.wait(max(deadline - time.monotonic(), 0.0)):
+                break
+            self.sample()
+        self.flush()
+
+    def start(self, duration_sec=None):
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, args=(duration_sec,), name="host_sampler", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        for proc_file in [self.stat_file, self.meminfo_file, self.net_file] + list(self.pid_files.values()):
+            proc_file.close()
+
+    def column(self, column=None):
+        with self.lock:
+            return list(self.data[column])
+
+    def graph_data(self, columns=None):
+        """
+        :return: (x-axis of elapsed seconds, data_set, labels) as lf_graph.lf_line_graph takes them
+        """
+        with self.lock:
+            return list(self.data["elapsed_sec"]), [list(self.data[column]) for column in columns], list(columns)
+
+    def summary(self):
+        """
+        :return: dict of ticks, missed ticks, mean and max time a tick took, and per column mean and max
+        """
+        result = {"ticks": self.ticks,
+                  "missed": self.missed,
+                  "mean_sample_ms": round(self.sample_sec * 1000 / max(self.ticks, 1), 3),
+                  "max_sample_ms": round(self.max_sample_sec * 1000, 3)}
+        with self.lock:
+            for column in self.columns[2:]:
+                values = [value for value in self.data[column] if not math.isnan(value)]
+                if values:
+                    result[column] = {"mean": round(sum(values) / len(values), 2), "max": max(values)}
+        return result
+
+    @staticmethod
+    def load_log(path=None):
+        """
+        :return: dict of column -> list of floats (NaN where empty) from a log written by flush()
+        """
+        with open(path, newline="") as log_file:
+            reader = csv.reader(log_file)
+            columns = next(reader)
+            data = {column: [] for column in columns}
+            for row in reader:
+                for column, value in zip(columns, row):
+                    data[column].append(float(value) if value != "" else float("nan"))
+        return data
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Columnar layer-3 endpoint stats shared by the L3 test scripts.
+
+test_l3.py, test_l3_longevity.py, lf_rssi_check.py, lf_snp_test.py,
+lf_test_max_association.py and sta_connect2.py all poll the endp table every
+monitor interval and total the rx rates by direction.  L3EndpStats fetches the
+table once per tick and keeps one row per endpoint in NumPy arrays:
+
+    index       endpoint name -> row
+    side        SIDE_A, SIDE_B, SIDE_MC_RX, SIDE_MC_TX or SIDE_OTHER, set when the
+                endpoint is registered (from the cx profile right after the CXs are
+                created) or from the name the first time it is seen
+    port, cx    row -> port EID / CX name group number
+    owned       endpoint was registered by the test
+
+Each tick stores the requested numeric fields as a 2-D float array in response
+order, so totals and group-bys are NumPy reductions over masks.
+
+Example:
+    stats = local_realm.new_l3_endp_stats()
+    stats.register_cx_profile(cx_profile)
+    stats.register_multicast_profile(multicast_profile)
+    if stats.poll():
+        mask = stats.mask(owned_only=True)
+        total_dl = stats.total('rx rate', mask & stats.side_mask(stats.SIDE_A))
+        per_port = stats.group_sum('rx rate', by='port', mask=mask)
+"""
+import logging
+import urllib.parse
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class L3EndpStats:
+    SIDE_OTHER = 0
+    SIDE_A = 1
+    SIDE_B = 2
+    SIDE_MC_RX = 3
+    SIDE_MC_TX = 4
+
+    DEFAULT_FIELDS = ("name", "eid", "delay", "jitter", "rx rate", "rx rate ll",
+                      "rx bytes", "rx drop %", "rx pkts ll")
+    NON_NUMERIC_FIELDS = ("name", "eid")
+    # the legacy endp_rx_map kept whichever of these came last in the record
+    RX_MAP_FIELDS = ("rx bytes", "rx rate", "rx rate ll", "rx pkts ll")
+
+    def __init__(self, local_realm=None, fields=None, debug=False):
+        self.local_realm = local_realm
+        self.fields = list(fields) if fields is not None else list(self.DEFAULT_FIELDS)
+        for required in ("name", "eid"):
+            if required not in self.fields:
+                self.fields.insert(0, required)
+        self.numeric_fields = [field for field in self.fields if field not in self.NON_NUMERIC_FIELDS]
+        self.field_index = {field: j for j, field in enumerate(self.numeric_fields)}
+        self.url = "endp?fields=" + ",".join(urllib.parse.quote_plus(field) for field in self.fields)
+        self.debug = debug
+
+        # per endpoint, grown as endpoints are registered or first seen
+        self.index = {}
+        self.names = []
+        self.side = np.zeros(0, dtype=np.int8)
+        self.owned = np.zeros(0, dtype=bool)
+        self.port = np.zeros(0, dtype=np.int32)
+        self.cx = np.zeros(0, dtype=np.int32)
+        self.port_names = []
+        self.port_index = {}
+        self.cx_names = []
+        self.cx_index = {}
+        self.size = 0
+        self.prefix_cache = {}
+
+        # latest tick, in response order
+        self.tick_rows = np.zeros(0, dtype=np.intp)
+        self.tick_names = []
+        self.tick_records = []
+        self.tick_values = np.zeros((0, len(self.numeric_fields)), dtype=np.float64)
+        self.tick_count = 0
+
+    @staticmethod
+    def side_of_name(name=None):
+        if "-mrx-" in name:
+            return L3EndpStats.SIDE_MC_RX
+        if name.endswith("-A"):
+            return L3EndpStats.SIDE_A
+        if name.endswith("-B"):
+            return L3EndpStats.SIDE_B
+        return L3EndpStats.SIDE_OTHER
+
+    @staticmethod
+    def cx_of_name(name=None):
+        if name.endswith("-A") or name.endswith("-B"):
+            return name[:-2]
+        return name
+
+    @staticmethod
+    def port_of_eid(eid=None):
+        if not eid:
+            return None
+        hunks = str(eid).split('.')
+        if len(hunks) < 3:
+            return None
+        return '.'.join(hunks[:3])
+
+    def _group(self, names, index, name):
+        group = index.get(name)
+        if group is None:
+            group = len(names)
+            names.append(name)
+            index[name] = group
+        return group
+
+    def _grow(self, needed):
+        capacity = len(self.side)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2, 64)
+        extra = capacity - len(self.side)
+        self.side = np.concatenate((self.side, np.zeros(extra, dtype=np.int8)))
+        self.owned = np.concatenate((self.owned, np.zeros(extra, dtype=bool)))
+        self.port = np.concatenate((self.port, np.full(extra, -1, dtype=np.int32)))
+        self.cx = np.concatenate((self.cx, np.full(extra, -1, dtype=np.int32)))
+
+    def register(self, name=None, side=None, cx_name=None, owned=True):
+        """
+        Add an endpoint, or update the side/CX/ownership of a known one.
+        :param name: endpoint name
+        :param side: one of the SIDE_ constants, default: from the name
+        :param cx_name: CX the endpoint belongs to, default: name without -A/-B
+        :param owned: endpoint belongs to this test
+        :return: row of the endpoint
+        """
+        row = self.index.get(name)
+        if row is None:
+            row = self.size
+            self._grow(row + 1)
+            self.index[name] = row
+            self.names.append(name)
+            self.size += 1
+            self.prefix_cache.clear()
+        self.side[row] = self.side_of_name(name) if side is None else side
+        self.cx[row] = self._group(self.cx_names, self.cx_index,
+                                   self.cx_of_name(name) if cx_name is None else cx_name)
+        if owned:
+            self.owned[row] = True
+        return row
+
+    def register_cx_profile(self, cx_profile=None):
+        """
+        Register the endpoints of an L3CXProfile, call after the CXs are created.
+        Endpoints that are already known are skipped so this is cheap to call every tick.
+        """
+        for cx_name, endp_names in cx_profile.created_cx.items():
+            for side, endp_name in zip((self.SIDE_A, self.SIDE_B), endp_names):
+                if endp_name not in self.index or not self.owned[self.index[endp_name]]:
+                    self.register(endp_name, side=side, cx_name=cx_name)
+        for endp_name in cx_profile.created_endp.keys():
+            if endp_name not in self.index:
+                self.register(endp_name)
+
+    def register_multicast_profile(self, multicast_profile=None):
+        for endp_name in multicast_profile.get_mc_names():
+            if endp_name not in self.index or not self.owned[self.index[endp_name]]:
+                side = self.SIDE_MC_RX if "-mrx-" in endp_name else self.SIDE_MC_TX
+                self.register(endp_name, side=side)
+
+    @staticmethod
+    def _as_number(value):
+        if isinstance(value, (int, float)):
+            return value
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0
+
+    def poll(self, debug_=False):
+        """
+        Fetch the endp table and store it as the current tick.
+        :return: True if the table was read
+        """
+        response = self.local_realm.json_get(self.url, debug_=debug_ or self.debug)
+        return self.ingest(response)
+
+    def ingest(self, response=None):
+        """
+        Store an endp response as the current tick.
+        :param response: decoded /endp response
+        :return: True if the response held endpoints
+        """
+        if not response or 'endpoint' not in response:
+            logger.warning("endp response has no endpoint list: {}".format(response))
+            return False
+        endpoint_list = response['endpoint']
+        if isinstance(endpoint_list, dict):
+            # a single endpoint is not wrapped in a list or keyed by name
+            if 'name' in endpoint_list:
+                endpoint_list = [{endpoint_list['name']: endpoint_list}]
+            else:
+                endpoint_list = [endpoint_list]
+
+        names = []
+        records = []
+        for entry in endpoint_list:
+            for name, record in entry.items():
+                names.append(name)
+                records.append(record)
+
+        rows = np.empty(len(names), dtype=np.intp)
+        for i, name in enumerate(names):
+            row = self.index.get(name)
+            if row is None:
+                row = self.register(name, owned=False)
+            rows[i] = row
+            if self.port[row] < 0:
+                port_eid = self.port_of_eid(records[i].get('eid'))
+                if port_eid is not None:
+                    self.port[row] = self._group(self.port_names, self.port_index, port_eid)
+
+        values = np.zeros((len(records), len(self.numeric_fields)), dtype=np.float64)
+        for j, field in enumerate(self.numeric_fields):
+            column = [record.get(field, 0) for record in records]
+            try:
+                values[:, j] = column
+            except (TypeError, ValueError):
+                values[:, j] = [self._as_number(value) for value in column]
+
+        self.tick_rows = rows
+        self.tick_names = names
+        self.tick_records = records
+        self.tick_values = values
+        self.tick_count += 1
+        return True
+
+    def column(self, field=None):
+        """
+        :return: values of a numeric field for the current tick, in response order
+        """
+        return self.tick_values[:, self.field_index[field]]
+
+    def mask(self, owned_only=True):
+        """
+        :param owned_only: only endpoints registered by the test, otherwise every endpoint
+        :return: bool mask over the current tick
+        """
+        if owned_only:
+            return self.owned[self.tick_rows]
+        return np.ones(len(self.tick_rows), dtype=bool)
+
+    def side_mask(self, *sides):
+        return np.isin(self.side[self.tick_rows], sides)
+
+    def prefix_mask(self, prefix=None):
+        """
+        :return: bool mask over the current tick of endpoints whose name starts with prefix
+        """
+        by_row = self.prefix_cache.get(prefix)
+        if by_row is None:
+            by_row = np.array([name.startswith(prefix) for name in self.names], dtype=bool)
+            self.prefix_cache[prefix] = by_row
+        return by_row[self.tick_rows]
+
+    def total(self, field=None, mask=None):
+        values = self.column(field)
+        if mask is not None:
+            values = values[mask]
+        return int(values.sum())
+
+    def totals_by_side(self, field=None, mask=None):
+        """
+        :return: dict of SIDE_ constant -> total of field
+        """
+        sides = self.side[self.tick_rows]
+        values = self.column(field)
+        if mask is not None:
+            sides = sides[mask]
+            values = values[mask]
+        sums = np.bincount(sides, weights=values, minlength=self.SIDE_MC_TX + 1)
+        return {side: int(sums[side]) for side in range(len(sums))}
+
+    def group_sum(self, field=None, by='port', mask=None):
+        """
+        Sum a field per port EID or per CX.
+        :param by: 'port' or 'cx'
+        :return: dict of port EID or CX name -> total
+        """
+        if by == 'port':
+            groups, labels = self.port[self.tick_rows], self.port_names
+        elif by == 'cx':
+            groups, labels = self.cx[self.tick_rows], self.cx_names
+        else:
+            raise ValueError("group_sum by [%s] must be port or cx" % by)
+        values = self.column(field)
+        keep = groups >= 0
+        if mask is not None:
+            keep &= mask
+        sums = np.bincount(groups[keep], weights=values[keep], minlength=len(labels))
+        present = np.unique(groups[keep])
+        return {labels[group]: float(sums[group]) for group in present}
+
+    def rx_maps(self, mask=None, rx_key=None):
+        """
+        Maps in the form the scripts' __get_rx_values used to build.
+        :param rx_key: field whose values go in endp_rx_map; None for the last of the
+            RX_MAP_FIELDS in the records, as the loops over every field left it
+        :return: endp_rx_map, endp_rx_drop_map, endps (list of records)
+        """
+        selected = range(len(self.tick_names)) if mask is None else np.flatnonzero(mask)
+        names = self.tick_names
+        records = self.tick_records
+        endps = [records[i] for i in selected]
+        if not endps:
+            return {}, {}, endps
+        if rx_key is None:
+            rx_keys = [key for key in endps[0] if key in self.RX_MAP_FIELDS]
+            rx_key = rx_keys[-1] if rx_keys else None
+        endp_rx_map = {}
+        if rx_key is not None:
+            endp_rx_map = {names[i]: records[i][rx_key] for i in selected if rx_key in records[i]}
+        endp_rx_drop_map = {names[i]: records[i]['rx drop %'] for i in selected if 'rx drop %' in records[i]}
+        return endp_rx_map, endp_rx_drop_map, endps
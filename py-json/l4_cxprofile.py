@@ -15,6 +15,8 @@ sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
+l4_endp_stats = importlib.import_module("py-json.l4_endp_stats")
+L4EndpStats = l4_endp_stats.L4EndpStats
 
 logger = logging.getLogger(__name__)
 
@@ -37,23 +39,16 @@ class L4CXProfile(LFCliBase):
         fields_list = ["!conn", "acc.+denied", "bad-proto", "bad-url", "other-err", "total-err", "rslv-p", "rslv-h",
                        "timeout", "nf+(4xx)", "http-r", "http-p", "http-t", "login-denied"]
         endp_list = self.json_get("layer4/list?fields=%s" % ','.join(fields_list))
-        debug_info = {}
-        if endp_list is not None and endp_list['endpoint'] is not None:
-            endp_list = endp_list['endpoint']
-            expected_passes = len(endp_list)
-            passes = len(endp_list)
-            for item in range(len(endp_list)):
-                for name, info in endp_list[item].items():
-                    for field in fields_list:
-                        if info[field.replace("+", " ")] > 0:
-                            passes -= 1
-                            debug_info[name] = {field: info[field.replace("+", " ")]}
+        if endp_list is not None and endp_list.get('endpoint') is not None:
+            stats = L4EndpStats(fields=fields_list)
+            stats.ingest(endp_list)
+            errors = stats.errors(fields_list)
             if debug:
-                logger.debug(debug_info)
-            if passes == expected_passes:
+                logger.debug(errors)
+            if errors.empty:
                 return True
             else:
-                logger.info(list(debug_info), " Endps in this list showed errors getting to %s " % self.url)
+                logger.info("%s Endps in this list showed errors getting to %s " % (list(errors.index), self.url))
                 return False
 
     def start_cx(self):
@@ -76,71 +71,46 @@ class L4CXProfile(LFCliBase):
 
     @staticmethod
     def compare_vals(old_list, new_list):
-        passes = 0
-        expected_passes = 0
-        if len(old_list) == len(new_list):
-            for item, value in old_list.items():
-                expected_passes += 1
-                if new_list[item] > old_list[item]:
-                    passes += 1
-            if passes == expected_passes:
-                return True
-            else:
-                return False
-        else:
+        if len(old_list) != len(new_list):
             return False
+        old_values = pd.Series(old_list, dtype=float)
+        new_values = pd.Series(new_list, dtype=float).reindex(old_values.index)
+        return bool((new_values > old_values).all())
 
     def get_bytes(self):
         time.sleep(1)
         cx_list = self.json_get("layer4/list?fields=name,%s" % self.test_type, debug_=self.debug)
         logger.info(pformat(cx_list))
-
-        # single CX == 'endpoint':{'bytes-rd': 5535, 'name': 'sta0000_l4'}
-        # multiple CX == 'endpoint': [{'sta0000_l4': {'bytes-rd': 4920, 'name': 'sta0000_l4'}}, {'sta0001_l4': {'bytes-rd': 3690, 'name': 'sta0001_l4'}}]
-        cx_map = {}
-        logger.info("cx_list['endpoint'] type {type}".format(type=type(cx_list['endpoint'])))
-
-        for cx_name in cx_list['endpoint']:
-            if cx_name != 'uri' and cx_name != 'handler':
-                # single CX
-                if (type(cx_name) is str):
-                    # single CX (str) 
-                    # create a dictionary
-                    cx_name_dict = {cx_list['endpoint']['name'] : cx_list['endpoint']}
-                    for item, value in cx_name_dict.items():
-                        for value_name, value_rx in value.items():
-                            if item in self.created_cx.keys() and value_name == self.test_type:
-                                cx_map[item] = value_rx
-                    # break is needed for cx_name is not the cx_names
-                    # {'_links': '/layer4/451', 'entity id': '1.1.12.451.11', 'name': 'sta0000_l4'} 
-                    # 
-                    break
-                else:
-                    # multipe CX (dict)
-                    for item, value in cx_name.items():
-                        for value_name, value_rx in value.items():
-                            if item in self.created_cx.keys() and value_name == self.test_type:
-                                cx_map[item] = value_rx
-        return cx_map
+        # one endpoint and several come back in different shapes, to_frame reads both
+        frame = l4_endp_stats.to_frame(cx_list)
+        column = self.test_type.replace("+", " ")
+        if column not in frame.columns:
+            return {}
+        owned = frame.index.intersection(list(self.created_cx.keys()))
+        return frame.loc[owned, column].to_dict()
 
     def check_request_rate(self):
         endp_list = self.json_get("layer4/list?fields=urls/s")
-        expected_passes = 0
-        passes = 0
         # TODO: this might raise a nameerror lower down
         #  if self.target_requests_per_ten is None:
         #    raise NameError("check request rate: missing self.target_requests_per_ten")
-        if endp_list is not None and endp_list['endpoint'] is not None:
-            endp_list = endp_list['endpoint']
-            for item in endp_list:
-                for name, info in item.items():
-                    if name in self.created_cx.keys():
-                        expected_passes += 1
-                        if info['urls/s'] * self.requests_per_ten >= self.target_requests_per_ten * .9:
-                            # logger.info(name, info['urls/s'], info['urls/s'] * self.requests_per_ten, self.target_requests_per_ten * .9)
-                            passes += 1
-
-        return passes == expected_passes
+        if endp_list is None or endp_list.get('endpoint') is None:
+            return True
+        stats = L4EndpStats(fields=["urls/s"])
+        if not stats.ingest(endp_list):
+            return True
+        owned = stats.frame.index.isin(list(self.created_cx.keys()))
+        return bool(stats.rate_ok(self.target_requests_per_ten, self.requests_per_ten)[owned].all())
+
+    def new_stats(self, fields=None, csv_path=None):
+        """
+        :return: L4EndpStats for the endpoints of this profile
+        """
+        return L4EndpStats(local_realm=self.local_realm,
+                           fields=fields,
+                           names=list(self.created_cx.keys()),
+                           csv_path=csv_path,
+                           debug=self.debug)
 
     def cleanup(self):
         logger.info("Cleaning up cxs and endpoints")
@@ -247,113 +217,87 @@ class L4CXProfile(LFCliBase):
         else:
             output_format = report_file.split('.')[-1]
 
-        # Step 1 - Assign column names 
-
+        # Step 1 - Assign column names, one /layer4 query per tick also carries the fields the checks use
+        if created_cx is not None and not isinstance(created_cx, str):
+            created_cx = ",".join(created_cx)
         if col_names is not None and len(col_names) > 0:
-            header_row = col_names
+            header_row = list(col_names)
+            stats = L4EndpStats(local_realm=self.local_realm, fields=col_names,
+                                names=created_cx.split(','), debug=self.debug)
         else:
-            header_row = list((list(self.json_get("/layer4/all")['endpoint'][0].values())[0].keys()))
+            header_row = None
+            stats = L4EndpStats(local_realm=self.local_realm, debug=self.debug)
+        if self.test_type == 'urls':
+            stats.add_fields("urls/s", *l4_endp_stats.ERROR_FIELDS)
+        else:
+            stats.add_fields(self.test_type)
         if debug:
             logger.debug(header_row)
 
-        # Step 2 - Monitor columns
+        # Step 2 - Monitor columns, a tick every monitor_interval
         start_time = datetime.datetime.now()
         end_time = start_time + datetime.timedelta(seconds=duration_sec)
-        sleep_interval = round(duration_sec // 5)
         if debug:
-            logger.debug("Sleep_interval is %s ", sleep_interval)
             logger.debug("Start time is %s ", start_time)
             logger.debug("End time is %s ", end_time)
-        value_map = dict()
         passes = 0
         expected_passes = 0
-        timestamps = []
+        # csv output is written tick by tick, other formats are built at the end
+        stream = output_format.lower() == 'csv'
+        samples = []
+        rows_written = 0
+        owned = list(self.created_cx.keys())
+        next_tick = time.monotonic() + monitor_interval
         if self.test_type != 'urls':
-            old_rx_values = self.get_bytes()
-
-        for test in range(1 + iterations):
-            while datetime.datetime.now() < end_time:
-                if col_names is None:
-                    response = self.json_get("/layer4/all")
-                else:
-                    fields = ",".join(col_names)
-                    response = self.json_get("/layer4/%s?fields=%s" % (created_cx, fields), debug_=self.debug)
-                if debug:
-                    logger.debug(pformat(response))
-                if response is None:
-                    logger.debug(pformat(response))
-                    raise ValueError("Cannot find any endpoints")
-                if monitor:
-                    if debug:
-                        logger.debug(pformat(response))
-
-                time.sleep(sleep_interval)
-                t = datetime.datetime.now()
-                timestamps.append(t)
-                value_map[t] = response
-                expected_passes += 1
-                if self.test_type == 'urls':
-                    if self.check_errors(self.debug):
-                        if self.check_request_rate():
-                            passes += 1
-                        else:
-                            self._fail("FAIL: Request rate did not exceed target rate")
-                            break
-                    else:
-                        self._fail("FAIL: Errors found getting to %s " % self.url)
-                        break
-
-                else:
-                    new_rx_values = self.get_bytes()
-                    if self.compare_vals(old_rx_values, new_rx_values):
-                        passes += 1
-                    else:
-                        self._fail("FAIL: Not all stations increased traffic")
-
-                    # self.exit_fail()
-                time.sleep(monitor_interval)
-
-        logger.info(pformat(value_map))
-
-        # [further] post-processing data, after test completion
-        full_test_data_list = []
-        for test_timestamp, data in value_map.items():
-            # reduce the endpoint data to single dictionary of dictionaries
-            # for single cx data["endpoint"] string not dict
-            logger.debug("type data['endpoint']  {data}".format(data=type(data['endpoint'])))
-            logger.debug(" data['endpoint'] : {data}".format(data=data['endpoint']))
-
-            for datum in data["endpoint"]:
-                logger.debug("type datum {datum}".format(datum=type(datum)))
-                if type(datum) is str:
-                    # single CX (str)
-                    datum_dict = {data['endpoint']['name'] : data['endpoint']}
-                    logger.debug("datum_dict {datum}".format(datum=datum_dict))
-                    for endpoint_data in datum_dict.values():
-                        logger.debug(endpoint_data)
-                        endpoint_data["Timestamp"] = test_timestamp
-                        full_test_data_list.append(endpoint_data)
-                    # break is needed ,  there is a single CX the json is formatted 
+            # start-of-test baseline, every tick is compared with it
+            stats.poll()
+
+        while datetime.datetime.now() < end_time:
+            time.sleep(max(next_tick - time.monotonic(), 0))
+            next_tick += monitor_interval
+            if not stats.poll():
+                raise ValueError("Cannot find any endpoints")
+            t = datetime.datetime.now()
+            if header_row is None:
+                header_row = ["name"] + [column for column in stats.frame.columns if column != "_links"]
+            tick = stats.frame.reset_index().reindex(columns=header_row)
+            tick.insert(0, "Timestamp milliseconds", int(self.get_milliseconds(t)))
+            tick.insert(0, "Timestamp", t.strftime("%m/%d/%Y %I:%M:%S"))
+            if stream:
+                tick.index = range(rows_written, rows_written + len(tick))
+                tick.to_csv(report_file, mode='a' if rows_written else 'w', header=not rows_written)
+                rows_written += len(tick)
+            else:
+                samples.append(tick)
+            if monitor and debug:
+                logger.debug(pformat(tick))
+
+            expected_passes += 1
+            mine = stats.frame.index.isin(owned)
+            if self.test_type == 'urls':
+                errors = stats.errors()
+                if not errors.empty:
+                    logger.info("%s Endps in this list showed errors getting to %s " % (list(errors.index), self.url))
+                    self._fail("FAIL: Errors found getting to %s " % self.url)
                     break
-
+                if not stats.rate_ok(self.target_requests_per_ten, self.requests_per_ten)[mine].all():
+                    self._fail("FAIL: Request rate did not exceed target rate")
+                    break
+                passes += 1
+            else:
+                if stats.increased(self.test_type, since_start=True)[mine].all():
+                    passes += 1
                 else:
-                    # multiple CS (str)
-                    for endpoint_data in datum.values():
-                        if debug:
-                            logger.debug(endpoint_data)
-                        endpoint_data["Timestamp"] = test_timestamp
-                        full_test_data_list.append(endpoint_data)
-
-        header_row.append("Timestamp")
-        header_row.append('Timestamp milliseconds')
-        df = pd.DataFrame(full_test_data_list)
+                    self._fail("FAIL: Not all stations increased traffic")
 
-        df["Timestamp milliseconds"] = [self.get_milliseconds(x) for x in df["Timestamp"]]
-        # round entire column
-        df["Timestamp milliseconds"] = df["Timestamp milliseconds"].astype(int)
-        df["Timestamp"] = df["Timestamp"].apply(lambda x: x.strftime("%m/%d/%Y %I:%M:%S"))
-        df = df[["Timestamp", "Timestamp milliseconds", *header_row[:-2]]]
-        # compare previous data to current data
+        # [further] post-processing data, after test completion
+        if stream:
+            # already in report_file
+            df = None
+        elif samples:
+            df = pd.concat(samples, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=["Timestamp", "Timestamp milliseconds", *(header_row or [])])
 
         systeminfo = ast.literal_eval(
             requests.get('http://' + str(self.lfclient_host) + ':' + str(self.lfclient_port)).text)
@@ -369,5 +313,7 @@ class L4CXProfile(LFCliBase):
             return df
         supported_formats = ['csv', 'json', 'stata', 'pickle', 'html']
         for x in supported_formats:
+            if stream and x == 'csv':
+                continue
             if output_format.lower() == x or report_file.split('.')[-1] == x:
                 exec('df.to_' + x + '("' + report_file + '")')
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Columnar layer-4 endpoint stats for L4CXProfile and the HTTP/FTP load tests.
+
+L4CXProfile.monitor used to ask /layer4 for the monitored columns, then again for
+the error counters (check_errors), the request rate (check_request_rate) or the
+byte counter (get_bytes, after sleeping a second), walking each response with
+branches for the single endpoint ('endpoint': {...}) and the multiple endpoint
+('endpoint': [{name: {...}}, ...]) shapes and comparing dicts entry by entry.
+
+L4EndpStats fetches every field needed in one /layer4 query per tick and turns
+either response shape into a DataFrame indexed by endpoint name, numeric columns
+converted once.  The checks are column operations on that frame:
+
+    errors()            endpoints with any error counter above 0
+    rate_ok()           urls/s * requests_per_ten >= 90% of the target, per endpoint
+    increased(column)   column grew since the previous tick, per endpoint, or with
+                        since_start=True since the first tick (the baseline)
+    rates(column)       growth per second since the previous tick
+
+With csv_path every tick is appended to a csv file as it is taken (one row per
+endpoint, header written once), so a long run keeps only the baseline and the last two
+ticks in memory.
+
+Example:
+    stats = local_realm.new_l4_endp_stats(fields=["name", "bytes-rd", "urls/s"],
+                                          names=l4_profile.created_cx.keys(),
+                                          csv_path="/tmp/l4.csv")
+    stats.poll()
+    ...
+    stats.poll()
+    if not stats.increased("bytes-rd").all():
+        print("stalled:", stats.stalled("bytes-rd"))
+"""
+import logging
+import os
+import time
+import urllib.parse
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ERROR_FIELDS = ("!conn", "acc. denied", "bad-proto", "bad-url", "other-err", "total-err", "rslv-p", "rslv-h",
+                "timeout", "nf (4xx)", "http-r", "http-p", "http-t", "login-denied")
+NON_NUMERIC_FIELDS = ("name", "entity id", "eid", "type", "status", "state", "_links")
+
+
+def normalize(response=None):
+    """
+    :return: list of endpoint records in a /layer4 response, for one endpoint or many
+    """
+    if not response:
+        return []
+    listing = response.get("endpoint", response.get("endpoints"))
+    if listing is None:
+        return []
+    if isinstance(listing, dict):
+        # a single endpoint is not wrapped in a list or keyed by name
+        if "name" in listing or not all(isinstance(value, dict) for value in listing.values()):
+            return [listing]
+        listing = [listing]
+    records = []
+    for item in listing:
+        for name, record in item.items():
+            if isinstance(record, dict):
+                if "name" not in record:
+                    record = dict(record, name=name)
+                records.append(record)
+    return records
+
+
+def to_frame(response=None, fields=None):
+    """
+    :return: DataFrame indexed by endpoint name, numeric fields as floats
+    """
+    frame = pd.DataFrame.from_records(normalize(response))
+    if frame.empty:
+        return pd.DataFrame(columns=list(fields or [])).set_index(pd.Index([], name="name"))
+    frame = frame.drop_duplicates("name", keep="last").set_index("name")
+    for column in frame.columns:
+        if column not in NON_NUMERIC_FIELDS:
+            frame[column] = pd.to_numeric(frame[column], errors="coerce")
+    return frame
+
+
+class L4EndpStats:
+    def __init__(self,
+                 local_realm=None,
+                 fields=None,
+                 names=None,
+                 csv_path=None,
+                 debug=False):
+        """
+        :param fields: /layer4 fields to fetch, name is always fetched; None for all
+        :param names: endpoints of the test; the checks only look at these, None for all
+        :param csv_path: append every tick to this csv file
+        """
+        self.local_realm = local_realm
+        self.fields = None
+        if fields is not None:
+            self.fields = [field.replace("+", " ") for field in fields]
+            if "name" not in self.fields:
+                self.fields.insert(0, "name")
+        self.names = list(names) if names else None
+        self.csv_path = csv_path
+        self.csv_header = None
+        self.debug = debug
+        self.frame = None
+        self.previous = None
+        self.baseline = None
+        self.tick_sec = None
+        self.previous_sec = None
+        self.tick_count = 0
+        self.rows_written = 0
+
+    def add_fields(self, *fields):
+        if self.fields is None:
+            return
+        for field in fields:
+            field = field.replace("+", " ")
+            if field not in self.fields:
+                self.fields.append(field)
+
+    @property
+    def url(self):
+        target = ",".join(self.names) if self.names else "all"
+        if self.fields is None:
+            return "/layer4/%s" % target
+        return "/layer4/%s?fields=%s" % (target, ",".join(urllib.parse.quote_plus(field) for field in self.fields))
+
+    def poll(self, debug_=False):
+        """
+        Fetch /layer4 once and store it as the current tick.
+        :return: True if endpoints were read
+        """
+        response = self.local_realm.json_get(self.url, debug_=debug_ or self.debug)
+        return self.ingest(response)
+
+    def ingest(self, response=None, tick_sec=None):
+        """
+        Store a /layer4 response as the current tick.
+        :return: True if the response held endpoints
+        """
+        frame = to_frame(response, self.fields)
+        if frame.empty:
+            logger.warning("layer4 response has no endpoints: {}".format(response))
+            return False
+        if self.names:
+            frame = frame.reindex(self.names)
+        self.previous, self.previous_sec = self.frame, self.tick_sec
+        self.frame = frame
+        if self.baseline is None:
+            self.baseline = frame
+        self.tick_sec = time.time() if tick_sec is None else tick_sec
+        self.tick_count += 1
+        if self.csv_path:
+            self.write_tick()
+        return True
+
+    def write_tick(self):
+        frame = self.frame.reset_index()
+        frame.insert(0, "Timestamp milliseconds", int(self.tick_sec * 1000))
+        if self.csv_header is None:
+            self.csv_header = list(frame.columns)
+            header = not (os.path.exists(self.csv_path) and os.path.getsize(self.csv_path) > 0)
+        else:
+            header = False
+        frame.reindex(columns=self.csv_header).to_csv(self.csv_path, mode="a", header=header, index=False)
+        self.rows_written += len(frame)
+
+    def column(self, column=None):
+        """
+        :return: Series of column for the endpoints of the current tick
+        """
+        column = column.replace("+", " ")
+        if self.frame is None or column not in self.frame.columns:
+            return pd.Series(dtype=np.float64)
+        return self.frame[column]
+
+    def errors(self, fields=ERROR_FIELDS):
+        """
+        :return: DataFrame of the error counters above 0, endpoints without errors left out
+        """
+        fields = [field.replace("+", " ") for field in fields]
+        present = [field for field in fields if field in self.frame.columns]
+        counters = self.frame[present].fillna(0)
+        return counters[(counters > 0).any(axis=1)]
+
+    def rate_ok(self, target_requests_per_ten=None, requests_per_ten=600, column="urls/s"):
+        """
+        :return: boolean Series, request rate of each endpoint reaches 90% of the target
+        """
+        return self.column(column).fillna(0) * requests_per_ten >= target_requests_per_ten * .9
+
+    def increased(self, column=None, since_start=False):
+        """
+        :param since_start: compare with the first tick instead of the previous one
+        :return: boolean Series, column grew since the previous (or first) tick; False for
+                 endpoints missing from either tick
+        """
+        before = self.baseline if since_start else self.previous
+        if before is None or before is self.frame:
+            return pd.Series(False, index=self.frame.index)
+        column = column.replace("+", " ")
+        current = self.frame[column]
+        previous = before[column].reindex(current.index)
+        return (current > previous).fillna(False)
+
+    def stalled(self, column=None, since_start=False):
+        increased = self.increased(column, since_start)
+        return list(increased.index[~increased.values])
+
+    def rates(self, column=None):
+        """
+        :return: Series of the growth of column per second since the previous tick
+        """
+        if self.previous is None or not self.tick_sec or self.tick_sec <= self.previous_sec:
+            return pd.Series(np.nan, index=self.frame.index)
+        column = column.replace("+", " ")
+        delta = self.frame[column] - self.previous[column].reindex(self.frame.index)
+        return delta / (self.tick_sec - self.previous_sec)
+
+    def totals(self, *columns):
+        return {column: float(self.column(column).sum()) for column in columns}
@@ -37,6 +37,8 @@ class ATTENUATORProfile(LFCliBase):
             "pulse_time_ms": 'NA'
         }
         self.debug = debug_
+        # wait after set_attenuator; atten_sweep.py waits on the stations instead
+        self.settle_sec = 10
 
     def set_command_param(self, command_name, param_name, param_value):
         # we have to check what the param name is
@@ -92,5 +94,5 @@ class ATTENUATORProfile(LFCliBase):
         set_attenuators.addPostData(self.atten_data)
         time.sleep(0.01)
         set_attenuators.jsonPost(self.debug)
-        time.sleep(10)
+        time.sleep(self.settle_sec)
         print("\n")
@@ -1,7 +1,24 @@
 #!/usr/bin/env python3
 # flake8: noqa
+"""
+monitor_interval used to walk every port of the response for every endpoint and
+every station name, matching names by substring, and returned after the first
+endpoint.  sample() fetches /endp and /port once per tick, indexes the ports by
+station name once (port_map) and looks each endpoint's station up by the end of
+its name (join_rows), so a tick costs one pass over each response and returns a
+row for every endpoint.  The rows of the last max_samples ticks are kept in a
+ring buffer, self.samples.
+
+Example:
+    data = local_realm.new_lf_data_collection()
+    rows = data.sample(created_cx=cx_endps, layer3_fields="name,tx bytes,rx bytes",
+                       sta_list=["sta0000", "sta0001"], port_mgr_fields="alias,signal")
+    for when, rows in data.latest(10):
+        ...
+"""
 import datetime
 import logging
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +36,14 @@ logger = logging.getLogger(__name__)
 # reading data from websockets
 
 class LFDataCollection:
-    def __init__(self, local_realm, debug=False):
+    def __init__(self, local_realm, debug=False, max_samples=1000):
+        """
+        :param max_samples: samples kept by sample(), the oldest are dropped first
+        """
         self.parent_realm = local_realm
         self.exit_on_error = False
         self.debug = debug or local_realm.debug
+        self.samples = deque(maxlen=max_samples)
 
     def json_get(self, _req_url, debug_=False):
         return self.parent_realm.json_get(_req_url, debug_=debug_)
@@ -48,50 +69,129 @@ class LFDataCollection:
     def get_seconds(timestamp):
         return (timestamp - datetime.datetime(1970, 1, 1)).total_seconds()
 
+    @staticmethod
+    def records(response=None, keyword=None):
+        """
+        :return: list of (key, record) in a response, whether it holds one record or a list
+        """
+        listing = response.get(keyword)
+        if isinstance(listing, dict):
+            # a single record is not wrapped in a list or keyed
+            return [(listing.get("name", listing.get("alias", "")), listing)]
+        found = []
+        for item in listing or []:
+            for key, record in item.items():
+                found.append((key, record))
+        return found
+
+    @staticmethod
+    def port_map(port_response=None, sta_list=None, prefix="port mgr - "):
+        """
+        Index the port records by station name, with the columns renamed once.
+        :param sta_list: station names to keep; None for every port
+        :return: dict of station name -> {prefix + column: value}
+        """
+        wanted = set(sta_list) if sta_list is not None else None
+        ports = {}
+        keyword = "interfaces" if "interfaces" in port_response else "interface"
+        for key, record in LFDataCollection.records(port_response, keyword):
+            name = key.split('.')[-1] if key else record.get("alias", "")
+            if wanted is not None and name not in wanted:
+                # the station list may hold a part of the name, the key then has it at the end
+                match = [sta for sta in wanted if key.endswith(sta)]
+                if not match:
+                    continue
+                name = max(match, key=len)
+            ports[name] = {prefix + column: value for column, value in record.items()}
+        return ports
+
+    @staticmethod
+    def join_rows(endp_response=None, ports=None, columns=None, base=()):
+        """
+        Join every endpoint with the port its name ends in (the CX of 'prefix' + station
+        name, with -A or -B): the candidate names are looked up in ports, no scan.
+        :param ports: port_map() result
+        :param columns: merged columns to return, in order
+        :param base: values leading each row
+        :return: list of rows, one per endpoint
+        """
+        ports = ports or {}
+        lengths = sorted(set(len(name) for name in ports), reverse=True)
+        rows = []
+        for _key, endp in LFDataCollection.records(endp_response, "endpoint"):
+            merge = dict(endp)
+            name = endp.get("name", "")
+            cx_name = name[:-2] if name.endswith(("-A", "-B")) else name
+            for length in lengths:
+                port = ports.get(cx_name[-length:])
+                if port is not None:
+                    merge.update(port)
+                    break
+            rows.append(list(base) + [merge.get(column) for column in columns])
+        return rows
+
+    def sample(self, created_cx=None, layer3_fields=None, sta_list=None, port_mgr_fields=None,
+               columns=None, start_time=None, resource=1):
+        """
+        Fetch the endpoints and ports once, join them and keep the result in the ring buffer.
+        :param created_cx: endpoint names, list or comma separated
+        :param layer3_fields: endpoint fields, list or comma separated
+        :param sta_list: station names the ports are matched by
+        :param port_mgr_fields: port fields, list or comma separated; None to skip the port query
+        :param columns: columns of each row after timestamp, milliseconds and elapsed seconds;
+                        default the layer3 fields then the port fields as 'port mgr - ' + field
+        :return: list of rows, one per endpoint
+        """
+        def joined(value):
+            return value if value is None or isinstance(value, str) else ",".join(value)
+
+        created_cx, layer3_fields, port_mgr_fields = joined(created_cx), joined(layer3_fields), joined(port_mgr_fields)
+        t = datetime.datetime.now()
+        start_time = start_time or t
+        base = (t.strftime("%m/%d/%Y %I:%M:%S"),
+                int(self.get_milliseconds(t)),
+                int(self.get_seconds(t)) - int(self.get_seconds(start_time)))
+
+        layer_3_response = self.json_get("/endp/%s?fields=%s" % (created_cx, layer3_fields), debug_=self.debug)
+        self.check_json_validity(keyword="endpoint", json_response=layer_3_response)
+        ports = {}
+        if port_mgr_fields is not None:
+            stations = sta_list if sta_list is None or isinstance(sta_list, str) else ",".join(sta_list)
+            port_mgr_response = self.json_get("/port/1/%s/%s?fields=%s" % (resource, stations, port_mgr_fields),
+                                              debug_=self.debug)
+            self.check_json_validity(keyword="interfaces" if "interfaces" in (port_mgr_response or {}) else "interface",
+                                     json_response=port_mgr_response)
+            if isinstance(sta_list, str):
+                sta_list = sta_list.split(',')
+            ports = self.port_map(port_mgr_response, sta_list)
+
+        if columns is None:
+            columns = [field for field in layer3_fields.split(',')]
+            if port_mgr_fields is not None:
+                columns += ["port mgr - " + field for field in port_mgr_fields.split(',')]
+        rows = self.join_rows(layer_3_response, ports, columns, base)
+        self.samples.append((t, rows))
+        return rows
+
+    def latest(self, count=1):
+        """
+        :return: the last count samples in the ring buffer, as (datetime, rows), oldest first
+        """
+        return list(self.samples)[-count:]
+
     # only for ipv4_variable_time at the moment
     def monitor_interval(self, header_row_=None,
                          start_time_=None, sta_list_=None,
                          created_cx_=None, layer3_fields_=None,
                          port_mgr_fields_=None):
-
-        # time calculations for while loop and writing to csv
-        t = datetime.datetime.now()
-        timestamp = t.strftime("%m/%d/%Y %I:%M:%S")
-        t_to_millisec_epoch = int(self.get_milliseconds(t))
-        time_elapsed = int(self.get_seconds(t)) - int(self.get_seconds(start_time_))
-
-        # get responses from json
-        layer_3_response = self.json_get("/endp/%s?fields=%s" % (created_cx_, layer3_fields_), debug_=self.debug)
-        if port_mgr_fields_ is not None:
-            port_mgr_response = self.json_get("/port/1/1/%s?fields=%s" % (sta_list_, port_mgr_fields_),
-                                              debug_=self.debug)
-
-        # check json response validity
-        self.check_json_validity(keyword="endpoint", json_response=layer_3_response)
-        self.check_json_validity(keyword="interfaces", json_response=port_mgr_response)
-
-        # dict manipulation
-        temp_list = []
-        for endpoint in layer_3_response["endpoint"]:
-            if self.debug:
-                logger.debug("Current endpoint values list... ")
-                logger.debug(list(endpoint.values())[0])
-            temp_endp_values = list(endpoint.values())[0]  # dict
-            temp_list.extend([timestamp, t_to_millisec_epoch, time_elapsed])
-            current_sta = temp_endp_values['name']
-            merge = {}
-            if port_mgr_fields_ is not None:
-                for sta_name in sta_list_:
-                    if sta_name in current_sta:
-                        for interface in port_mgr_response["interfaces"]:
-                            if sta_name in list(interface.keys())[0]:
-                                merge = temp_endp_values.copy()
-
-                                port_mgr_values_dict = list(interface.values())[0]
-                                renamed_port_cols = {}
-                                for key in port_mgr_values_dict.keys():
-                                    renamed_port_cols['port mgr - ' + key] = port_mgr_values_dict[key]
-                                merge.update(renamed_port_cols)
-            for name in header_row_[3:-3]:
-                temp_list.append(merge[name])
-            return temp_list
+        """
+        :return: one row per endpoint, each timestamp, milliseconds, elapsed seconds and
+                 the header_row_ columns between those and the last three
+        """
+        columns = header_row_[3:-3] if header_row_ is not None else None
+        return self.sample(created_cx=created_cx_,
+                           layer3_fields=layer3_fields_,
+                           sta_list=sta_list_,
+                           port_mgr_fields=port_mgr_fields_,
+                           columns=columns,
+                           start_time=start_time_)
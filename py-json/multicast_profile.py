@@ -2,13 +2,19 @@
 import sys
 import os
 import importlib
+import csv
 import logging
+import math
 import pprint
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
+multicast_stats = importlib.import_module("py-json.multicast_stats")
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +73,9 @@ class MULTICASTProfile(LFCliBase):
         self.local_realm = local_realm
         self.report_timer = report_timer_
         self.created_mc = {}
+        # "mcast_group:dest_port" -> {"tx": [endp names], "rx": [endp names]}
+        self.mc_groups = OrderedDict()
+        self.command_queue = []
         self.name_prefix = name_prefix_
         self.number_template = number_template_
 
@@ -109,6 +118,7 @@ class MULTICASTProfile(LFCliBase):
         # but, if you are trying to modify existing connections, then clearing these arrays and
         # re-calling 'create' will do the trick.
         self.created_mc = {}
+        self.mc_groups = OrderedDict()
 
     def get_mc_names(self):
         return list(self.created_mc.keys())
@@ -211,6 +221,7 @@ class MULTICASTProfile(LFCliBase):
         self.local_realm.json_post(url, json_data, debug_=debug_, suppress_related_commands_=suppress_related_commands)
 
         self.created_mc[side_tx_name] = side_tx_name
+        self.add_to_group(side_tx_name, self.side_b_mcast_group, self.side_b_mcast_dest_port, "tx")
 
         these_endp = [side_tx_name]
 
@@ -236,47 +247,20 @@ class MULTICASTProfile(LFCliBase):
             side_rx_shelf = side_rx_info[0]
             side_rx_resource = side_rx_info[1]
             side_rx_port = side_rx_info[2]
-            if tos and add_tos_to_name:
-                side_rx_name = "%smrx-%s-%s-%i" % (self.name_prefix, tos, side_rx_port, len(self.created_mc))
-            else:
-                side_rx_name = "%smrx-%s-%i" % (self.name_prefix, side_rx_port, len(self.created_mc))
+            side_rx_name = self.rx_name(side_rx_port, tos, add_tos_to_name)
             # add_endp mcast-rcv-sta-001 1 1 sta0002 mc_udp 9999 NO 0 0 NO 1472 0 INCREASING NO 32 0 0
-            json_data = {
-                'alias': side_rx_name,
-                'shelf': side_rx_shelf,
-                'resource': side_rx_resource,
-                'port': side_rx_port,
-                'type': endp_type,
-                'type': endp_type,
-                'ip_port': self.side_a_ip_port,
-                'is_rate_bursty': self.side_a_is_rate_bursty,
-                'min_rate': self.side_a_min_bps,
-                'max_rate': self.side_a_max_bps,
-                'is_pkt_sz_random': self.side_a_is_pkt_sz_random,
-                'min_pkt': self.side_a_min_pdu,
-                'max_pkt': self.side_a_max_pdu,
-                'payload_pattern': self.side_a_payload_pattern,
-                'use_checksum': self.side_a_use_checksum,
-                'ttl': self.side_a_ttl,
-                'send_bad_crc_per_million': self.side_a_send_bad_crc_per_million,
-                'multi_conn': self.side_a_multi_conn
-            }
+            json_data = self.rx_endp_data(endp_type, side_rx_name, side_rx_shelf, side_rx_resource, side_rx_port)
 
             url = "cli-json/add_endp"
             self.local_realm.json_post(url, json_data, debug_=debug_,
                                        suppress_related_commands_=suppress_related_commands)
-            json_data = {
-                'name': side_rx_name,
-                'ttl': self.side_a_ttl,
-                'mcast_group': self.side_a_mcast_group,
-                'mcast_dest_port': self.side_a_mcast_dest_port,
-                'rcv_mcast': self.side_a_rcv_mcast
-            }
+            json_data = self.rx_mc_data(side_rx_name)
             url = "cli-json/set_mc_endp"
             self.local_realm.json_post(url, json_data, debug_=debug_,
                                        suppress_related_commands_=suppress_related_commands)
 
             self.created_mc[side_rx_name] = side_rx_name
+            self.add_to_group(side_rx_name, self.side_a_mcast_group, self.side_a_mcast_dest_port, "rx")
             these_endp.append(side_rx_name)
 
             if tos:
@@ -284,5 +268,180 @@ class MULTICASTProfile(LFCliBase):
 
         self.local_realm.wait_until_endps_appear(these_endp, debug=debug_)
 
+    @staticmethod
+    def group_key(mcast_group=None, mcast_dest_port=None):
+        return "%s:%s" % (mcast_group, mcast_dest_port)
+
+    def add_to_group(self, endp_name=None, mcast_group=None, mcast_dest_port=None, role="rx"):
+        members = self.mc_groups.setdefault(self.group_key(mcast_group, mcast_dest_port), {"tx": [], "rx": []})
+        if endp_name not in members[role]:
+            members[role].append(endp_name)
+
+    def rx_name(self, side_rx_port=None, tos=None, add_tos_to_name=False):
+        if tos and add_tos_to_name:
+            return "%smrx-%s-%s-%i" % (self.name_prefix, tos, side_rx_port, len(self.created_mc))
+        return "%smrx-%s-%i" % (self.name_prefix, side_rx_port, len(self.created_mc))
+
+    def rx_endp_data(self, endp_type=None, side_rx_name=None, shelf=None, resource=None, port=None):
+        return {
+            'alias': side_rx_name,
+            'shelf': shelf,
+            'resource': resource,
+            'port': port,
+            'type': endp_type,
+            'ip_port': self.side_a_ip_port,
+            'is_rate_bursty': self.side_a_is_rate_bursty,
+            'min_rate': self.side_a_min_bps,
+            'max_rate': self.side_a_max_bps,
+            'is_pkt_sz_random': self.side_a_is_pkt_sz_random,
+            'min_pkt': self.side_a_min_pdu,
+            'max_pkt': self.side_a_max_pdu,
+            'payload_pattern': self.side_a_payload_pattern,
+            'use_checksum': self.side_a_use_checksum,
+            'ttl': self.side_a_ttl,
+            'send_bad_crc_per_million': self.side_a_send_bad_crc_per_million,
+            'multi_conn': self.side_a_multi_conn
+        }
+
+    def rx_mc_data(self, side_rx_name=None):
+        return {
+            'name': side_rx_name,
+            'ttl': self.side_a_ttl,
+            'mcast_group': self.side_a_mcast_group,
+            'mcast_dest_port': self.side_a_mcast_dest_port,
+            'rcv_mcast': self.side_a_rcv_mcast
+        }
+
+    def queue_command(self, url, data):
+        self.command_queue.append((url, data))
+
+    def flush_commands(self, max_in_flight=8, debug_=False, suppress_related_commands_=None):
+        """
+        Send every queued command, up to max_in_flight at once.  Commands queued
+        together must not depend on each other.
+        :return: number of commands that got no response
+        """
+        queued, self.command_queue = self.command_queue, []
+        if not queued:
+            return 0
+
+        def send(command):
+            url, data = command
+            return self.local_realm.json_post(url, data, debug_=debug_ or self.debug,
+                                              suppress_related_commands_=suppress_related_commands_)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_in_flight, len(queued)))) as pool:
+            responses = list(pool.map(send, queued))
+        failed = sum(1 for response in responses if response is None)
+        if failed:
+            logger.warning("{failed} of {count} commands got no response".format(failed=failed, count=len(queued)))
+        return failed
+
+    def create_mc_rx_batched(self,
+                             endp_type,
+                             side_rx,
+                             tos=None,
+                             add_tos_to_name=False,
+                             max_in_flight=8,
+                             timeout=100,
+                             suppress_related_commands=None,
+                             debug_=False):
+        """
+        Same receivers as create_mc_rx(), the commands queued per stage and flushed together:
+        add_endp for every station, then set_mc_endp (and set_endp_tos) for every receiver,
+        then one wait for all of them to be listed.
+        :return: names of the receivers created
+        """
+        if self.debug:
+            debug_ = True
+
+        these_endp = []
+        for port_name in side_rx:
+            shelf, resource, port = self.local_realm.name_to_eid(port_name)[:3]
+            side_rx_name = self.rx_name(port, tos, add_tos_to_name)
+            self.queue_command("cli-json/add_endp", self.rx_endp_data(endp_type, side_rx_name, shelf, resource, port))
+            self.created_mc[side_rx_name] = side_rx_name
+            these_endp.append(side_rx_name)
+        self.flush_commands(max_in_flight, debug_, suppress_related_commands)
+
+        for side_rx_name in these_endp:
+            self.queue_command("cli-json/set_mc_endp", self.rx_mc_data(side_rx_name))
+            if tos:
+                self.queue_command("cli-json/set_endp_tos",
+                                   {"name": side_rx_name, "tos": self.local_realm.tos_value(tos)})
+            self.add_to_group(side_rx_name, self.side_a_mcast_group, self.side_a_mcast_dest_port, "rx")
+        self.flush_commands(max_in_flight, debug_, suppress_related_commands)
+
+        if these_endp:
+            self.local_realm.wait_until_endps_appear(these_endp, debug=debug_, timeout=timeout)
+        return these_endp
+
+    def set_group_state(self, group=None, running=True, max_in_flight=8, suppress_related_commands=None,
+                        debug_=False):
+        """
+        Start or stop every endpoint of a group, receivers joined before the senders start and
+        the senders stopped first.  Multicast endpoints are not in cross connects, so there is no
+        set_cx_state for them: each side is one batch of start_endp/stop_endp.
+        :param group: key of mc_groups, or None for every group
+        """
+        if self.debug:
+            debug_ = True
+        groups = list(self.mc_groups.keys()) if group is None else [group]
+        url = "cli-json/start_endp" if running else "cli-json/stop_endp"
+        for key in groups:
+            members = self.mc_groups[key]
+            for role in (("rx", "tx") if running else ("tx", "rx")):
+                for endp_name in members[role]:
+                    self.queue_command(url, {"endp_name": endp_name})
+                self.flush_commands(max_in_flight, debug_, suppress_related_commands)
+
+    def start_group(self, group=None, max_in_flight=8, suppress_related_commands=None, debug_=False):
+        logger.info("Starting multicast group(s): {groups}".format(
+            groups=list(self.mc_groups.keys()) if group is None else group))
+        self.set_group_state(group, True, max_in_flight, suppress_related_commands, debug_)
+
+    def stop_group(self, group=None, max_in_flight=8, suppress_related_commands=None, debug_=False):
+        self.set_group_state(group, False, max_in_flight, suppress_related_commands, debug_)
+
+    def new_stats(self, fields=None):
+        """
+        :return: MulticastStats for the endpoints of this profile
+        """
+        stats = multicast_stats.MulticastStats(local_realm=self.local_realm, fields=fields, debug=self.debug)
+        stats.register_profile(self)
+        return stats
+
+    def monitor(self, duration_sec=60, monitor_interval=2, report_file=None, fields=None):
+        """
+        Poll the endpoints of this profile once per interval, one /endp query per tick, and write
+        the loss and latency of every receiver to report_file.
+        :return: the MulticastStats of the last tick
+        """
+        stats = self.new_stats(fields)
+        end_time = time.monotonic() + duration_sec
+        csvfile = None
+        csvwriter = None
+        columns = ["rx drop %", "loss_pct", "delay", "jitter", "rx rate"]
+        if report_file:
+            csvfile = open(str(report_file), 'w')
+            csvwriter = csv.writer(csvfile, delimiter=",")
+            csvwriter.writerow(['Timestamp seconds epoch', 'name', 'group'] + columns)
+        try:
+            while True:
+                tick_sec = int(time.time())
+                if stats.poll() and csvwriter is not None:
+                    table = stats.receivers()
+                    for i, name in enumerate(table["names"]):
+                        csvwriter.writerow([tick_sec, name, table["groups"][i]]
+                                           + ["" if math.isnan(table[column][i]) else table[column][i]
+                                              for column in columns])
+                if time.monotonic() + monitor_interval >= end_time:
+                    break
+                time.sleep(monitor_interval)
+        finally:
+            if csvfile is not None:
+                csvfile.close()
+        return stats
+
     def to_string(self):
         pprint.pprint(self)
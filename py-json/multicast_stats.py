@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Per-receiver multicast loss and latency, one /endp query per tick.
+
+Tests with multicast receivers on hundreds of stations read the endp table for every
+receiver, or the whole table, to find out which receivers lose packets.  MulticastStats
+is an L3EndpStats that asks /endp only for the endpoints of a MULTICASTProfile and maps
+each one to its group (mcast address:port, see MULTICASTProfile.mc_groups), so a tick
+gives, for every receiver:
+
+    rx drop %     loss the GUI reports for the receiver
+    loss_pct      1 - received / sent since the previous tick, where sent is the 'tx pkts ll'
+                  growth of the senders of the receiver's group (NaN on the first tick or
+                  when the group sent nothing)
+    delay         latency in microseconds
+    jitter          "
+
+and group_summary() totals them per group.
+
+Example:
+    stats = multicast_profile.new_stats()
+    stats.poll()
+    time.sleep(5)
+    stats.poll()
+    table = stats.receivers()
+    print(table["names"][np.nanargmax(table["loss_pct"])], stats.group_summary())
+"""
+import importlib
+import logging
+import urllib.parse
+from collections import OrderedDict
+
+import numpy as np
+
+l3_endp_stats = importlib.import_module("py-json.l3_endp_stats")
+L3EndpStats = l3_endp_stats.L3EndpStats
+
+logger = logging.getLogger(__name__)
+
+
+class MulticastStats(L3EndpStats):
+    DEFAULT_FIELDS = ("name", "eid", "rx pkts ll", "tx pkts ll", "rx drop %", "delay", "jitter",
+                      "rx rate", "tx rate")
+
+    def __init__(self, local_realm=None, fields=None, names=None, debug=False):
+        """
+        :param fields: /endp fields to fetch; the DEFAULT_FIELDS are always fetched
+        :param names: endpoints to query, default all
+        """
+        fields = list(fields) if fields is not None else []
+        for required in self.DEFAULT_FIELDS:
+            if required not in fields:
+                fields.append(required)
+        self.group_names = []
+        self.group_index = {}
+        self.mc_group = np.zeros(0, dtype=np.int32)
+        super().__init__(local_realm=local_realm, fields=fields, debug=debug)
+        self.set_names(names)
+        self.previous_pkts = {}
+        self.rx_delta = np.zeros(0, dtype=np.float64)
+        self.tx_delta = np.zeros(0, dtype=np.float64)
+
+    def set_names(self, names=None):
+        fields = ",".join(urllib.parse.quote_plus(field) for field in self.fields)
+        if names:
+            self.url = "endp/%s?fields=%s" % (",".join(names), fields)
+        else:
+            self.url = "endp?fields=%s" % fields
+
+    def _grow(self, needed):
+        super()._grow(needed)
+        extra = len(self.side) - len(self.mc_group)
+        if extra > 0:
+            self.mc_group = np.concatenate((self.mc_group, np.full(extra, -1, dtype=np.int32)))
+
+    def register_group(self, name=None, group=None, side=None):
+        """
+        Register a multicast endpoint as a sender (SIDE_MC_TX) or receiver (SIDE_MC_RX) of group.
+        """
+        row = self.register(name, side=side)
+        self.mc_group[row] = self._group(self.group_names, self.group_index, group)
+        return row
+
+    def register_profile(self, multicast_profile=None):
+        """
+        Register the endpoints of a MULTICASTProfile with their groups, and only query those.
+        """
+        for group, members in multicast_profile.mc_groups.items():
+            for name in members["tx"]:
+                self.register_group(name, group, self.SIDE_MC_TX)
+            for name in members["rx"]:
+                self.register_group(name, group, self.SIDE_MC_RX)
+        self.register_multicast_profile(multicast_profile)
+        self.set_names(multicast_profile.get_mc_names())
+
+    def ingest(self, response=None):
+        if not super().ingest(response):
+            return False
+        rx_pkts = self.column("rx pkts ll")
+        tx_pkts = self.column("tx pkts ll")
+        self.rx_delta = np.full(len(self.tick_names), np.nan)
+        self.tx_delta = np.full(len(self.tick_names), np.nan)
+        previous = self.previous_pkts
+        for i, name in enumerate(self.tick_names):
+            before = previous.get(name)
+            if before is not None:
+                self.rx_delta[i] = rx_pkts[i] - before[0]
+                self.tx_delta[i] = tx_pkts[i] - before[1]
+        self.previous_pkts = {name: (rx_pkts[i], tx_pkts[i]) for i, name in enumerate(self.tick_names)}
+        return True
+
+    def sent_by_group(self):
+        """
+        :return: array of the packets each group's senders sent since the previous tick
+        """
+        groups = self.mc_group[self.tick_rows]
+        senders = (self.side[self.tick_rows] == self.SIDE_MC_TX) & (groups >= 0) & ~np.isnan(self.tx_delta)
+        sent = np.bincount(groups[senders], weights=self.tx_delta[senders], minlength=len(self.group_names))
+        # a group whose senders were not read this tick has no count
+        seen = np.zeros(len(self.group_names), dtype=bool)
+        seen[groups[senders]] = True
+        return np.where(seen, sent, np.nan)
+
+    def receivers(self, owned_only=True):
+        """
+        :return: dict of columns over the receivers of the current tick: names, groups,
+                 'rx drop %', loss_pct, delay, jitter, rx rate
+        """
+        selected = self.side_mask(self.SIDE_MC_RX)
+        if owned_only:
+            selected &= self.mask(owned_only=True)
+        rows = np.flatnonzero(selected)
+        groups = self.mc_group[self.tick_rows[rows]]
+        sent = self.sent_by_group()
+        group_sent = np.full(len(rows), np.nan)
+        known = groups >= 0
+        group_sent[known] = sent[groups[known]]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loss_pct = np.where(group_sent > 0, (1 - self.rx_delta[rows] / group_sent) * 100, np.nan)
+        return {
+            "names": [self.tick_names[i] for i in rows],
+            "groups": [self.group_names[group] if group >= 0 else None for group in groups],
+            "rx drop %": self.column("rx drop %")[rows],
+            "loss_pct": np.clip(loss_pct, 0, 100),
+            "delay": self.column("delay")[rows],
+            "jitter": self.column("jitter")[rows],
+            "rx rate": self.column("rx rate")[rows],
+        }
+
+    def group_summary(self, owned_only=True):
+        """
+        :return: OrderedDict of group -> receivers, worst and mean 'rx drop %' and loss_pct, mean delay
+        """
+        table = self.receivers(owned_only)
+        summary = OrderedDict()
+        groups = np.array([-1 if group is None else self.group_index[group] for group in table["groups"]],
+                          dtype=np.int32)
+        for group_id, group in enumerate(self.group_names):
+            members = groups == group_id
+            if not members.any():
+                continue
+
+            def reduce(fn, column):
+                values = table[column][members]
+                return None if np.isnan(values).all() else round(float(fn(values)), 3)
+
+            summary[group] = {
+                "receivers": int(members.sum()),
+                "max rx drop %": reduce(np.nanmax, "rx drop %"),
+                "mean rx drop %": reduce(np.nanmean, "rx drop %"),
+                "max loss_pct": reduce(np.nanmax, "loss_pct"),
+                "mean loss_pct": reduce(np.nanmean, "loss_pct"),
+                "mean delay": reduce(np.nanmean, "delay"),
+            }
+        return summary
+
+    def lossy(self, threshold_pct=1.0, owned_only=True):
+        """
+        :return: names of the receivers whose 'rx drop %' or loss_pct is above threshold_pct
+        """
+        table = self.receivers(owned_only)
+        worst = np.fmax(table["rx drop %"], table["loss_pct"])
+        return [table["names"][i] for i in np.flatnonzero(worst > threshold_pct)]
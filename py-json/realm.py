@@ -63,6 +63,22 @@ port_utils = importlib.import_module("py-json.port_utils")
 PortUtils = port_utils.PortUtils
 lfdata = importlib.import_module("py-json.lfdata")
 LFDataCollection = lfdata.LFDataCollection
+l3_endp_stats = importlib.import_module("py-json.l3_endp_stats")
+L3EndpStats = l3_endp_stats.L3EndpStats
+generic_stats = importlib.import_module("py-json.generic_stats")
+GenericStats = generic_stats.GenericStats
+l4_endp_stats = importlib.import_module("py-json.l4_endp_stats")
+L4EndpStats = l4_endp_stats.L4EndpStats
+multicast_stats = importlib.import_module("py-json.multicast_stats")
+MulticastStats = multicast_stats.MulticastStats
+atten_sweep = importlib.import_module("py-json.atten_sweep")
+AttenSweep = atten_sweep.AttenSweep
+event_waiter = importlib.import_module("py-json.event_waiter")
+EventWaiter = event_waiter.EventWaiter
+event_tailer = importlib.import_module("py-json.event_tailer")
+EventTailer = event_tailer.EventTailer
+reconcile = importlib.import_module("py-json.reconcile")
+Reconciler = reconcile.Reconciler
 vr_profile2 = importlib.import_module("py-json.vr_profile2")
 VRProfile = vr_profile2.VRProfile
 
@@ -465,8 +481,8 @@ class Realm(LFCliBase):
         }
         self.json_post(req_url, data, debug_=debug_, suppress_related_commands_=suppress_related_commands_)
 
-    def set_endp_tos(self, ename, _tos, debug_=False, suppress_related_commands_=True):
-        req_url = "cli-json/set_endp_tos"
+    @staticmethod
+    def tos_value(_tos):
         tos = _tos
         # Convert some human readable values to numeric needed by LANforge.
         if _tos == "BK":
@@ -481,9 +497,13 @@ class Realm(LFCliBase):
             tos = "184"
         if _tos == "Video":
             tos = "136"
+        return tos
+
+    def set_endp_tos(self, ename, _tos, debug_=False, suppress_related_commands_=True):
+        req_url = "cli-json/set_endp_tos"
         data = {
             "name": ename,
-            "tos": tos
+            "tos": self.tos_value(_tos)
         }
         self.json_post(req_url, data, debug_=debug_, suppress_related_commands_=suppress_related_commands_)
 
@@ -1165,8 +1185,47 @@ class Realm(LFCliBase):
     def new_test_group_profile(self):
         return TestGroupProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
-    def new_lf_data_collection(self):
-        return LFDataCollection(local_realm=self)
+    def new_lf_data_collection(self, max_samples=1000):
+        return LFDataCollection(local_realm=self, max_samples=max_samples)
+
+    def new_l3_endp_stats(self, fields=None):
+        return L3EndpStats(local_realm=self, fields=fields, debug=self.debug)
+
+    def new_generic_stats(self, fields=None, endpoints=None):
+        return GenericStats(local_realm=self, fields=fields, endpoints=endpoints, debug=self.debug)
+
+    def new_l4_endp_stats(self, fields=None, names=None, csv_path=None):
+        return L4EndpStats(local_realm=self, fields=fields, names=names, csv_path=csv_path, debug=self.debug)
+
+    def new_multicast_stats(self, fields=None, names=None):
+        return MulticastStats(local_realm=self, fields=fields, names=names, debug=self.debug)
+
+    def new_atten_sweep(self, steps=None, settle=None, measure=None, collect=None, max_in_flight=8):
+        return AttenSweep(backend=atten_sweep.RealmAttenBackend(self), steps=steps, settle=settle, measure=measure,
+                          collect=collect, max_in_flight=max_in_flight, debug=self.debug)
+
+    def new_event_waiter(self, start_id=None, min_interval_sec=0.25, max_interval_sec=1.0):
+        return EventWaiter(local_realm=self,
+                           start_id=start_id,
+                           min_interval_sec=min_interval_sec,
+                           max_interval_sec=max_interval_sec,
+                           debug=self.debug)
+
+    def new_event_tailer(self, start_id=None, max_events=50000, sqlite_path=None):
+        return EventTailer(local_realm=self,
+                           start_id=start_id,
+                           max_events=max_events,
+                           sqlite_path=sqlite_path,
+                           debug=self.debug)
+
+    def new_reconciler(self, stations=None, cxs=None, station_prefixes=None, cx_prefixes=None, refresh=False):
+        return Reconciler(local_realm=self,
+                          stations=stations,
+                          cxs=cxs,
+                          station_prefixes=station_prefixes,
+                          cx_prefixes=cx_prefixes,
+                          refresh=refresh,
+                          debug=self.debug)
 
 
 class PacketFilter:
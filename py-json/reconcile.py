@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Desired-state builder for stations and layer-3 cross connects.
+
+StationProfile.create and L3CXProfile.create send every add_sta, set_port, add_endp
+and add_cx, and most scripts run precleanup first, so each run deletes and rebuilds
+the whole testbed.  Reconciler instead compares a desired state with one /port/all,
+one /cx/all and one /endp/all snapshot and only sends the commands for what differs:
+
+    station missing                       add_sta + set_port, admin up after it appears
+    station on another radio, phantom     rm_vlan, then created again
+    station with another SSID             add_sta (modifies the station in place)
+    station admin state differs           set_port up or down
+    CX missing                            add_endp A/B, endpoint flags, add_cx
+    CX with other endpoints or type       rm_cx + rm_endp, then created again
+    CX endpoint with other rates          add_endp A/B (modifies the endpoints)
+    station or CX not desired             rm_vlan / rm_cx + rm_endp, for names starting
+                                          with one of the owned prefixes only
+
+The GUI does not list a station's security or an endpoint's port, so those are not
+compared; refresh=True sends add_sta and add_endp again for every existing station
+and CX to apply them.
+
+plan() works on the snapshots only, so a plan can be checked against a recorded
+snapshot (save_snapshot() / load_snapshot()) without a LANforge system; apply()
+sends it.
+
+Example:
+    stations = reconcile.stations_from_profile(station_profile, radio, station_names)
+    cxs = reconcile.cxs_from_profile(cx_profile, "lf_udp", [(sta, "1.1.eth1") for sta in station_names])
+    reconciler = local_realm.new_reconciler(stations=stations, cxs=cxs,
+                                            station_prefixes=["sta"], cx_prefixes=[cx_profile.name_prefix])
+    actions = reconciler.reconcile()
+"""
+import importlib
+import json
+import logging
+import re
+from collections import namedtuple, OrderedDict
+
+LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+set_port = importlib.import_module("py-json.LANforge.set_port")
+add_sta = importlib.import_module("py-json.LANforge.add_sta")
+station_profile = importlib.import_module("py-json.station_profile")
+StationProfile = station_profile.StationProfile
+
+logger = logging.getLogger(__name__)
+
+StationSpec = namedtuple("StationSpec", "eid radio ssid security password mode up dhcp")
+StationSpec.__new__.__defaults__ = (None, None, "NA", "open", "[BLANK]", 0, True, True)
+
+CXSpec = namedtuple("CXSpec", "name endp_type side_a side_b min_bps_a min_bps_b max_bps_a max_bps_b")
+CXSpec.__new__.__defaults__ = (None, "lf_udp", None, None, 256000, 256000, 0, 0)
+
+# op: create, recreate, modify, admin_up, admin_down, delete
+Action = namedtuple("Action", "op kind name reason commands")
+
+PORT_FIELDS = ("alias", "port type", "parent dev", "ssid", "down", "phantom")
+ENDP_FIELDS = ("name", "type", "min rate", "max rate")
+CX_ENDPOINTS = "endpoints (a ↔ b)"
+# members of a /cx response that are not connections
+CX_META_KEYS = ("handler", "uri", "warnings", "errors", "empty")
+UDP_TYPES = ("lf_udp", "udp", "lf_udp6", "udp6")
+
+
+def eid_str(eid=None):
+    shelf, resource, name = LFUtils.name_to_eid(eid)[:3]
+    return "%s.%s.%s" % (shelf, resource, name)
+
+
+def normalize_endp_type(endp_type=None):
+    """
+    'LF/UDP' as listed and 'lf_udp' as created are the same type
+    """
+    return re.sub("[^a-z0-9]", "", str(endp_type or "").lower())
+
+
+def stations_from_profile(profile=None, radio=None, station_names=None):
+    """
+    :return: list of StationSpec for station_names on radio, configured as profile
+    """
+    radio = eid_str(radio)
+    shelf, resource = LFUtils.name_to_eid(radio)[:2]
+    specs = []
+    for name in station_names or []:
+        port = LFUtils.name_to_eid(name)[2]
+        specs.append(StationSpec(eid="%s.%s.%s" % (shelf, resource, port),
+                                 radio=radio,
+                                 ssid=profile.ssid,
+                                 security=profile.security,
+                                 password=profile.ssid_pass,
+                                 mode=profile.mode,
+                                 up=profile.up,
+                                 dhcp=profile.dhcp))
+    return specs
+
+
+def cxs_from_profile(profile=None, endp_type="lf_udp", pairs=None, names=None):
+    """
+    :param pairs: list of (side_a port eid, side_b port eid)
+    :param names: CX names; default is name_prefix + side A port name, as L3CXProfile names them
+    :return: list of CXSpec with the rates of profile
+    """
+    specs = []
+    for i, (side_a, side_b) in enumerate(pairs or []):
+        if names:
+            name = names[i]
+        else:
+            name = "%s%s" % (profile.name_prefix, re.sub("[^-_a-zA-Z0-9]", "_", LFUtils.name_to_eid(side_a)[2]))
+        specs.append(CXSpec(name=name,
+                            endp_type=endp_type,
+                            side_a=eid_str(side_a),
+                            side_b=eid_str(side_b),
+                            min_bps_a=profile.side_a_min_bps,
+                            min_bps_b=profile.side_b_min_bps,
+                            max_bps_a=profile.side_a_max_bps,
+                            max_bps_b=profile.side_b_max_bps))
+    return specs
+
+
+def parse_ports(response=None):
+    """
+    :return: OrderedDict of port eid -> record of a /port/all response
+    """
+    ports = OrderedDict()
+    if not response:
+        return ports
+    listing = response.get("interfaces")
+    if listing is None and "interface" in response:
+        listing = [{response["interface"].get("eid", response["interface"].get("alias")): response["interface"]}]
+    for item in listing or []:
+        for eid, record in item.items():
+            ports[eid] = record
+    return ports
+
+
+def parse_cxs(response=None):
+    """
+    :return: OrderedDict of cx name -> record of a /cx/all response
+    """
+    cxs = OrderedDict()
+    for name, record in (response or {}).items():
+        if name in CX_META_KEYS or not isinstance(record, dict):
+            continue
+        cxs[record.get("name", name)] = record
+    return cxs
+
+
+def parse_endps(response=None):
+    """
+    :return: OrderedDict of endpoint name -> record of a /endp/all response
+    """
+    endps = OrderedDict()
+    if not response:
+        return endps
+    listing = response.get("endpoint")
+    if isinstance(listing, dict):
+        listing = [{listing.get("name"): listing}]
+    for item in listing or []:
+        for name, record in item.items():
+            endps[record.get("name", name)] = record
+    return endps
+
+
+def _int(value=None):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def cx_endpoints(record=None):
+    """
+    :return: (endp A name, endp B name) of a /cx record, (None, None) when not listed
+    """
+    listed = record.get(CX_ENDPOINTS)
+    if listed and "↔" in listed:
+        side_a, side_b = listed.split("↔", 1)
+        return side_a.strip(), side_b.strip()
+    return record.get("endp a"), record.get("endp b")
+
+
+class Reconciler:
+    def __init__(self,
+                 local_realm=None,
+                 stations=None,
+                 cxs=None,
+                 station_prefixes=None,
+                 cx_prefixes=None,
+                 delete_extra=True,
+                 refresh=False,
+                 suppress_related_commands=True,
+                 debug=False):
+        """
+        :param stations: list of StationSpec, the stations that should exist
+        :param cxs: list of CXSpec, the cross connects that should exist
+        :param station_prefixes: stations starting with one of these and not in stations are deleted
+        :param cx_prefixes: CXs starting with one of these and not in cxs are deleted
+        :param delete_extra: False to never delete
+        :param refresh: send add_sta / add_endp again for existing stations and CXs
+        """
+        self.local_realm = local_realm
+        self.stations = [spec._replace(eid=eid_str(spec.eid), radio=eid_str(spec.radio)) for spec in stations or []]
+        self.cxs = list(cxs or [])
+        self.station_prefixes = tuple(station_prefixes or ())
+        self.cx_prefixes = tuple(cx_prefixes or ())
+        self.delete_extra = delete_extra
+        self.refresh = refresh
+        self.suppress_related_commands = suppress_related_commands
+        self.debug = debug
+        self.port_snapshot = None
+        self.cx_snapshot = None
+        self.endp_snapshot = None
+
+    # ----- ----- snapshots ----- -----
+    def snapshot(self):
+        """
+        Fetch /port/all, /cx/all and /endp/all once.
+        :return: (port response, cx response, endp response)
+        """
+        self.port_snapshot = self.local_realm.json_get("/port/all?fields=%s" % ",".join(PORT_FIELDS).replace(" ", "+"))
+        self.cx_snapshot = self.local_realm.json_get("/cx/all")
+        self.endp_snapshot = self.local_realm.json_get("/endp/all?fields=%s" % ",".join(ENDP_FIELDS).replace(" ", "+"))
+        return self.port_snapshot, self.cx_snapshot, self.endp_snapshot
+
+    def save_snapshot(self, path=None):
+        with open(path, "w") as snapshot_file:
+            json.dump({"port": self.port_snapshot, "cx": self.cx_snapshot, "endp": self.endp_snapshot},
+                      snapshot_file, indent=1)
+
+    def load_snapshot(self, path=None):
+        """
+        Load a save_snapshot() file; one recorded without "endp" plans without comparing rates.
+        """
+        with open(path) as snapshot_file:
+            recorded = json.load(snapshot_file)
+        self.port_snapshot = recorded.get("port")
+        self.cx_snapshot = recorded.get("cx")
+        self.endp_snapshot = recorded.get("endp")
+        return self.port_snapshot, self.cx_snapshot, self.endp_snapshot
+
+    # ----- ----- commands ----- -----
+    def station_commands(self, spec=None):
+        """
+        :return: [add_sta, set_port] commands creating or modifying the station as StationProfile.create does
+        """
+        profile = StationProfile(None, None,
+                                 ssid=spec.ssid,
+                                 ssid_pass=spec.password,
+                                 security=spec.security,
+                                 mode=spec.mode,
+                                 up=spec.up,
+                                 dhcp=spec.dhcp)
+        if spec.security:
+            profile.use_security(spec.security, ssid=spec.ssid, passwd=spec.password)
+        flags = list(profile.desired_add_sta_flags)
+        if spec.up and "create_admin_down" in flags:
+            flags.remove("create_admin_down")
+        shelf, resource, radio = LFUtils.name_to_eid(spec.radio)[:3]
+        name = LFUtils.name_to_eid(spec.eid)[2]
+        add_sta_data = dict(profile.add_sta_data)
+        add_sta_data.update({
+            "shelf": shelf,
+            "resource": resource,
+            "radio": radio,
+            "sta_name": name,
+            "flags": profile.add_named_flags(flags, add_sta.add_sta_flags),
+            "flags_mask": profile.add_named_flags(profile.desired_add_sta_flags_mask, add_sta.add_sta_flags),
+        })
+        set_port_data = dict(profile.set_port_data)
+        set_port_data.update({
+            "shelf": shelf,
+            "resource": resource,
+            "port": name,
+            "current_flags": profile.add_named_flags(profile.desired_set_port_current_flags,
+                                                     set_port.set_port_current_flags),
+            "interest": profile.add_named_flags(profile.desired_set_port_interest_flags,
+                                                set_port.set_port_interest_flags),
+        })
+        return [("/cli-json/add_sta", add_sta_data), ("/cli-json/set_port", set_port_data)]
+
+    @staticmethod
+    def admin_command(eid=None, up=True):
+        shelf, resource, name = LFUtils.name_to_eid(eid)[:3]
+        if up:
+            data = LFUtils.port_up_request(resource_id=resource, port_name=name)
+        else:
+            data = LFUtils.port_down_request(resource_id=resource, port_name=name)
+        data["shelf"] = shelf
+        return [("/cli-json/set_port", data)]
+
+    @staticmethod
+    def rm_station_commands(eid=None):
+        shelf, resource, name = LFUtils.name_to_eid(eid)[:3]
+        return [("/cli-json/rm_vlan", {"shelf": shelf, "resource": resource, "port": name})]
+
+    @staticmethod
+    def endp_commands(spec=None):
+        """
+        :return: add_endp and endpoint flag commands for both sides, as L3CXProfile.create sends them
+        """
+        commands = []
+        for side, port, min_bps, max_bps in (("A", spec.side_a, spec.min_bps_a, spec.max_bps_a),
+                                             ("B", spec.side_b, spec.min_bps_b, spec.max_bps_b)):
+            shelf, resource, name = LFUtils.name_to_eid(port)[:3]
+            endp_name = "%s-%s" % (spec.name, side)
+            commands.append(("/cli-json/add_endp", {
+                "alias": endp_name,
+                "shelf": shelf,
+                "resource": resource,
+                "port": name,
+                "type": spec.endp_type,
+                "min_rate": min_bps,
+                "max_rate": max_bps,
+                "min_pkt": -1,
+                "max_pkt": 0,
+                "ip_port": -1,
+                "multi_conn": 0,
+            }))
+        return commands
+
+    def cx_commands(self, spec=None):
+        commands = self.endp_commands(spec)
+        for side in ("A", "B"):
+            endp_name = "%s-%s" % (spec.name, side)
+            commands.append(("/cli-json/set_endp_report_timer", {"endp_name": endp_name, "milliseconds": 250}))
+            commands.append(("/cli-json/set_endp_flag", {"name": endp_name, "flag": "AutoHelper", "val": 1}))
+            if spec.endp_type in UDP_TYPES:
+                commands.append(("/cli-json/set_endp_flag", {"name": endp_name, "flag": "UseAutoNAT", "val": 1}))
+        commands.append(("/cli-json/add_cx", {"alias": spec.name,
+                                              "test_mgr": "default_tm",
+                                              "tx_endp": spec.name + "-A",
+                                              "rx_endp": spec.name + "-B"}))
+        commands.append(("/cli-json/set_cx_report_timer", {"test_mgr": "all",
+                                                           "cx_name": spec.name,
+                                                           "milliseconds": 8000}))
+        return commands
+
+    @staticmethod
+    def rm_cx_commands(name=None, endpoints=None):
+        commands = [("/cli-json/rm_cx", {"test_mgr": "ALL", "cx_name": name})]
+        for endp_name in endpoints:
+            if endp_name:
+                commands.append(("/cli-json/rm_endp", {"endp_name": endp_name}))
+        return commands
+
+    @staticmethod
+    def rate_differences(spec=None, endps=None):
+        """
+        :return: list of the endpoint rates of spec that differ from the /endp records
+        """
+        differs = []
+        for side, min_bps, max_bps in (("A", spec.min_bps_a, spec.max_bps_a), ("B", spec.min_bps_b, spec.max_bps_b)):
+            record = endps.get("%s-%s" % (spec.name, side))
+            if record is None:
+                continue
+            listed = _int(record.get("min rate"))
+            if listed is not None and listed != _int(min_bps):
+                differs.append("%s min rate %s" % (side, listed))
+            # a max_rate of 0 is 'same as min rate', whatever the GUI lists for it
+            listed = _int(record.get("max rate"))
+            if _int(max_bps) and listed is not None and listed != _int(max_bps):
+                differs.append("%s max rate %s" % (side, listed))
+        return differs
+
+    # ----- ----- plan ----- -----
+    def plan(self, port_snapshot=None, cx_snapshot=None, endp_snapshot=None):
+        """
+        Compare the desired state with the snapshots.
+        :param port_snapshot: /port/all response, default the last snapshot()
+        :param cx_snapshot: /cx/all response, default the last snapshot()
+        :param endp_snapshot: /endp/all response, default the last snapshot()
+        :return: list of Action, in the order apply() sends them
+        """
+        ports = parse_ports(port_snapshot if port_snapshot is not None else self.port_snapshot)
+        cxs = parse_cxs(cx_snapshot if cx_snapshot is not None else self.cx_snapshot)
+        endps = parse_endps(endp_snapshot if endp_snapshot is not None else self.endp_snapshot)
+        deletes, creates, changes, cx_actions = [], [], [], []
+
+        desired_stations = set()
+        for spec in self.stations:
+            desired_stations.add(spec.eid)
+            port = ports.get(spec.eid)
+            radio = LFUtils.name_to_eid(spec.radio)[2]
+            if port is None:
+                creates.append(Action("create", "station", spec.eid, "missing", self.station_commands(spec)))
+                continue
+            if port.get("phantom") or (port.get("parent dev") and port.get("parent dev") != radio):
+                reason = "phantom" if port.get("phantom") else "on %s" % port.get("parent dev")
+                deletes.append(Action("delete", "station", spec.eid, reason, self.rm_station_commands(spec.eid)))
+                creates.append(Action("recreate", "station", spec.eid, reason, self.station_commands(spec)))
+                continue
+            if self.refresh or ("ssid" in port and spec.ssid not in (None, "NA", "[BLANK]")
+                                and port.get("ssid") != spec.ssid):
+                reason = "refresh" if self.refresh else "ssid %s" % port.get("ssid")
+                # add_sta of an existing station modifies it
+                changes.append(Action("modify", "station", spec.eid, reason, self.station_commands(spec)[:1]))
+            if "down" in port and bool(port.get("down")) == bool(spec.up):
+                op = "admin_up" if spec.up else "admin_down"
+                changes.append(Action(op, "station", spec.eid, "down" if spec.up else "up",
+                                      self.admin_command(spec.eid, up=spec.up)))
+
+        desired_cxs = set()
+        for spec in self.cxs:
+            desired_cxs.add(spec.name)
+            record = cxs.get(spec.name)
+            if record is None:
+                cx_actions.append(Action("create", "cx", spec.name, "missing", self.cx_commands(spec)))
+                continue
+            endpoints = cx_endpoints(record)
+            wanted = (spec.name + "-A", spec.name + "-B")
+            differs = []
+            if endpoints[0] is not None and tuple(endpoints) != wanted:
+                differs.append("endpoints %s" % "/".join(str(endp) for endp in endpoints))
+            if record.get("type") and normalize_endp_type(record.get("type")) != normalize_endp_type(spec.endp_type):
+                differs.append("type %s" % record.get("type"))
+            if differs:
+                reason = ", ".join(differs)
+                deletes.insert(0, Action("delete", "cx", spec.name, reason,
+                                         self.rm_cx_commands(spec.name, [endp for endp in endpoints if endp]
+                                                             or list(wanted))))
+                cx_actions.append(Action("recreate", "cx", spec.name, reason, self.cx_commands(spec)))
+            elif self.refresh:
+                cx_actions.append(Action("modify", "cx", spec.name, "refresh", self.endp_commands(spec)))
+            else:
+                rates = self.rate_differences(spec, endps)
+                if rates:
+                    # add_endp of an existing endpoint modifies it
+                    cx_actions.append(Action("modify", "cx", spec.name, ", ".join(rates), self.endp_commands(spec)))
+
+        if self.delete_extra:
+            if self.cx_prefixes:
+                extra_cxs = [Action("delete", "cx", name, "not desired",
+                                    self.rm_cx_commands(name, [endp for endp in cx_endpoints(record) if endp]
+                                                        or [name + "-A", name + "-B"]))
+                             for name, record in cxs.items()
+                             if name not in desired_cxs and name.startswith(self.cx_prefixes)]
+                deletes = extra_cxs + deletes
+            if self.station_prefixes:
+                for eid, port in ports.items():
+                    alias = port.get("alias") or LFUtils.name_to_eid(eid)[2]
+                    if eid in desired_stations or not alias.startswith(self.station_prefixes):
+                        continue
+                    if port.get("port type") not in (None, "WIFI-STA"):
+                        continue
+                    deletes.append(Action("delete", "station", eid, "not desired", self.rm_station_commands(eid)))
+        return deletes + creates + changes + cx_actions
+
+    @staticmethod
+    def summary(actions=None):
+        """
+        :return: dict of 'kind op' -> count, and 'commands'
+        """
+        counts = OrderedDict()
+        for action in actions or []:
+            key = "%s %s" % (action.kind, action.op)
+            counts[key] = counts.get(key, 0) + 1
+        counts["commands"] = sum(len(action.commands) for action in actions or [])
+        return counts
+
+    # ----- ----- apply ----- -----
+    def post(self, commands=None):
+        for url, data in commands:
+            # json_post adds the suppress_* members, keep the plan as it was
+            self.local_realm.json_post(url, dict(data),
+                                       debug_=self.debug,
+                                       suppress_related_commands_=self.suppress_related_commands)
+
+    def apply(self, actions=None, timeout=300):
+        """
+        Send the commands of a plan: deletions, stations, admin state, then CXs once
+        their stations and endpoints exist.
+        :return: True when created stations and CXs appeared
+        """
+        ok = True
+        deleted_ports = []
+        for action in actions:
+            if action.op == "delete":
+                self.post(action.commands)
+                if action.kind == "station":
+                    deleted_ports.append(action.name)
+        if deleted_ports:
+            LFUtils.wait_until_ports_disappear(base_url=self.local_realm.lfclient_url,
+                                               port_list=deleted_ports,
+                                               debug=self.debug)
+
+        created_ports = []
+        bring_up = []
+        for action in actions:
+            if action.kind != "station" or action.op == "delete":
+                continue
+            self.post(action.commands)
+            if action.op in ("create", "recreate"):
+                created_ports.append(action.name)
+        if created_ports:
+            if not LFUtils.wait_until_ports_appear(self.local_realm.lfclient_url, created_ports,
+                                                   debug=self.debug, timeout=timeout):
+                logger.error("reconcile: stations did not appear: %s" % created_ports)
+                ok = False
+            specs = {spec.eid: spec for spec in self.stations}
+            bring_up = [eid for eid in created_ports if specs[eid].up]
+            for eid in bring_up:
+                self.post(self.admin_command(eid, up=True))
+
+        cx_actions = [action for action in actions if action.kind == "cx" and action.op != "delete"]
+        if cx_actions:
+            new_endps, new_cxs = [], []
+            for action in cx_actions:
+                # endpoints first, the CX can only be added once both exist
+                split = next((i for i, (url, _data) in enumerate(action.commands) if url == "/cli-json/add_cx"),
+                             len(action.commands))
+                self.post(action.commands[:split])
+                if action.op != "modify":
+                    new_endps.extend([action.name + "-A", action.name + "-B"])
+                    new_cxs.append(action)
+            if new_endps and not self.local_realm.wait_until_endps_appear(new_endps, debug=self.debug,
+                                                                           timeout=timeout):
+                logger.error("reconcile: endpoints did not appear")
+                return False
+            for action in new_cxs:
+                split = next(i for i, (url, _data) in enumerate(action.commands) if url == "/cli-json/add_cx")
+                self.post(action.commands[split:])
+            if new_cxs and not self.local_realm.wait_until_cxs_appear([action.name for action in new_cxs],
+                                                                       debug=self.debug, timeout=timeout):
+                logger.error("reconcile: cross connects did not appear")
+                ok = False
+        return ok
+
+    def reconcile(self, dry_run=False, timeout=300):
+        """
+        Snapshot, plan and apply.
+        :return: the list of Action planned
+        """
+        self.snapshot()
+        actions = self.plan()
+        summary = self.summary(actions)
+        logger.info("reconcile: %s" % ", ".join("%s=%s" % item for item in summary.items()))
+        if self.debug:
+            for action in actions:
+                logger.debug("%s %s %s: %s" % (action.op, action.kind, action.name, action.reason))
+        if not dry_run and actions:
+            self.apply(actions, timeout=timeout)
+        return actions
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Shared ssh command runner for operations on the LANforge test host.
+
+Scripts like lf_ftp.py and lf_webpage.py create files on the test host before each
+file size and band iteration.  Opening a new paramiko.SSHClient each time costs a
+full key exchange and authentication, and fixed sleeps were used to wait for the
+commands to settle.  An SSHExecutor keeps one authenticated transport per
+host/port/user, runs commands (or a batch of commands in one channel) and waits
+on the exit status or polls a check command instead of sleeping.
+
+Example:
+    executor = get_ssh_executor("192.168.100.10", port=22, username="root", password="lanforge")
+    status, out, err = executor.run_batch(["rm -f /home/lanforge/ftp_test.txt",
+                                           "fallocate -l 10MB /home/lanforge/ftp_test.txt"])
+    executor.wait_for_file_size("/home/lanforge/ftp_test.txt", 10 * 10 ** 6)
+
+For testing, pass client_factory= a callable returning an object with the
+paramiko.SSHClient methods used here (connect, exec_command, get_transport, close).
+"""
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# (host, port, username) -> SSHExecutor
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def default_client_factory():
+    import paramiko
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())  # automatically adds the missing host key
+    return client
+
+
+class SSHExecutor:
+    def __init__(self,
+                 host=None,
+                 port=22,
+                 username="root",
+                 password="lanforge",
+                 banner_timeout=600,
+                 client_factory=None):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.banner_timeout = banner_timeout
+        self.client_factory = client_factory if client_factory is not None else default_client_factory
+        self.client = None
+        self.lock = threading.Lock()
+        self.connect_count = 0
+        self.command_count = 0
+
+    def is_connected(self):
+        if self.client is None:
+            return False
+        transport = self.client.get_transport()
+        return (transport is not None) and transport.is_active()
+
+    def connect(self):
+        """
+        Open the ssh connection if there is no active transport; reused otherwise.
+        """
+        if self.is_connected():
+            return self.client
+        if self.client is not None:
+            self.close()
+        client = self.client_factory()
+        client.connect(self.host,
+                       port=self.port,
+                       username=self.username,
+                       password=self.password,
+                       banner_timeout=self.banner_timeout)
+        self.client = client
+        self.connect_count += 1
+        logger.debug("ssh connected to %s:%s as %s" % (self.host, self.port, self.username))
+        return self.client
+
+    def close(self):
+        if self.client is not None:
+            try:
+                self.client.close()
+            except Exception as x:
+                logger.debug("ssh close of %s: %s" % (self.host, x))
+        self.client = None
+
+    def run(self, cmd, timeout=None):
+        """
+        Run one command and wait for it to exit.
+        :param cmd: shell command
+        :param timeout: seconds to wait for the command, None waits until it exits
+        :return: (exit status, stdout lines, stderr lines)
+        """
+        with self.lock:
+            client = self.connect()
+            self.command_count += 1
+            logger.debug("ssh %s: %s" % (self.host, cmd))
+            stdin, stdout, stderr = client.exec_command(str(cmd), timeout=timeout)
+            # reading to EOF returns once the remote command has finished
+            output = stdout.readlines()
+            errors = stderr.readlines()
+            status = stdout.channel.recv_exit_status()
+        if status != 0:
+            logger.warning("ssh %s: [%s] exited %s: %s" % (self.host, cmd, status, "".join(errors).strip()))
+        return status, output, errors
+
+    def run_batch(self, cmd_list=None, stop_on_error=True, timeout=None):
+        """
+        Run several commands in one channel.
+        :param cmd_list: list of shell commands
+        :param stop_on_error: join with && so the batch stops at the first failure, otherwise with ;
+        :param timeout: seconds to wait for the batch
+        :return: (exit status, stdout lines, stderr lines)
+        """
+        if not cmd_list:
+            return 0, [], []
+        separator = " && " if stop_on_error else " ; "
+        return self.run(separator.join(cmd_list), timeout=timeout)
+
+    def wait_for(self, cmd, predicate=None, timeout_sec=60, interval_sec=0.25, max_interval_sec=2.0):
+        """
+        Poll a check command until predicate(exit status, stdout lines) is true.
+        The poll interval starts at interval_sec and doubles up to max_interval_sec.
+        :param cmd: shell command used as the check
+        :param predicate: callable(status, output) -> bool, default: exit status 0
+        :param timeout_sec: give up after this many seconds
+        :return: True if the predicate matched, False on timeout
+        """
+        if predicate is None:
+            predicate = lambda status, output: status == 0
+        deadline = time.monotonic() + timeout_sec
+        interval = interval_sec
+        while True:
+            status, output, errors = self.run(cmd)
+            if predicate(status, output):
+                return True
+            if time.monotonic() + interval > deadline:
+                logger.warning("ssh %s: timed out after %ss waiting on [%s]" % (self.host, timeout_sec, cmd))
+                return False
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval_sec)
+
+    def file_exists(self, path):
+        status, output, errors = self.run('[ -f %s ] && echo "True" || echo "False"' % path)
+        return output == ["True\n"]
+
+    def wait_for_file_size(self, path, size_bytes=None, timeout_sec=60):
+        """
+        Wait until a file exists and, if size_bytes is given, is at least that large.
+        """
+        def size_reached(status, output):
+            if status != 0 or not output:
+                return False
+            if size_bytes is None:
+                return True
+            try:
+                return int(output[0].strip()) >= int(size_bytes)
+            except ValueError:
+                return False
+        return self.wait_for("stat -c %%s %s" % path, predicate=size_reached, timeout_sec=timeout_sec)
+
+
+def get_ssh_executor(host=None, port=22, username="root", password="lanforge", client_factory=None):
+    """
+    Return the shared executor for host/port/username, creating it on first use.
+    """
+    key = (host, int(port), username)
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            executor = SSHExecutor(host=host,
+                                   port=port,
+                                   username=username,
+                                   password=password,
+                                   client_factory=client_factory)
+            _executors[key] = executor
+        elif password != executor.password:
+            executor.password = password
+            executor.close()
+    return executor
+
+
+def close_all():
+    """
+    Close every cached connection, call at the end of a test run.
+    """
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.close()
+        _executors.clear()
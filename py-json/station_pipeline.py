@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Concurrent station creation across radios.
+
+StationProfile.create handles one radio per call and walks its stations one at a
+time: add_sta, a 10 ms sleep, set_port, another sleep, the optional wifi_extra,
+wifi_extra2 and wifi_txo commands, then sleep_time, checking each name against a
+list of the stations done so far.  A test building 500 stations on 8 radios
+therefore waits for 1000+ sequential round trips plus the sleeps.
+
+StationPipeline groups the stations by radio EID and runs one worker per radio.
+A worker sends the commands of its stations in order (add_sta before the set_port
+of the same station), the workers run side by side, and a shared semaphore keeps
+at most max_in_flight commands outstanding so the GUI is not flooded.  Stations
+are tracked in sets; the ports are then waited for once, and brought up per radio
+in parallel as well.  The command payloads are the ones StationProfile.create
+sends, built from the same profile.
+
+create() returns a dict with the stations created, skipped and failed, and the
+timing of every stage:
+
+    prepare      building the per-radio payloads
+    add_sta      requests and time spent in them, summed over the workers
+    set_port       "
+    wifi_extra   set_wifi_extra, set_wifi_extra2 and set_wifi_txo, when the profile sets them
+    commands     wall time until every worker was done
+    appear       wait_until_ports_appear
+    admin_up     set_port up of the new stations, when the profile is up
+
+Example:
+    pipeline = station_profile.new_pipeline(max_in_flight=8)
+    result = pipeline.create({"1.1.wiphy0": names_0, "1.1.wiphy1": names_1})
+    print(result["stages"]["add_sta"], result["failed"])
+"""
+import importlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+LFRequest = importlib.import_module("py-json.LANforge.LFRequest")
+LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+set_port = importlib.import_module("py-json.LANforge.set_port")
+add_sta = importlib.import_module("py-json.LANforge.add_sta")
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("prepare", "add_sta", "set_port", "wifi_extra", "commands", "appear", "admin_up")
+
+
+def radio_key(radio=None):
+    shelf, resource, name = LFUtils.name_to_eid(radio)[:3]
+    return "%s.%s.%s" % (shelf, resource, name)
+
+
+class StationPipeline:
+    def __init__(self,
+                 station_profile=None,
+                 max_in_flight=8,
+                 max_workers=32,
+                 use_radius=False,
+                 hs20_enable=False,
+                 suppress_related_commands=True,
+                 timeout=300,
+                 debug=False):
+        """
+        :param station_profile: StationProfile with the station configuration
+        :param max_in_flight: commands outstanding at once, over all radios
+        :param max_workers: radios worked on at once
+        :param timeout: seconds to wait for the stations to appear
+        """
+        self.profile = station_profile
+        self.max_in_flight = max(int(max_in_flight), 1)
+        self.max_workers = max(int(max_workers), 1)
+        self.use_radius = use_radius
+        self.hs20_enable = hs20_enable
+        self.suppress_related_commands = suppress_related_commands
+        self.timeout = timeout
+        self.debug = debug
+        self.in_flight = threading.BoundedSemaphore(self.max_in_flight)
+        self.lock = threading.Lock()
+        self.stages = None
+        self.radio_ms = None
+
+    def group(self, radio_stations=None):
+        """
+        :param radio_stations: dict of radio -> station names, or a list of (radio, station names)
+        :return: OrderedDict of radio EID -> list of station EIDs, each station once
+        """
+        items = radio_stations.items() if isinstance(radio_stations, dict) else radio_stations
+        groups = OrderedDict()
+        seen = set()
+        for radio, names in items:
+            radio = radio_key(radio)
+            shelf, resource = LFUtils.name_to_eid(radio)[:2]
+            eids = groups.setdefault(radio, [])
+            for name in names:
+                eid = "%s.%s.%s" % (shelf, resource, LFUtils.name_to_eid(name)[2])
+                if eid in seen:
+                    continue
+                seen.add(eid)
+                eids.append(eid)
+        return groups
+
+    def radio_data(self, radio=None, many=False):
+        """
+        :return: dict of command -> payload template for stations on radio, as StationProfile.create builds them
+        """
+        profile = self.profile
+        shelf, resource, radio_port = LFUtils.name_to_eid(radio)[:3]
+        flags = list(profile.desired_add_sta_flags)
+        mask = list(profile.desired_add_sta_flags_mask)
+        extra = []
+        if profile.use_ht160:
+            extra.append("ht160_enable")
+        if self.use_radius:
+            extra.append("8021x_radius")
+        if self.hs20_enable:
+            extra.append("hs20_enable")
+        for flag in extra:
+            if flag not in flags:
+                flags.append(flag)
+            if flag not in mask:
+                mask.append(flag)
+        if profile.up:
+            if "create_admin_down" in flags:
+                flags.remove("create_admin_down")
+        elif "create_admin_down" not in flags:
+            flags.append("create_admin_down")
+
+        add_sta_data = dict(profile.add_sta_data)
+        add_sta_data.update({
+            "shelf": shelf,
+            "resource": resource,
+            "radio": radio_port,
+            "ap": profile.bssid,
+            "flags": profile.add_named_flags(flags, add_sta.add_sta_flags),
+            "flags_mask": profile.add_named_flags(mask, add_sta.add_sta_flags),
+        })
+        if profile.mode is not None:
+            add_sta_data["mode"] = profile.mode
+        set_port_data = dict(profile.set_port_data)
+        set_port_data.update({
+            "shelf": shelf,
+            "resource": resource,
+            "current_flags": profile.add_named_flags(profile.desired_set_port_current_flags,
+                                                     set_port.set_port_current_flags),
+            "interest": profile.add_named_flags(profile.desired_set_port_interest_flags,
+                                                set_port.set_port_interest_flags),
+        })
+        if many or self.suppress_related_commands:
+            for data in (add_sta_data, set_port_data):
+                data["suppress_preexec_cli"] = "yes"
+                data["suppress_preexec_method"] = 1
+        commands = OrderedDict([("add_sta", add_sta_data), ("set_port", set_port_data)])
+        for command, data, modified in (("set_wifi_extra", profile.wifi_extra_data, profile.wifi_extra_data_modified),
+                                        ("set_wifi_extra2", profile.wifi_extra2_data, profile.wifi_extra2_data_modified),
+                                        ("set_wifi_txo", profile.wifi_txo_data, profile.wifi_txo_data_modified)):
+            if modified:
+                data = dict(data)
+                data.update({"shelf": shelf, "resource": resource})
+                commands[command] = data
+        return commands
+
+    def record(self, stage=None, started=None):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self.lock:
+            totals = self.stages[stage]
+            totals["requests"] += 1
+            totals["ms"] += elapsed_ms
+
+    def post(self, request=None, data=None, stage=None):
+        """
+        Send one command, waiting for a free in-flight slot.
+        :return: True when the GUI answered
+        """
+        with self.in_flight:
+            started = time.perf_counter()
+            request.addPostData(data)
+            response = request.jsonPost(show_error=self.debug, debug=self.debug)
+            self.record(stage, started)
+        return response is not None
+
+    def create_radio(self, radio=None, eids=None, commands=None, dry_run=False):
+        """
+        Worker for one radio: send the commands of each station in order.
+        :return: (set of station EIDs sent, set of station EIDs that failed)
+        """
+        started = time.perf_counter()
+        base_url = self.profile.lfclient_url
+        requests = {command: LFRequest.LFRequest(base_url + "/cli-json/" + command, debug_=self.debug)
+                    for command in commands}
+        sent, failed = set(), set()
+        for eid in eids:
+            name = LFUtils.name_to_eid(eid)[2]
+            if dry_run:
+                sent.add(eid)
+                continue
+            ok = True
+            for command, template in commands.items():
+                data = dict(template)
+                if command == "add_sta":
+                    data["sta_name"] = name
+                else:
+                    data["port"] = name
+                stage = command if command in self.stages else "wifi_extra"
+                if not self.post(requests[command], data, stage):
+                    ok = False
+                    if command == "add_sta":
+                        # nothing to configure when the station was not accepted
+                        break
+            (sent if ok else failed).add(eid)
+        with self.lock:
+            self.radio_ms[radio] = round((time.perf_counter() - started) * 1000, 3)
+        return sent, failed
+
+    def admin_up_radio(self, eids=None):
+        request = LFRequest.LFRequest(self.profile.lfclient_url + "/cli-json/set_port", debug_=self.debug)
+        for eid in eids:
+            shelf, resource, name = LFUtils.name_to_eid(eid)[:3]
+            data = LFUtils.port_up_request(resource_id=resource, port_name=name)
+            data["shelf"] = shelf
+            self.post(request, data, "admin_up")
+
+    def create(self, radio_stations=None, dry_run=False):
+        """
+        Create the stations, all radios at once.
+        :param radio_stations: dict of radio -> station names, or a list of (radio, station names)
+        :return: dict with the sets 'created', 'skipped', 'failed', the 'stages' timing, the
+                 'radios' worker times in ms and 'wall_ms'
+        """
+        started = time.perf_counter()
+        self.stages = OrderedDict((stage, {"requests": 0, "ms": 0.0}) for stage in STAGES)
+        self.radio_ms = OrderedDict()
+        profile = self.profile
+
+        prepare_started = time.perf_counter()
+        groups = self.group(radio_stations)
+        known = set(profile.station_names)
+        skipped = set()
+        for radio, eids in groups.items():
+            skipped.update(eid for eid in eids if eid in known)
+            groups[radio] = [eid for eid in eids if eid not in known]
+        for eid in sorted(skipped):
+            logger.info("Station {eid} already created, skipping.".format(eid=eid))
+        total = sum(len(eids) for eids in groups.values())
+        commands = {radio: self.radio_data(radio, many=total >= 15) for radio in groups}
+        self.stages["prepare"]["ms"] = (time.perf_counter() - prepare_started) * 1000
+
+        created, failed = set(), set()
+        commands_started = time.perf_counter()
+        workers = min(len(groups), self.max_workers) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="station_pipeline") as pool:
+            futures = [pool.submit(self.create_radio, radio, eids, commands[radio], dry_run)
+                       for radio, eids in groups.items() if eids]
+            for future in futures:
+                sent, not_sent = future.result()
+                created |= sent
+                failed |= not_sent
+        self.stages["commands"]["ms"] = (time.perf_counter() - commands_started) * 1000
+
+        # keep the order the stations were given in
+        ordered = [eid for eids in groups.values() for eid in eids if eid in created]
+        if not dry_run:
+            profile.station_names.extend(ordered)
+        ok = not failed
+        if ordered and not dry_run:
+            appear_started = time.perf_counter()
+            if not LFUtils.wait_until_ports_appear(profile.lfclient_url, ordered, debug=self.debug,
+                                                   timeout=self.timeout):
+                logger.error("Failed to create all ports, desired stations: {eids}".format(eids=ordered))
+                ok = False
+            self.stages["appear"]["ms"] = (time.perf_counter() - appear_started) * 1000
+            if ok and profile.up:
+                up_started = time.perf_counter()
+                by_radio = [[eid for eid in eids if eid in created] for eids in groups.values()]
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="station_pipeline") as pool:
+                    list(pool.map(self.admin_up_radio, [eids for eids in by_radio if eids]))
+                self.stages["admin_up"]["ms"] = (time.perf_counter() - up_started) * 1000
+
+        for totals in self.stages.values():
+            totals["ms"] = round(totals["ms"], 3)
+        if failed:
+            logger.error("station_pipeline: commands failed for {eids}".format(eids=sorted(failed)))
+        result = {
+            "ok": ok,
+            "created": created,
+            "skipped": skipped,
+            "failed": failed,
+            "stages": self.stages,
+            "radios": self.radio_ms,
+            "wall_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+        if self.debug:
+            logger.debug("station_pipeline: %d stations on %d radios in %.1f ms"
+                         % (len(created), len(groups), result["wall_ms"]))
+        return result
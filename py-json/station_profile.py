@@ -15,6 +15,7 @@ LFRequest = importlib.import_module("py-json.LANforge.LFRequest")
 LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
 set_port = importlib.import_module("py-json.LANforge.set_port")
 add_sta = importlib.import_module("py-json.LANforge.add_sta")
+station_pipeline = importlib.import_module("py-json.station_pipeline")
 
 logger = logging.getLogger(__name__)
 
@@ -684,6 +685,27 @@ class StationProfile:
             logger.debug("created {num} stations".format(num=num))
         return True
 
+    def new_pipeline(self, max_in_flight=8, use_radius=False, hs20_enable=False, timeout=300):
+        """
+        :return: StationPipeline creating stations of this profile on several radios at once
+        """
+        return station_pipeline.StationPipeline(station_profile=self,
+                                                max_in_flight=max_in_flight,
+                                                use_radius=use_radius,
+                                                hs20_enable=hs20_enable,
+                                                timeout=timeout,
+                                                debug=self.debug)
+
+    def create_multi_radio(self, radio_stations, max_in_flight=8, dry_run=False, timeout=300):
+        """
+        Create stations on several radios concurrently, one worker per radio.
+        :param radio_stations: dict of radio -> station names
+        :return: True when every station was created and appeared
+        """
+        result = self.new_pipeline(max_in_flight=max_in_flight, timeout=timeout).create(radio_stations,
+                                                                                        dry_run=dry_run)
+        return result["ok"]
+
     def modify(self, radio):
         for station in self.station_names:
             logger.info(f"modifying station {station}")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # flake8: noqa
 """ ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
-    internal test driving LFUtils.expand_endp_histogram
+    internal test driving LFUtils.expand_endp_histogram and endp_histogram
 ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- """
 import sys
 import os
@@ -11,6 +11,7 @@ import importlib
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+endp_histogram = importlib.import_module("py-json.endp_histogram")
 
 
 distrib_load = {
@@ -41,3 +42,21 @@ distrib_load = {
 
 if __name__ == '__main__':
     LFUtils.expand_endp_histogram(distrib_load)
+
+    endp_response = {
+        "endpoint": [
+            {"cx0-A": {"eid": "1.1.3.10", "rx-silence-5m": distrib_load}},
+            {"cx0-B": {"eid": "1.1.4.11", "rx-silence-5m": distrib_load}},
+            {"cx1-A": {"eid": "1.1.3.12", "rx-silence-5m": distrib_load}},
+        ]
+    }
+    hist = endp_histogram.EndpHistogram.from_endp_response(endp_response, column="rx-silence-5m")
+    print(hist.expand("cx0-A"))
+    print(hist.percentile_table())
+    print(hist.merge(hist.port_groups()).percentile_table())
+
+    tracker = endp_histogram.EndpHistogramTracker(column="rx-silence-5m")
+    tracker.update(hist)
+    distrib_load["histogram"][5] += 100
+    next_poll = endp_histogram.EndpHistogram.from_endp_response(endp_response, column="rx-silence-5m")
+    print(tracker.update(next_poll).percentile_table())
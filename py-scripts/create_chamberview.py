@@ -180,22 +180,25 @@ class CreateChamberview(cv_test):
         self.apply_cv_scenario(scenario_name)  # Apply scenario
         self.show_text_blob(None, None, False)  # Show changes on GUI
         self.apply_cv_scenario(scenario_name)  # Apply scenario
+        # ports created by the build are logged, so 'cv is_built' is asked again as
+        # soon as the event log shows activity, and at least every second otherwise
+        waiter = self.new_event_waiter()
         self.build_cv_scenario()  # build scenario
-        tries = 0
-        while True:
+        started = time.time()
+
+        def is_built():
             self.get_popup_info_and_close()
-            if not self.get_cv_is_built():
-                # It can take a while to build a large scenario, so wait-time
-                # is currently max of 5 minutes.
-                logger.info("Waiting %i/300 for Chamber-View to be built." % tries)
-                tries += 1
-                if tries > 300:
-                    self._fail("Waiting %i/300 for Chamber-View to be built." % tries)
-                    break
-                time.sleep(1)
-            else:
-                self._pass("completed building %s scenario" % scenario_name)
-                break
+            if self.get_cv_is_built():
+                return True
+            # It can take a while to build a large scenario, so wait-time
+            # is currently max of 5 minutes.
+            logger.info("Waiting %i/300 seconds for Chamber-View to be built." % (time.time() - started))
+            return False
+
+        if waiter.wait_for(check=is_built, timeout_sec=300):
+            self._pass("completed building %s scenario" % scenario_name)
+        else:
+            self._fail("Waiting %i/300 for Chamber-View to be built." % (time.time() - started))
 
 
 def main():
@@ -19,6 +19,8 @@
 import sys
 import os
 import argparse
+import csv
+import pandas as pd
 
 if sys.version_info[0] != 3:
     print("This script requires Python 3")
@@ -27,6 +29,21 @@ if sys.version_info[0] != 3:
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 
+def read_text(csv_file=None):
+    """
+    Read a csv as text the way the line.split(",") parser used before did: fields past the
+    header's are ignored, short rows are padded with '' and blank lines are kept, as rows
+    of empty values.  Rows are trimmed here, before pandas sees them, as a callable
+    on_bad_lines needs pandas 1.4.
+    """
+    with open(csv_file, newline='') as fp:
+        reader = csv.reader(fp)
+        header = next(reader, [])
+        width = len(header)
+        rows = [(row + [""] * (width - len(row)))[:width] for row in reader]
+    return pd.DataFrame(rows, columns=header, dtype=str)
+
+
 class CSVParser:
     def __init__(self, csv_infile=None, csv_infile2=None, csv_outfile=None):
 
@@ -39,105 +56,84 @@ class CSVParser:
         i_tx_mcs = -1
         rate_with_units = False
 
-        fpo = open(csv_outfile, "w")
-        fp = open(csv_infile)
-        fp2 = None
-        if csv_infile2:
-            fp2 = open(csv_infile2)
-
-        if True:
-            line = fp.readline()
-            if not line:
-                exit(1)
-
-            # Concat lines so we can read data from both csv files.
-            if fp2:
-                l2 = fp2.readline()
-                if l2:
-                    line = "%s,%s" %(line, l2)
-
-            # Read in initial line, this is the CSV headers.  Parse it to find the column indices for
-            # the columns we care about.
-            x = line.split(",")
-            cni = 0
-            for cn in x:
-                #print("cn: " + cn)
-                # This works with the 'brief' csv output.
-                if cn == "Attenuation [dB]":
-                    i_atten = cni
-                if cn == "Position [Deg]":
-                    i_rotation = cni
-                if cn == "Throughput [Mbps]":
-                    i_rxbps = cni
-                if cn == "Beacon RSSI [dBm]":
-                    i_beacon_rssi = cni
-                if cn == "Data RSSI [dBm]":
-                    i_data_rssi = cni
-
-                # This is for parsing the more complete csv output.
-                if cn == "Atten":
-                    i_atten = cni
-                if cn == "Rotation":
-                    i_rotation = cni
-                if cn == "Rx-Bps":
-                    rate_with_units = True
-                    i_rxbps = cni
-                # NOTE: Beacon RSSI does not exist in the 'full' csv
-                if cn == "RSSI":
-                    i_data_rssi = cni
-                if cn == "Tx-Rate":
-                    i_tx_mcs = cni
-                if cn == "Rx-Rate":
-                    i_rx_mcs = cni
-                    
-                cni += 1
+        # Each csv is parsed once as text; the columns we care about are taken from that frame.
+        if not os.path.exists(csv_infile) or os.path.getsize(csv_infile) == 0:
+            exit(1)
+        df = read_text(csv_infile)
 
+        # Concat columns so we can read data from both csv files.  Rows are paired by position.
+        if csv_infile2:
+            df2 = read_text(csv_infile2)
+            df = pd.concat([df.reset_index(drop=True), df2.iloc[:len(df)].reset_index(drop=True)], axis=1)
+            df = df.fillna("")
+
+        # Parse the CSV headers to find the column indices for the columns we care about.
+        cni = 0
+        for cn in df.columns:
+            #print("cn: " + cn)
+            # This works with the 'brief' csv output.
+            if cn == "Attenuation [dB]":
+                i_atten = cni
+            if cn == "Position [Deg]":
+                i_rotation = cni
+            if cn == "Throughput [Mbps]":
+                i_rxbps = cni
+            if cn == "Beacon RSSI [dBm]":
+                i_beacon_rssi = cni
+            if cn == "Data RSSI [dBm]":
+                i_data_rssi = cni
+
+            # This is for parsing the more complete csv output.
+            if cn == "Atten":
+                i_atten = cni
+            if cn == "Rotation":
+                i_rotation = cni
+            if cn == "Rx-Bps":
+                rate_with_units = True
+                i_rxbps = cni
+            # NOTE: Beacon RSSI does not exist in the 'full' csv
+            if cn == "RSSI":
+                i_data_rssi = cni
+            if cn == "Tx-Rate":
+                i_tx_mcs = cni
+            if cn == "Rx-Rate":
+                i_rx_mcs = cni
+
+            cni += 1
+
+        num_rows = len(df)
+        rotation = df.iloc[:, i_rotation].tolist()
+        atten = df.iloc[:, i_atten].tolist()
+        data_rssi = df.iloc[:, i_data_rssi].tolist()
+        beacon_rssi = ["0"] * num_rows
+        if (i_beacon_rssi >= 0):
+            beacon_rssi = df.iloc[:, i_beacon_rssi].tolist()
+        tx_rate = ["0"] * num_rows
+        rx_rate = ["0"] * num_rows
+        if (i_tx_mcs >= 0):
+            tx_rate = [self.convert_to_mbps(val) for val in df.iloc[:, i_tx_mcs]]
+        if (i_rx_mcs >= 0):
+            rx_rate = [self.convert_to_mbps(val) for val in df.iloc[:, i_rx_mcs]]
+        rxbps = [self.convert_to_mbps(val) for val in df.iloc[:, i_rxbps]]
+
+        test_run = "1"
+
+        with open(csv_outfile, "w") as fpo:
             # Write out out header for the new file.
             fpo.write("Test Run,Position [Deg],Attenuation 1 [dB],Pal Stats Endpoint 1 Control Rssi [dBm],Pal Stats Endpoint 1 Data Rssi [dBm] Mean,Pal Stats Endpoint 1 RX rate [Mbps] Mode,Pal Stats Endpoint 1 TX rate [Mbps] Mode\n")
+            fpo.writelines("%s,%s,%s,%s,%s,%s,%s\n" % (test_run, rotation[i], atten[i], beacon_rssi[i], data_rssi[i], tx_rate[i], rx_rate[i])
+                           for i in range(num_rows))
 
-            # Read rest of the input lines, processing one at a time.  Covert the columns as
-            # needed, and write out new data to the output file.
-            line = fp.readline()
-
-            # Concat lines so we can read data from both csv files.
-            if fp2:
-                l2 = fp2.readline()
-                if l2:
-                    line = "%s,%s" %(line, l2)
-
-            bottom_half = "Step Index,Position [Deg],Attenuation [dB],Traffic Pair 1 Throughput [Mbps]\n"
-
-            test_run = "1"
-
-            step_i = 0
-            while line:
-                x = line.split(",")
-                beacon_rssi = "0"
-                if (i_beacon_rssi >= 0):
-                    beacon_rssi = x[i_beacon_rssi]
-                tx_rate = "0"
-                rx_rate = "0"
-                if (i_tx_mcs >= 0):
-                    tx_rate = self.convert_to_mbps(x[i_tx_mcs])
-                if (i_rx_mcs >= 0):
-                    rx_rate = self.convert_to_mbps(x[i_rx_mcs])
-                fpo.write("%s,%s,%s,%s,%s,%s,%s\n" % (test_run, x[i_rotation], x[i_atten], beacon_rssi, x[i_data_rssi], tx_rate, rx_rate))
-                bottom_half += ("%s,%s,%s,%s\n" % (step_i, x[i_rotation], x[i_atten], self.convert_to_mbps(x[i_rxbps])))
-                line = fp.readline()
-
-                # Concat lines so we can read data from both csv files.
-                if fp2:
-                    l2 = fp2.readline()
-                    if l2:
-                        line = "%s,%s" %(line, l2)
-
-                step_i += 1
-
-            # First half is written out now, and second half is stored...
+            # First half is written out now, then the second half.
             fpo.write("\n\n# RvRvO Data\n\n")
-            fpo.write(bottom_half)
+            fpo.write("Step Index,Position [Deg],Attenuation [dB],Traffic Pair 1 Throughput [Mbps]\n")
+            fpo.writelines("%s,%s,%s,%s\n" % (step_i, rotation[step_i], atten[step_i], rxbps[step_i])
+                           for step_i in range(num_rows))
 
     def convert_to_mbps(self, val):
+        # a blank input line stays blank
+        if not val:
+            return val
         tokens = val.split(" ")
         rv = float(tokens[0])
 
@@ -3,7 +3,7 @@
 import sys
 import os
 import argparse
-import pandas as pd
+import importlib
 
 #https://pandas.pydata.org/pandas-docs/stable/user_guide/visualization.html
 #https://queirozf.com/entries/pandas-dataframe-plot-examples-with-matplotlib-pyplot
@@ -16,6 +16,8 @@ if sys.version_info[0] != 3:
  
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
+lf_csv_loader = importlib.import_module("py-scripts.lf_csv_loader")
+
 class L3CSVParcer():
     def __init__(self,csv_file):
 
@@ -29,9 +31,12 @@ class L3CSVParcer():
             if row[1] == 'rx':
                 print(row)'''
 
-        include_summary = ['Time epoch','Time','Monitor','least','most','average']
+        # read the csv once, both the summary and raw files are taken from the same frame
         self.csv_file = csv_file
-        df_s = pd.read_csv(self.csv_file,header = 0, usecols = lambda column : any(substr in column for substr in include_summary))
+        loader = lf_csv_loader.lf_csv_loader(csv_file=self.csv_file)
+
+        include_summary = ['Time epoch','Time','Monitor','least','most','average']
+        df_s = loader.columns_containing(include_summary)
 
         print('{}'.format(csv_file))
         csv_file_summary = self.csv_file.replace('results_','results_summary_')
@@ -39,8 +44,7 @@ class L3CSVParcer():
         df_s.to_csv(csv_file_summary, index = False, header=True)
 
         include_raw = ['Time epoch','Time','Monitor','LT','MT']
-        self.csv_file = csv_file
-        df_r = pd.read_csv(self.csv_file,header = 0, usecols = lambda column : any(substr in column for substr in include_raw))
+        df_r = loader.columns_containing(include_raw)
 
         csv_file_raw = self.csv_file.replace('results_','results_raw_')
         df_r.to_csv(csv_file_raw, index = False, header=True)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+NAME: lf_atten_sweep.py
+
+PURPOSE: Step one or more attenuators through a sweep, sending the module changes of each step
+         together and waiting for the stations' signal (or association) to settle instead of a
+         fixed sleep, while the readings of the previous step are written out
+         (see py-json/atten_sweep.py).
+
+EXAMPLE:
+        # 0 to 70 dB in 1 dB steps on every module of attenuator 2324, signal of two stations
+            ./lf_atten_sweep.py --mgr localhost --serno 2324 --start 0 --stop 700 --step 10 \\
+                --stations 1.1.sta0000 1.1.sta0001 --csv /tmp/sweep.csv
+
+        # roam pattern: 2324 down while 2325 goes up, settled when the stations are associated
+            ./lf_atten_sweep.py --mgr localhost --serno 2324 2325 --crossfade --settle bssid \\
+                --stations 1.1.sta0000
+
+        # steps from a json file: [[["2324", "all", 0], ["2325", 3, 950]], ...]
+            ./lf_atten_sweep.py --mgr localhost --steps /tmp/steps.json --stations 1.1.sta0000
+
+        # simulated attenuators, compared with one module at a time and a 4 second sleep
+            ./lf_atten_sweep.py --simulate --serno 1001 1002 --crossfade --step 50 --compare
+
+SCRIPT_CLASSIFICATION:  Test
+
+SCRIPT_CATEGORIES:   Performance, Functional
+
+NOTES:
+        Values are in ddB, 0 to 955; modules are 0 to 7 or all.
+
+COPYRIGHT:
+    Copyright 2024 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+"""
+import argparse
+import csv
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+realm = importlib.import_module("py-json.realm")
+Realm = realm.Realm
+atten_sweep = importlib.import_module("py-json.atten_sweep")
+
+logger = logging.getLogger(__name__)
+
+
+def build_steps(args=None):
+    if args.steps:
+        with open(args.steps) as steps_file:
+            return json.load(steps_file)
+    if args.crossfade:
+        if len(args.serno) != 2:
+            raise ValueError("--crossfade wants two --serno, the one going down first")
+        return atten_sweep.crossfade(args.serno[0], args.serno[1], args.start, args.stop, args.step, args.idx)
+    return atten_sweep.ramp(args.serno, args.start, args.stop, args.step, args.idx)
+
+
+def build_settle(args=None, read_rssi=None, read_bssid=None):
+    if args.settle == "fixed":
+        return atten_sweep.FixedSettle(args.settle_sec)
+    if args.settle == "bssid":
+        return atten_sweep.BssidSettle(read_bssid, expected=args.expected_bssid, interval_sec=args.interval_sec,
+                                       timeout_sec=args.timeout_sec)
+    return atten_sweep.RssiSettle(read_rssi, tolerance_db=args.tolerance_db, samples=args.samples,
+                                  interval_sec=args.interval_sec, timeout_sec=args.timeout_sec)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lf_atten_sweep.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='''
+Sweep attenuators, waiting for the stations to settle after each step.
+''')
+    parser.add_argument('--mgr', help='LANforge GUI host', default='localhost')
+    parser.add_argument('--mgr_port', help='LANforge GUI port', type=int, default=8080)
+    parser.add_argument('--serno', help='attenuator serial(s), shelf.resource.serno or serno', nargs='+',
+                        default=[])
+    parser.add_argument('--idx', help='module 0 to 7, or all', default='all')
+    parser.add_argument('--start', help='first value in ddB', type=int, default=0)
+    parser.add_argument('--stop', help='last value in ddB', type=int, default=700)
+    parser.add_argument('--step', help='ddB per step', type=int, default=10)
+    parser.add_argument('--crossfade', help='two --serno: the first goes from --stop to --start as the second '
+                                            'goes from --start to --stop', action='store_true')
+    parser.add_argument('--steps', help='json file with the steps, a list of lists of [serno, idx, val]',
+                        default=None)
+    parser.add_argument('--stations', help='stations to watch', nargs='+', default=[])
+    parser.add_argument('--settle', help='rssi | bssid | fixed', default='rssi')
+    parser.add_argument('--tolerance_db', help='signal spread that counts as settled', type=float, default=1.0)
+    parser.add_argument('--samples', help='signal readings that must agree', type=int, default=3)
+    parser.add_argument('--interval_sec', help='time between settle readings', type=float, default=0.25)
+    parser.add_argument('--timeout_sec', help='longest wait for a step to settle', type=float, default=30)
+    parser.add_argument('--settle_sec', help='wait of --settle fixed', type=float, default=4.0)
+    parser.add_argument('--expected_bssid', help='BSSID --settle bssid waits for', default=None)
+    parser.add_argument('--max_in_flight', help='attenuator commands sent at once', type=int, default=8)
+    parser.add_argument('--csv', help='write the readings of every step to this file', default=None)
+    parser.add_argument('--simulate', help='use simulated attenuators and stations', action='store_true')
+    parser.add_argument('--latency_ms', help='round trip of a simulated set_attenuator', type=float, default=5.0)
+    parser.add_argument('--collect_ms', help='extra time the collection of a simulated step takes',
+                        type=float, default=0.0)
+    parser.add_argument('--compare', help='also run the steps one module at a time with --settle_sec sleeps',
+                        action='store_true')
+    parser.add_argument('--json', help='write the summary to this json file', default=None)
+    parser.add_argument('--debug', help='log every step', action='store_true')
+    parser.add_argument('--log_level', help='debug | info | warning | error', default='info')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO),
+                        format='%(asctime)s %(name)s %(levelname)s: %(message)s')
+
+    steps = build_steps(args)
+    if args.simulate:
+        serials = args.serno or sorted({atten_sweep.check_change(change).serno for step in steps for change in step})
+        simulated = atten_sweep.SimulatedAttenuators(serials=serials, stations=args.stations or None,
+                                                     latency_ms=args.latency_ms)
+        backend, read_rssi, read_bssid = simulated, simulated.read_rssi, simulated.read_bssid
+    else:
+        local_realm = Realm(lfclient_host=args.mgr, lfclient_port=args.mgr_port, debug_=args.debug)
+        backend = atten_sweep.RealmAttenBackend(local_realm)
+        read_rssi = atten_sweep.port_rssi_reader(local_realm, args.stations)
+        read_bssid = atten_sweep.port_bssid_reader(local_realm, args.stations)
+        if not args.stations and args.settle != "fixed":
+            logger.warning("no --stations to watch, using --settle fixed")
+            args.settle = "fixed"
+
+    csvfile = None
+    csvwriter = None
+    if args.csv:
+        csvfile = open(args.csv, 'w')
+        csvwriter = csv.writer(csvfile, delimiter=",")
+        csvwriter.writerow(['Timestamp seconds epoch', 'step', 'changes', 'station', 'signal', 'bssid'])
+
+    def measure(index, changes):
+        return int(time.time()), read_rssi()
+
+    def collect(index, changes, sample):
+        tick_sec, signals = sample
+        bssids = read_bssid() if args.settle == "bssid" or args.simulate else {}
+        if args.collect_ms:
+            time.sleep(args.collect_ms / 1000.0)
+        if csvwriter is not None:
+            described = " ".join("%s/%s=%s" % change for change in changes)
+            for station, signal in signals.items():
+                csvwriter.writerow([tick_sec, index, described, station, signal, bssids.get(station, "")])
+        return len(signals)
+
+    runs = [("sweep", atten_sweep.AttenSweep(backend=backend,
+                                             steps=steps,
+                                             settle=build_settle(args, read_rssi, read_bssid),
+                                             measure=measure,
+                                             collect=collect,
+                                             max_in_flight=args.max_in_flight,
+                                             debug=args.debug))]
+    if args.compare:
+        # the pattern this replaces: one module at a time, a fixed sleep, collection in line
+        runs.append(("legacy", atten_sweep.AttenSweep(backend=backend,
+                                                      steps=steps,
+                                                      settle=atten_sweep.FixedSettle(args.settle_sec),
+                                                      measure=measure,
+                                                      collect=collect,
+                                                      max_in_flight=1,
+                                                      overlap=False,
+                                                      skip_unchanged=False)))
+    summaries = {}
+    try:
+        for name, sweep in runs:
+            sweep.run()
+            summaries[name] = sweep.summary()
+            logger.info("%-7s %s" % (name, ", ".join("%s: %s" % item for item in summaries[name].items())))
+    finally:
+        if csvfile is not None:
+            csvfile.close()
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump(summaries, json_file, indent=2)
+    if any(summary["unsettled"] for summary in summaries.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# flake8: noqa
+'''
+NAME: lf_csv_loader.py
+
+PURPOSE:
+Common loader for the csv files written by the LANforge monitor and longevity scripts.
+The csv is parsed once, with explicit dtypes, and any number of column subsets may then
+be taken from the single in-memory frame.
+
+With use_cache=True a columnar copy is cached next to the csv (<csv>.feather by default)
+and is used instead of the csv for as long as it is newer than the csv, so re-processing
+a multi-GB results file only parses it once.  Feather and parquet need pyarrow; when it
+is not installed nothing is cached.
+
+EXAMPLE:
+    loader = lf_csv_loader(csv_file='longevity_results_08_14_2020_14_37.csv')
+    df_summary = loader.columns_containing(['Time epoch', 'Time', 'Monitor', 'least', 'most', 'average'])
+    df_raw = loader.columns_containing(['Time epoch', 'Time', 'Monitor', 'LT', 'MT'])
+
+    # cache a columnar copy for the next run
+    loader = lf_csv_loader(csv_file='longevity_results_08_14_2020_14_37.csv', use_cache=True)
+
+    # legacy list of rows (header first), every value a string like csv.reader returns
+    rows = lf_csv_loader(csv_file='rssi.csv', dtype=str).as_rows()
+
+COPYRIGHT:
+    Copyright 2023 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+'''
+import os
+import logging
+import argparse
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class lf_csv_loader:
+    CACHE_FORMATS = ('feather', 'parquet')
+
+    def __init__(self,
+                 csv_file=None,
+                 dtype=None,
+                 usecols=None,
+                 cache_format='feather',
+                 use_cache=False,
+                 read_options=None):
+        """
+        :param csv_file: path of the csv to load
+        :param dtype: dtype or dict of column -> dtype passed to pandas.read_csv,
+            str keeps every value as text (empty cells stay '')
+        :param usecols: optional list of columns, or callable, limiting what is parsed
+        :param cache_format: feather | parquet
+        :param use_cache: read and write the columnar cache (needs pyarrow)
+        :param read_options: dict of further pandas.read_csv arguments, e.g. on_bad_lines;
+            a loader with read_options is not cached
+        """
+        if cache_format is not None and cache_format not in self.CACHE_FORMATS:
+            raise ValueError("cache_format [%s] must be one of %s" % (cache_format, self.CACHE_FORMATS))
+        self.csv_file = csv_file
+        self.dtype = dtype
+        self.usecols = usecols
+        self.cache_format = cache_format
+        self.read_options = dict(read_options or {})
+        self.use_cache = use_cache and cache_format is not None and usecols is None and not self.read_options
+        self.df = None
+
+    def cache_path(self, cache_format=None):
+        if cache_format is None:
+            cache_format = self.cache_format
+        # text and typed reads of the same csv are cached separately
+        tag = '.str' if self.dtype is str else ''
+        return "{csv}{tag}.{ext}".format(csv=self.csv_file, tag=tag, ext=cache_format)
+
+    def cache_is_current(self, cache_file):
+        return os.path.exists(cache_file) \
+            and os.path.getmtime(cache_file) >= os.path.getmtime(self.csv_file)
+
+    def read_cache(self):
+        cache_file = self.cache_path()
+        if not self.cache_is_current(cache_file):
+            return None
+        try:
+            if self.cache_format == 'feather':
+                return pd.read_feather(cache_file)
+            return pd.read_parquet(cache_file)
+        except ImportError as x:
+            logger.debug("cannot read {cache}: {err}".format(cache=cache_file, err=x))
+        except Exception as x:
+            logger.warning("ignoring unreadable cache {cache}: {err}".format(cache=cache_file, err=x))
+        return None
+
+    def write_cache(self, df):
+        cache_file = self.cache_path()
+        try:
+            if self.cache_format == 'feather':
+                df.reset_index(drop=True).to_feather(cache_file)
+            else:
+                df.to_parquet(cache_file, index=False)
+            logger.info("cached columnar copy: {cache}".format(cache=cache_file))
+        except ImportError as x:
+            logger.info("{fmt} cache unavailable ({err}), not caching".format(fmt=self.cache_format, err=x))
+        except (OSError, ValueError) as x:
+            logger.warning("could not write {cache}: {err}".format(cache=cache_file, err=x))
+
+    def read_csv(self):
+        if not os.path.exists(self.csv_file):
+            logger.error("File not found {csv_file}".format(csv_file=self.csv_file))
+            raise FileNotFoundError(self.csv_file)
+        options = dict(self.read_options)
+        if options.get('engine') != 'python':
+            options.setdefault('low_memory', False)
+        return pd.read_csv(self.csv_file,
+                           header=0,
+                           dtype=self.dtype,
+                           usecols=self.usecols,
+                           keep_default_na=(self.dtype is not str),
+                           **options)
+
+    def load(self):
+        """
+        :return: DataFrame of the whole csv, read at most once per loader
+        """
+        if self.df is not None:
+            return self.df
+        if self.use_cache:
+            self.df = self.read_cache()
+            if self.df is not None:
+                logger.debug("loaded {csv} from columnar cache".format(csv=self.csv_file))
+                return self.df
+        self.df = self.read_csv()
+        if self.use_cache:
+            self.write_cache(self.df)
+        return self.df
+
+    def columns(self, column_list=None):
+        """
+        :param column_list: list of exact column names, missing names are skipped
+        :return: DataFrame with only those columns
+        """
+        df = self.load()
+        return df[[column for column in column_list if column in df.columns]]
+
+    def columns_containing(self, substr_list=None):
+        """
+        Same selection as pandas.read_csv(usecols=lambda column: any(substr in column ...))
+        :param substr_list: list of substrings
+        :return: DataFrame with the columns whose name contains any of the substrings
+        """
+        df = self.load()
+        return df[[column for column in df.columns if any(substr in column for substr in substr_list)]]
+
+    def as_rows(self):
+        """
+        :return: list of rows with the header as the first row, like csv.reader() would produce
+        """
+        df = self.load()
+        return [list(df.columns)] + df.values.tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lf_csv_loader.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='''
+lf_csv_loader.py:
+    Read a LANforge results csv once and store a columnar copy next to it.
+
+Example:
+    ./lf_csv_loader.py -i longevity_results_08_14_2020_14_37.csv --cache_format feather
+        ''')
+    parser.add_argument('-i', '--infile', help="csv file to load", required=True)
+    parser.add_argument('--cache_format', help="feather | parquet", default='feather')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    loader = lf_csv_loader(csv_file=args.infile, cache_format=args.cache_format, use_cache=True)
+    df = loader.load()
+    print("{rows} rows, {cols} columns".format(rows=len(df), cols=len(df.columns)))
+
+
+if __name__ == '__main__':
+    main()
@@ -103,7 +103,6 @@ INCLUDE_IN_README: False
 """
 import sys
 import importlib
-import paramiko
 import argparse
 from datetime import datetime, timedelta
 import time
@@ -127,6 +126,7 @@ if sys.version_info[0] != 3:
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+ssh_executor = importlib.import_module("py-json.ssh_executor")
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
 realm = importlib.import_module("py-json.realm")
@@ -836,8 +836,6 @@ class FtpTest(LFCliBase):
         user = "root"
         pswd = "lanforge"
         port = self.ssh_port
-        ssh = paramiko.SSHClient()  # creating shh client object we use this object to connect to router
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())  # automatically adds the missing host key
 
         # get upstream port ip-address from test ftp server
         if entity_id[1] > 1:
@@ -846,27 +844,14 @@ class FtpTest(LFCliBase):
             ftp_server_ip = ftp_resource_url["interface"]["ip"]
             ip = ftp_server_ip
 
-        ssh.connect(ip, port=port, username=user, password=pswd, banner_timeout=600)
-        cmd = '[ -f /home/lanforge/ftp_test.txt ] && echo "True" || echo "False"'
-        stdin, stdout, stderr = ssh.exec_command(str(cmd))
-        output = stdout.readlines()
-        logger.info(output)
-        if output == ["True\n"]:
-            cmd1 = "rm /home/lanforge/ftp_test.txt"
-            stdin, stdout, stderr = ssh.exec_command(str(cmd1))
-            output = stdout.readlines()
-            time.sleep(10)
-            cmd2 = "sudo fallocate -l " + self.file_size + " /home/lanforge/ftp_test.txt"
-            stdin, stdout, stderr = ssh.exec_command(str(cmd2))
-            logger.info("File creation done %s", self.file_size)
-            output = stdout.readlines()
-        else:
-            cmd2 = "sudo fallocate -l " + self.file_size + " /home/lanforge/ftp_test.txt"
-            stdin, stdout, stderr = ssh.exec_command(str(cmd2))
-            logger.info("File creation done %s", self.file_size)
-            output = stdout.readlines()
-        ssh.close()
-        time.sleep(1)
+        # the ssh connection is kept open across file sizes and bands
+        ssh = ssh_executor.get_ssh_executor(ip, port=port, username=user, password=pswd)
+        ftp_file = "/home/lanforge/ftp_test.txt"
+        status, output, errors = ssh.run_batch(["rm -f " + ftp_file,
+                                                "sudo fallocate -l " + self.file_size + " " + ftp_file])
+        logger.info("File creation done %s", self.file_size)
+        # wait for the file to be in place rather than sleeping
+        ssh.wait_for_file_size(ftp_file, self.convert_file_size_in_Bytes(self.file_size))
         return output
 
     def convert_file_size_in_Bytes(self, size):
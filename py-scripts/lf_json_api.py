@@ -25,8 +25,16 @@ EXAMPLE:
         --port 1.1.vap0000 --get_request 'wifi-stats'
 
 
+    # repeat the same requests from a loop without re-querying the GUI for 5 seconds
+    ./lf_json_api.py --lf_mgr 192.168.100.116 --lf_port 8080 --port 1.1.wlan3 --get_request 'port wifi-stats' --cache_ttl 5
+
 NOTE:
     LANforge GUI , click on info -> API Help  look under GET Requests  use similiar format to what is being done below.
+
+    lf_json_cache keeps each table EID-keyed; lf_json.cache.get_fields('port', ['1.1.wlan3'], ['signal', 'channel'])
+    only queries the columns that are missing or older than --cache_ttl.  Records are found by their
+    numeric EID (1.1.3) or by shelf.resource.alias (1.1.wlan3).  The get_request_* methods only use
+    the whole-URL cache; get_fields() is opt-in API for scripts polling a few columns.
 '''
 
 import argparse
@@ -41,6 +49,7 @@ import json
 import traceback
 import csv
 import time
+import urllib.parse
 
 
 if sys.version_info[0] != 3:
@@ -56,6 +65,269 @@ logger = logging.getLogger(__name__)
 lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
 
 
+class lf_cached_response():
+    """
+    Holds the parts of a requests.Response that the get_request_* methods use,
+    so a cached answer can be handed back in place of a new request.
+    """
+    def __init__(self, status_code=0, text='', json_data=None):
+        self.status_code = status_code
+        self.text = text
+        self.json_data = json_data
+
+    def json(self):
+        return self.json_data
+
+
+class lf_json_cache():
+    """
+    Cache of LANforge JSON responses and EID-keyed table index.
+
+    Every GET goes through one keep-alive requests.Session.  Responses are kept
+    for ttl_sec seconds and also merged into self.tables[table][eid], where table
+    is the first element of the URL path (port, stations, wifi-stats, layer4 ...).
+    Each column of a table carries its own fetch time, so get_fields() only asks
+    the GUI for the columns (and EIDs) that are missing or older than ttl_sec.
+    Records are stored under their numeric EID; self.aliases[table] maps the
+    shelf.resource.alias and listed names of a record to that EID.
+    A ttl_sec of 0 disables serving from the cache but keeps connection reuse.
+    """
+    # top level keys of a response that are not table data
+    NON_TABLE_KEYS = ('handler', 'uri', 'empty', 'warnings', 'errors', 'status', 'error_list')
+
+    def __init__(self,
+                 lf_mgr='localhost',
+                 lf_port=8080,
+                 lf_user='lanforge',
+                 lf_passwd='lanforge',
+                 ttl_sec=0):
+        self.lf_mgr = lf_mgr
+        self.lf_port = lf_port
+        self.ttl_sec = ttl_sec
+        self.session = requests.Session()
+        if lf_user is not None and lf_passwd is not None:
+            self.session.auth = (lf_user, lf_passwd)
+        self.session.headers.update({'Accept': 'application/json'})
+        # url -> (fetch time, lf_cached_response)
+        self.responses = {}
+        # table -> {eid: record}
+        self.tables = {}
+        # table -> {eid: {column: fetch time}}
+        self.column_times = {}
+        # table -> {shelf.resource.alias or listed name: eid}
+        self.aliases = {}
+        self.hits = 0
+        self.misses = 0
+
+    def is_fresh(self, fetch_time, now=None):
+        if self.ttl_sec <= 0 or fetch_time is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        return (now - fetch_time) < self.ttl_sec
+
+    @staticmethod
+    def table_of(request_command):
+        path = urllib.parse.urlsplit(request_command).path.strip('/')
+        return path.split('/')[0] if path else ''
+
+    @staticmethod
+    def record_eid(name, record):
+        """
+        Pick the EID of a record: prefer the eid / entity id columns, then the
+        _links path (/port/1/1/3 -> 1.1.3), then the name the record is listed under.
+        """
+        for column in ('eid', 'entity id'):
+            if record.get(column):
+                return str(record[column])
+        links = record.get('_links')
+        if links:
+            hunks = links.strip('/').split('/')
+            if len(hunks) > 1:
+                return '.'.join(hunks[1:])
+        return name
+
+    @staticmethod
+    def normalize_eid(eid):
+        """
+        1.1.wlan3, 1.wlan3 and wlan3 -> 1.1.wlan3; numeric EIDs like 1.1.3 are kept.
+        """
+        try:
+            shelf, resource, name = LFUtils.name_to_eid(str(eid))[:3]
+        except ValueError:
+            return eid
+        return "{shelf}.{resource}.{name}".format(shelf=shelf, resource=resource, name=name)
+
+    @staticmethod
+    def record_aliases(eid, name, record):
+        """
+        Other names a record may be asked for by: the name it is listed under and
+        shelf.resource.alias built from the alias (or name) column and the EID.
+        """
+        aliases = []
+        if name and name != eid:
+            aliases.append(str(name))
+        alias = record.get('alias') or record.get('name')
+        hunks = str(eid).split('.')
+        if alias:
+            aliases.append(str(alias))
+            if len(hunks) >= 2 and hunks[0].isnumeric() and hunks[1].isnumeric():
+                aliases.append('{shelf}.{resource}.{alias}'.format(shelf=hunks[0], resource=hunks[1], alias=alias))
+        return aliases
+
+    def resolve(self, table, eid):
+        """
+        :return: the EID a record of table is stored under for eid, or eid when unknown
+        """
+        if eid in self.tables.get(table, {}):
+            return eid
+        aliases = self.aliases.get(table, {})
+        if eid in aliases:
+            return aliases[eid]
+        return aliases.get(self.normalize_eid(eid), eid)
+
+    def invalidate(self, table=None):
+        if table is None:
+            self.responses.clear()
+            self.tables.clear()
+            self.column_times.clear()
+            self.aliases.clear()
+            return
+        self.tables.pop(table, None)
+        self.column_times.pop(table, None)
+        self.aliases.pop(table, None)
+        for url in [url for url in self.responses if self.table_of(url) == table]:
+            del self.responses[url]
+
+    def index_response(self, table, lanforge_json, now=None):
+        """
+        Merge the records of a response into self.tables[table].
+        Handles both the list form [{name: record}, ...] and the single record form.
+        """
+        if not isinstance(lanforge_json, dict):
+            return
+        if now is None:
+            now = time.monotonic()
+        eid_map = self.tables.setdefault(table, {})
+        time_map = self.column_times.setdefault(table, {})
+        alias_map = self.aliases.setdefault(table, {})
+        for key, value in lanforge_json.items():
+            if key in self.NON_TABLE_KEYS:
+                continue
+            entries = []
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict) and len(item) == 1:
+                        name, record = next(iter(item.items()))
+                        if isinstance(record, dict):
+                            entries.append((name, record))
+            elif isinstance(value, dict):
+                # a single record, unless it is a map of name -> record
+                if value and all(isinstance(v, dict) for v in value.values()):
+                    entries.extend(value.items())
+                else:
+                    # listed under the response member (interface, endpoint ...), not a name
+                    entries.append((None, value))
+            for name, record in entries:
+                eid = self.record_eid(name, record)
+                eid_map.setdefault(eid, {}).update(record)
+                for alias in self.record_aliases(eid, name, eid_map[eid]):
+                    alias_map[alias] = eid
+                column_map = time_map.setdefault(eid, {})
+                for column in record:
+                    column_map[column] = now
+
+    def get(self, request_command):
+        """
+        GET a URL, answering from the cache when the same URL was fetched within ttl_sec.
+        :return: requests.Response or lf_cached_response
+        """
+        now = time.monotonic()
+        cached = self.responses.get(request_command)
+        if cached is not None and self.is_fresh(cached[0], now):
+            self.hits += 1
+            logger.debug("cache hit: {url}".format(url=request_command))
+            return cached[1]
+        self.misses += 1
+        response = self.session.get(request_command)
+        if self.ttl_sec <= 0 or response.status_code != 200:
+            return response
+        try:
+            lanforge_json = response.json()
+        except ValueError:
+            return response
+        self.index_response(self.table_of(request_command), lanforge_json, now)
+        self.responses[request_command] = (now, lf_cached_response(status_code=response.status_code,
+                                                                   text=response.text,
+                                                                   json_data=lanforge_json))
+        return response
+
+    def get_fields(self, table, eid_list=None, fields=None):
+        """
+        Return {eid: {column: value}} for the requested columns, only querying the
+        GUI for the columns that are missing or stale for any of the requested EIDs.
+        :param table: port, stations, endp, layer4, generic ...
+        :param eid_list: list of EIDs like 1.1.sta0000 or 1.1.3, None or 'all' for the whole table
+        :param fields: list of column names
+        :return: dict keyed by the EIDs as given in eid_list, numeric EIDs for the whole table
+        """
+        if not fields:
+            raise ValueError("get_fields requires a list of fields")
+        now = time.monotonic()
+        if eid_list in (None, 'all'):
+            eid_list = None
+        time_map = self.column_times.get(table, {})
+        if eid_list is not None:
+            check_eids = [self.resolve(table, eid) for eid in eid_list]
+        else:
+            check_eids = list(time_map.keys())
+        if not check_eids:
+            stale = list(fields)
+        else:
+            stale = [field for field in fields
+                     if any(not self.is_fresh(time_map.get(eid, {}).get(field), now) for eid in check_eids)]
+        if stale:
+            self.refresh(table, eid_list=eid_list, fields=stale)
+        else:
+            self.hits += 1
+        eid_map = self.tables.get(table, {})
+        wanted = eid_list if eid_list is not None else list(eid_map.keys())
+        result = {}
+        for eid in wanted:
+            record = eid_map.get(self.resolve(table, eid))
+            if record is None:
+                continue
+            result[eid] = {field: record.get(field) for field in fields}
+        return result
+
+    def refresh(self, table, eid_list=None, fields=None):
+        """
+        Query only the given columns of a table and merge them into the index.
+        """
+        if eid_list:
+            target = ','.join(eid_list)
+        else:
+            target = 'all'
+        request_command = 'http://{lfmgr}:{lfport}/{table}/{target}'.format(
+            lfmgr=self.lf_mgr, lfport=self.lf_port, table=table, target=target)
+        if fields:
+            # the eid column keys the records, alias / name finds them by name
+            columns = list(fields)
+            for column in ('eid', 'alias' if table == 'port' else 'name'):
+                if column not in columns:
+                    columns.append(column)
+            request_command += '?fields=' + ','.join(urllib.parse.quote_plus(f) for f in columns)
+        self.misses += 1
+        logger.debug("cache refresh: {url}".format(url=request_command))
+        response = self.session.get(request_command)
+        if response.status_code != 200:
+            logger.warning("{url} returned status {status}".format(url=request_command, status=response.status_code))
+            return None
+        lanforge_json = response.json()
+        self.index_response(table, lanforge_json)
+        return lanforge_json
+
+
 class lf_json_api():
     def __init__(self,
                  lf_mgr='localhost',
@@ -64,7 +336,8 @@ class lf_json_api():
                  lf_passwd='lanforge',
                  port=None,
                  endpoint=None,
-                 csv_mode='write'):
+                 csv_mode='write',
+                 cache_ttl=0):
 
         self.lf_mgr = lf_mgr
         self.lf_port = lf_port
@@ -88,6 +361,12 @@ class lf_json_api():
         self.csv_mode = csv_mode
         # convert write to w and append to a
         self.update_csv_mode()
+        # get_request_* calls are answered from here within cache_ttl seconds
+        self.cache = lf_json_cache(lf_mgr=self.lf_mgr,
+                                   lf_port=self.lf_port,
+                                   lf_user=self.lf_user,
+                                   lf_passwd=self.lf_passwd,
+                                   ttl_sec=cache_ttl)
 
 
     """ Reporting, json, and general use functions: """
@@ -145,9 +424,7 @@ class lf_json_api():
         # where --user "USERNAME:PASSWORD"
         request_command = 'http://{lfmgr}:{lfport}/{request}/1/{resource}/{port_name}'.format(
             lfmgr=self.lf_mgr, lfport=self.lf_port, request=self.request, resource=self.resource, port_name=self.port_name)
-        request = requests.get(
-            request_command, auth=(
-                self.lf_user, self.lf_passwd))
+        request = self.cache.get(request_command)
         logger.info(
             "{request} request command: {request_command}".format(request=self.request,
                                                                   request_command=request_command))
@@ -207,9 +484,7 @@ class lf_json_api():
             lfmgr=self.lf_mgr, lfport=self.lf_port, request=self.request, mac=self.mac)
         #    lfmgr=self.lf_mgr, lfport=self.lf_port,request=self.request, resource=self.resource, port_name=self.port_name, mac=self.mac)
         logger.debug("request_command: {request_command}".format(request_command=request_command))
-        request = requests.get(
-            request_command, auth=(
-                self.lf_user, self.lf_passwd))
+        request = self.cache.get(request_command)
 
         logger.info("equivalent curl command: curl --user \"lanforge:lanforge\" -H 'Accept: application/json' http://{lf_mgr}:{lf_port}/{request}/{shelf}/{resource}/{port_name}/{mac} | json_pp  ".format(
             lf_mgr=self.lf_mgr, lf_port=self.lf_port, request=self.request, shelf=self.shelf, resource=self.resource, port_name=self.port_name, mac=self.mac
@@ -263,9 +538,7 @@ class lf_json_api():
             lfmgr=self.lf_mgr, lfport=self.lf_port, request=self.request)
         #    lfmgr=self.lf_mgr, lfport=self.lf_port,request=self.request, resource=self.resource, port_name=self.port_name, mac=self.mac)
         logger.debug("request_command: {request_command}".format(request_command=request_command))
-        request = requests.get(
-            request_command, auth=(
-                self.lf_user, self.lf_passwd))
+        request = self.cache.get(request_command)
 
         logger.info("equivalent curl command: curl --user \"lanforge:lanforge\" -H 'Accept: application/json' http://{lf_mgr}:{lf_port}/{request}/all | json_pp  ".format(
             lf_mgr=self.lf_mgr, lf_port=self.lf_port, request=self.request))
@@ -339,9 +612,7 @@ class lf_json_api():
         # "USERNAME:PASSWORD"
         request_command = 'http://{lfmgr}:{lfport}/port/1/{resource}/{port_name}'.format(
             lfmgr=self.lf_mgr, lfport=self.lf_port, resource=self.resource, port_name=self.port_name)
-        request = requests.get(
-            request_command, auth=(
-                self.lf_user, self.lf_passwd))
+        request = self.cache.get(request_command)
         logger.info(
             "port request command: {request_command}".format(
                 request_command=request_command))
@@ -397,9 +668,7 @@ class lf_json_api():
         # "USERNAME:PASSWORD"
         request_command = 'http://{lfmgr}:{lfport}/wifi-stats/1/{resource}/{port_name}'.format(
             lfmgr=self.lf_mgr, lfport=self.lf_port, resource=self.resource, port_name=self.port_name)
-        request = requests.get(
-            request_command, auth=(
-                self.lf_user, self.lf_passwd))
+        request = self.cache.get(request_command)
 
         logger.info(
             "wifi-stats request command: {request_command}".format(
@@ -448,8 +717,7 @@ class lf_json_api():
         # http://192.168.100.116:8080/radiostatus/all | json_pp  , where --user
         # "USERNAME:PASSWORD"
         request_command = 'http://{lfmgr}:{port}/radiostatus/all'.format(lfmgr=self.lf_mgr, port=self.lf_port)
-        request = requests.get(
-            request_command, auth=(self.lf_user, self.lf_passwd))
+        request = self.cache.get(request_command)
         logger.info("radio request command: {request_command}".format(request_command=request_command))
         logger.info("radio request status_code {status}".format(status=request.status_code))
         logger.info("equivalent curl command: curl --user \"lanforge:lanforge\" -H 'Accept: application/json' http://{lf_mgr}:{lf_port}/radiostatus/all | json_pp \n\n ".format(
@@ -528,9 +796,7 @@ class lf_json_api():
         # "USERNAME:PASSWORD"
         request_command = 'http://{lfmgr}:{lfport}/layer4/{endpoint_name}'.format(
             lfmgr=self.lf_mgr, lfport=self.lf_port, endpoint_name=self.endpoint)
-        request = requests.get(
-            request_command, auth=(
-                self.lf_user, self.lf_passwd))
+        request = self.cache.get(request_command)
 
         logger.info(
             "layer4 request command: {request_command}".format(
@@ -592,7 +858,7 @@ class lf_json_api():
         request_command = 'http://{lfmgr}:{lfport}/{request}/{endpoint_name}?fields={fields}'.format(
             lfmgr=self.lf_mgr, lfport=self.lf_port, request=self.request, endpoint_name=self.endpoint_name, fields=fields)
         logger.debug("request_command: {request_command}".format(request_command=request_command))
-        request = requests.get(request_command, auth=(self.lf_user, self.lf_passwd))
+        request = self.cache.get(request_command)
 
         logger.info("{request} request command: {request_command}".format(request=self.request, request_command=request_command))
         logger.info("{request} request status_code {status}".format(request=self.request, status=request.status_code))
@@ -639,9 +905,7 @@ class lf_json_api():
         # where --user "USERNAME:PASSWORD"
         request_command = 'http://{lfmgr}:{lfport}/adb/1/{resource}/{port_name}'.format(
             lfmgr=self.lf_mgr, lfport=self.lf_port, request=self.request, resource=self.resource, port_name=self.port_name)
-        request = requests.get(
-            request_command, auth=(
-                self.lf_user, self.lf_passwd))
+        request = self.cache.get(request_command)
         logger.info(
             "{request} request command: {request_command}".format(request=self.request,
                                                                   request_command=request_command))
@@ -717,6 +981,7 @@ def main():
     parser.add_argument("--post_requests", type=str, help="perform set request may be a list:  nss , in development")
     parser.add_argument("--nss", type=str, help="--nss 4  set the number of spatial streams for a speific antenna ")
     parser.add_argument("--csv_mode", type=str, help="--csv_mode 'write' or 'append' default: write", choices=['append', 'write'], default='write')
+    parser.add_argument("--cache_ttl", type=float, help="--cache_ttl <seconds> answer repeated get requests from cache for this long, default: 0 (no caching)", default=0)
     parser.add_argument('--help_summary', action="store_true", help='Show summary of what this script does')
 
 
@@ -747,7 +1012,8 @@ This script will is an example of using LANforge JSON API to use GET Requests to
                           args.lf_passwd,
                           args.port,
                           args.endpoint,
-                          args.csv_mode)
+                          args.csv_mode,
+                          args.cache_ttl)
 
     if args.get_requests:
         get_requests = args.get_requests.split()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+NAME: lf_reconcile.py
+
+PURPOSE: Bring stations and layer-3 cross connects to a desired state described in a json file,
+         sending only the commands for what differs from one /port/all, /cx/all and /endp/all snapshot
+         (see py-json/reconcile.py).  Running it again with the same spec sends nothing.
+
+EXAMPLE:
+        # show what would change
+            ./lf_reconcile.py --mgr localhost --spec testbed.json --dry_run
+
+        # apply, and record the snapshot it was planned against
+            ./lf_reconcile.py --mgr localhost --spec testbed.json --save_snapshot /tmp/testbed_snapshot.json
+
+        # plan against a recorded snapshot, no LANforge system needed
+            ./lf_reconcile.py --spec testbed.json --snapshot /tmp/testbed_snapshot.json
+
+        The spec:
+            {
+              "station_prefixes": ["sta"],
+              "cx_prefixes": ["udp-"],
+              "stations": [{"radio": "1.1.wiphy0", "names": ["sta0000", "sta0001"],
+                            "ssid": "lanforge", "security": "wpa2", "password": "lanforge", "up": true}],
+              "cxs": [{"name": "udp-sta0000", "endp_type": "lf_udp", "side_a": "1.1.sta0000", "side_b": "1.1.eth1",
+                       "min_bps_a": 56000, "min_bps_b": 56000}]
+            }
+
+SCRIPT_CLASSIFICATION:  Creation
+
+SCRIPT_CATEGORIES:   Functional
+
+NOTES:
+        Station security is not listed by the GUI, use --refresh to send it (and the endpoint
+        settings) again for stations and cross connects that already exist.
+
+COPYRIGHT:
+    Copyright 2024 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+"""
+import argparse
+import importlib
+import json
+import logging
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+realm = importlib.import_module("py-json.realm")
+Realm = realm.Realm
+reconcile = importlib.import_module("py-json.reconcile")
+lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
+
+logger = logging.getLogger(__name__)
+
+
+def load_spec(path=None):
+    """
+    :return: (list of StationSpec, list of CXSpec, station prefixes, cx prefixes)
+    """
+    with open(path) as spec_file:
+        spec = json.load(spec_file)
+    stations = []
+    for group in spec.get("stations", []):
+        group = dict(group)
+        radio = group.pop("radio")
+        for name in group.pop("names", []):
+            shelf, resource = reconcile.LFUtils.name_to_eid(radio)[:2]
+            port = reconcile.LFUtils.name_to_eid(name)[2]
+            stations.append(reconcile.StationSpec(eid="%s.%s.%s" % (shelf, resource, port), radio=radio, **group))
+    cxs = [reconcile.CXSpec(**cx) for cx in spec.get("cxs", [])]
+    return stations, cxs, spec.get("station_prefixes"), spec.get("cx_prefixes")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lf_reconcile.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='''
+Create, modify and delete stations and layer-3 cross connects so they match a json spec,
+sending only the commands needed.
+''')
+    parser.add_argument('--mgr', help='LANforge GUI host', default='localhost')
+    parser.add_argument('--mgr_port', help='LANforge GUI port', type=int, default=8080)
+    parser.add_argument('--spec', help='json file with the desired stations and cross connects', required=True)
+    parser.add_argument('--snapshot', help='plan against this recorded snapshot instead of the GUI', default=None)
+    parser.add_argument('--save_snapshot', help='write the snapshot planned against to this file', default=None)
+    parser.add_argument('--dry_run', help='only show the plan', action='store_true')
+    parser.add_argument('--refresh', help='send security and rates again for existing stations and cxs',
+                        action='store_true')
+    parser.add_argument('--no_delete', help='do not delete stations and cxs missing from the spec',
+                        action='store_true')
+    parser.add_argument('--timeout', help='seconds to wait for new ports and cross connects', type=int, default=300)
+    parser.add_argument('--debug', help='show each planned action', action='store_true')
+    parser.add_argument('--log_level', help='debug | info | warning | error', default='info')
+    parser.add_argument('--lf_logger_config_json', help='--lf_logger_config_json <json file> , json configuration of logger')
+    args = parser.parse_args()
+
+    logger_config = lf_logger_config.lf_logger_config()
+    logger_config.set_level(level=args.log_level)
+    logger_config.set_json(json_file=args.lf_logger_config_json)
+
+    stations, cxs, station_prefixes, cx_prefixes = load_spec(args.spec)
+    local_realm = None
+    if not args.snapshot:
+        local_realm = Realm(lfclient_host=args.mgr, lfclient_port=args.mgr_port, debug_=args.debug)
+    reconciler = reconcile.Reconciler(local_realm=local_realm,
+                                      stations=stations,
+                                      cxs=cxs,
+                                      station_prefixes=station_prefixes,
+                                      cx_prefixes=cx_prefixes,
+                                      delete_extra=not args.no_delete,
+                                      refresh=args.refresh,
+                                      debug=args.debug)
+    if args.snapshot:
+        reconciler.load_snapshot(args.snapshot)
+    else:
+        reconciler.snapshot()
+    if args.save_snapshot:
+        reconciler.save_snapshot(args.save_snapshot)
+
+    actions = reconciler.plan()
+    for action in actions:
+        print("%-10s %-7s %-24s %s" % (action.op, action.kind, action.name, action.reason))
+    print(", ".join("%s: %s" % item for item in reconciler.summary(actions).items()))
+    if args.snapshot or args.dry_run or not actions:
+        return
+    if not reconciler.apply(actions, timeout=args.timeout):
+        logger.error("reconcile did not complete")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
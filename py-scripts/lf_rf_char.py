@@ -66,6 +66,7 @@ lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
 
 realm = importlib.import_module("py-json.realm")
 Realm = realm.Realm
+event_tailer = importlib.import_module("py-json.event_tailer")
 
 
 logger = logging.getLogger(__name__)
@@ -141,6 +142,7 @@ class RfCharTest(Realm):
         self.gen_endpoint = ''
         self.cx_state = ''
         self.bookmark_event_id : int = 0
+        self.event_tailer = None
 
         # create api_json
         self.json_vap_api = lf_json_api.lf_json_api(lf_mgr=self.lf_mgr,
@@ -244,21 +246,12 @@ class RfCharTest(Realm):
         Assumes have bookmarked last event by calling `bookmark_events()`
         before calling this function.
         """
-        events_rec = self.json_get("/events/since/%d" % self.bookmark_event_id, debug_=self.debug)
-        if not events_rec:
-            return None
-        noun = 'events'
-        if noun not in events_rec:
-            noun = 'event'
-        if noun not in events_rec:
-            return None
-        dhcp_events = []
-
-        for event_entry in events_rec[noun]:
-            event = event_entry[next(iter(event_entry))]
-            # pprint(event)
-            if event['event description'].startswith("DHCPACK on"):
-                dhcp_events.append(event)
+        # the tailer only fetches the events logged since the previous lookup
+        if self.event_tailer is None:
+            self.event_tailer = self.new_event_tailer(start_id=self.bookmark_event_id)
+        self.event_tailer.tail()
+        dhcp_events = [event_tailer.as_gui_record(event)
+                       for event in self.event_tailer.query(description_prefix="DHCPACK on")]
 
         # pprint(["events", dhcp_events])
         return dhcp_events
@@ -545,6 +538,7 @@ class RfCharTest(Realm):
             if noun in events_rec:
                 # pprint(events_rec[noun])
                 self.bookmark_event_id = int(events_rec[noun]["id"])
+        self.event_tailer = self.new_event_tailer(start_id=self.bookmark_event_id)
 
 
 
@@ -8,13 +8,18 @@ PURPOSE: Module to Process the data that was measured during  lf_rssi_check.py ,
             TODO this graphing protion may be moved to graph.py
 
 EXAMPLE:
+    ./lf_rssi_process.py --csv sta0000.csv --csv sta0001.csv --png_dir ./pngs --channels "6 36" --bandwidths "20 40" --antennas "0 4"
+
+    # vectorized analysis of all attenuation steps, channels and chains, figures rendered by 4 processes
+    ./lf_rssi_process.py --csv sta0000.csv --csv sta0001.csv --png_dir ./pngs --channels "6 36" --vectorized --png_workers 4
 
 '''
 
 import matplotlib.pyplot as plt
 import numpy as np
-import csv
+import pandas as pd
 import argparse
+import concurrent.futures
 import os
 import sys
 import importlib
@@ -26,6 +31,7 @@ sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 logger = logging.getLogger(__name__)
 
 lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
+lf_csv_loader = importlib.import_module("py-scripts.lf_csv_loader")
 
 
 
@@ -36,14 +42,95 @@ lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
 # 3: Radio disconnected before exit threshold expected RSSI; PNG will still be generated
 # 4: Attempted Bandwidth HT80 used with Channel 6
 
+RSSI_COLORS = {
+    'red': '#dc322f',
+    'orange': '#cb4b16',
+    'yellow': '#b58900',
+    'green': '#859900',
+    'blue': '#268bd2',
+    'violet': '#6c71c4',
+    'magenta': '#d33682',
+    'cyan': '#2aa198',
+    'black': '#002b36',
+    'gray': '#839496',
+    'dark_gray': '#073642'
+}
+RSSI_COLOR_ORDER = ['red', 'orange', 'yellow', 'green', 'blue', 'violet', 'magenta', 'cyan', 'black', 'gray', 'dark_gray']
+
+
+def use_agg_backend():
+    """
+    Worker initializer: render without a display, leaving the backend of the calling process alone.
+    """
+    plt.switch_backend('Agg')
+
+
+def render_rssi_figures(figure):
+    """
+    Draw the signal and signal deviation PNGs for one channel/bandwidth/antenna.
+    Module level so that it can run in a worker process.
+    :param figure: dict built by lf_rssi_process.rssi_figure_specs()
+    :return: list of png files written
+    """
+    png_files = []
+    plt.rc('font', family='Liberation Serif')
+    plt.style.use('dark_background')
+    for kind in ('signal', 'deviation'):
+        fig = plt.figure(figsize=(8, 8), dpi=100)
+        ax = fig.add_axes([0.1, 0.1, 0.8, 0.8])
+        if kind == 'signal':
+            ax.plot(figure['expected_atten'], figure['expected'], color=RSSI_COLORS['gray'], alpha=1.0, label='Expected')
+        for j, series in enumerate(figure['series']):
+            color = RSSI_COLORS[RSSI_COLOR_ORDER[j % len(RSSI_COLOR_ORDER)]]
+            ax.plot(series['atten'], series[kind], color=color, alpha=1.0, label=series['label'])
+        if kind == 'signal':
+            ax.set_title('Attenuation vs. Signal:\n'
+                         + F"VAP={figure['ssid']}, "
+                         + F"Channel={figure['channel']}, "
+                         + F"Bandwidth={figure['bandwidth']}, "
+                         + F"Antenna={figure['antenna_name']}")
+            ax.set_yticks(range(-5, -110, -5))
+            png_file = F"{figure['png_dir']}/{figure['channel']}_{figure['bandwidth']}_{figure['antenna_name']}_signal_atten.png"
+        else:
+            ax.set_title('Atteunuation vs. Signal Deviation:\n'
+                         + F"SSID={figure['ssid']}, "
+                         + F"Channel={figure['channel']}, "
+                         + F"Bandwidth={figure['bandwidth']}, "
+                         + F"Antenna={figure['antenna_name']}")
+            ax.set_yticks(range(-50, 0, 5))
+            png_file = F"{figure['png_dir']}/{figure['channel']}_{figure['bandwidth']}_{figure['antenna_name']}_signal_deviation_atten.png"
+        ax.set_xlabel('Attenuation (dB)')
+        ax.set_ylabel('RSSI (dBm)')
+        ax.set_xticks(range(20, 100, 5))
+        ax.grid(color=RSSI_COLORS['dark_gray'], linestyle='-', linewidth=1)
+        ax.legend()
+        fig.savefig(png_file)
+        plt.close(fig)
+        png_files.append(png_file)
+    return png_files
+
+
 class lf_rssi_process:
+    # column positions in the lf_rssi_check.py per-port csv
+    COL_ATTEN = 11
+    COL_RSSI = 17
+    COL_SSID = 19
+    COL_CHAIN_RSSI = 21
+    COL_RADIO = 24
+    COL_RADIO_MODEL = 25
+    COL_CHANNEL = 27
+    COL_BANDWIDTH = 29
+    COL_ANTENNA = 30
+
     def __init__(self,
                 csv_file_list='NA',
                 png_dir='NA',
                 bandwidths_list='NA',
                 channel_list='NA',
                 antenna_list=0,
-                pathloss_list='NA'
+                pathloss_list='NA',
+                rssi_tolerance=10.0,
+                png_workers=None
                 ):
         self.csv_file_list = csv_file_list
         self.num_station_csv = len(self.csv_file_list)
@@ -73,6 +160,12 @@ class lf_rssi_process:
         self.atten_data = [[], [], [], [], [], [], []]
         self.signal_data = [[], [], [], [], [], [], []]
 
+        # measured RSSI within this many dB of expected is a pass
+        self.rssi_tolerance = float(rssi_tolerance)
+        self.png_workers = png_workers
+        # vectorized path: one typed frame for every csv, see read_all_csv_frames()
+        self.rssi_df = None
+
         self.ANTENNA_LEGEND = {
             '0': 'Diversity_All',
             '1': 'Fixed-A_1x1',
@@ -139,14 +232,155 @@ class lf_rssi_process:
                 logger.error("File not found {csv_file}".format(csv_file=csv_file))
                 sys.exit(2)
             # TODO There will be multiple lists.
-            with open(csv_file, 'r') as filename:
-                reader = csv.reader(filename)
-                for row in reader:
-                    self.csv_data[csv_file_index].append(row)
+            # rows are kept as text, the same as csv.reader would return them
+            self.csv_data[csv_file_index].extend(lf_csv_loader.lf_csv_loader(csv_file=csv_file, dtype=str).as_rows())
 
             csv_file_index += 1                    
 
 
+    # Vectorized path
+    # read_all_csv_frames() loads every csv into one typed frame, analyze_rssi() computes
+    # expected signal, deviation and pass/fail for every row and chain at once and
+    # create_png_files_parallel() renders each channel/bandwidth/antenna figure in its own process.
+
+    def read_all_csv_frames(self):
+        frames = []
+        for csv_index, csv_file in enumerate(self.csv_file_list):
+            if not os.path.exists(csv_file):
+                logger.error("File not found {csv_file}".format(csv_file=csv_file))
+                sys.exit(2)
+            raw = lf_csv_loader.lf_csv_loader(csv_file=csv_file, dtype=str).load()
+            if raw.empty:
+                continue
+            frame = pd.DataFrame({
+                'csv_index': csv_index,
+                # attenuation is in 1/10 dB
+                'atten': pd.to_numeric(raw.iloc[:, self.COL_ATTEN], errors='coerce') / 10,
+                'rssi': pd.to_numeric(raw.iloc[:, self.COL_RSSI].str.replace(' dBm', '', regex=False), errors='coerce'),
+                'ssid': raw.iloc[:, self.COL_SSID],
+                'station': raw.iloc[:, self.COL_RADIO],
+                'radio': raw.iloc[:, self.COL_RADIO_MODEL],
+                'channel': raw.iloc[:, self.COL_CHANNEL],
+                'bandwidth': raw.iloc[:, self.COL_BANDWIDTH],
+                'antenna': raw.iloc[:, self.COL_ANTENNA],
+            })
+            # chain rssi is reported like "-40,-42,-41"
+            chains = raw.iloc[:, self.COL_CHAIN_RSSI].str.replace(' dBm', '', regex=False).str.replace(r'[,\s]+', ',', regex=True).str.split(',', expand=True)
+            for chain in chains.columns:
+                frame['chain_{n}'.format(n=chain)] = pd.to_numeric(chains[chain], errors='coerce')
+            frames.append(frame)
+        if len(frames) == 0:
+            self.rssi_df = pd.DataFrame(columns=['csv_index', 'atten', 'rssi', 'ssid', 'station', 'radio', 'channel', 'bandwidth', 'antenna'])
+        else:
+            self.rssi_df = pd.concat(frames, ignore_index=True)
+        # an RSSI of 0 means the station was not connected
+        self.rssi_df.loc[self.rssi_df['rssi'] == 0, 'rssi'] = np.nan
+        return self.rssi_df
+
+    def path_loss_array(self, channel):
+        channel = pd.to_numeric(channel, errors='coerce').to_numpy(dtype=float)
+        path_loss = np.full(channel.shape, 36.0)
+        path_loss[channel <= 11] = float(self.pathloss_list[0])
+        path_loss[(channel >= 34) & (channel <= 177)] = float(self.pathloss_list[1])
+        return path_loss
+
+    def analyze_rssi(self):
+        """
+        Add expected signal, deviation, and pass/fail columns to self.rssi_df for every
+        attenuation step, channel and chain.
+        rssi_checked: expected signal is above EXIT_THRESHOLD so the row is judged
+        rssi_pass: measured RSSI is within rssi_tolerance of expected
+        rssi_disconnected: no RSSI while expected signal is above EXIT_THRESHOLD
+        :return: summary DataFrame per channel, bandwidth, antenna and station
+        """
+        if self.rssi_df is None:
+            self.read_all_csv_frames()
+        df = self.rssi_df
+        df['expected'] = self.TX_POWER - (self.path_loss_array(df['channel']) + df['atten'].to_numpy(dtype=float))
+        df['deviation'] = df['rssi'] - df['expected']
+        df['rssi_checked'] = df['expected'] > self.EXIT_THRESHOLD
+        measured = df['rssi'].notna()
+        df['rssi_disconnected'] = df['rssi_checked'] & ~measured
+        df['rssi_pass'] = df['rssi_checked'] & measured & (df['deviation'].abs() <= self.rssi_tolerance)
+        for chain in [col for col in df.columns if col.startswith('chain_') and not col.endswith(('_deviation', '_pass'))]:
+            df[chain + '_deviation'] = df[chain] - df['expected']
+            df[chain + '_pass'] = df['rssi_checked'] & df[chain].notna() & (df[chain + '_deviation'].abs() <= self.rssi_tolerance)
+
+        checked = df[df['rssi_checked']]
+        summary = checked.groupby(['channel', 'bandwidth', 'antenna', 'station'], sort=True).agg(
+            samples=('rssi_checked', 'size'),
+            passed=('rssi_pass', 'sum'),
+            disconnected=('rssi_disconnected', 'sum'),
+            mean_deviation=('deviation', 'mean'),
+            max_abs_deviation=('deviation', lambda d: d.abs().max()))
+        summary['failed'] = summary['samples'] - summary['passed']
+        return summary.reset_index()
+
+    def rssi_figure_specs(self):
+        """
+        :return: list of dicts, one per requested channel/bandwidth/antenna with data, for render_rssi_figures()
+        """
+        df = self.rssi_df
+        figures = []
+        for channel in self.channel_list:
+            for bandwidth in self.bandwidths_list:
+                for antenna in self.antenna_list:
+                    selected = df[(df['channel'] == channel) & (df['bandwidth'] == bandwidth) & (df['antenna'] == antenna)]
+                    if selected.empty:
+                        logger.info("no data for channel {ch} bandwidth {bw} antenna {at}".format(ch=channel, bw=bandwidth, at=antenna))
+                        continue
+                    series = []
+                    for csv_index, station in selected.groupby('csv_index', sort=True):
+                        series.append({
+                            'label': '{station} {radio}'.format(station=station['station'].iloc[0], radio=station['radio'].iloc[0]),
+                            'atten': station['atten'].to_numpy(),
+                            'signal': station['rssi'].to_numpy(),
+                            'deviation': station['deviation'].to_numpy()})
+                    expected = selected.drop_duplicates('atten').sort_values('atten')
+                    figures.append({
+                        'png_dir': self.PNG_OUTPUT_DIR,
+                        'channel': channel,
+                        'bandwidth': bandwidth,
+                        'antenna_name': self.ANTENNA_LEGEND[antenna],
+                        'ssid': selected['ssid'].iloc[0],
+                        'expected_atten': expected['atten'].to_numpy(),
+                        'expected': expected['expected'].to_numpy(),
+                        'series': series})
+        return figures
+
+    def create_png_files_parallel(self):
+        """
+        Render every figure, one process per figure up to png_workers.
+        :return: list of png files written
+        """
+        figures = self.rssi_figure_specs()
+        png_files = []
+        if len(figures) == 0:
+            return png_files
+        if self.png_workers == 1 or len(figures) == 1:
+            for figure in figures:
+                png_files.extend(render_rssi_figures(figure))
+            return png_files
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.png_workers,
+                                                    initializer=use_agg_backend) as executor:
+            for written in executor.map(render_rssi_figures, figures):
+                png_files.extend(written)
+        return png_files
+
+    def process_vectorized(self):
+        """
+        Load, analyze and graph every csv; the pass/fail summary is written to <png_dir>/rssi_pass_fail.csv
+        :return: summary DataFrame
+        """
+        self.read_all_csv_frames()
+        summary = self.analyze_rssi()
+        summary_file = os.path.join(self.PNG_OUTPUT_DIR, 'rssi_pass_fail.csv')
+        summary.to_csv(summary_file, index=False)
+        logger.info("rssi pass/fail summary: {summary_file}".format(summary_file=summary_file))
+        for png_file in self.create_png_files_parallel():
+            logger.debug(png_file)
+        return summary
+
     # Read in the data this probably should be generic
     # TODO remove not used
     def read_csv_file(self, csv_file,index):
@@ -157,10 +391,7 @@ class lf_rssi_process:
             logger.error("File not found {csv_file}".format(csv_file=self.CSV_FILE))
             sys.exit(2)
         # TODO There will be multiple lists.
-        with open(self.CSV_FILE, 'r') as filename:
-            reader = csv.reader(filename)
-            for row in reader:
-                self.csv_data[index].append(row)
+        self.csv_data[index].extend(lf_csv_loader.lf_csv_loader(csv_file=self.CSV_FILE, dtype=str).as_rows())
 
     def populate_signal_and_attenuation_data_create_png(self):
         # Each station has its own csv file 
@@ -386,6 +617,9 @@ def main():
                                 default is 0
                         ''', default= 0)
     parser.add_argument('--pathloss_list', help='list of path loss for 2g, 5g, 6g default: 26.74 31.87 0',default='26.74 31.87 0')
+    parser.add_argument('--vectorized', action="store_true", help='analyze all csv data at once and render the PNGs in parallel, writes rssi_pass_fail.csv')
+    parser.add_argument('--png_workers', type=int, help='--png_workers <n> number of processes rendering PNGs with --vectorized, default: cpu count', default=None)
+    parser.add_argument('--rssi_tolerance', type=float, help='--rssi_tolerance <dB> allowed deviation from expected RSSI for a pass, default: 10', default=10.0)
     parser.add_argument('--log_level', default=None, help='Set logging level: debug | info | warning | error | critical')
     # logging configuration
     parser.add_argument("--lf_logger_config_json", help="--lf_logger_config_json <json file> , json configuration of logger")
@@ -433,9 +667,13 @@ extract the data and graph
                                     channel_list = channel_list,
                                     antenna_list = antenna_list,
                                     pathloss_list = pathloss_list,
+                                    rssi_tolerance = args.rssi_tolerance,
+                                    png_workers = args.png_workers
                                     )
 
-
+    if args.vectorized:
+        rssi_process.process_vectorized()
+        return
 
     rssi_process.read_all_csv_files()
     # using the csv as a count 
@@ -144,7 +144,6 @@ import sys
 import os
 import importlib
 import itertools
-from pprint import pprint
 import argparse
 import time
 import datetime
@@ -1084,6 +1083,7 @@ class L3VariableTime(Realm):
         # self.local_realm = realm.Realm(lfclient_host=self.host, lfclient_port=self.port, debug_=debug_on)
         self.polling_interval_seconds = self.duration_time_to_seconds(polling_interval)
         self.cx_profile = self.new_l3_cx_profile()
+        self.l3_endp_stats = self.new_l3_endp_stats(fields=["name", "eid", "delay", "jitter", "rx rate", "rx bytes", "rx drop %"])
         self.multicast_profile = self.new_multicast_profile()
         self.multicast_profile.name_prefix = "MLT-"
         self.station_profiles = []
@@ -1155,41 +1155,19 @@ class L3VariableTime(Realm):
         self.cx_profile.side_b_max_pdu = self.side_b_max_pdu
 
     def __get_rx_values(self):
-        endp_list = self.json_get("endp?fields=name,eid,delay,jitter,rx+rate,rx+bytes,rx+drop+%25", debug_=False)
-        endp_rx_drop_map = {}
-        endp_rx_map = {}
-        our_endps = {}
-
-        endps = []
-        # total upload in bits per second across all stations
-        total_ul = 0
-        total_dl = 0
-
-        for e in self.multicast_profile.get_mc_names():
-            our_endps[e] = e
-        for e in self.cx_profile.created_endp.keys():
-            our_endps[e] = e
-        for endp_name in endp_list['endpoint']:
-            if endp_name != 'uri' and endp_name != 'handler':
-                for item, endp_value in endp_name.items():
-                    if item in our_endps:
-                        endps.append(endp_value)
-                        print("endpoint: ", item, " value:\n")
-                        pprint(endp_value)
-
-                        for value_name, value in endp_value.items():
-                            if value_name == 'rx bytes':
-                                endp_rx_map[item] = value
-                            if value_name == 'rx drop %':
-                                endp_rx_drop_map[item] = value
-                            if value_name == 'rx rate':
-                                # This hack breaks for mcast or if someone names endpoints weirdly.
-                                # print("item: ", item, " rx-bps: ", value_rx_bps)
-                                if item.endswith("-A"):
-                                    total_dl += int(value)
-                                else:
-                                    total_ul += int(value)
-
+        stats = self.l3_endp_stats
+        stats.register_multicast_profile(self.multicast_profile)
+        stats.register_cx_profile(self.cx_profile)
+        if not stats.poll():
+            return {}, {}, [], 0, 0
+
+        selected = stats.mask(owned_only=True)
+        # This hack breaks for mcast or if someone names endpoints weirdly.
+        dl = selected & stats.side_mask(stats.SIDE_A)
+        total_dl = stats.total('rx rate', dl)
+        total_ul = stats.total('rx rate', selected & ~dl)
+
+        endp_rx_map, endp_rx_drop_map, endps = stats.rx_maps(selected, rx_key="rx bytes")
         # print("total-dl: ", total_dl, " total-ul: ", total_ul, "\n")
         return endp_rx_map, endp_rx_drop_map, endps, total_dl, total_ul
 
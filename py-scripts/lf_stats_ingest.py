@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# flake8: noqa
+'''
+NAME: lf_stats_ingest.py
+
+PURPOSE:
+Shared stats ingestion for the real application tests (youtube, zoom, real browser).
+The devices POST their stats to the test's web server.  Before, every request rebuilt the
+stats dicts and wrote the csv rows in the request handler.  Now the handler only appends
+the posted batch to a queue (collections.deque, append and popleft need no extra lock),
+and a background writer thread drains the queue every flush_interval seconds:
+
+    latest      dict of device -> last stats, the dict the test already serves for GET
+    buffers     per device columnar buffers, column -> list of values
+    csv rows    optional, row_fn(device, stats) -> row, written with one open per device
+                per flush through lf_stats_store
+
+A POST body is either one sample, {device: stats, ...}, or a batch, a list of those or
+{"batch": [...]}.  GET requests are answered from memory.
+
+Flask routes can be added to an existing app with add_flask_routes(); serve() runs a
+standalone stdlib http server with the same routes, used by the load test.
+
+EXAMPLE:
+    Load test, 200 simulated devices posting at 1 Hz for 30 seconds:
+    ./lf_stats_ingest.py --load_test --devices 200 --rate 1 --duration 30
+
+    Batched posts of 10 samples each:
+    ./lf_stats_ingest.py --load_test --devices 200 --rate 1 --duration 30 --batch 10
+
+COPYRIGHT:
+    Copyright 2024 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+'''
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import importlib
+import threading
+import collections
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit(1)
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+lf_stats_store = importlib.import_module("py-scripts.lf_stats_store")
+
+logger = logging.getLogger(__name__)
+
+
+class lf_stats_ingest:
+    def __init__(self,
+                 latest=None,
+                 csv_dir=None,
+                 csv_name="{device}.csv",
+                 headers=None,
+                 row_fn=None,
+                 flush_interval=0.5,
+                 max_samples=None):
+        """
+        :param latest: dict to keep the last stats per device in, default: a new dict
+        :param csv_dir: directory for per-device csv files, None to not write csv
+        :param csv_name: csv file name format, {device} is replaced by the device name
+        :param headers: csv column names
+        :param row_fn: callable(device, stats) -> list of csv values, required with csv_dir
+        :param flush_interval: seconds between writer passes
+        :param max_samples: keep at most this many samples per device in the columnar buffers
+        """
+        self.latest = latest if latest is not None else {}
+        self.csv_dir = csv_dir
+        self.csv_name = csv_name
+        self.headers = headers
+        self.row_fn = row_fn
+        self.flush_interval = flush_interval
+        self.max_samples = max_samples
+        self.stats_store = lf_stats_store.lf_stats_store()
+
+        self.queue = collections.deque()
+        # device -> column -> list of values
+        self.buffers = {}
+        self.buffer_lengths = {}
+        self.flush_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.writer_thread = None
+
+        self.posts = 0
+        self.samples_posted = 0
+        self.samples_applied = 0
+        self.flushes = 0
+        self.max_queue_depth = 0
+
+    def post(self, data=None, extra=None):
+        """
+        Queue one sample or a batch of samples, called from the request handler.
+        :param data: {device: stats} or a list of those or {"batch": [...]}
+        :param extra: dict merged into every stats dict by the writer, e.g. {"stop": False}
+        :return: number of device samples queued
+        """
+        if isinstance(data, dict) and "batch" in data:
+            data = data["batch"]
+        if isinstance(data, dict):
+            data = [data]
+        received = time.time()
+        queued = 0
+        for sample in data:
+            for device, stats in sample.items():
+                if not isinstance(stats, dict):
+                    continue
+                self.queue.append((received, device, stats, extra))
+                queued += 1
+        self.posts += 1
+        self.samples_posted += queued
+        depth = len(self.queue)
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+        return queued
+
+    def csv_file(self, device=None):
+        return os.path.join(self.csv_dir, self.csv_name.format(device=device))
+
+    def flush(self):
+        """
+        Apply everything queued so far, called by the writer thread or to get a consistent view.
+        :return: number of samples applied
+        """
+        with self.flush_lock:
+            applied = 0
+            rows = {}
+            queue = self.queue
+            while queue:
+                received, device, stats, extra = queue.popleft()
+                if extra:
+                    stats = {**stats, **extra}
+                self.latest[device] = stats
+                self.buffer_sample(device, received, stats)
+                if self.csv_dir is not None and self.row_fn is not None:
+                    rows.setdefault(device, []).append(self.row_fn(device, stats))
+                applied += 1
+            for device, device_rows in rows.items():
+                try:
+                    self.stats_store.append_rows(self.csv_file(device), device_rows, headers=self.headers)
+                except OSError as x:
+                    logger.error("could not write stats for {device}: {err}".format(device=device, err=x))
+            self.samples_applied += applied
+            if applied:
+                self.flushes += 1
+            return applied
+
+    def buffer_sample(self, device=None, received=None, stats=None):
+        buffer = self.buffers.get(device)
+        if buffer is None:
+            buffer = {"received": []}
+            self.buffers[device] = buffer
+            self.buffer_lengths[device] = 0
+        length = self.buffer_lengths[device]
+        buffer["received"].append(received)
+        for column, value in stats.items():
+            values = buffer.get(column)
+            if values is None:
+                # a column first seen now is None for the earlier samples
+                values = [None] * length
+                buffer[column] = values
+            values.append(value)
+        length += 1
+        for values in buffer.values():
+            if len(values) < length:
+                values.append(None)
+        if self.max_samples is not None and length > self.max_samples:
+            drop = length - self.max_samples
+            for column in buffer:
+                del buffer[column][:drop]
+            length = self.max_samples
+        self.buffer_lengths[device] = length
+
+    def run_writer(self):
+        while not self.stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as x:
+                logger.error("stats writer: {err}".format(err=x), exc_info=True)
+        self.flush()
+
+    def start(self):
+        if self.writer_thread is not None and self.writer_thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.writer_thread = threading.Thread(target=self.run_writer, name="lf_stats_ingest", daemon=True)
+        self.writer_thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.writer_thread is not None:
+            self.writer_thread.join()
+            self.writer_thread = None
+
+    def clear(self):
+        """
+        Drop queued samples, the latest stats and the buffers; the latest dict is cleared in place.
+        """
+        with self.flush_lock:
+            self.queue.clear()
+            self.latest.clear()
+            self.buffers.clear()
+            self.buffer_lengths.clear()
+
+    def columns(self, device=None, column_list=None):
+        """
+        :return: dict of column -> list of values for one device, all columns if column_list is None
+        """
+        buffer = self.buffers.get(device, {})
+        if column_list is None:
+            return {column: list(values) for column, values in buffer.items()}
+        return {column: list(buffer[column]) for column in column_list if column in buffer}
+
+    def counters(self):
+        return {"posts": self.posts,
+                "samples_posted": self.samples_posted,
+                "samples_applied": self.samples_applied,
+                "flushes": self.flushes,
+                "queue_depth": len(self.queue),
+                "max_queue_depth": self.max_queue_depth}
+
+    def add_flask_routes(self, app=None, post_rule='/upload_stats', get_rule='/get_latest_stats'):
+        """
+        Add the POST and GET routes to a Flask app.
+        """
+        from flask import request, jsonify
+
+        def ingest_post():
+            self.post(request.get_json())
+            return jsonify({"status": "success"}), 200
+
+        def ingest_get():
+            return jsonify(self.latest), 200
+
+        app.add_url_rule(post_rule, endpoint="lf_stats_ingest_post", view_func=ingest_post, methods=['POST'])
+        app.add_url_rule(get_rule, endpoint="lf_stats_ingest_get", view_func=ingest_get, methods=['GET'])
+
+    def serve(self, host='0.0.0.0', port=5010, post_rule='/upload_stats', get_rule='/get_latest_stats'):
+        """
+        Standalone http server with the same routes, returned running in a daemon thread.
+        """
+        ingest = self
+
+        class IngestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def reply(self, status, body):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                if self.path != post_rule:
+                    self.reply(404, {"error": "not found"})
+                    return
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    data = json.loads(self.rfile.read(length))
+                except ValueError:
+                    self.reply(400, {"error": "invalid json"})
+                    return
+                ingest.post(data)
+                self.reply(200, {"status": "success"})
+
+            def do_GET(self):
+                if self.path == get_rule:
+                    self.reply(200, dict(ingest.latest))
+                elif self.path == "/counters":
+                    self.reply(200, ingest.counters())
+                else:
+                    self.reply(404, {"error": "not found"})
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        class IngestServer(ThreadingHTTPServer):
+            # the default listen backlog of 5 refuses connections when many devices post at once
+            request_queue_size = 256
+            daemon_threads = True
+
+        server = IngestServer((host, port), IngestHandler)
+        thread = threading.Thread(target=server.serve_forever, name="lf_stats_ingest_http", daemon=True)
+        thread.start()
+        return server
+
+
+def load_test(devices=200, rate=1.0, duration=30, batch=1, port=5010, workers=32, csv_dir=None):
+    """
+    Simulate devices posting stats to a local ingest server and report throughput and latency.
+    Each device posts `rate` samples per second; with batch > 1 it posts batch samples at a time.
+    """
+    headers = ["timestamp", "device", "BufferHealth", "DroppedFrames", "TotalFrames"]
+    ingest = lf_stats_ingest(csv_dir=csv_dir,
+                             headers=headers,
+                             row_fn=lambda device, stats: [stats["timestamp"], device, stats["BufferHealth"],
+                                                           stats["DroppedFrames"], stats["TotalFrames"]])
+    ingest.start()
+    server = ingest.serve(host='127.0.0.1', port=port)
+    url = "http://127.0.0.1:%d/upload_stats" % port
+
+    post_times = []
+    errors = [0]
+    times_lock = threading.Lock()
+
+    def device_post(device, seq):
+        samples = [{device: {"timestamp": time.time(), "BufferHealth": 10.0 + (seq + i) % 7,
+                             "DroppedFrames": seq + i, "TotalFrames": 30 * (seq + i)}}
+                   for i in range(batch)]
+        body = json.dumps(samples if batch > 1 else samples[0]).encode()
+        request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                response.read()
+        except Exception as x:
+            logger.debug("post from {device} failed: {err}".format(device=device, err=x))
+            with times_lock:
+                errors[0] += 1
+            return
+        with times_lock:
+            post_times.append(time.perf_counter() - started)
+
+    period = batch / float(rate)
+    device_names = ["device%03d" % i for i in range(devices)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        tick = 0
+        while time.perf_counter() - started < duration:
+            tick_start = time.perf_counter()
+            for device in device_names:
+                pool.submit(device_post, device, tick * batch)
+            tick += 1
+            time.sleep(max(0.0, period - (time.perf_counter() - tick_start)))
+    elapsed = time.perf_counter() - started
+    ingest.stop()
+    server.shutdown()
+
+    post_times.sort()
+    counters = ingest.counters()
+
+    def percentile(p):
+        if not post_times:
+            return 0.0
+        return post_times[min(len(post_times) - 1, int(p / 100.0 * len(post_times)))] * 1000
+
+    print("devices {devices} rate {rate}/s batch {batch} duration {elapsed:.1f}s".format(
+        devices=devices, rate=rate, batch=batch, elapsed=elapsed))
+    print("posts ok {ok} failed {failed}, samples posted {posted} applied {applied} ({per_sec:.0f}/s)".format(
+        ok=len(post_times), failed=errors[0], posted=counters["samples_posted"], applied=counters["samples_applied"],
+        per_sec=counters["samples_applied"] / elapsed if elapsed else 0))
+    print("post latency ms p50 {p50:.2f} p95 {p95:.2f} p99 {p99:.2f} max {pmax:.2f}".format(
+        p50=percentile(50), p95=percentile(95), p99=percentile(99), pmax=percentile(100)))
+    print("writer flushes {flushes}, max queue depth {depth}".format(
+        flushes=counters["flushes"], depth=counters["max_queue_depth"]))
+    return counters
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lf_stats_ingest.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='''
+lf_stats_ingest.py:
+    Batched stats ingestion used by the real application tests, run standalone
+    to serve the ingest routes or to load test them.
+
+Example:
+    ./lf_stats_ingest.py --load_test --devices 200 --rate 1 --duration 30
+        ''')
+    parser.add_argument('--load_test', help="simulate devices posting to a local server", action='store_true')
+    parser.add_argument('--devices', help="number of simulated devices", type=int, default=200)
+    parser.add_argument('--rate', help="samples per second per device", type=float, default=1.0)
+    parser.add_argument('--duration', help="load test duration in seconds", type=int, default=30)
+    parser.add_argument('--batch', help="samples per post", type=int, default=1)
+    parser.add_argument('--workers', help="client threads posting", type=int, default=32)
+    parser.add_argument('--port', help="server port", type=int, default=5010)
+    parser.add_argument('--csv_dir', help="write per-device csv files to this directory", default=None)
+    parser.add_argument('--log_level', help="logging level", default="info")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
+    if args.load_test:
+        load_test(devices=args.devices, rate=args.rate, duration=args.duration, batch=args.batch,
+                  port=args.port, workers=args.workers, csv_dir=args.csv_dir)
+        return
+
+    ingest = lf_stats_ingest()
+    ingest.start()
+    ingest.serve(port=args.port)
+    logger.info("serving /upload_stats and /get_latest_stats on port {port}".format(port=args.port))
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        ingest.stop()
+
+
+if __name__ == '__main__':
+    main()
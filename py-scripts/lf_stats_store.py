@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# flake8: noqa
+'''
+NAME: lf_stats_store.py
+
+PURPOSE:
+Latest-row store for the per-device stats csv files written by the real application tests
+(youtube, zoom).  Rows are appended to the csv as before, and the last row of each file is
+kept in memory, so the web UI poll for the current stats costs O(devices) instead of
+re-reading every csv from the start.  When a file was written by an earlier run (or another
+process) the last row is recovered by seeking to the end of the csv and reading backwards
+until the start of the last line.
+
+EXAMPLE:
+    store = lf_stats_store()
+    store.append_row('laptop1_youtube_stats_report.csv',
+                     ['laptop1', '10:00:01', '1920x1080', 0, 300, '1080p', '1080p', 12.5],
+                     headers=["Instance Name", "TimeStamp", "Viewport", "DroppedFrames",
+                              "TotalFrames", "CurrentRes", "OptimalRes", "BufferHealth"])
+    last_row = store.latest_row('laptop1_youtube_stats_report.csv')
+
+COPYRIGHT:
+    Copyright 2024 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+'''
+import os
+import csv
+import io
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def typed_value(value=None):
+    """
+    Convert a csv cell the way pandas.read_csv would type it: int, then float, else the string.
+    Empty cells become None.
+    """
+    if not isinstance(value, str):
+        return value
+    if value == '':
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+class lf_stats_store:
+    def __init__(self, block_size=4096):
+        """
+        :param block_size: bytes read per step when seeking backwards for the last line
+        """
+        self.block_size = block_size
+        self.lock = threading.Lock()
+        # csv path -> list of column names
+        self.headers = {}
+        # csv path -> dict of the last row
+        self.latest = {}
+
+    def append_row(self, csv_file=None, row=None, headers=None):
+        """
+        Append one row to csv_file, writing the header first if the file is new or empty,
+        and keep the row as the latest for that file.
+        :param row: list of values in header order
+        :param headers: column names
+        """
+        with self.lock:
+            with open(csv_file, mode='a', newline='') as file:
+                writer = csv.writer(file)
+                if file.tell() == 0:
+                    writer.writerow(headers)
+                writer.writerow(row)
+            if headers is None:
+                headers = self.headers.get(csv_file) or self.read_header(csv_file)
+            self.headers[csv_file] = list(headers)
+            # same representation as a row read back from the csv
+            self.latest[csv_file] = {column: typed_value(str(value)) for column, value in zip(headers, row)}
+
+    def append_rows(self, csv_file=None, rows=None, headers=None):
+        """
+        Append several rows with one open of the file, the last one becomes the latest.
+        """
+        if not rows:
+            return
+        with self.lock:
+            with open(csv_file, mode='a', newline='') as file:
+                writer = csv.writer(file)
+                if file.tell() == 0:
+                    writer.writerow(headers)
+                writer.writerows(rows)
+            if headers is None:
+                headers = self.headers.get(csv_file) or self.read_header(csv_file)
+            self.headers[csv_file] = list(headers)
+            self.latest[csv_file] = {column: typed_value(str(value)) for column, value in zip(headers, rows[-1])}
+
+    def forget(self, csv_file=None):
+        with self.lock:
+            self.headers.pop(csv_file, None)
+            self.latest.pop(csv_file, None)
+
+    @staticmethod
+    def read_header(csv_file=None):
+        with open(csv_file, mode='r', newline='') as file:
+            return next(csv.reader(file), [])
+
+    def read_last_line(self, csv_file=None):
+        """
+        :return: the last non-empty line of the file, found by reading backwards from the end
+        """
+        with open(csv_file, mode='rb') as file:
+            file.seek(0, os.SEEK_END)
+            position = file.tell()
+            tail = b''
+            while position > 0:
+                step = min(self.block_size, position)
+                position -= step
+                file.seek(position)
+                tail = file.read(step) + tail
+                stripped = tail.rstrip(b'\r\n')
+                # a newline before the last line means the whole line is in tail
+                if b'\n' in stripped:
+                    return stripped.rsplit(b'\n', 1)[1].decode('utf-8', errors='replace')
+            return tail.rstrip(b'\r\n').decode('utf-8', errors='replace')
+
+    def recover_latest(self, csv_file=None):
+        """
+        Read the header and the last row of a csv without reading the rows between them.
+        :return: dict of the last row, or None if the file has no data rows
+        """
+        headers = self.read_header(csv_file)
+        last_line = self.read_last_line(csv_file)
+        values = next(csv.reader(io.StringIO(last_line)), [])
+        if not headers or values == headers:
+            return None
+        latest = {column: typed_value(value) for column, value in zip(headers, values)}
+        with self.lock:
+            self.headers[csv_file] = headers
+            self.latest[csv_file] = latest
+        return latest
+
+    def latest_row(self, csv_file=None):
+        """
+        :return: dict of the last row written to csv_file, or None if there is none
+        """
+        latest = self.latest.get(csv_file)
+        if latest is not None:
+            return latest
+        if not os.path.isfile(csv_file):
+            return None
+        try:
+            return self.recover_latest(csv_file)
+        except (OSError, StopIteration) as x:
+            logger.warning("could not read last row of {csv}: {err}".format(csv=csv_file, err=x))
+            return None
+
+    def latest_rows(self, csv_files=None):
+        """
+        :return: dict of csv path -> last row, files without rows are left out
+        """
+        rows = {}
+        for csv_file in csv_files:
+            latest = self.latest_row(csv_file)
+            if latest is not None:
+                rows[csv_file] = latest
+        return rows
@@ -299,6 +299,7 @@ class max_associate(Realm):
 
         self.station_profile = self.new_station_profile()
         self.cx_profile = self.new_l3_cx_profile()
+        self.l3_endp_stats = self.new_l3_endp_stats()
         self.cx_profile.host = self.host
         self.cx_profile.port = self.port
         self.cx_profile.name_prefix = self.name_prefix
@@ -406,81 +407,23 @@ class max_associate(Realm):
     # Query all endpoints to generate rx and other stats, returned
     # as an array of objects.
     def get_rx_values(self):
-        endp_list = self.json_get(
-            "endp?fields=name,eid,delay,jitter,rx+rate,rx+rate+ll,rx+bytes,rx+drop+%25,rx+pkts+ll",
-            debug_=True)
-        # logger.info("endp_list: {endp_list}".format(endp_list=endp_list))
-        endp_rx_drop_map = {}
-        endp_rx_map = {}
-        endps = []
-
-        total_ul_rate = 0
-        total_ul_ll = 0
-        total_ul_pkts_ll = 0
-        total_dl_rate = 0
-        total_dl_ll = 0
-        total_dl_pkts_ll = 0
-
-        '''
-        for e in self.cx_profile.created_endp.keys():
-            our_endps[e] = e
-        print("our_endps {our_endps}".format(our_endps=our_endps))
-        '''
-        for endp_name in endp_list['endpoint']:
-            if endp_name != 'uri' and endp_name != 'handler':
-                for item, endp_value in endp_name.items():
-                    # if item in our_endps:
-                    if True:
-                        endps.append(endp_value)
-                        logger.debug("endpoint: {item} value:\n".format(item=item))
-                        logger.debug(endp_value)
-
-                        # logger.info(endps)
-
-                        for value_name, value in endp_value.items():
-                            if value_name == 'rx bytes':
-                                endp_rx_map[item] = value
-                                # logger.info("rx_bytes {value}".format(value=value))
-                            if value_name == 'rx rate':
-                                endp_rx_map[item] = value
-                                # logger.info("rx_rate {value}".format(value=value))
-                                # This hack breaks for mcast or if someone names endpoints weirdly.
-                                # logger.info("item: ", item, " rx-bps: ", value_rx_bps)
-                                # info for upload test data
-                                # logger.info(self.traffic_type)
-                                if item.endswith("-A"):
-                                    total_ul_rate += int(value)
-                                    # logger.info(udp_ul_rate_bps)
-                                else:
-                                    total_dl_rate += int(value)
-                                    # logger.info(udp_dl_rate_bps)
-
-                            if value_name == 'rx rate ll':
-                                endp_rx_map[item] = value
-                                # logger.info("rx_rate_ll {value}".format(value=value))
-                            if value_name == 'rx pkts ll':
-                                endp_rx_map[item] = value
-
-                                if item.endswith("-A"):
-                                    total_ul_pkts_ll += int(value)
-                                    # logger.info(total_ul_pkts_ll)
-                                if value == '':
-                                    value = '0'
-                                else:
-                                    total_dl_pkts_ll += int(value)
-                                    # logger.info(total_dl_pkts_ll)
-
-                            if value_name == 'rx drop %':
-                                endp_rx_drop_map[item] = value
-                            if value_name == 'rx rate ll':
-                                # This hack breaks for mcast or if someone
-                                # names endpoints weirdly.
-                                if item.endswith("-A"):
-                                    total_ul_ll += int(value)
-                                else:
-                                    total_dl_ll += int(value)
-
-        # logger.debug("total-dl: ", total_dl, " total-ul: ", total_ul, "\n")
+        stats = self.l3_endp_stats
+        stats.register_cx_profile(self.cx_profile)
+        if not stats.poll(debug_=True):
+            return {}, {}, [], 0, 0, 0, 0, 0, 0
+
+        # every endpoint is reported, info for upload test data is on the A side
+        selected = stats.mask(owned_only=False)
+        ul = stats.side_mask(stats.SIDE_A)
+        dl = ~ul
+        total_ul_rate = stats.total('rx rate', ul)
+        total_dl_rate = stats.total('rx rate', dl)
+        total_ul_ll = stats.total('rx rate ll', ul)
+        total_dl_ll = stats.total('rx rate ll', dl)
+        total_ul_pkts_ll = stats.total('rx pkts ll', ul)
+        total_dl_pkts_ll = stats.total('rx pkts ll', dl)
+
+        endp_rx_map, endp_rx_drop_map, endps = stats.rx_maps(selected)
         return endp_rx_map, endp_rx_drop_map, endps, total_ul_rate, total_dl_rate, total_dl_ll, total_ul_ll, total_ul_pkts_ll, total_dl_pkts_ll
 
     def cleanup(self):
@@ -82,7 +82,6 @@ import os
 import importlib
 import time
 import argparse
-import paramiko
 from datetime import datetime, timedelta
 import pandas as pd
 import logging
@@ -98,6 +97,7 @@ import csv
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+ssh_executor = importlib.import_module("py-json.ssh_executor")
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
 realm = importlib.import_module("py-json.realm")
@@ -780,28 +780,14 @@ class HttpDownload(Realm):
         user = "root"
         pswd = "lanforge"
         port = ssh_port
-        ssh = paramiko.SSHClient()  # creating shh client object we use this object to connect to router
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())  # automatically adds the missing host key
-        ssh.connect(ip, port=port, username=user, password=pswd, banner_timeout=600)
-        cmd = '[ -f /usr/local/lanforge/nginx/html/webpage.html ] && echo "True" || echo "False"'
-        stdin, stdout, stderr = ssh.exec_command(str(cmd))
-        output = stdout.readlines()
-        if output == ["True\n"]:
-            cmd1 = "rm /usr/local/lanforge/nginx/html/webpage.html"
-            stdin, stdout, stderr = ssh.exec_command(str(cmd1))
-            output = stdout.readlines()
-            time.sleep(10)
-            cmd2 = "sudo fallocate -l " + self.file_size + " /usr/local/lanforge/nginx/html/webpage.html"
-            stdin, stdout, stderr = ssh.exec_command(str(cmd2))
-            print("File creation done", self.file_size)
-            output = stdout.readlines()
-        else:
-            cmd2 = "sudo fallocate -l " + self.file_size + " /usr/local/lanforge/nginx/html/webpage.html"
-            stdin, stdout, stderr = ssh.exec_command(str(cmd2))
-            print("File creation done", self.file_size)
-            output = stdout.readlines()
-        ssh.close()
-        time.sleep(1)
+        # the ssh connection is kept open across file sizes and bands
+        ssh = ssh_executor.get_ssh_executor(ip, port=port, username=user, password=pswd)
+        webpage_file = "/usr/local/lanforge/nginx/html/webpage.html"
+        status, output, errors = ssh.run_batch(["rm -f " + webpage_file,
+                                                "sudo fallocate -l " + self.file_size + " " + webpage_file])
+        print("File creation done", self.file_size)
+        # wait for the file to be in place rather than sleeping
+        ssh.wait_for_file_size(webpage_file)
         return output
 
     def download_time_in_sec(self, result_data):
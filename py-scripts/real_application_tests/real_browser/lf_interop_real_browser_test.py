@@ -112,6 +112,7 @@ PortUtils = port_utils.PortUtils
 # Set up logging configuration for the script
 logger = logging.getLogger(__name__)
 lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
+lf_stats_ingest = importlib.import_module("py-scripts.lf_stats_ingest")
 
 logger = logging.getLogger(__name__)
 log = logging.getLogger('werkzeug')
@@ -188,6 +189,8 @@ class RealBrowserTest(Realm):
         self.app = Flask(__name__)
         self.app.logger.setLevel(logging.WARNING)
         self.laptop_stats = {}
+        # /upload_stats only queues the posted stats, the writer thread updates laptop_stats
+        self.stats_ingest = lf_stats_ingest.lf_stats_ingest(latest=self.laptop_stats)
         self.user_name = None
         self.hw = None
         self.mac_list = None
@@ -831,9 +834,7 @@ class RealBrowserTest(Realm):
 
         @self.app.route('/upload_stats', methods=['POST'])
         def upload_stats():
-            temp_data = request.get_json()
-            for hostname, stats in temp_data.items():
-                self.laptop_stats[hostname] = stats
+            self.stats_ingest.post(request.get_json())
             return jsonify({"status": "success"}), 200
 
         # New route to check the health of the Flask server
@@ -845,6 +846,7 @@ class RealBrowserTest(Realm):
         def check_stop():
             return jsonify({"stop": self.stop_signal})
 
+        self.stats_ingest.start()
         try:
             self.app.run(host='0.0.0.0', port=5003, debug=True, threaded=True, use_reloader=False)
 
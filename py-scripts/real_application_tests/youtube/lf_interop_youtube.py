@@ -53,7 +53,6 @@ import pandas as pd
 import importlib
 import logging
 import matplotlib.pyplot as plt
-import csv
 import asyncio
 import json
 import shutil
@@ -101,6 +100,8 @@ lf_base_interop_profile = importlib.import_module("py-scripts.lf_base_interop_pr
 lf_report = lf_report.lf_report
 lf_bar_graph_horizontal = lf_graph.lf_bar_graph_horizontal
 RealDevice = lf_base_interop_profile.RealDevice
+lf_stats_store = importlib.import_module("py-scripts.lf_stats_store")
+lf_stats_ingest = importlib.import_module("py-scripts.lf_stats_ingest")
 
 
 class Youtube(Realm):
@@ -192,6 +193,9 @@ class Youtube(Realm):
         self.mydatajson = {}
         self.final_data = None
         self.stats_api_response = {}
+        self.stats_store = lf_stats_store.lf_stats_store()
+        # devices post to /youtube_stats, the writer thread keeps stats_api_response current
+        self.stats_ingest = lf_stats_ingest.lf_stats_ingest(latest=self.stats_api_response)
         self.upstream_port = upstream_port
         self.stop_signal = False
         self.config = config
@@ -571,17 +575,13 @@ class Youtube(Realm):
 
                 self.devices_list.append(csv_file_path)
 
-                file_exists = os.path.isfile(csv_file_path)
                 headers = ["Instance Name", "TimeStamp", "Viewport", "DroppedFrames", "TotalFrames", "CurrentRes", "OptimalRes", "BufferHealth"]
 
-                with open(csv_file_path, mode='a', newline='') as file:
-                    writer = csv.writer(file)
-                    if not file_exists:
-                        writer.writerow(headers)
-                    row = [device_name, timestamp]
-                    for header in headers[2:]:
-                        row.append(stats.get(header, "NA"))
-                    writer.writerow(row)
+                row = [device_name, timestamp]
+                for header in headers[2:]:
+                    row.append(stats.get(header, "NA"))
+                # appends to the csv and keeps the row as the latest for the web UI
+                self.stats_store.append_row(csv_file_path, row, headers=headers)
 
             return self.data
         else:
@@ -626,22 +626,11 @@ class Youtube(Realm):
 
                 # Clear data if requested
                 if data.get("clear_data"):
-                    self.stats_api_response = {}
+                    self.stats_ingest.clear()
                     return jsonify({"message": "Data cleared"}), 200
 
-                for key, value in data.items():
-                    if key == "stop":
-                        continue
-                    device_name = key
-                    stats = value
-                    stop = data.get("stop", False)
-
-                    if device_name not in self.stats_api_response:
-                        self.stats_api_response[device_name] = {}
-                    self.stats_api_response[device_name] = {
-                        **stats,
-                        "stop": stop
-                    }
+                # queued only, the writer thread adds the stop flag to each device's stats
+                self.stats_ingest.post(data, extra={"stop": data.get("stop", False)})
 
                 return jsonify({"message": "Stats updated"}), 200
 
@@ -656,19 +645,16 @@ class Youtube(Realm):
             API endpoint to read YouTube data from CSV files and return the last row for each device.
             """
             device_data = {}
-            for csv_file_path in self.devices_list:
-                if not os.path.isfile(csv_file_path):
-                    continue
-                df = pd.read_csv(csv_file_path)
-                if not df.empty:
-                    last_row = df.iloc[-1].to_dict()
-                    device_name = os.path.basename(csv_file_path).split('_youtube_stats_report')[0]
-                    device_data[device_name] = last_row
+            for csv_file_path, last_row in self.stats_store.latest_rows(self.devices_list).items():
+                device_name = os.path.basename(csv_file_path).split('_youtube_stats_report')[0]
+                device_data[device_name] = last_row
             return jsonify({"result": device_data}), 200
 
         def run_flask():
             app.run(host="0.0.0.0", port=5002, debug=False, use_reloader=False)
 
+        self.stats_ingest.start()
+
         # Run the Flask server in a separate thread to avoid blocking
         flask_thread = Thread(target=run_flask)
         flask_thread.daemon = True
@@ -1531,6 +1517,7 @@ NOTES:
             logging.info("Duration ended")
 
             logging.info('Stopping the test')
+            youtube.stats_ingest.flush()
             if do_webUI:
                 youtube.create_report(youtube.stats_api_response, youtube.ui_report_dir)
             else:
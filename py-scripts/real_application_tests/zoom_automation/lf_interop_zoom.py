@@ -77,6 +77,7 @@ lf_stacked_graph = lf_graph.lf_stacked_graph
 lf_horizontal_stacked_graph = lf_graph.lf_horizontal_stacked_graph
 DeviceConfig = importlib.import_module("py-scripts.DeviceConfig")
 lf_base_interop_profile = importlib.import_module("py-scripts.lf_base_interop_profile")
+lf_stats_ingest = importlib.import_module("py-scripts.lf_stats_ingest")
 RealDevice = lf_base_interop_profile.RealDevice
 
 # Set up logging
@@ -156,10 +157,31 @@ class ZoomAutomation(Realm):
                        "Sent Video Frames ps (khz)", "Receive Video Latency (ms)", "Receive Video Jitter (ms)", "Receive Video Packet loss (%)",
                        "Receive Video Resolution (khz)", "Receive Video Frames ps (khz)"
                        ]
+        # /upload_stats only queues the posted stats, the writer thread updates data_store
+        # and appends the rows to <hostname>.csv
+        self.stats_ingest = lf_stats_ingest.lf_stats_ingest(latest=self.data_store,
+                                                            csv_dir=self.path,
+                                                            headers=self.header,
+                                                            row_fn=self.stats_row)
         self.config = config
         self.selected_groups = selected_groups
         self.selected_profiles = selected_profiles
 
+    def stats_row(self, hostname, stats):
+        timestamp = stats.get('timestamp', '')
+        audio = stats.get('audio_stats', {})
+        video = stats.get('video_stats', {})
+
+        return [
+            timestamp,
+            audio.get('frequency_sent', '0'), audio.get('latency_sent', '0'), audio.get('jitter_sent', '0'), audio.get('packet_loss_sent', '0'),
+            audio.get('frequency_received', '0'), audio.get('latency_received', '0'), audio.get('jitter_received', '0'), audio.get('packet_loss_received', '0'),
+            video.get('latency_sent', '0'), video.get('jitter_sent', '0'), video.get('packet_loss_sent', '0'),
+            video.get('resolution_sent', '0'), video.get('frames_per_second_sent', '0'),
+            video.get('latency_received', '0'), video.get('jitter_received', '0'), video.get('packet_loss_received', '0'),
+            video.get('resolution_received', '0'), video.get('frames_per_second_received', '0')
+        ]
+
     def start_flask_server(self):
         @self.app.route('/login_url', methods=['GET', 'POST'])
         def login_url():
@@ -258,33 +280,7 @@ class ZoomAutomation(Realm):
 
         @self.app.route('/upload_stats', methods=['POST'])
         def upload_stats():
-            data = request.json
-            for hostname, stats in data.items():
-                self.data_store[hostname] = stats
-            for hostname, stats in data.items():
-
-                csv_file = os.path.join(self.path, f'{hostname}.csv')
-                with open(csv_file, mode='a', newline='') as file:
-                    writer = csv.writer(file)
-
-                    if os.path.getsize(csv_file) == 0:
-                        writer.writerow(self.header)
-
-                    timestamp = stats.get('timestamp', '')
-                    audio = stats.get('audio_stats', {})
-                    video = stats.get('video_stats', {})
-
-                    row = [
-                        timestamp,
-                        audio.get('frequency_sent', '0'), audio.get('latency_sent', '0'), audio.get('jitter_sent', '0'), audio.get('packet_loss_sent', '0'),
-                        audio.get('frequency_received', '0'), audio.get('latency_received', '0'), audio.get('jitter_received', '0'), audio.get('packet_loss_received', '0'),
-                        video.get('latency_sent', '0'), video.get('jitter_sent', '0'), video.get('packet_loss_sent', '0'),
-                        video.get('resolution_sent', '0'), video.get('frames_per_second_sent', '0'),
-                        video.get('latency_received', '0'), video.get('jitter_received', '0'), video.get('packet_loss_received', '0'),
-                        video.get('resolution_received', '0'), video.get('frames_per_second_received', '0')
-                    ]
-                    writer.writerow(row)
-
+            self.stats_ingest.post(request.json)
             return jsonify({"status": "success"}), 200
 
         @self.app.route('/get_latest_stats', methods=['GET'])
@@ -307,6 +303,7 @@ class ZoomAutomation(Realm):
             shutdown_thread.start()
             return response
 
+        self.stats_ingest.start()
         try:
             self.app.run(host='0.0.0.0', port=5000, debug=True, threaded=True, use_reloader=False)
         except Exception as e:
@@ -1602,6 +1599,7 @@ def main():
                 exit(0)
 
             zoom_automation.run(args.duration, args.upstream_port, args.signin_email, args.signin_passwd, args.participants)
+            zoom_automation.stats_ingest.stop()
             zoom_automation.data_store.clear()
             zoom_automation.generate_report()
             logging.info("Test Completed Sucessfully")
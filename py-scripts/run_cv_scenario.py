@@ -24,6 +24,7 @@ lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
 realm = importlib.import_module("py-json.realm")
 Realm = realm.Realm
+event_waiter = importlib.import_module("py-json.event_waiter")
 
 """
     cvScenario.scenario_db = args.scenario_db
@@ -117,34 +118,13 @@ class RunCvScenario(LFCliBase):
 
         # check for scenario (db) load message
         begin_time: int = round(time.time() * 1000)
-        load_completed = False
-        while not load_completed:
-            if time.time() > (begin_time + self.load_timeout_sec):
-                logger.error("Unable to load database within %d sec" % self.load_timeout_sec)
-                exit(1)
-            events_response = self.json_get("/events/since/%s" % previous_event_id)
-            pronoun = None
-            if "events" in events_response:
-                pronoun = "events"
-            elif "event" in events_response:
-                pronoun = "event"
-            if not pronoun:
-                logger.debug(pprint.pformat(("events response", events_response)))
-                raise ValueError("incorrect events response")
-            for event_o in events_response[pronoun]:
-                if load_completed:
-                    break
-                for (key, record) in event_o.items():
-                    if "event description" not in record:
-                        continue
-                    if not record["event description"]:
-                        continue
-                    if record["event description"].startswith("LOAD COMPLETED at "):
-                        logger.info("load completed: %s " % record["event description"])
-                        load_completed = True
-                        break
-            if not load_completed:
-                sleep(1)
+        waiter = self.localrealm.new_event_waiter(start_id=previous_event_id)
+        load_event = waiter.wait_for(event_waiter.description_startswith("LOAD COMPLETED at "),
+                                     timeout_sec=self.load_timeout_sec)
+        if load_event is None:
+            logger.error("Unable to load database within %d sec" % self.load_timeout_sec)
+            exit(1)
+        logger.info("load completed: %s " % event_waiter.event_description(load_event))
 
         blobs_last_updated = begin_time
         status_response = self.json_get("/")
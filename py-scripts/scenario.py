@@ -17,6 +17,7 @@ LFCliBase = lfcli_base.LFCliBase
 LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
 realm = importlib.import_module("py-json.realm")
 Realm = realm.Realm
+event_waiter = importlib.import_module("py-json.event_waiter")
 
 
 class LoadScenario(Realm):
@@ -102,26 +103,14 @@ class LoadScenario(Realm):
             self.json_post("/cli-json/quiesce_group", {"name": self.quiesce})
 
     def check_if_complete(self):
-        completed = False
-        timer = 0
-        while not completed:
-            new_events = self.find_new_events(self.starting_events)
-            target_events = [event for event in self.get_events(new_events, 'event description') if
-                             event.startswith('LOAD COMPLETED')]
-            if 'LOAD-DB:  Load attempt has been completed.' in self.get_events(new_events, 'event description'):
-                completed = True
-                print('Scenario %s fully loaded after %s seconds' % (self.scenario, timer))
-            elif len(target_events) > 0:
-                completed = True
-                print('Scenario %s fully loaded after %s seconds' % (self.scenario, timer))
-            else:
-                timer += 1
-                time.sleep(1)
-                if timer > self.timeout:
-                    completed = True
-                    print('Scenario failed to load after %s seconds' % self.timeout)
-                else:
-                    print('Waiting %s out of %s seconds to load scenario %s' % (timer, self.timeout, self.scenario))
+        # only the events logged since start_test are fetched and matched
+        waiter = self.new_event_waiter(start_id=self.starting_events)
+        started = time.time()
+        print('Waiting up to %s seconds to load scenario %s' % (self.timeout, self.scenario))
+        if waiter.wait_for(event_waiter.SCENARIO_LOADED, timeout_sec=self.timeout):
+            print('Scenario %s fully loaded after %s seconds' % (self.scenario, round(time.time() - started, 1)))
+        else:
+            print('Scenario failed to load after %s seconds' % self.timeout)
         if self.debug:
             print(self.json_get('/port'))
 
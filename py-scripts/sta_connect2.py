@@ -118,6 +118,7 @@ class StaConnect2(Realm):
         self.use_existing_sta = False
 
         self.cx_profile = self.new_l3_cx_profile()
+        self.l3_endp_stats = self.new_l3_endp_stats()
         self.cx_profile.host = self.host
         self.cx_profile.port = self.port
         self.cx_profile.name_prefix = self.name_prefix
@@ -155,86 +156,30 @@ class StaConnect2(Realm):
     # Query all endpoints to generate rx and other stats, returned
     # as an array of objects.
     def get_rx_values(self):
-        endp_list = self.json_get(
-            "endp?fields=name,eid,delay,jitter,rx+rate,rx+rate+ll,rx+bytes,rx+drop+%25,rx+pkts+ll",
-            debug_=True)
-        # logger.info("endp_list: {endp_list}".format(endp_list=endp_list))
-        endp_rx_drop_map = {}
-        endp_rx_map = {}
-        our_endps = {}
-        endps = []
-
-        total_ul = 0
-        total_ul_ll = 0
-        total_dl = 0
-        total_dl_ll = 0
-        udp_dl = 0
-        tcp_dl = 0
-        udp_ul = 0
-        tcp_ul = 0
-
-        '''
-        for e in self.cx_profile.created_endp.keys():
-            our_endps[e] = e
-        print("our_endps {our_endps}".format(our_endps=our_endps))
-        '''
-        for endp_name in endp_list['endpoint']:
-            if endp_name != 'uri' and endp_name != 'handler':
-                for item, endp_value in endp_name.items():
-                    # if item in our_endps:
-                    if True:
-                        endps.append(endp_value)
-                        logger.debug("endpoint: {item} value:\n".format(item=item))
-                        logger.debug(endp_value)
-                        # print("item {item}".format(item=item))
-
-                        for value_name, value in endp_value.items():
-                            if value_name == 'rx bytes':
-                                endp_rx_map[item] = value
-                            if value_name == 'rx rate':
-                                endp_rx_map[item] = value
-                                # print("value {value}".format(value=value))
-                            if value_name == 'rx rate ll':
-                                endp_rx_map[item] = value
-                                # print("value {value}".format(value=value))
-                            if value_name == 'rx pkts ll':
-                                endp_rx_map[item] = value
-                            if value_name == 'rx drop %':
-                                endp_rx_drop_map[item] = value
-                            if value_name == 'rx rate':
-                                # This hack breaks for mcast or if someone names endpoints weirdly.
-                                # logger.info("item: ", item, " rx-bps: ", value_rx_bps)
-
-                                # info for download test data
-                                if item.startswith("udp") and item.endswith("-A"):
-                                    udp_ul += int(value)
-                                    # logger.info(udp_udl)
-                                elif item.startswith("tcp") and item.endswith("-A"):
-                                    tcp_ul += int(value)
-                                    # logger.info(tcp_dl)
-
-                                # info for upload test data
-                                if item.startswith("udp") and item.endswith("-B"):
-                                    udp_dl += int(value)
-                                    # logger.info(udp_ul)
-                                elif item.startswith("tcp") and item.endswith("-B"):
-                                    tcp_dl += int(value)
-                                    # logger.info(tcp_ul)
-                                # combine total download (tcp&udp) and upload (tcp&udp) test data
-                                if item.endswith("-A"):
-                                    total_dl += int(value)
-                                    # logger.info(total_dl)
-                                else:
-                                    total_ul += int(value)
-                            if value_name == 'rx rate ll':
-                                # This hack breaks for mcast or if someone
-                                # names endpoints weirdly.
-                                if item.endswith("-A"):
-                                    total_dl_ll += int(value)
-                                else:
-                                    total_ul_ll += int(value)
-
-        # logger.debug("total-dl: ", total_dl, " total-ul: ", total_ul, "\n")
+        stats = self.l3_endp_stats
+        stats.register_cx_profile(self.cx_profile)
+        if not stats.poll(debug_=True):
+            return {}, {}, [], 0, 0, 0, 0, 0, 0, 0, 0
+
+        # every endpoint is reported
+        selected = stats.mask(owned_only=False)
+        side_a = stats.side_mask(stats.SIDE_A)
+        side_b = stats.side_mask(stats.SIDE_B)
+        udp = stats.prefix_mask("udp")
+        tcp = stats.prefix_mask("tcp")
+        # info for download test data
+        udp_ul = stats.total('rx rate', udp & side_a)
+        tcp_ul = stats.total('rx rate', tcp & side_a)
+        # info for upload test data
+        udp_dl = stats.total('rx rate', udp & side_b)
+        tcp_dl = stats.total('rx rate', tcp & side_b)
+        # combine total download (tcp&udp) and upload (tcp&udp) test data
+        total_dl = stats.total('rx rate', side_a)
+        total_ul = stats.total('rx rate', ~side_a)
+        total_dl_ll = stats.total('rx rate ll', side_a)
+        total_ul_ll = stats.total('rx rate ll', ~side_a)
+
+        endp_rx_map, endp_rx_drop_map, endps = stats.rx_maps(selected)
         return endp_rx_map, endp_rx_drop_map, endps, udp_dl, tcp_dl, udp_ul, tcp_ul, total_dl, total_ul, total_dl_ll, total_ul_ll
 
     # Common code to generate timestamp for CSV files.
@@ -251,6 +251,7 @@ class L3VariableTime(Realm):
         self.polling_interval_seconds = self.duration_time_to_seconds(
             polling_interval)
         self.cx_profile = self.new_l3_cx_profile()
+        self.l3_endp_stats = self.new_l3_endp_stats()
         self.multicast_profile = self.new_multicast_profile()
         self.multicast_profile.name_prefix = "MLT-"
         self.station_profiles = []
@@ -636,59 +637,24 @@ class L3VariableTime(Realm):
     # Query all endpoints to generate rx and other stats, returned
     # as an array of objects.
     def __get_rx_values(self):
-        endp_list = self.json_get(
-            "endp?fields=name,eid,delay,jitter,rx+rate,rx+rate+ll,rx+bytes,rx+drop+%25,rx+pkts+ll",
-            debug_=False)
-
-        logger.debug("endp_list: {}".format(endp_list))
-        endp_rx_drop_map = {}
-        endp_rx_map = {}
-        our_endps = {}
-        endps = []
-
-        total_ul = 0
-        total_ul_ll = 0
-        total_dl = 0
-        total_dl_ll = 0
-
-        for e in self.multicast_profile.get_mc_names():
-            our_endps[e] = e
-        for e in self.cx_profile.created_endp.keys():
-            our_endps[e] = e
-        for endp_name in endp_list['endpoint']:
-            if endp_name != 'uri' and endp_name != 'handler':
-                for item, endp_value in endp_name.items():
-                    if item in our_endps or self.use_existing_station_lists:
-                        endps.append(endp_value)
-                        logger.info("endpoint: {item} value:\n".format(item=item))
-                        logger.info(pformat(endp_value))
-
-                        for value_name, value in endp_value.items():
-                            if value_name == 'rx bytes':
-                                endp_rx_map[item] = value
-                            if value_name == 'rx rate':
-                                endp_rx_map[item] = value
-                            if value_name == 'rx rate ll':
-                                endp_rx_map[item] = value
-                            if value_name == 'rx pkts ll':
-                                endp_rx_map[item] = value
-                            if value_name == 'rx drop %':
-                                endp_rx_drop_map[item] = value
-                            if value_name == 'rx rate':
-                                # This hack breaks for mcast or if someone names endpoints weirdly.
-                                if item.endswith("-A"):
-                                    total_dl += int(value)
-                                else:
-                                    total_ul += int(value)
-                            if value_name == 'rx rate ll':
-                                # This hack breaks for mcast or if someone
-                                # names endpoints weirdly.
-                                if item.endswith("-A"):
-                                    total_dl_ll += int(value)
-                                else:
-                                    total_ul_ll += int(value)
-
-        logger.debug("total-dl: {total_dl}, total-ul: {total_ul}\n".format(total_dl=total_dl, total_ul=total_ul))
+        stats = self.l3_endp_stats
+        stats.register_multicast_profile(self.multicast_profile)
+        stats.register_cx_profile(self.cx_profile)
+        if not stats.poll():
+            return {}, {}, [], 0, 0, 0, 0
+
+        # if using existing stations list then the endpoints were existing
+        selected = stats.mask(owned_only=not self.use_existing_station_lists)
+        # This hack breaks for mcast or if someone names endpoints weirdly.
+        dl = selected & stats.side_mask(stats.SIDE_A)
+        ul = selected & ~dl
+        total_dl = stats.total('rx rate', dl)
+        total_ul = stats.total('rx rate', ul)
+        total_dl_ll = stats.total('rx rate ll', dl)
+        total_ul_ll = stats.total('rx rate ll', ul)
+
+        endp_rx_map, endp_rx_drop_map, endps = stats.rx_maps(selected)
+        logger.debug("total-dl: {total_dl}, total-ul: {total_ul}".format(total_dl=total_dl, total_ul=total_ul))
         return endp_rx_map, endp_rx_drop_map, endps, total_dl, total_ul, total_dl_ll, total_ul_ll
     # This script supports resetting ports, allowing one to test AP/controller under data load
     # while bouncing wifi stations.  Check here to see if we should reset
@@ -145,6 +145,9 @@ lf_report = importlib.import_module("lf_report")
 lf_kpi_csv = importlib.import_module("lf_kpi_csv")
 logger = logging.getLogger(__name__)
 lf_logger_config = importlib.import_module("lf_logger_config")
+# lanforge_client is at the top of the repository
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+http_stats = importlib.import_module("lanforge_client.http_stats")
 
 
 # lf_report is from the parent of the current file
@@ -342,6 +345,8 @@ class lf_check():
         self.test_timeout = 120
         self.test_timeout_default = 120
         self.test_iterations_default = 1
+        # record the LANforge HTTP requests of each test, see lanforge_client/http_stats.py
+        self.http_stats = False
         self.iteration = 0
         self.use_blank_db = "FALSE"
         self.use_factory_default_db = "FALSE"
@@ -1442,10 +1447,24 @@ junit.xml path: allure serve {junit_path}
                 time=self.test_start_time, timeout=self.test_timeout))
         start_time = datetime.datetime.now()
         summary_output = ''
+
+        # the test writes its LANforge HTTP request statistics here at exit
+        test_env = None
+        http_stats_json = ""
+        http_budget = self.test_dict[self.test].get('http_budget', None)
+        if self.http_stats or http_budget:
+            http_stats_json = os.path.join(
+                self.log_path, "{}-{}-http_stats.json".format(self.outfile_name, self.test))
+            if os.path.exists(http_stats_json):
+                os.remove(http_stats_json)
+            test_env = os.environ.copy()
+            test_env['LF_HTTP_STATS'] = http_stats_json
+            self.logger.info("http_stats_json: {}".format(http_stats_json))
+
         # have stderr go to stdout
         try:
             summary = subprocess.Popen(command_to_run, shell=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                       universal_newlines=True)
+                                       universal_newlines=True, env=test_env)
         # TODO the looks one directory higher,  there needs to be a way to execute from higher directory.
         except FileNotFoundError:
             # TODO tx_power is one directory up from py-scripts
@@ -1455,7 +1474,7 @@ junit.xml path: allure serve {junit_path}
             self.logger.info(
                 "Changed Current Working Directory to {}".format(os.getcwd()))
             summary = subprocess.Popen(command_to_run, shell=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                       universal_newlines=True)
+                                       universal_newlines=True, env=test_env)
 
         except PermissionError:
             self.logger.info("PermissionError on execution of {command}".format(
@@ -1691,6 +1710,25 @@ junit.xml path: allure serve {junit_path}
                 else:
                     self.test_result = "Failure"
                     background = self.background_red
+
+        # compare the HTTP requests the test made to its http_budget
+        if http_stats_json:
+            if os.path.exists(http_stats_json):
+                test_http_stats = http_stats.load(http_stats_json)
+                self.logger.info("http_stats totals: {}".format(test_http_stats.get('totals')))
+                for row in test_http_stats.get('patterns', [])[:10]:
+                    self.logger.info("http_stats {method} {pattern} count: {count} total_ms: {total_ms} p95_ms: {p95_ms}".format(
+                        method=row['method'], pattern=row['pattern'], count=row['count'],
+                        total_ms=row['total_ms'], p95_ms=row['p95_ms']))
+                budget_violations = http_stats.check_budget(test_http_stats, http_budget)
+                for violation in budget_violations:
+                    self.logger.error("http_budget: {}".format(violation))
+                if budget_violations and self.test_result == "Finished":
+                    self.test_result = "HTTP Budget Exceeded"
+                    background = self.background_orange
+            else:
+                self.logger.info("no http_stats written by test: {}".format(http_stats_json))
+
         # Total up test, tests success, tests failure, tests
         # timeouts
         self.tests_run += 1
@@ -1700,6 +1738,8 @@ junit.xml path: allure serve {junit_path}
             self.tests_failure += 1
         elif self.test_result == "Some Tests Failed":
             self.tests_some_failure += 1
+        elif self.test_result == "HTTP Budget Exceeded":
+            self.tests_some_failure += 1
         elif self.test_result == "Test Errors":
             self.tests_failure += 1
         elif self.test_result == "Incorrect args":
@@ -2176,6 +2216,11 @@ If parameter not set will read TEST_WINDOW_DAYS from rig.json""")
     parser.add_argument("--no_exit","--no_exit_if_no_gui",dest='no_exit_if_no_gui',
                         help="--no_exit_if_no_gui store true , if gui unavailable do not exit to allow gui restart",
                         action='store_true')
+    parser.add_argument("--http_stats",
+                        help="""--http_stats store true, record the LANforge HTTP requests of every test to
+<outfile>-<test>-http_stats.json in the log directory. Tests with an "http_budget" in the test json
+are always recorded, example: "http_budget": {"max_requests": 5000, "max_total_sec": 60}""",
+                        action='store_true')
 
 
     args = parser.parse_args()
@@ -2428,6 +2473,7 @@ If parameter not set will read TEST_WINDOW_DAYS from rig.json""")
                                  _report_path=report_path,
                                  _log_path=log_path,
                                  _json_test_name=json_test_name)
+                check.http_stats = args.http_stats
 
                 # set up logging
                 logfile = args.logfile[:-4]
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# flake8: noqa
+'''
+NAME: lf_event_wait_bench.py
+
+PURPOSE:
+Compare the event-cursor completion waits in py-json/event_waiter.py with the one second
+polling loops they replaced, against the fake event source in lf_replay_gui.py:
+
+    scenario_load   database load until 'LOAD-DB:  Load attempt has been completed.' is logged,
+                    as in scenario.py check_if_complete
+    cv_build        'cv build' until 'cv is_built' answers YES, as in create_chamberview.py build
+
+The stand-in completes a load about --load_delay_sec after it was sent and a build about
+--build_delay_sec after it was started (each run picks a delay from 0.75 to 1.25 times the
+given one, so the loops are not timed in step with the delay), while logging --event_rate
+unrelated events per second.  For every run the
+latency (time from completion until the loop noticed it) and the number of requests the loop
+sent are reported; the legacy loops are copies of the previous code.
+
+EXAMPLE:
+    ./lf_event_wait_bench.py
+    ./lf_event_wait_bench.py --runs 5 --load_delay_sec 2.5 --event_rate 20 --latency_ms 2
+    ./lf_event_wait_bench.py --json /tmp/event_wait.json
+
+COPYRIGHT:
+    Copyright 2024 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+'''
+import argparse
+import importlib
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+realm = importlib.import_module("py-json.realm")
+Realm = realm.Realm
+event_waiter = importlib.import_module("py-json.event_waiter")
+lf_replay_gui = importlib.import_module("py-scripts.tools.lf_replay_gui")
+
+logger = logging.getLogger(__name__)
+
+
+class lf_event_wait_bench:
+    def __init__(self,
+                 server=None,
+                 runs=3,
+                 load_delay_sec=1.0,
+                 build_delay_sec=1.0,
+                 timeout_sec=30,
+                 seed=0):
+        self.server = server
+        self.runs = runs
+        self.load_delay_sec = load_delay_sec
+        self.build_delay_sec = build_delay_sec
+        self.timeout_sec = timeout_sec
+        self.random = random.Random(seed)
+        host, port = server.server_address[:2]
+        self.local_realm = Realm(lfclient_host=host, lfclient_port=port)
+        self.results = []
+
+    def run_cv_cmd(self, command=None):
+        # as cv_test.run_cv_cmd, which needs the report modules (paramiko) to import
+        response_json = []
+        self.local_realm.json_post("/gui-json/cmd", {"cmd": command}, response_json_list_=response_json)
+        return response_json[0]["LAST"]["response"]
+
+    def is_built(self):
+        self.run_cv_cmd("cv get_and_close_dialog")
+        return self.run_cv_cmd("cv is_built") == "YES"
+
+    def delay_sec(self, base_sec=1.0):
+        return base_sec * self.random.uniform(0.75, 1.25)
+
+    # ----- ----- scenario load ----- -----
+    def start_load(self):
+        starting_events = self.local_realm.json_get('/events/last/1')['event']['id']
+        delay_sec = self.server.model.load_delay_sec = self.delay_sec(self.load_delay_sec)
+        self.local_realm.json_post("/cli-json/load", {"name": "BENCH", "action": "overwrite"})
+        return starting_events, time.monotonic() + delay_sec
+
+    def legacy_load(self):
+        starting_events, done_at = self.start_load()
+        timer = 0
+        while True:
+            new_events = self.local_realm.find_new_events(starting_events)
+            descriptions = self.local_realm.get_events(new_events, 'event description')
+            target_events = [event for event in descriptions if event.startswith('LOAD COMPLETED')]
+            if 'LOAD-DB:  Load attempt has been completed.' in descriptions or target_events:
+                return done_at
+            timer += 1
+            time.sleep(1)
+            if timer > self.timeout_sec:
+                return None
+
+    def waiter_load(self):
+        starting_events, done_at = self.start_load()
+        waiter = self.local_realm.new_event_waiter(start_id=starting_events)
+        if waiter.wait_for(event_waiter.SCENARIO_LOADED, timeout_sec=self.timeout_sec):
+            return done_at
+        return None
+
+    # ----- ----- chamber view build ----- -----
+    def start_build(self):
+        delay_sec = self.server.model.build_delay_sec = self.delay_sec(self.build_delay_sec)
+        self.run_cv_cmd("cv build")
+        return time.monotonic() + delay_sec
+
+    def legacy_build(self):
+        done_at = self.start_build()
+        tries = 0
+        while True:
+            if self.is_built():
+                return done_at
+            tries += 1
+            if tries > self.timeout_sec:
+                return None
+            time.sleep(1)
+
+    def waiter_build(self):
+        waiter = self.local_realm.new_event_waiter()
+        done_at = self.start_build()
+        if waiter.wait_for(check=self.is_built, timeout_sec=self.timeout_sec):
+            return done_at
+        return None
+
+    def measure(self, name=None, fn=None):
+        latencies, requests = [], []
+        for _ in range(self.runs):
+            before = self.server.requests
+            done_at = fn()
+            noticed_at = time.monotonic()
+            if done_at is None:
+                raise RuntimeError("%s timed out" % name)
+            latencies.append((noticed_at - done_at) * 1000)
+            requests.append(self.server.requests - before)
+        result = {
+            "loop": name,
+            "runs": self.runs,
+            "latency_ms": round(statistics.median(latencies), 1),
+            "latency_ms_max": round(max(latencies), 1),
+            "requests": statistics.median(requests),
+        }
+        self.results.append(result)
+        logger.info("{loop:16s} latency {latency_ms:8.1f} ms (max {latency_ms_max:8.1f})  {requests:6.1f} requests"
+                    .format(**result))
+        return result
+
+    def run(self):
+        self.measure("legacy_load", self.legacy_load)
+        self.measure("waiter_load", self.waiter_load)
+        self.measure("legacy_build", self.legacy_build)
+        self.measure("waiter_build", self.waiter_build)
+        return self.results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lf_event_wait_bench.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='''
+Benchmark the event-cursor completion waits against the one second polling loops,
+using the fake event source of the LANforge GUI stand-in (lf_replay_gui.py).
+''')
+    parser.add_argument('--runs', help='waits to time per loop', type=int, default=5)
+    parser.add_argument('--load_delay_sec', help='seconds until a database load completes', type=float, default=2.0)
+    parser.add_argument('--build_delay_sec', help="seconds after 'cv build' until Chamber View is built",
+                        type=float, default=2.0)
+    parser.add_argument('--event_rate', help='unrelated events logged per second', type=float, default=5.0)
+    parser.add_argument('--latency_ms', help='stand-in delay per response', type=float, default=0.0)
+    parser.add_argument('--timeout_sec', help='give up on a wait after this long', type=int, default=30)
+    parser.add_argument('--json', help='write the results to this json file', default=None)
+    parser.add_argument('--log_level', help='debug | info | warning | error', default='info')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO),
+                        format='%(asctime)s %(name)s %(levelname)s: %(message)s')
+    for noisy in ("py-json", "py-json.LANforge", "lanforge_client"):
+        logging.getLogger(noisy).setLevel(logging.WARNING)
+
+    model = lf_replay_gui.lf_gui_model(event_rate=args.event_rate,
+                                       load_delay_sec=args.load_delay_sec,
+                                       build_delay_sec=args.build_delay_sec)
+    server = lf_replay_gui.lf_replay_gui(host="127.0.0.1",
+                                         port=0,
+                                         model=model,
+                                         latency_ms=args.latency_ms).start()
+    try:
+        bench = lf_event_wait_bench(server=server,
+                                    runs=args.runs,
+                                    load_delay_sec=args.load_delay_sec,
+                                    build_delay_sec=args.build_delay_sec,
+                                    timeout_sec=args.timeout_sec)
+        results = bench.run()
+    finally:
+        server.stop()
+
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump({"args": vars(args), "results": results}, json_file, indent=2)
+        logger.info("wrote {path}".format(path=args.json))
+
+
+if __name__ == '__main__':
+    main()
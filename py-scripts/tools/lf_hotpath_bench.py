@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# flake8: noqa
+'''
+NAME: lf_hotpath_bench.py
+
+PURPOSE:
+Time the hot paths of the py-json library and lanforge_client against the GUI stand-in in
+lf_replay_gui.py, so performance changes can be measured without a LANforge system:
+
+    realm_init        Realm() and its license check
+    station_create    StationProfile.create(), including wait_until_ports_appear
+    wait_for_ip       admin up and Realm.wait_for_ip
+    cx_create         L3CXProfile.create(), including waiting for the endpoints and CXs
+    monitor_tick      one L3EndpStats poll of /endp and one /port query of the stations
+    cx_cleanup        L3CXProfile.cleanup()
+    station_cleanup   StationProfile.cleanup(), including wait_until_ports_disappear
+    session_query     lanforge_client LFSession and LFJsonQuery.get_port of the model's stations
+
+With --radios N, --radio_stations stations are also created on each of N radios, first one radio
+after the other with StationProfile.create (radios_serial), then with the per-radio workers of
+py-json/station_pipeline.py (radios_pipeline), and removed after each.
+
+With --multicast, a multicast sender and a receiver on each benchmark station are created,
+started and stopped with MULTICASTProfile.create_mc_rx/start_mc/stop_mc (mc_serial), then with
+the batched create_mc_rx_batched/start_group/stop_group (mc_batched).  The batched receivers
+are then started again, outside the timed phases, and mc_monitor_tick polls their loss and
+latency (py-json/multicast_stats.py).
+
+For each phase the wall time, the number of HTTP requests and the time spent in them are
+reported (from lanforge_client/http_stats.py).  The stand-in is started in this process unless
+--mgr is given; --latency_ms emulates the round trip to a remote GUI.  --coalesce_sec turns on
+lanforge_client/single_flight.py and reports the GETs it answered without a request.
+
+EXAMPLE:
+    ./lf_hotpath_bench.py --num_ports 500 --num_endps 1000 --stations 20 --ticks 20
+    ./lf_hotpath_bench.py --latency_ms 2 --json /tmp/hotpath.json
+    ./lf_hotpath_bench.py --radios 8 --radio_stations 63 --latency_ms 2
+    ./lf_hotpath_bench.py --multicast --stations 200 --latency_ms 1
+    # against a stand-in or GUI that is already running, cleaning up what was created
+    ./lf_hotpath_bench.py --mgr 127.0.0.1 --mgr_port 8080 --radio 1.1.wiphy0
+
+COPYRIGHT:
+    Copyright 2024 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+'''
+import argparse
+import gc
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+realm = importlib.import_module("py-json.realm")
+Realm = realm.Realm
+LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+http_stats = importlib.import_module("lanforge_client.http_stats")
+single_flight = importlib.import_module("lanforge_client.single_flight")
+lanforge_api = importlib.import_module("lanforge_client.lanforge_api")
+lf_replay_gui = importlib.import_module("py-scripts.tools.lf_replay_gui")
+
+logger = logging.getLogger(__name__)
+
+
+class lf_hotpath_bench:
+    def __init__(self,
+                 mgr="127.0.0.1",
+                 mgr_port=8080,
+                 radio="1.1.wiphy0",
+                 upstream="1.1.eth1",
+                 stations=10,
+                 ticks=10,
+                 radios=0,
+                 radio_stations=10,
+                 max_in_flight=8,
+                 multicast=False):
+        self.mgr = mgr
+        self.mgr_port = mgr_port
+        self.radio = radio
+        self.upstream = upstream
+        self.num_stations = stations
+        self.ticks = ticks
+        self.radios = radios
+        self.radio_stations = radio_stations
+        self.max_in_flight = max_in_flight
+        self.multicast = multicast
+        self.multicast_profile = None
+        self.multicast_stats = None
+        self.pipeline_result = None
+        self.results = []
+        self.local_realm = None
+        self.station_profile = None
+        self.cx_profile = None
+        self.l3_endp_stats = None
+        self.station_list = []
+        self.session = None
+
+    def phase(self, name=None, fn=None, repeat=1):
+        """
+        Run fn repeat times and record wall time and HTTP requests.
+        """
+        http_stats.reset()
+        single_flight.reset_counters()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        elapsed = time.perf_counter() - start
+        totals = http_stats.totals()
+        result = {
+            "phase": name,
+            "repeat": repeat,
+            "wall_ms": round(elapsed * 1000, 3),
+            "wall_ms_each": round(elapsed * 1000 / repeat, 3),
+            "requests": totals["requests"],
+            "requests_each": round(totals["requests"] / repeat, 1),
+            "http_ms": totals["total_ms"],
+            "errors": totals["errors"],
+            "coalesced": single_flight.counters()["coalesced"],
+        }
+        self.results.append(result)
+        logger.info("{phase:16s} {wall_ms:10.1f} ms  {requests:6d} requests  {http_ms:10.1f} ms in http".format(**result))
+        return result
+
+    def realm_init(self):
+        self.local_realm = Realm(lfclient_host=self.mgr, lfclient_port=self.mgr_port)
+
+    def station_create(self):
+        self.station_list = LFUtils.port_name_series(prefix="bench",
+                                                     start_id=0,
+                                                     end_id=self.num_stations - 1,
+                                                     padding_number=10000,
+                                                     radio=self.radio)
+        self.station_profile = self.local_realm.new_station_profile()
+        self.station_profile.use_security("open", ssid="standin", passwd="[BLANK]")
+        self.station_profile.set_command_flag("add_sta", "create_admin_down", 1)
+        self.station_profile.set_command_param("set_port", "report_timer", 1500)
+        self.station_profile.set_command_flag("set_port", "rpt_timer", 1)
+        if not self.station_profile.create(radio=self.radio, sta_names_=self.station_list, sleep_time=0):
+            logger.warning("station_profile.create did not report success")
+
+    def wait_for_ip(self):
+        self.station_profile.admin_up()
+        if not self.local_realm.wait_for_ip(self.station_list, timeout_sec=60):
+            logger.warning("not every station got an IP")
+
+    def cx_create(self):
+        self.cx_profile = self.local_realm.new_l3_cx_profile()
+        self.cx_profile.name_prefix = "bench-"
+        self.cx_profile.side_a_min_bps = 1000000
+        self.cx_profile.side_b_min_bps = 1000000
+        self.cx_profile.create(endp_type="lf_udp", side_a=self.station_list, side_b=self.upstream, sleep_time=0)
+        self.cx_profile.start_cx()
+        self.l3_endp_stats = self.local_realm.new_l3_endp_stats()
+        self.l3_endp_stats.register_cx_profile(self.cx_profile)
+
+    def monitor_tick(self):
+        if self.l3_endp_stats.poll():
+            mask = self.l3_endp_stats.mask(owned_only=True)
+            self.l3_endp_stats.totals_by_side('rx rate', mask)
+        eid = LFUtils.name_to_eid(self.station_list[0])
+        names = ",".join(LFUtils.name_to_eid(station)[2] for station in self.station_list)
+        self.local_realm.json_get("/port/%s/%s/%s?fields=alias,ip,signal,channel,rx-rate,tx-rate"
+                                  % (eid[0], eid[1], names))
+
+    def multicast_profile_new(self, prefix=None):
+        self.multicast_profile = self.local_realm.new_multicast_profile()
+        self.multicast_profile.name_prefix = prefix
+        self.multicast_profile.create_mc_tx("mc_udp", self.upstream)
+        return self.multicast_profile
+
+    def mc_serial(self):
+        profile = self.multicast_profile_new("mcs-")
+        profile.create_mc_rx("mc_udp", side_rx=self.station_list)
+        profile.start_mc()
+        profile.stop_mc()
+
+    def mc_batched(self):
+        profile = self.multicast_profile_new("mcb-")
+        profile.create_mc_rx_batched("mc_udp", side_rx=self.station_list, max_in_flight=self.max_in_flight)
+        profile.start_group(max_in_flight=self.max_in_flight)
+        profile.stop_group(max_in_flight=self.max_in_flight)
+
+    def mc_monitor_setup(self):
+        self.multicast_profile.start_group(max_in_flight=self.max_in_flight)
+        self.multicast_stats = self.multicast_profile.new_stats()
+
+    def mc_monitor_tick(self):
+        if self.multicast_stats.poll():
+            self.multicast_stats.group_summary()
+
+    def mc_cleanup(self):
+        self.multicast_profile.cleanup()
+
+    def cx_cleanup(self):
+        self.cx_profile.cleanup()
+
+    def station_cleanup(self):
+        self.station_profile.cleanup(self.station_list, delay=0)
+
+    def radio_station_names(self):
+        shelf, resource = LFUtils.name_to_eid(self.radio)[:2]
+        groups = {}
+        for radio_id in range(self.radios):
+            radio = "%s.%s.wiphy%d" % (shelf, resource, radio_id)
+            groups[radio] = LFUtils.port_name_series(prefix="mr%d" % radio_id,
+                                                     start_id=0,
+                                                     end_id=self.radio_stations - 1,
+                                                     padding_number=10000,
+                                                     radio=radio)
+        return groups
+
+    def radio_profile(self):
+        profile = self.local_realm.new_station_profile()
+        profile.use_security("open", ssid="standin", passwd="[BLANK]")
+        profile.set_command_flag("add_sta", "create_admin_down", 1)
+        profile.up = False
+        return profile
+
+    def radios_serial(self):
+        profile = self.radio_profile()
+        for radio, names in self.radio_station_names().items():
+            profile.create(radio=radio, sta_names_=names, sleep_time=0)
+
+    def radios_pipeline(self):
+        profile = self.radio_profile()
+        self.pipeline_result = profile.new_pipeline(max_in_flight=self.max_in_flight) \
+            .create(self.radio_station_names())
+        logger.info("radios_pipeline stages: %s" % ", ".join(
+            "%s %d/%.1f ms" % (stage, totals["requests"], totals["ms"])
+            for stage, totals in self.pipeline_result["stages"].items()))
+
+    def radios_cleanup(self):
+        names = [name for names in self.radio_station_names().values() for name in names]
+        self.radio_profile().cleanup(names, delay=0)
+
+    def session_query(self):
+        self.session = lanforge_api.LFSession(lfclient_url="http://%s:%s" % (self.mgr, self.mgr_port))
+        ports = self.local_realm.json_get("/port/list?fields=alias,port+type")
+        eids = [list(entry.keys())[0] for entry in ports.get("interfaces", [])][:200]
+        self.session.get_query().get_port(eid_list=eids, requested_col_names=["alias", "ip", "signal"])
+
+    def close(self):
+        # LFSession ends its session when collected, do that while the server is still up
+        self.session = None
+        gc.collect()
+
+    def run(self):
+        http_stats.enable()
+        self.phase("realm_init", self.realm_init)
+        self.phase("station_create", self.station_create)
+        self.phase("wait_for_ip", self.wait_for_ip)
+        self.phase("cx_create", self.cx_create)
+        self.phase("monitor_tick", self.monitor_tick, repeat=self.ticks)
+        if self.multicast:
+            self.phase("mc_serial", self.mc_serial)
+            self.mc_cleanup()
+            self.phase("mc_batched", self.mc_batched)
+            self.mc_monitor_setup()
+            self.phase("mc_monitor_tick", self.mc_monitor_tick, repeat=self.ticks)
+            self.multicast_profile.stop_group()
+            self.mc_cleanup()
+        self.phase("cx_cleanup", self.cx_cleanup)
+        self.phase("station_cleanup", self.station_cleanup)
+        if self.radios:
+            self.phase("radios_serial", self.radios_serial)
+            self.radios_cleanup()
+            self.phase("radios_pipeline", self.radios_pipeline)
+            self.radios_cleanup()
+        self.phase("session_query", self.session_query)
+        return self.results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lf_hotpath_bench.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='''
+Benchmark the station build, wait-for-IP, CX create, monitor tick and cleanup paths
+against the LANforge GUI stand-in (lf_replay_gui.py).
+''')
+    parser.add_argument('--mgr', help='use this running GUI or stand-in instead of starting one', default=None)
+    parser.add_argument('--mgr_port', help='port of --mgr', type=int, default=8080)
+    parser.add_argument('--radio', help='radio for the benchmark stations', default='1.1.wiphy0')
+    parser.add_argument('--upstream', help='B side of the benchmark CXs', default='1.1.eth1')
+    parser.add_argument('--stations', help='stations to create', type=int, default=10)
+    parser.add_argument('--radios', help='also create stations on this many radios, serially and concurrently',
+                        type=int, default=0)
+    parser.add_argument('--radio_stations', help='stations per radio for --radios', type=int, default=10)
+    parser.add_argument('--max_in_flight', help='commands outstanding at once in the station pipeline',
+                        type=int, default=8)
+    parser.add_argument('--multicast', help='also time multicast receivers on the stations, serial and batched',
+                        action='store_true')
+    parser.add_argument('--ticks', help='monitor ticks to time', type=int, default=10)
+    parser.add_argument('--num_ports', help='stations already in the stand-in model', type=int, default=200)
+    parser.add_argument('--num_endps', help='running endpoints already in the stand-in model', type=int, default=400)
+    parser.add_argument('--recording', help='recording for the stand-in to replay', default=None)
+    parser.add_argument('--latency_ms', help='stand-in delay per response', type=float, default=0.0)
+    parser.add_argument('--jitter_ms', help='stand-in random extra delay', type=float, default=0.0)
+    parser.add_argument('--coalesce_sec', help='share identical GETs, and results this many seconds old',
+                        type=float, default=None)
+    parser.add_argument('--json', help='write the results to this json file', default=None)
+    parser.add_argument('--log_level', help='debug | info | warning | error', default='info')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO),
+                        format='%(asctime)s %(name)s %(levelname)s: %(message)s')
+    # the library logs every port and endpoint it waits for
+    for noisy in ("py-json", "py-json.LANforge", "lanforge_client"):
+        logging.getLogger(noisy).setLevel(logging.WARNING)
+
+    if args.coalesce_sec is not None:
+        single_flight.enable(window_sec=args.coalesce_sec)
+    server = None
+    mgr, mgr_port = args.mgr, args.mgr_port
+    if mgr is None:
+        model = lf_replay_gui.lf_gui_model(num_ports=args.num_ports, num_endps=args.num_endps)
+        recording = lf_replay_gui.lf_gui_recording(args.recording) if args.recording else None
+        server = lf_replay_gui.lf_replay_gui(host="127.0.0.1",
+                                             port=0,
+                                             model=model,
+                                             recording=recording,
+                                             latency_ms=args.latency_ms,
+                                             jitter_ms=args.jitter_ms).start()
+        mgr, mgr_port = server.server_address[:2]
+        logger.info("stand-in at {url} with {ports} stations and {endps} endpoints".format(
+            url=server.url, ports=args.num_ports, endps=args.num_endps))
+
+    bench = lf_hotpath_bench(mgr=mgr,
+                             mgr_port=mgr_port,
+                             radio=args.radio,
+                             upstream=args.upstream,
+                             stations=args.stations,
+                             ticks=args.ticks,
+                             radios=args.radios,
+                             radio_stations=args.radio_stations,
+                             max_in_flight=args.max_in_flight,
+                             multicast=args.multicast)
+    try:
+        results = bench.run()
+    finally:
+        bench.close()
+        if server is not None:
+            server.stop()
+
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump({"args": vars(args), "results": results}, json_file, indent=2)
+        logger.info("wrote {path}".format(path=args.json))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# flake8: noqa
+'''
+NAME: lf_import_bench.py
+
+PURPOSE:
+Measure how long short-lived scripts spend importing the LANforge libraries.  Each run
+starts a new interpreter with -X importtime, so the numbers include everything a script
+pays before its first request: unmarshalling the byte code and running the module body.
+
+For every module the median self and cumulative import time over --runs interpreters is
+reported.  For lanforge_client.lanforge_api the cost of the first use of a flag class and of
+LFSession.find_method style lookups is timed as well, since those are built on demand.
+
+Byte code is compiled before timing (python usually runs with it cached); use --no_compile
+to time the imports the way they are when PYTHONDONTWRITEBYTECODE is set.
+
+EXAMPLE:
+    ./lf_import_bench.py
+    ./lf_import_bench.py --runs 20 --module lanforge_client.lanforge_api --module py-json.realm
+    ./lf_import_bench.py --json /tmp/import_bench.json
+
+COPYRIGHT:
+    Copyright 2024 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+'''
+import argparse
+import compileall
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+
+logger = logging.getLogger(__name__)
+
+REPO_TOP = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+
+# timed in the child interpreter after importing lanforge_api
+FIRST_USE_SNIPPET = '''
+import time
+from lanforge_client.lanforge_api import LFJsonCommand, MethodRegistry, CLI_COMMAND_NAMES, QUERY_URL_NAMES
+start = time.perf_counter()
+flags = LFJsonCommand.AddStaFlags
+flags_ms = (time.perf_counter() - start) * 1000
+
+class _session:
+    command_instance = LFJsonCommand.__new__(LFJsonCommand)
+    query_instance = None
+
+start = time.perf_counter()
+registry = MethodRegistry(session_obj=_session, cli_commands=CLI_COMMAND_NAMES, query_urls=QUERY_URL_NAMES)
+registry["add_sta"]
+registry["set_port"]
+lookup_ms = (time.perf_counter() - start) * 1000
+print("FIRST_USE %f %f" % (flags_ms, lookup_ms))
+'''
+
+
+class lf_import_bench:
+    def __init__(self,
+                 modules=None,
+                 runs=10,
+                 compile_first=True):
+        self.modules = modules or ["lanforge_client.lanforge_api"]
+        self.runs = runs
+        self.compile_first = compile_first
+        self.results = []
+
+    def child_env(self):
+        env = dict(os.environ)
+        env["PYTHONPATH"] = REPO_TOP + os.pathsep + env.get("PYTHONPATH", "")
+        return env
+
+    def compile(self):
+        for directory in ("lanforge_client", "py-json"):
+            compileall.compile_dir(os.path.join(REPO_TOP, directory), quiet=1, maxlevels=2)
+
+    def import_once(self, module=None):
+        """
+        :return: (self_ms, cumulative_ms, first use line or None) for one new interpreter
+        """
+        # -X importtime only reports the import statement, not importlib.import_module()
+        code = "__import__(%r)" % module
+        if module == "lanforge_client.lanforge_api":
+            code += "\n" + FIRST_USE_SNIPPET
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                   env=self.child_env(),
+                                   cwd=REPO_TOP,
+                                   capture_output=True,
+                                   text=True)
+        if completed.returncode != 0:
+            raise RuntimeError("importing %s failed:\n%s" % (module, completed.stderr))
+        self_ms = cumulative_ms = None
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            parts = [part.strip() for part in line[len("import time:"):].split("|")]
+            if len(parts) == 3 and parts[2].strip() == module:
+                self_ms = int(parts[0]) / 1000
+                cumulative_ms = int(parts[1]) / 1000
+        first_use = None
+        for line in completed.stdout.splitlines():
+            if line.startswith("FIRST_USE "):
+                first_use = [float(value) for value in line.split()[1:]]
+        return self_ms, cumulative_ms, first_use
+
+    def run(self):
+        if self.compile_first:
+            self.compile()
+        for module in self.modules:
+            self_times, cumulative_times, flag_times, lookup_times = [], [], [], []
+            for _ in range(self.runs):
+                self_ms, cumulative_ms, first_use = self.import_once(module)
+                if self_ms is None:
+                    raise RuntimeError("no -X importtime line for %s" % module)
+                self_times.append(self_ms)
+                cumulative_times.append(cumulative_ms)
+                if first_use:
+                    flag_times.append(first_use[0])
+                    lookup_times.append(first_use[1])
+            result = {
+                "module": module,
+                "runs": self.runs,
+                "self_ms": round(statistics.median(self_times), 3),
+                "cumulative_ms": round(statistics.median(cumulative_times), 3),
+                "cumulative_ms_min": round(min(cumulative_times), 3),
+            }
+            if flag_times:
+                result["first_flag_class_ms"] = round(statistics.median(flag_times), 3)
+                result["first_method_lookup_ms"] = round(statistics.median(lookup_times), 3)
+            self.results.append(result)
+            logger.info(" ".join("%s=%s" % (key, value) for key, value in result.items()))
+        return self.results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lf_import_bench.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='''
+Time the import of LANforge library modules in new interpreters.
+''')
+    parser.add_argument('--module', help='module to import, may be repeated\n'
+                                         'default: lanforge_client.lanforge_api',
+                        action='append', default=None)
+    parser.add_argument('--runs', help='interpreters to start per module', type=int, default=10)
+    parser.add_argument('--no_compile', help='do not compile byte code before timing', action='store_true')
+    parser.add_argument('--json', help='write the results to this json file', default=None)
+    parser.add_argument('--log_level', help='debug | info | warning | error', default='info')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO),
+                        format='%(asctime)s %(name)s %(levelname)s: %(message)s')
+
+    bench = lf_import_bench(modules=args.module,
+                            runs=args.runs,
+                            compile_first=not args.no_compile)
+    results = bench.run()
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump({"args": vars(args), "results": results}, json_file, indent=2)
+        logger.info("wrote {path}".format(path=args.json))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# flake8: noqa
+'''
+NAME: lf_lfdata_bench.py
+
+PURPOSE:
+Compare the endpoint/port join of LFDataCollection (py-json/lfdata.py) with the nested
+loop monitor_interval used before, on synthetic /endp and /port responses:
+
+    legacy   for each endpoint, for each station, for each port, substring matches
+             (a copy of the previous code, made to go on past the first endpoint so
+             both build the same rows)
+    join     port_map once per tick, then one lookup per endpoint
+
+Both results are checked to be the same rows before the times are reported.
+
+EXAMPLE:
+    ./lf_lfdata_bench.py
+    ./lf_lfdata_bench.py --endpoints 1000 --ticks 20
+    ./lf_lfdata_bench.py --json /tmp/lfdata_join.json
+
+COPYRIGHT:
+    Copyright 2024 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+'''
+import argparse
+import importlib
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
+
+lfdata = importlib.import_module("py-json.lfdata")
+LFDataCollection = lfdata.LFDataCollection
+
+logger = logging.getLogger(__name__)
+
+LAYER3_FIELDS = ("name", "tx bytes", "rx bytes", "tx rate", "rx rate", "dropped")
+PORT_FIELDS = ("alias", "signal", "channel", "mode", "ap")
+
+
+class lf_lfdata_bench:
+    def __init__(self, endpoints=1000, ticks=10):
+        self.endpoints = endpoints
+        self.ticks = ticks
+        # two endpoints per cross connect, one cross connect per station
+        self.stations = ["sta%04d" % n for n in range(max(endpoints // 2, 1))]
+        self.columns = list(LAYER3_FIELDS) + ["port mgr - " + field for field in PORT_FIELDS]
+
+    def responses(self, tick=0):
+        endpoints = []
+        for n in range(self.endpoints):
+            name = "VT%s-%s" % (self.stations[(n // 2) % len(self.stations)], "AB"[n % 2])
+            endpoints.append({name: {"name": name, "tx bytes": 1000 * tick + n, "rx bytes": 900 * tick + n,
+                                     "tx rate": 56000, "rx rate": 55000 + n, "dropped": n % 7}})
+        interfaces = []
+        for n, station in enumerate(self.stations):
+            interfaces.append({"1.1.%s" % station: {"alias": station, "signal": -40 - n % 30, "channel": 36,
+                                                    "mode": "802.11an-AC", "ap": "00:0e:8e:%02x:00:01" % (n % 256)}})
+        return {"endpoint": endpoints}, {"interfaces": interfaces}
+
+    def legacy(self, layer_3_response=None, port_mgr_response=None, base=()):
+        rows = []
+        for endpoint in layer_3_response['endpoint']:
+            endp_name = list(endpoint.keys())[0]
+            for sta_name in self.stations:
+                if sta_name in endp_name:
+                    merge = {}
+                    for interface in port_mgr_response['interfaces']:
+                        if sta_name in list(interface.keys())[0]:
+                            merge = endpoint[endp_name].copy()
+                            port_mgr_values_dict = list(interface.values())[0]
+                            renamed_port_cols = {}
+                            for key in port_mgr_values_dict.keys():
+                                renamed_port_cols['port mgr - ' + key] = port_mgr_values_dict[key]
+                            merge.update(renamed_port_cols)
+                    rows.append(list(base) + [merge[name] for name in self.columns])
+        return rows
+
+    def join(self, layer_3_response=None, port_mgr_response=None, base=()):
+        ports = LFDataCollection.port_map(port_mgr_response, self.stations)
+        return LFDataCollection.join_rows(layer_3_response, ports, self.columns, base)
+
+    def run(self):
+        result = {"endpoints": self.endpoints, "stations": len(self.stations), "ticks": self.ticks}
+        for name, method in (("legacy", self.legacy), ("join", self.join)):
+            times = []
+            for tick in range(self.ticks):
+                layer_3_response, port_mgr_response = self.responses(tick)
+                started = time.perf_counter()
+                rows = method(layer_3_response, port_mgr_response)
+                times.append((time.perf_counter() - started) * 1000)
+                if name == "join":
+                    expected = self.legacy(layer_3_response, port_mgr_response)
+                    if rows != expected:
+                        raise ValueError("join rows differ from the legacy rows at tick %d" % tick)
+            result[name] = {"rows": len(rows),
+                            "median_ms": round(statistics.median(times), 3),
+                            "max_ms": round(max(times), 3)}
+        result["speedup"] = round(result["legacy"]["median_ms"] / max(result["join"]["median_ms"], 1e-6), 1)
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lf_lfdata_bench.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='Time the LFDataCollection endpoint/port join against the nested loop it replaced.')
+    parser.add_argument('--endpoints', help='layer-3 endpoints per tick, two per station', type=int, default=1000)
+    parser.add_argument('--ticks', help='ticks to time', type=int, default=10)
+    parser.add_argument('--json', help='write the results to this file', default=None)
+    parser.add_argument('--log_level', help='debug | info | warning | error', default='info')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO),
+                        format='%(asctime)s %(name)s %(levelname)s: %(message)s')
+
+    result = lf_lfdata_bench(endpoints=args.endpoints, ticks=args.ticks).run()
+    for name in ("legacy", "join"):
+        print("%-7s rows %6d  median %9.3f ms  max %9.3f ms"
+              % (name, result[name]["rows"], result[name]["median_ms"], result[name]["max_ms"]))
+    print("speedup %.1fx for %d endpoints" % (result["speedup"], result["endpoints"]))
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(result, json_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,955 @@
+#!/usr/bin/env python3
+# flake8: noqa
+'''
+NAME: lf_replay_gui.py
+
+PURPOSE:
+Stand-in for the LANforge GUI JSON API, so Realm, the py-json profiles and the lanforge_client
+generated methods can be run and benchmarked without a LANforge system.
+
+The stand-in answers from two sources:
+  * a recording made against a real GUI: run any script with
+        LF_HTTP_RECORD=/tmp/run.jsonl ./test_l3.py ...
+    and every request and response is appended to /tmp/run.jsonl (see lanforge_client/http_stats.py).
+    Responses are replayed in the order they were recorded for each method and url.
+  * a synthetic model with --num_ports stations and --num_endps layer-3 endpoints that serves
+    /port, /endp, /cx, /events, /misc/license, / and applies the cli-json commands the profiles send
+    (add_sta, set_port, rm_vlan, add_endp, add_cx, set_cx_state, rm_cx, rm_endp ...), so stations
+    appear, get an IP after --ip_delay_sec and running endpoints count bytes.
+    It is also a fake event source: --event_rate background events per second, a database 'load'
+    logs its completion after --load_delay_sec, and the Chamber View commands sent to /gui-json/cmd
+    (cv sync, apply, build, is_built, get_and_close_dialog) report built --build_delay_sec after
+    'cv build', logging the ports the build creates on the way.
+    Generic endpoints (add_gen_endp, set_gen_cmd) are served on /generic; running ones report
+    'last results' in the format of their command (lfping/ping, iperf3, speedtest, lf_curl).
+    Layer-4 endpoints (add_l4_endp) are served on /layer4 and count urls and bytes at their url_rate.
+    Multicast endpoints (set_mc_endp, start_endp, stop_endp) either send or receive, and the
+    receivers report a small 'rx drop %'.
+With both, requests missing from the recording are answered by the model.
+
+--latency_ms and --jitter_ms delay every response to emulate the round trip to a remote GUI.
+
+EXAMPLE:
+    # synthetic system with 500 stations and 1000 endpoints, 2ms round trip
+    ./lf_replay_gui.py --port 8080 --num_ports 500 --num_endps 1000 --latency_ms 2
+
+    # replay a recording, fall back to an empty model
+    ./lf_replay_gui.py --port 8080 --recording /tmp/run.jsonl
+
+    See lf_hotpath_bench.py for the benchmarks that run against it.
+
+COPYRIGHT:
+    Copyright 2024 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+'''
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+import urllib.parse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# counters of a layer-4 endpoint that L4CXProfile.check_errors looks at
+L4_ERROR_FIELDS = ("!conn", "acc. denied", "bad-proto", "bad-url", "other-err", "total-err", "rslv-p", "rslv-h",
+                   "timeout", "nf (4xx)", "http-r", "http-p", "http-t", "login-denied")
+
+# set_port flags used by the model
+IF_DOWN = 0x1
+INTEREST_IFDOWN = 0x800000
+
+HANDLER = "candela.lanforge.HttpReplay$JsonResponse"
+LICENSE = "FEATURE 1 STANDIN Stand-in forever\n"
+
+
+def flag_value(value=None):
+    """
+    set_port flags arrive as numbers or as hex/decimal strings
+    """
+    if value is None or value == "NA":
+        return 0
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value), 0)
+    except ValueError:
+        return 0
+
+
+class lf_gui_model:
+    def __init__(self,
+                 num_ports=0,
+                 num_endps=0,
+                 resource=1,
+                 num_radios=2,
+                 ip_delay_sec=0.0,
+                 appear_delay_sec=0.0,
+                 event_rate=0.0,
+                 load_delay_sec=1.0,
+                 build_delay_sec=1.0,
+                 seed=0):
+        """
+        :param num_ports: stations present at start, spread over the radios
+        :param num_endps: layer-3 endpoints present and running at start, in A/B pairs
+        :param ip_delay_sec: time after admin-up before a DHCP station has an IP
+        :param appear_delay_sec: time after add_sta before the station is listed
+        :param event_rate: unrelated events logged per second
+        :param load_delay_sec: time after a database load until it is logged as completed
+        :param build_delay_sec: time after 'cv build' until Chamber View is built
+        """
+        self.lock = threading.RLock()
+        self.resource = resource
+        self.ip_delay_sec = ip_delay_sec
+        self.appear_delay_sec = appear_delay_sec
+        self.random = random.Random(seed)
+        self.started = time.time()
+
+        # port eid "1.1.name" -> record, in creation order
+        self.ports = {}
+        # "1.1.3" -> port eid, for requests by port number
+        self.port_ids = {}
+        self.port_ready_at = {}
+        self.ip_at = {}
+        self.next_port_id = 1
+        # endpoint name -> record
+        self.endps = {}
+        self.endp_started = {}
+        self.next_endp_id = 1
+        # cx name -> record
+        self.cxs = {}
+        # generic endpoint name -> record
+        self.gen_endps = {}
+        # layer-4 endpoint name -> record
+        self.l4_endps = {}
+        self.events = []
+        self.next_event_id = 1000
+        self.event_rate = event_rate
+        self.load_delay_sec = load_delay_sec
+        self.build_delay_sec = build_delay_sec
+        # (due time, message, entity) logged once due, in due order
+        self.scheduled_events = []
+        self.chatter_at = self.started
+        self.built_at = self.started
+
+        self.add_port("eth0", port_type="Ethernet", ip="192.168.100.10", down=False)
+        self.add_port("eth1", port_type="Ethernet", ip="10.40.0.1", down=False)
+        for radio in range(num_radios):
+            self.add_port("wiphy%d" % radio, port_type="WIFI-Radio", ip="0.0.0.0", down=False)
+        for i in range(num_ports):
+            name = "sta%05d" % i
+            self.add_port(name,
+                          port_type="WIFI-STA",
+                          parent="wiphy%d" % (i % max(num_radios, 1)),
+                          ip="10.40.%d.%d" % (1 + i // 250, 1 + i % 250),
+                          down=False)
+        stations = [eid for eid, port in self.ports.items() if port["port type"] == "WIFI-STA"]
+        eth1 = "1.%d.eth1" % resource
+        for i in range(num_endps // 2):
+            cx_name = "standin-%d" % i
+            side_a = stations[i % len(stations)] if stations else eth1
+            self.add_endp(cx_name + "-A", side_a, rate=self.random.randint(1, 10) * 1000000)
+            self.add_endp(cx_name + "-B", eth1, rate=self.random.randint(1, 10) * 1000000)
+            self.add_cx(cx_name, cx_name + "-A", cx_name + "-B")
+            self.set_cx_state(cx_name, "RUNNING")
+
+    # ----- ----- ports ----- -----
+    def add_port(self, name=None, port_type="WIFI-STA", parent=None, ip="0.0.0.0", down=True, resource=None):
+        with self.lock:
+            resource = self.resource if resource is None else int(resource)
+            eid = "1.%d.%s" % (resource, name)
+            port_id = self.next_port_id
+            self.next_port_id += 1
+            self.ports[eid] = {
+                "_links": "/port/1/%d/%d" % (resource, port_id),
+                "alias": name,
+                "port": "1.%d.%d" % (resource, port_id),
+                "device": name,
+                "port type": port_type,
+                "parent dev": parent or "",
+                "phantom": False,
+                "down": down,
+                "ip": ip,
+                "ipv6 address": "DELETED",
+                "mac": "00:0e:8e:%02x:%02x:%02x" % ((port_id >> 16) & 0xff, (port_id >> 8) & 0xff, port_id & 0xff),
+                "ssid": "standin" if port_type == "WIFI-STA" else "",
+                "channel": "36" if port_type != "Ethernet" else "-1",
+                "mode": "802.11an-AX" if port_type != "Ethernet" else "",
+                "signal": "-%d dBm" % self.random.randint(35, 70) if port_type == "WIFI-STA" else "",
+                "ap": "00:0e:8e:00:00:01" if port_type == "WIFI-STA" else "",
+                "rx bytes": 0,
+                "tx bytes": 0,
+                "bps rx": 0,
+                "bps tx": 0,
+                "rx-rate": "1200.9 Mbps" if port_type == "WIFI-STA" else "",
+                "tx-rate": "1200.9 Mbps" if port_type == "WIFI-STA" else "",
+                "mtu": 1500,
+                "qlen": 1000,
+            }
+            self.port_ids["1.%d.%d" % (resource, port_id)] = eid
+            self.port_ready_at[eid] = 0
+            return eid
+
+    def find_port(self, resource=None, name=None):
+        eid = "1.%s.%s" % (resource, name)
+        if eid in self.ports:
+            return eid
+        eid = self.port_ids.get("1.%s.%s" % (resource, name))
+        if eid in self.ports:
+            return eid
+        return None
+
+    def port_view(self, eid=None, now=None):
+        port = self.ports[eid]
+        ip_at = self.ip_at.get(eid)
+        if ip_at is not None and now >= ip_at:
+            port_id = int(port["port"].split('.')[-1])
+            port["ip"] = "10.41.%d.%d" % (port_id // 250, 1 + port_id % 250)
+            del self.ip_at[eid]
+        return port
+
+    def visible_ports(self, now=None):
+        return [eid for eid in self.ports if self.port_ready_at[eid] <= now]
+
+    # ----- ----- endpoints and cross connects ----- -----
+    def add_endp(self, name=None, port_eid=None, endp_type="LF/UDP", rate=1000000):
+        with self.lock:
+            port_id = self.ports[port_eid]["port"] if port_eid in self.ports else "1.%d.0" % self.resource
+            endp_id = self.next_endp_id
+            self.next_endp_id += 1
+            self.endps[name] = {
+                "name": name,
+                "eid": "%s.%d" % (port_id, endp_id),
+                "type": endp_type,
+                "run": False,
+                "a/b": "A" if name.endswith("-A") else "B",
+                "tx rate": 0,
+                "rx rate": 0,
+                "rx rate ll": 0,
+                "tx bytes": 0,
+                "rx bytes": 0,
+                "tx pkts ll": 0,
+                "rx pkts ll": 0,
+                "rx drop %": 0.0,
+                "delay": 0,
+                "jitter": 0,
+                "max rate": rate,
+                "port": port_eid,
+            }
+
+    def endp_view(self, name=None, now=None):
+        endp = self.endps[name]
+        started = self.endp_started.get(name)
+        if endp["run"] and started is not None:
+            start_time, rx_bytes, tx_bytes = started
+            elapsed = max(now - start_time, 0)
+            rate = endp["max rate"]
+            endp["rx rate"] = endp["rx rate ll"] = endp["tx rate"] = rate
+            endp["rx bytes"] = rx_bytes + int(rate / 8 * elapsed)
+            endp["tx bytes"] = tx_bytes + int(rate / 8 * elapsed)
+            if "mcast group" in endp:
+                # multicast endpoints only send or only receive, receivers lose 0 to 2% of the packets
+                if endp["rcv mcast"]:
+                    loss = (zlib.crc32(name.encode()) % 5) / 200
+                    endp["rx rate"] = endp["rx rate ll"] = int(rate * (1 - loss))
+                    endp["rx bytes"] = rx_bytes + int(rate * (1 - loss) / 8 * elapsed)
+                    endp["rx drop %"] = loss * 100
+                    endp["tx rate"], endp["tx bytes"] = 0, tx_bytes
+                else:
+                    endp["rx rate"] = endp["rx rate ll"] = 0
+                    endp["rx bytes"] = rx_bytes
+            endp["rx pkts ll"] = endp["rx bytes"] // 1500
+            endp["tx pkts ll"] = endp["tx bytes"] // 1500
+            endp["delay"] = 1200 + (zlib.crc32(name.encode()) % 800)
+            endp["jitter"] = 50 + (zlib.crc32(name.encode()) % 50)
+        return endp
+
+    def add_gen_endp(self, name=None, port_eid=None):
+        with self.lock:
+            port_id = self.ports[port_eid]["port"] if port_eid in self.ports else "1.%d.0" % self.resource
+            endp_id = self.next_endp_id
+            self.next_endp_id += 1
+            self.gen_endps[name] = {
+                "name": name,
+                "eid": "%s.%d" % (port_id, endp_id),
+                "type": "gen_generic",
+                "command": "",
+                "run": False,
+                "tx pkts": 0,
+                "rx pkts": 0,
+                "dropped": 0,
+                "tx bytes": 0,
+                "rx bytes": 0,
+                "last results": "",
+            }
+
+    @staticmethod
+    def gen_results(command=None, seq=0, name=""):
+        """
+        :return: 'last results' of a generic endpoint running command for seq seconds
+        """
+        words = command.split()
+        rtt = 1.0 + (zlib.crc32(name.encode()) % 100) / 10.0
+        if words and words[0] in ("lfping", "ping") or "lfping" in command:
+            dest = words[-1] if words else "127.0.0.1"
+            lines = ["64 bytes from %s: icmp_seq=%d ttl=64 time=%.3f ms" % (dest, i, rtt + (i % 3) / 10.0)
+                     for i in range(max(seq - 2, 1), seq + 1)]
+            lines.append("--- %s ping statistics ---" % dest)
+            lines.append("%d packets transmitted, %d received, 0%% packet loss, time %dms" % (seq, seq, seq * 1000))
+            lines.append("rtt min/avg/max/mdev = %.3f/%.3f/%.3f/0.081 ms" % (rtt, rtt + 0.1, rtt + 0.2))
+            return "\n".join(lines) + "\n"
+        if "iperf3" in command:
+            kbps = 800.0 + zlib.crc32(name.encode()) % 400
+            return "[  5]  %4d.00-%4d.00 sec   %.2f KBytes  %.4f Kbits/sec\n" % (seq - 1, seq, kbps / 8, kbps)
+        if "speedtest" in command:
+            return json.dumps({"download": 250e6 + rtt * 1e6, "upload": 50e6 + rtt * 1e5, "ping": rtt})
+        if "lf_curl" in command:
+            return "Finished %d/ %d urls in %d ms\n" % (seq, seq, int(seq * rtt * 10))
+        return "not known" if command else ""
+
+    def gen_view(self, name=None, now=None):
+        endp = self.gen_endps[name]
+        started = self.endp_started.get(name)
+        if endp["run"] and started is not None:
+            seq = int(max(now - started[0], 0)) + 1
+            endp["tx pkts"] = endp["rx pkts"] = seq
+            endp["tx bytes"] = endp["rx bytes"] = seq * 84
+            endp["last results"] = self.gen_results(endp["command"], seq, name)
+        return endp
+
+    def add_l4_endp(self, name=None, port_eid=None, url_rate=600):
+        with self.lock:
+            port_id = self.ports[port_eid]["port"] if port_eid in self.ports else "1.%d.0" % self.resource
+            endp_id = self.next_endp_id
+            self.next_endp_id += 1
+            record = {
+                "name": name,
+                "entity id": "%s.%d" % (port_id, endp_id),
+                "type": "L4",
+                "run": False,
+                "urls": 0,
+                "urls/s": 0.0,
+                "bytes-rd": 0,
+                "bytes-wr": 0,
+                "rx rate": 0,
+                "tx rate": 0,
+                "url_rate": url_rate,
+            }
+            for field in L4_ERROR_FIELDS:
+                record[field] = 0
+            self.l4_endps[name] = record
+
+    def l4_view(self, name=None, now=None):
+        endp = self.l4_endps[name]
+        started = self.endp_started.get(name)
+        if endp["run"] and started is not None:
+            elapsed = max(now - started[0], 0)
+            urls_per_sec = endp["url_rate"] / 600.0
+            endp["urls"] = started[1] + int(elapsed * urls_per_sec)
+            endp["urls/s"] = urls_per_sec
+            endp["bytes-rd"] = started[2] + int(elapsed * urls_per_sec * 10000)
+            endp["rx rate"] = int(urls_per_sec * 80000)
+        return endp
+
+    def add_cx(self, name=None, endp_a=None, endp_b=None):
+        with self.lock:
+            self.cxs[name] = {
+                "name": name,
+                "type": "Generic" if endp_a in self.gen_endps else "L4" if endp_a in self.l4_endps else "LF/UDP",
+                "state": "Stopped",
+                "endpoints (a ↔ b)": "%s ↔ %s" % (endp_a, endp_b),
+                "endp a": endp_a,
+                "endp b": endp_b,
+            }
+
+    def cx_view(self, name=None, now=None):
+        cx = self.cxs[name]
+        endp_a = self.endps.get(cx["endp a"])
+        endp_b = self.endps.get(cx["endp b"])
+        if endp_a is not None and endp_b is not None:
+            endp_a = self.endp_view(cx["endp a"], now)
+            endp_b = self.endp_view(cx["endp b"], now)
+            cx["bps rx a"] = endp_a["rx rate"]
+            cx["bps rx b"] = endp_b["rx rate"]
+            cx["rx drop % a"] = endp_a["rx drop %"]
+            cx["rx drop % b"] = endp_b["rx drop %"]
+            cx["pkt rx a"] = endp_a["rx pkts ll"]
+            cx["pkt rx b"] = endp_b["rx pkts ll"]
+            cx["avg rtt"] = (endp_a["delay"] + endp_b["delay"]) // 1000
+        return cx
+
+    def set_cx_state(self, cx_name=None, state=None):
+        with self.lock:
+            names = list(self.cxs.keys()) if cx_name in ("all", "ALL") else [cx_name]
+            now = time.time()
+            for name in names:
+                cx = self.cxs.get(name)
+                if cx is None:
+                    continue
+                if state == "DELETED":
+                    self.rm_cx(name)
+                    continue
+                running = state == "RUNNING"
+                cx["state"] = "Run" if running else "Stopped"
+                for endp_name in (cx["endp a"], cx["endp b"]):
+                    if endp_name in self.l4_endps:
+                        l4_endp = self.l4_view(endp_name, now)
+                        if running and not l4_endp["run"]:
+                            self.endp_started[endp_name] = (now, l4_endp["urls"], l4_endp["bytes-rd"])
+                        elif not running:
+                            self.endp_started.pop(endp_name, None)
+                            l4_endp["urls/s"] = 0.0
+                            l4_endp["rx rate"] = 0
+                        l4_endp["run"] = running
+                        continue
+                    if endp_name in self.gen_endps:
+                        gen_endp = self.gen_endps[endp_name]
+                        if running and not gen_endp["run"]:
+                            self.endp_started[endp_name] = (now, 0, 0)
+                        elif not running:
+                            self.endp_started.pop(endp_name, None)
+                        gen_endp["run"] = running
+                        continue
+                    self.set_endp_run(endp_name, running, now)
+
+    def set_endp_run(self, name=None, running=False, now=None):
+        with self.lock:
+            if name not in self.endps:
+                return
+            endp = self.endp_view(name, now)
+            if running and not endp["run"]:
+                self.endp_started[name] = (now, endp["rx bytes"], endp["tx bytes"])
+            elif not running:
+                self.endp_started.pop(name, None)
+                endp["rx rate"] = endp["rx rate ll"] = endp["tx rate"] = 0
+            endp["run"] = running
+
+    def rm_cx(self, name=None):
+        with self.lock:
+            self.cxs.pop(name, None)
+
+    def rm_endp(self, name=None):
+        with self.lock:
+            self.endps.pop(name, None)
+            self.gen_endps.pop(name, None)
+            self.l4_endps.pop(name, None)
+            self.endp_started.pop(name, None)
+
+    # ----- ----- events ----- -----
+    def add_event(self, message=None, entity=None):
+        with self.lock:
+            event_id = self.next_event_id
+            self.next_event_id += 1
+            self.events.append({
+                "id": event_id,
+                "event": message,
+                "event description": message,
+                "entity id": entity or "",
+                "time-stamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "priority": "Info",
+                "type": "Event",
+            })
+            # keep the event list bounded like the GUI does
+            if len(self.events) > 10000:
+                del self.events[:len(self.events) - 10000]
+
+    def schedule_event(self, delay_sec=0.0, message=None, entity=None):
+        with self.lock:
+            self.scheduled_events.append((time.time() + delay_sec, message, entity))
+            self.scheduled_events.sort(key=lambda scheduled: scheduled[0])
+
+    def log_due_events(self, now=None):
+        """
+        Log the scheduled events that are due and the background chatter since the last call.
+        """
+        with self.lock:
+            if self.event_rate > 0:
+                count = int((now - self.chatter_at) * self.event_rate)
+                if count > 0:
+                    self.chatter_at += count / self.event_rate
+                    for _ in range(min(count, 1000)):
+                        self.add_event("Port up", "1.%d.eth1" % self.resource)
+            while self.scheduled_events and self.scheduled_events[0][0] <= now:
+                _due, message, entity = self.scheduled_events.pop(0)
+                self.add_event(message, entity)
+
+    # ----- ----- GET ----- -----
+    @staticmethod
+    def select_fields(record=None, fields=None):
+        if not fields:
+            return {key: value for key, value in record.items() if key not in ("endp a", "endp b", "max rate", "port")}
+        return {field: record[field] for field in fields if field in record}
+
+    def get(self, path=None, query=None):
+        """
+        :return: (status, json object)
+        """
+        hunks = [urllib.parse.unquote_plus(hunk) for hunk in path.split('/') if hunk]
+        fields = None
+        if query.get("fields"):
+            fields = [urllib.parse.unquote_plus(field) for field in ",".join(query["fields"]).split(',') if field]
+        now = time.time()
+        with self.lock:
+            if not hunks:
+                return 200, {"VersionInfo": {"BuildVersion": "5.4.9",
+                                             "BuildDate": "standin",
+                                             "GitVersion": "standin"},
+                             "resources": [{"1.%d" % self.resource: {"_links": "/resource/1/%d" % self.resource}}]}
+            table = hunks[0]
+            if table == "misc" and hunks[1:2] == ["license"]:
+                return 200, {"license": LICENSE}
+            if table in ("port", "ports"):
+                return self.get_ports(hunks[1:], fields, now)
+            if table == "endp":
+                return self.get_endps(hunks[1:], fields, now)
+            if table == "cx":
+                return self.get_cxs(hunks[1:], fields, now)
+            if table == "generic":
+                return self.get_generic(hunks[1:], fields, now)
+            if table == "layer4":
+                return self.get_layer4(hunks[1:], fields, now)
+            if table == "events":
+                self.log_due_events(now)
+                return self.get_events(hunks[1:])
+            if table == "resource":
+                return 200, {"resource": {"_links": "/resource/1/%d" % self.resource,
+                                          "hostname": "standin",
+                                          "eid": "1.%d" % self.resource,
+                                          "phantom": False}}
+            if table == "alerts":
+                return 200, {"alerts": []}
+        return 404, {"errors": ["no such path: /%s" % "/".join(hunks)]}
+
+    def get_ports(self, hunks=None, fields=None, now=None):
+        visible = self.visible_ports(now)
+        names = None
+        if len(hunks) >= 3 and hunks[2] not in ("all", "list"):
+            names = hunks[2].split(',')
+            selected = [self.find_port(hunks[1], name) for name in names]
+            selected = [eid for eid in selected if eid is not None and eid in visible]
+        elif len(hunks) >= 2 and hunks[1] not in ("all", "list"):
+            selected = [eid for eid in visible if eid.split('.')[1] == hunks[1]]
+        else:
+            selected = visible
+        if names is not None and len(names) == 1:
+            if not selected:
+                return 404, {"errors": ["port not found: %s" % names[0]]}
+            return 200, {"interface": self.select_fields(self.port_view(selected[0], now), fields)}
+        return 200, {"interfaces": [{eid: self.select_fields(self.port_view(eid, now), fields)} for eid in selected]}
+
+    def get_endps(self, hunks=None, fields=None, now=None):
+        names = None
+        if hunks and hunks[0] not in ("all", "list"):
+            names = hunks[0].split(',')
+            selected = [name for name in names if name in self.endps]
+        else:
+            selected = list(self.endps.keys())
+        if names is not None and len(names) == 1:
+            if not selected:
+                return 404, {"errors": ["endpoint not found: %s" % names[0]]}
+            return 200, {"endpoint": self.select_fields(self.endp_view(selected[0], now), fields)}
+        return 200, {"endpoint": [{name: self.select_fields(self.endp_view(name, now), fields)} for name in selected]}
+
+    def get_generic(self, hunks=None, fields=None, now=None):
+        names = None
+        if hunks and hunks[0] not in ("all", "list"):
+            names = hunks[0].split(',')
+            selected = [name for name in names if name in self.gen_endps]
+        else:
+            selected = list(self.gen_endps.keys())
+        if names is not None and len(names) == 1:
+            if not selected:
+                return 404, {"errors": ["endpoint not found: %s" % names[0]]}
+            return 200, {"endpoint": self.select_fields(self.gen_view(selected[0], now), fields)}
+        return 200, {"endpoints": [{name: self.select_fields(self.gen_view(name, now), fields)} for name in selected]}
+
+    def get_layer4(self, hunks=None, fields=None, now=None):
+        names = None
+        if hunks and hunks[0] not in ("all", "list"):
+            names = hunks[0].split(',')
+            selected = [name for name in names if name in self.l4_endps]
+        else:
+            selected = list(self.l4_endps.keys())
+        if len(selected) == 1:
+            # like the GUI, one endpoint is not wrapped in a list
+            return 200, {"endpoint": self.select_fields(self.l4_view(selected[0], now), fields)}
+        return 200, {"endpoint": [{name: self.select_fields(self.l4_view(name, now), fields)} for name in selected]}
+
+    def get_cxs(self, hunks=None, fields=None, now=None):
+        if hunks and hunks[0] not in ("all", "list"):
+            selected = [name for name in hunks[0].split(',') if name in self.cxs]
+        else:
+            selected = list(self.cxs.keys())
+        response = {name: self.select_fields(self.cx_view(name, now), fields) for name in selected}
+        return 200, response
+
+    def get_events(self, hunks=None):
+        if len(hunks) >= 2 and hunks[0] == "last":
+            count = max(int(hunks[1]), 1)
+            events = self.events[-count:]
+            if count == 1:
+                if not events:
+                    return 200, {"event": {"id": 0}}
+                return 200, {"event": events[-1]}
+        elif len(hunks) >= 2 and hunks[0] == "since":
+            since = int(hunks[1])
+            events = [event for event in self.events if event["id"] > since]
+        else:
+            events = self.events
+        return 200, {"events": [{str(event["id"]): event} for event in events]}
+
+    # ----- ----- POST ----- -----
+    def command(self, name=None, data=None):
+        """
+        Apply a cli-json command.
+        :return: (status, json object)
+        """
+        now = time.time()
+        with self.lock:
+            resource = data.get("resource", self.resource)
+            if name == "add_sta":
+                eid = self.add_port(data.get("sta_name"),
+                                    port_type="WIFI-STA",
+                                    parent=data.get("radio"),
+                                    resource=resource)
+                self.port_ready_at[eid] = now + self.appear_delay_sec
+                self.add_event("Station created", eid)
+            elif name == "set_port":
+                eid = self.find_port(resource, data.get("port"))
+                if eid is None:
+                    return 200, {"errors": ["set_port: no such port %s" % data.get("port")]}
+                interest = flag_value(data.get("interest"))
+                current = flag_value(data.get("current_flags"))
+                port = self.ports[eid]
+                if interest & INTEREST_IFDOWN:
+                    port["down"] = bool(current & IF_DOWN)
+                    if port["down"]:
+                        port["ip"] = "0.0.0.0"
+                        self.ip_at.pop(eid, None)
+                    elif port["ip"] in ("0.0.0.0", ""):
+                        self.ip_at[eid] = now + self.ip_delay_sec
+                    self.add_event("Port %s" % ("down" if port["down"] else "up"), eid)
+            elif name == "rm_vlan":
+                eid = self.find_port(resource, data.get("port"))
+                if eid is not None:
+                    self.port_ids.pop(self.ports[eid]["port"], None)
+                    del self.ports[eid]
+                    self.port_ready_at.pop(eid, None)
+                    self.ip_at.pop(eid, None)
+                    self.add_event("Port deleted", eid)
+            elif name == "add_endp":
+                port_eid = self.find_port(data.get("resource", self.resource), data.get("port"))
+                rate = flag_value(data.get("max_rate")) or flag_value(data.get("min_rate")) or 1000000
+                self.add_endp(data.get("alias"), port_eid, endp_type=data.get("type", "lf_udp"), rate=rate)
+            elif name == "add_gen_endp":
+                port_eid = self.find_port(data.get("resource", self.resource), data.get("port"))
+                self.add_gen_endp(data.get("alias"), port_eid)
+            elif name == "add_l4_endp":
+                port_eid = self.find_port(data.get("resource", self.resource), data.get("port"))
+                self.add_l4_endp(data.get("alias"), port_eid, url_rate=flag_value(data.get("url_rate")) or 600)
+            elif name == "set_gen_cmd":
+                if data.get("name") in self.gen_endps:
+                    self.gen_endps[data.get("name")]["command"] = data.get("command") or ""
+            elif name == "set_mc_endp":
+                endp = self.endps.get(data.get("name"))
+                if endp is not None:
+                    endp["mcast group"] = "%s:%s" % (data.get("mcast_group"), data.get("mcast_dest_port"))
+                    endp["rcv mcast"] = str(data.get("rcv_mcast", "")).lower() in ("yes", "1", "true")
+            elif name in ("start_endp", "stop_endp"):
+                self.set_endp_run(data.get("endp_name"), name == "start_endp", now)
+            elif name == "add_cx":
+                self.add_cx(data.get("alias"), data.get("tx_endp"), data.get("rx_endp"))
+            elif name == "set_cx_state":
+                self.set_cx_state(data.get("cx_name"), data.get("cx_state"))
+            elif name == "rm_cx":
+                self.rm_cx(data.get("cx_name"))
+            elif name == "rm_endp":
+                self.rm_endp(data.get("endp_name"))
+            elif name == "add_event":
+                self.add_event(data.get("details"), data.get("name"))
+            elif name == "load":
+                self.add_event("LOAD-DB:  Loading database %s" % data.get("name"))
+                self.schedule_event(self.load_delay_sec, "LOAD-DB:  Load attempt has been completed.")
+            # everything else (show_ports, set_endp_flag, set_*_report_timer, nc_show_*) is accepted
+        return 200, {"LAST": {"response": "OK", "cli": name}}
+
+    def cv_command(self, command=None):
+        """
+        Apply a Chamber View command sent to /gui-json/cmd.
+        :return: (status, json object)
+        """
+        now = time.time()
+        words = command.split()
+        response = "OK"
+        with self.lock:
+            if words[:2] == ["cv", "build"]:
+                self.built_at = now + self.build_delay_sec
+                # the build creates ports, which the GUI logs while it works
+                steps = 4
+                for step in range(steps):
+                    self.schedule_event(self.build_delay_sec * step / steps,
+                                        "Chamber View build: creating ports %d/%d" % (step + 1, steps))
+            elif words[:2] == ["cv", "is_built"]:
+                response = "YES" if now >= self.built_at else "NO"
+            elif words[:2] == ["cv", "get_and_close_dialog"]:
+                response = "NO-DIALOG"
+        return 200, {"LAST": {"response": response, "cli": command}}
+
+
+class lf_gui_recording:
+    def __init__(self, path=None):
+        """
+        :param path: json lines file written with LF_HTTP_RECORD
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        # (method, url) -> list of recorded exchanges, and the next one to serve
+        self.exchanges = {}
+        self.position = {}
+        # (method, path without query) -> exchanges, used when the query differs
+        self.by_path = {}
+        with open(path, "r") as recording:
+            for line in recording:
+                line = line.strip()
+                if not line:
+                    continue
+                exchange = json.loads(line)
+                key = (exchange["method"], exchange["url"])
+                self.exchanges.setdefault(key, []).append(exchange)
+                self.by_path.setdefault((exchange["method"], exchange["url"].split('?')[0]), []).append(exchange)
+        logger.info("loaded {count} recorded urls from {path}".format(count=len(self.exchanges), path=path))
+
+    def lookup(self, method=None, url=None):
+        """
+        :return: the next recorded exchange for the request, repeating the last one, or None
+        """
+        key = (method, url)
+        exchanges = self.exchanges.get(key)
+        if exchanges is None:
+            exchanges = self.by_path.get((method, url.split('?')[0]))
+            key = (method, url.split('?')[0], None)
+            if exchanges is None:
+                return None
+        with self.lock:
+            position = self.position.get(key, 0)
+            self.position[key] = position + 1
+        return exchanges[min(position, len(exchanges) - 1)]
+
+
+class lf_replay_handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server_version = "LANforge-standin"
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def send_json(self, status=200, body=None, headers=None):
+        if isinstance(body, str):
+            payload = body.encode('utf-8')
+        else:
+            body = dict(body)
+            body.setdefault("handler", HANDLER)
+            body.setdefault("uri", self.path.lstrip('/').split('?')[0])
+            payload = json.dumps(body).encode('utf-8')
+        self.server.delay()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            if name.lower() not in ("content-type", "content-length"):
+                self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # a streaming client stopped reading before the end of the listing
+            self.close_connection = True
+
+    def replay(self, method=None):
+        if self.server.recording is None:
+            return False
+        exchange = self.server.recording.lookup(method, self.path)
+        if exchange is None:
+            return False
+        self.send_json(exchange["status"],
+                       exchange["response"] if exchange["response"] is not None else "{}",
+                       headers=exchange.get("headers"))
+        return True
+
+    def do_GET(self):
+        self.server.count_request()
+        if self.replay("GET"):
+            return
+        if self.server.model is None:
+            self.send_json(404, {"errors": ["not recorded: %s" % self.path]})
+            return
+        parsed = urllib.parse.urlsplit(self.path)
+        status, body = self.server.model.get(parsed.path, urllib.parse.parse_qs(parsed.query))
+        self.send_json(status, body)
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        raw = self.rfile.read(length) if length else b''
+        if not raw:
+            return {}
+        if "json" in (self.headers.get("Content-Type") or ""):
+            try:
+                return json.loads(raw)
+            except ValueError:
+                return {}
+        return {key: values[-1] for key, values in urllib.parse.parse_qs(raw.decode('utf-8')).items()}
+
+    def do_POST(self):
+        self.server.count_request()
+        data = self.read_body()
+        if self.replay("POST"):
+            return
+        path = urllib.parse.urlsplit(self.path).path
+        hunks = [hunk for hunk in path.split('/') if hunk]
+        if hunks == ["newsession"]:
+            self.send_json(200, {"session_id": self.server.new_session()},
+                           headers={"X-LFJson-Session": self.server.session_id})
+            return
+        if hunks == ["endsession"]:
+            self.send_json(200, {"LAST": {"response": "OK"}})
+            return
+        if len(hunks) == 2 and hunks[0] in ("cli-json", "cli-form") and self.server.model is not None:
+            status, body = self.server.model.command(hunks[1], data)
+            self.send_json(status, body)
+            return
+        if hunks == ["gui-json", "cmd"] and self.server.model is not None:
+            status, body = self.server.model.cv_command(str(data.get("cmd", "")))
+            self.send_json(status, body)
+            return
+        self.send_json(404, {"errors": ["not recorded: %s" % self.path]})
+
+    do_PUT = do_POST
+
+    def do_DELETE(self):
+        self.server.count_request()
+        if self.replay("DELETE"):
+            return
+        self.send_json(200, {"LAST": {"response": "OK"}})
+
+
+class lf_replay_gui(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self,
+                 host="127.0.0.1",
+                 port=8080,
+                 model=None,
+                 recording=None,
+                 latency_ms=0.0,
+                 jitter_ms=0.0):
+        """
+        :param model: lf_gui_model answering requests missing from the recording
+        :param recording: lf_gui_recording, or None
+        :param latency_ms: added to every response
+        :param jitter_ms: up to this much more, uniformly random
+        """
+        super().__init__((host, port), lf_replay_handler)
+        self.model = model
+        self.recording = recording
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.requests = 0
+        self.session_id = None
+        self.counter_lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        return "http://%s:%d" % self.server_address[:2]
+
+    def delay(self):
+        delay_ms = self.latency_ms
+        if self.jitter_ms:
+            delay_ms += random.uniform(0, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+    def count_request(self):
+        with self.counter_lock:
+            self.requests += 1
+
+    def new_session(self):
+        self.session_id = "standin-%d" % int(time.time() * 1000)
+        return self.session_id
+
+    def start(self):
+        """
+        Serve from a background thread.
+        """
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='lf_replay_gui.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description='''
+Stand-in for the LANforge GUI JSON API, serving a recording and/or a synthetic model.
+
+Record a run with:
+    LF_HTTP_RECORD=/tmp/run.jsonl ./test_l3.py --mgr <lanforge> ...
+''')
+    parser.add_argument('--host', help='address to listen on', default='127.0.0.1')
+    parser.add_argument('--port', help='port to listen on', type=int, default=8080)
+    parser.add_argument('--recording', help='json lines recording written with LF_HTTP_RECORD', default=None)
+    parser.add_argument('--no_model', help='only answer from the recording', action='store_true')
+    parser.add_argument('--num_ports', help='stations in the synthetic model', type=int, default=0)
+    parser.add_argument('--num_endps', help='running layer-3 endpoints in the synthetic model', type=int, default=0)
+    parser.add_argument('--num_radios', help='radios in the synthetic model', type=int, default=2)
+    parser.add_argument('--ip_delay_sec', help='seconds after admin-up until a station has an IP', type=float, default=0.0)
+    parser.add_argument('--appear_delay_sec', help='seconds after add_sta until a station is listed', type=float, default=0.0)
+    parser.add_argument('--event_rate', help='unrelated events logged per second', type=float, default=0.0)
+    parser.add_argument('--load_delay_sec', help='seconds after a database load until it completes', type=float, default=1.0)
+    parser.add_argument('--build_delay_sec', help="seconds after 'cv build' until Chamber View is built", type=float, default=1.0)
+    parser.add_argument('--latency_ms', help='delay added to each response', type=float, default=0.0)
+    parser.add_argument('--jitter_ms', help='random extra delay up to this much', type=float, default=0.0)
+    parser.add_argument('--log_level', help='debug | info | warning | error', default='info')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO),
+                        format='%(asctime)s %(name)s %(levelname)s: %(message)s')
+    model = None
+    if not args.no_model:
+        model = lf_gui_model(num_ports=args.num_ports,
+                             num_endps=args.num_endps,
+                             num_radios=args.num_radios,
+                             ip_delay_sec=args.ip_delay_sec,
+                             appear_delay_sec=args.appear_delay_sec,
+                             event_rate=args.event_rate,
+                             load_delay_sec=args.load_delay_sec,
+                             build_delay_sec=args.build_delay_sec)
+    recording = lf_gui_recording(args.recording) if args.recording else None
+    server = lf_replay_gui(host=args.host,
+                           port=args.port,
+                           model=model,
+                           recording=recording,
+                           latency_ms=args.latency_ms,
+                           jitter_ms=args.jitter_ms)
+    logger.info("LANforge GUI stand-in listening on {url}".format(url=server.url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info("served {count} requests".format(count=server.requests))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Tests for the event cursor of py-json/event_waiter.py
+
+    python3 -m pytest tests/test_event_waiter.py
+"""
+import importlib
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+event_waiter = importlib.import_module("py-json.event_waiter")
+
+
+class FakeRealm:
+    """
+    An event log of (id, description); json_get of /events/last/1 fails while reachable is False.
+    """
+
+    def __init__(self, events=None):
+        self.events = list(events or [])
+        self.reachable = True
+        self.since = []
+
+    @staticmethod
+    def record(event_id=None, description=None):
+        return {event_id: {"id": str(event_id), event_waiter.DESCRIPTION: description}}
+
+    def json_get(self, url=None):
+        if not self.reachable:
+            return None
+        if not self.events:
+            return {"handler": "candela.lanforge.HttpEvents$JsonResponse"}
+        event_id, description = self.events[-1]
+        return {"event": self.record(event_id, description)[event_id]}
+
+    def find_new_events(self, previous_event_id=None):
+        self.since.append(previous_event_id)
+        return {"events": [self.record(event_id, description) for event_id, description in self.events
+                           if event_id >= int(previous_event_id)]}
+
+
+class TestEventWaiter(unittest.TestCase):
+
+    def test_cursor_starts_at_newest(self):
+        realm = FakeRealm([(1, "LOAD COMPLETED at 1"), (2, "other")])
+        waiter = event_waiter.EventWaiter(local_realm=realm)
+        self.assertEqual(waiter.cursor, 2)
+        self.assertEqual(waiter.poll(), [])
+        realm.events.append((3, "LOAD COMPLETED at 3"))
+        self.assertEqual([record["id"] for record in waiter.poll()], ["3"])
+        self.assertEqual(waiter.cursor, 3)
+
+    def test_empty_log(self):
+        realm = FakeRealm()
+        waiter = event_waiter.EventWaiter(local_realm=realm)
+        self.assertEqual(waiter.cursor, 0)
+        realm.events.append((1, "first"))
+        self.assertEqual(len(waiter.poll()), 1)
+
+    def test_failed_mark_does_not_match_old_events(self):
+        realm = FakeRealm([(1, "LOAD COMPLETED at 1"), (2, "other")])
+        realm.reachable = False
+        waiter = event_waiter.EventWaiter(local_realm=realm)
+        self.assertIsNone(waiter.cursor)
+        # still unreadable: nothing is asked for since None or 0
+        self.assertEqual(waiter.poll(), [])
+        self.assertIsNone(waiter.cursor)
+        self.assertEqual(realm.since, [])
+        realm.reachable = True
+        # the first poll that can read the log marks it, old events stay unmatched
+        self.assertEqual(waiter.poll(), [])
+        self.assertEqual(waiter.cursor, 2)
+        self.assertEqual(realm.since, [2])
+        realm.events.append((3, "LOAD COMPLETED at 3"))
+        event = waiter.wait_for(event_waiter.description_startswith("LOAD COMPLETED"), timeout_sec=1)
+        self.assertEqual(event["id"], "3")
+
+    def test_start_id(self):
+        realm = FakeRealm([(1, "LOAD COMPLETED at 1"), (2, "other")])
+        waiter = event_waiter.EventWaiter(local_realm=realm, start_id=0)
+        self.assertEqual([record["id"] for record in waiter.poll()], ["1", "2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Tests for the 'last results' decoding of py-json/generic_stats.py
+
+    python3 -m pytest tests/test_generic_stats.py
+"""
+import importlib
+import math
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+generic_stats = importlib.import_module("py-json.generic_stats")
+parse_last_results = generic_stats.parse_last_results
+
+PING_REPLY = "64 bytes from 192.168.1.1: icmp_seq=7 ttl=64 time=1.52 ms"
+PING_SUMMARY = """10 packets transmitted, 10 received, 0% packet loss, time 9013ms
+rtt min/avg/max/mdev = 1.101/1.523/2.210/0.301 ms"""
+PING_ALL_LOST = "10 packets transmitted, 0 received, 100% packet loss, time 9205ms"
+PING_UNREACHABLE = "From 192.168.1.10 icmp_seq=1 Destination Host Unreachable"
+
+
+class TestParsePing(unittest.TestCase):
+
+    def test_reply(self):
+        ok, values = parse_last_results(generic_stats.KIND_PING, PING_REPLY)
+        self.assertEqual(ok, 1)
+        self.assertEqual(values, {"rtt_ms": 1.52})
+
+    def test_summary(self):
+        ok, values = parse_last_results(generic_stats.KIND_PING, PING_SUMMARY)
+        self.assertEqual(ok, 1)
+        self.assertEqual(values["loss_pct"], 0.0)
+        self.assertEqual((values["rtt_min_ms"], values["rtt_avg_ms"], values["rtt_max_ms"]),
+                         (1.101, 1.523, 2.210))
+
+    def test_all_packets_lost(self):
+        ok, values = parse_last_results(generic_stats.KIND_PING, PING_ALL_LOST)
+        self.assertEqual(ok, 0)
+        self.assertEqual(values, {"loss_pct": 100.0})
+
+    def test_unreachable(self):
+        ok, values = parse_last_results(generic_stats.KIND_PING, PING_UNREACHABLE)
+        self.assertEqual(ok, 0)
+
+    def test_nothing_yet(self):
+        self.assertEqual(parse_last_results(generic_stats.KIND_PING, ""), (-1, {}))
+        self.assertEqual(parse_last_results(generic_stats.KIND_PING, "PING 192.168.1.1 56(84) bytes")[0], -1)
+
+
+class TestParseOther(unittest.TestCase):
+
+    def test_iperf3(self):
+        ok, values = parse_last_results(generic_stats.KIND_IPERF3,
+                                        "[  5]   0.00-1.00   sec  11.2 MBytes  94.1 Mbits/sec")
+        self.assertEqual(ok, 1)
+        self.assertTrue(math.isclose(values["bps"], 94.1e6))
+        self.assertEqual(parse_last_results(generic_stats.KIND_IPERF3, "iperf3: error - unable to connect")[0], 0)
+
+    def test_speedtest(self):
+        ok, values = parse_last_results(generic_stats.KIND_SPEEDTEST,
+                                        '{"download": 93000000.5, "upload": 11000000, "ping": 12.5}')
+        self.assertEqual(ok, 1)
+        self.assertEqual(values["ping_ms"], 12.5)
+        self.assertEqual(parse_last_results(generic_stats.KIND_SPEEDTEST, "{}")[0], 0)
+        self.assertEqual(parse_last_results(generic_stats.KIND_SPEEDTEST, "Retrieving")[0], -1)
+
+    def test_lfcurl(self):
+        self.assertEqual(parse_last_results(generic_stats.KIND_LFCURL, "Finished 10/ 10"),
+                         (1, {"urls_done": 10.0, "urls_total": 10.0}))
+        self.assertEqual(parse_last_results(generic_stats.KIND_LFCURL, "Finished 4/ 10")[0], 0)
+
+    def test_kind_of(self):
+        self.assertEqual(generic_stats.kind_of("ping -i 1 192.168.1.1"), generic_stats.KIND_PING)
+        self.assertEqual(generic_stats.kind_of(None, PING_ALL_LOST), generic_stats.KIND_OTHER)
+        self.assertEqual(generic_stats.kind_of(None, PING_REPLY), generic_stats.KIND_PING)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Tests for the column cache of py-scripts/lf_json_api.py, with a stubbed requests session.
+
+    python3 -m pytest tests/test_lf_json_api.py
+"""
+import importlib
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+lf_json_api = importlib.import_module("py-scripts.lf_json_api")
+
+PORTS = {
+    "1.1.3": {"eid": "1.1.3", "alias": "wlan3", "signal": -41, "channel": 36, "ip": "192.168.1.103"},
+    "1.1.4": {"eid": "1.1.4", "alias": "wlan4", "signal": -52, "channel": 149, "ip": "192.168.1.104"},
+}
+
+
+class StubResponse:
+    def __init__(self, json_data=None):
+        self.status_code = 200
+        self.json_data = json_data
+        self.text = str(json_data)
+
+    def json(self):
+        return self.json_data
+
+
+class StubSession:
+    """
+    Answers /port/<eid list>?fields=... like the GUI: one record as 'interface', more as 'interfaces'.
+    """
+
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url=None):
+        self.urls.append(url)
+        path, _, query = url.partition('?')
+        target = path.rsplit('/', 1)[-1]
+        fields = query[len('fields='):].split(',') if query else None
+        records = []
+        for eid, record in PORTS.items():
+            if target != 'all' and eid not in target.split(',') and "1.1." + record["alias"] not in target.split(','):
+                continue
+            records.append({"1.1." + record["alias"]: {k: v for k, v in record.items() if fields is None or k in fields}})
+        if len(records) == 1:
+            return StubResponse({"handler": "port", "interface": list(records[0].values())[0]})
+        return StubResponse({"handler": "port", "interfaces": records})
+
+
+class TestColumnCache(unittest.TestCase):
+
+    def cache(self):
+        cache = lf_json_api.lf_json_cache(lf_user=None, lf_passwd=None, ttl_sec=60)
+        cache.session = StubSession()
+        return cache
+
+    def test_alias_lookup_is_served_from_the_cache(self):
+        cache = self.cache()
+        first = cache.get_fields('port', ['1.1.wlan3'], ['signal', 'channel'])
+        self.assertEqual(first, {'1.1.wlan3': {'signal': -41, 'channel': 36}})
+        second = cache.get_fields('port', ['1.1.wlan3'], ['signal', 'channel'])
+        self.assertEqual(second, first)
+        self.assertEqual(len(cache.session.urls), 1)
+        # the same record by its numeric EID and by its bare alias
+        self.assertEqual(cache.get_fields('port', ['1.1.3'], ['signal']), {'1.1.3': {'signal': -41}})
+        self.assertEqual(cache.get_fields('port', ['wlan3'], ['channel']), {'wlan3': {'channel': 36}})
+        self.assertEqual(len(cache.session.urls), 1)
+
+    def test_only_missing_columns_are_fetched(self):
+        cache = self.cache()
+        cache.get_fields('port', ['1.1.wlan3'], ['signal'])
+        self.assertEqual(cache.get_fields('port', ['1.1.wlan3'], ['signal', 'ip']),
+                         {'1.1.wlan3': {'signal': -41, 'ip': '192.168.1.103'}})
+        self.assertEqual(len(cache.session.urls), 2)
+        self.assertIn('fields=ip,eid,alias', cache.session.urls[1])
+
+    def test_whole_table(self):
+        cache = self.cache()
+        self.assertEqual(cache.get_fields('port', None, ['signal']),
+                         {'1.1.3': {'signal': -41}, '1.1.4': {'signal': -52}})
+        self.assertEqual(cache.get_fields('port', ['1.1.wlan4'], ['signal']), {'1.1.wlan4': {'signal': -52}})
+        self.assertEqual(len(cache.session.urls), 1)
+
+    def test_invalidate(self):
+        cache = self.cache()
+        cache.get_fields('port', ['1.1.wlan3'], ['signal'])
+        cache.invalidate('port')
+        cache.get_fields('port', ['1.1.wlan3'], ['signal'])
+        self.assertEqual(len(cache.session.urls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Tests for the endpoint/port join of py-json/lfdata.py against the nested loop merge
+monitor_interval used before, on synthetic /endp and /port responses.
+
+    python3 -m pytest tests/test_lfdata.py
+"""
+import importlib
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+lfdata = importlib.import_module("py-json.lfdata")
+LFDataCollection = lfdata.LFDataCollection
+
+LAYER3_FIELDS = ["name", "tx bytes", "rx bytes", "rx rate"]
+PORT_FIELDS = ["alias", "signal", "channel"]
+COLUMNS = LAYER3_FIELDS + ["port mgr - " + field for field in PORT_FIELDS]
+
+
+def endp_response(stations=None):
+    """
+    Two endpoints, -A and -B, for the CX of each station.
+    """
+    endpoints = []
+    for n in range(2 * len(stations)):
+        name = "VT%s-%s" % (stations[n // 2], "AB"[n % 2])
+        endpoints.append({name: {"name": name, "tx bytes": 1000 + n, "rx bytes": 900 + n, "rx rate": 55000 + n}})
+    return {"endpoint": endpoints}
+
+
+def port_record(n=0, station=None):
+    return {"alias": station, "signal": -40 - n % 30, "channel": 36}
+
+
+def port_response(stations=None):
+    return {"interfaces": [{"1.1.%s" % station: port_record(n, station)} for n, station in enumerate(stations)]}
+
+
+def legacy(layer_3_response=None, port_mgr_response=None, sta_list=None, base=()):
+    """
+    The merge of the previous monitor_interval: for each endpoint, each station and each
+    port, by substring; made to go on past the first endpoint.
+    """
+    rows = []
+    for endpoint in layer_3_response['endpoint']:
+        endp_name = list(endpoint.keys())[0]
+        for sta_name in sta_list:
+            if sta_name in endp_name:
+                merge = {}
+                for interface in port_mgr_response['interfaces']:
+                    if sta_name in list(interface.keys())[0]:
+                        merge = endpoint[endp_name].copy()
+                        port_mgr_values_dict = list(interface.values())[0]
+                        renamed_port_cols = {}
+                        for key in port_mgr_values_dict.keys():
+                            renamed_port_cols['port mgr - ' + key] = port_mgr_values_dict[key]
+                        merge.update(renamed_port_cols)
+                rows.append(list(base) + [merge[name] for name in COLUMNS])
+    return rows
+
+
+class FakeRealm:
+    """
+    Answers /endp and /port like the GUI: one port record as 'interface', more as 'interfaces'.
+    """
+
+    def __init__(self, stations=None):
+        self.debug = False
+        self.stations = stations
+        self.urls = []
+
+    def json_get(self, url=None, debug_=False):
+        self.urls.append(url)
+        if url.startswith("/endp/"):
+            return endp_response(self.stations)
+        if len(self.stations) == 1:
+            return {"interface": port_record(0, self.stations[0])}
+        return port_response(self.stations)
+
+
+class TestJoinRows(unittest.TestCase):
+
+    def test_1k_endpoints_match_the_legacy_merge(self):
+        stations = ["sta%04d" % n for n in range(500)]
+        layer_3_response, port_mgr_response = endp_response(stations), port_response(stations)
+        ports = LFDataCollection.port_map(port_mgr_response, stations)
+        rows = LFDataCollection.join_rows(layer_3_response, ports, COLUMNS, base=("t", 1, 0))
+        self.assertEqual(len(rows), 1000)
+        self.assertEqual(rows, legacy(layer_3_response, port_mgr_response, stations, base=("t", 1, 0)))
+        self.assertEqual(rows[1][3:], ["VTsta0000-B", 1001, 901, 55001, "sta0000", -40, 36])
+
+    def test_single_interface(self):
+        ports = LFDataCollection.port_map({"interface": port_record(3, "sta0003")}, ["sta0003"])
+        self.assertEqual(ports, {"sta0003": {"port mgr - alias": "sta0003", "port mgr - signal": -43,
+                                             "port mgr - channel": 36}})
+        rows = LFDataCollection.join_rows(endp_response(["sta0003"]), ports, COLUMNS)
+        self.assertEqual(rows, [["VTsta0003-A", 1000, 900, 55000, "sta0003", -43, 36],
+                                ["VTsta0003-B", 1001, 901, 55001, "sta0003", -43, 36]])
+
+    def test_endpoint_without_port(self):
+        rows = LFDataCollection.join_rows(endp_response(["sta0000"]), {}, COLUMNS)
+        self.assertEqual(rows[0], ["VTsta0000-A", 1000, 900, 55000, None, None, None])
+
+
+class TestSample(unittest.TestCase):
+
+    def test_sample(self):
+        stations = ["sta%04d" % n for n in range(500)]
+        data = LFDataCollection(FakeRealm(stations), max_samples=2)
+        rows = data.sample(created_cx="all", layer3_fields=LAYER3_FIELDS, sta_list=stations,
+                           port_mgr_fields=PORT_FIELDS)
+        self.assertEqual([row[3:] for row in rows],
+                         [row[3:] for row in legacy(endp_response(stations), port_response(stations), stations,
+                                                    base=("t", 1, 0))])
+        self.assertEqual(data.parent_realm.urls[1], "/port/1/1/%s?fields=alias,signal,channel" % ",".join(stations))
+        data.sample(created_cx="all", layer3_fields=LAYER3_FIELDS, sta_list=stations, port_mgr_fields=PORT_FIELDS)
+        data.sample(created_cx="all", layer3_fields=LAYER3_FIELDS, sta_list=stations, port_mgr_fields=PORT_FIELDS)
+        self.assertEqual(len(data.latest(10)), 2)
+
+    def test_single_station(self):
+        data = LFDataCollection(FakeRealm(["sta0000"]))
+        rows = data.sample(created_cx="VTsta0000-A,VTsta0000-B", layer3_fields="name,tx bytes,rx bytes,rx rate",
+                           sta_list="sta0000", port_mgr_fields="alias,signal,channel")
+        self.assertEqual([row[3:] for row in rows], [["VTsta0000-A", 1000, 900, 55000, "sta0000", -40, 36],
+                                                     ["VTsta0000-B", 1001, 901, 55001, "sta0000", -40, 36]])
+
+    def test_without_port_fields(self):
+        realm = FakeRealm(["sta0000", "sta0001"])
+        data = LFDataCollection(realm)
+        rows = data.sample(created_cx="all", layer3_fields=LAYER3_FIELDS, sta_list=["sta0000", "sta0001"],
+                           port_mgr_fields=None)
+        self.assertEqual(len(realm.urls), 1)
+        self.assertEqual([row[3:] for row in rows], [["VTsta0000-A", 1000, 900, 55000],
+                                                     ["VTsta0000-B", 1001, 901, 55001],
+                                                     ["VTsta0001-A", 1002, 902, 55002],
+                                                     ["VTsta0001-B", 1003, 903, 55003]])
+        # monitor_interval with a header row still gets None for the port columns it names
+        header = ["timestamp", "ms", "sec"] + COLUMNS + ["a", "b", "c"]
+        rows = data.monitor_interval(header_row_=header, sta_list_=["sta0000", "sta0001"], created_cx_="all",
+                                     layer3_fields_=LAYER3_FIELDS)
+        self.assertEqual(rows[0][3:], ["VTsta0000-A", 1000, 900, 55000, None, None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
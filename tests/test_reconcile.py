@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Tests for the plan of py-json/reconcile.py against a recorded /port, /cx and /endp snapshot
+(fixtures/reconcile_snapshot.json).
+
+    python3 -m pytest tests/test_reconcile.py
+"""
+import importlib
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+reconcile = importlib.import_module("py-json.reconcile")
+
+SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "reconcile_snapshot.json")
+
+
+def station(name=None, radio="1.1.wiphy0", up=True):
+    return reconcile.StationSpec(eid="1.1." + name, radio=radio, ssid="lanforge", security="wpa2",
+                                 password="lanforge", up=up)
+
+
+def cx(name=None, endp_type="lf_udp"):
+    return reconcile.CXSpec(name="udp-" + name, endp_type=endp_type, side_a="1.1." + name, side_b="1.1.eth1",
+                            min_bps_a=56000, min_bps_b=56000)
+
+
+class TestReconcilePlan(unittest.TestCase):
+
+    def reconciler(self, stations=None, cxs=None, **kwargs):
+        reconciler = reconcile.Reconciler(stations=stations, cxs=cxs,
+                                          station_prefixes=["sta"], cx_prefixes=["udp-"], **kwargs)
+        reconciler.load_snapshot(SNAPSHOT)
+        return reconciler
+
+    def full_testbed(self, **kwargs):
+        names = ["sta0000", "sta0001", "sta0002", "sta0003", "sta0005"]
+        return self.reconciler(stations=[station(name) for name in names],
+                               cxs=[cx(name) for name in ("sta0000", "sta0001", "sta0002", "sta0003")],
+                               **kwargs)
+
+    def test_plan(self):
+        actions = self.full_testbed().plan()
+        self.assertEqual([(action.op, action.kind, action.name) for action in actions], [
+            # deletions first: unwanted and replaced CXs, then stations
+            ("delete", "cx", "udp-sta0004"),
+            ("delete", "cx", "udp-sta0002"),
+            ("delete", "station", "1.1.sta0002"),
+            ("delete", "station", "1.1.sta0004"),
+            ("recreate", "station", "1.1.sta0002"),
+            ("create", "station", "1.1.sta0003"),
+            ("modify", "station", "1.1.sta0001"),
+            ("admin_up", "station", "1.1.sta0005"),
+            ("modify", "cx", "udp-sta0001"),
+            ("recreate", "cx", "udp-sta0002"),
+            ("create", "cx", "udp-sta0003"),
+        ])
+        reasons = {(action.op, action.name): action.reason for action in actions}
+        self.assertEqual(reasons[("recreate", "1.1.sta0002")], "on wiphy1")
+        self.assertEqual(reasons[("modify", "1.1.sta0001")], "ssid guest")
+        self.assertEqual(reasons[("modify", "udp-sta0001")], "A min rate 9600")
+        self.assertEqual(reasons[("recreate", "udp-sta0002")], "type LF/TCP")
+
+    def test_commands(self):
+        actions = {(action.op, action.name): action for action in self.full_testbed().plan()}
+        self.assertEqual(actions[("delete", "1.1.sta0004")].commands,
+                         [("/cli-json/rm_vlan", {"shelf": 1, "resource": 1, "port": "sta0004"})])
+        self.assertEqual([url for url, _data in actions[("delete", "udp-sta0004")].commands],
+                         ["/cli-json/rm_cx", "/cli-json/rm_endp", "/cli-json/rm_endp"])
+        create = actions[("create", "1.1.sta0003")].commands
+        self.assertEqual([url for url, _data in create], ["/cli-json/add_sta", "/cli-json/set_port"])
+        self.assertEqual(create[0][1]["sta_name"], "sta0003")
+        self.assertEqual(create[0][1]["radio"], "wiphy0")
+        # a modified station only gets add_sta
+        self.assertEqual([url for url, _data in actions[("modify", "1.1.sta0001")].commands], ["/cli-json/add_sta"])
+        # modified rates resend add_endp for both sides
+        modify = actions[("modify", "udp-sta0001")].commands
+        self.assertEqual([(url, data["alias"], data["min_rate"]) for url, data in modify],
+                         [("/cli-json/add_endp", "udp-sta0001-A", 56000),
+                          ("/cli-json/add_endp", "udp-sta0001-B", 56000)])
+        self.assertEqual([url for url, _data in actions[("create", "udp-sta0003")].commands][-2:],
+                         ["/cli-json/add_cx", "/cli-json/set_cx_report_timer"])
+
+    def test_unowned_are_kept(self):
+        names = {action.name for action in self.full_testbed().plan()}
+        self.assertNotIn("1.1.wlan0", names)
+        self.assertNotIn("lab-wlan0", names)
+        self.assertNotIn("1.1.eth1", names)
+
+    def test_no_delete(self):
+        actions = self.full_testbed(delete_extra=False).plan()
+        self.assertNotIn("udp-sta0004", [action.name for action in actions])
+        self.assertNotIn("1.1.sta0004", [action.name for action in actions])
+
+    def test_matching_state_sends_nothing(self):
+        reconciler = self.reconciler(stations=[station("sta0000")], cxs=[cx("sta0000")], delete_extra=False)
+        self.assertEqual(reconciler.plan(), [])
+        self.assertEqual(reconciler.summary([]), {"commands": 0})
+
+    def test_refresh(self):
+        reconciler = self.reconciler(stations=[station("sta0000")], cxs=[cx("sta0000")], delete_extra=False,
+                                     refresh=True)
+        self.assertEqual([(action.op, action.kind, action.reason) for action in reconciler.plan()],
+                         [("modify", "station", "refresh"), ("modify", "cx", "refresh")])
+
+    def test_without_endp_snapshot(self):
+        reconciler = self.full_testbed()
+        reconciler.endp_snapshot = None
+        self.assertNotIn(("modify", "udp-sta0001"), [(action.op, action.name) for action in reconciler.plan()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# flake8: noqa
+"""
+Tests for lanforge_client/retry_policy.py
+
+    python3 -m pytest tests/test_retry_policy.py
+"""
+import http.server
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+from lanforge_client import lanforge_api
+from lanforge_client import retry_policy
+
+URL = "http://localhost:8080/port/1/1/sta0000"
+
+
+def send(policy=None, statuses=None, max_attempts=10):
+    """
+    The request loop of BaseLFJsonRequest.json_get, with the statuses of the attempts
+    in place of the GUI.
+    :return: list of the statuses of the attempts that were sent
+    """
+    sent = []
+    statuses = list(statuses)
+    attempt = 1
+    while attempt <= max_attempts:
+        if not policy.before_request("GET", URL):
+            break
+        status = statuses.pop(0)
+        sent.append(status)
+        policy.record_result("GET", URL, status)
+        if status == 200:
+            break
+        delay_sec = policy.retry_delay("GET", URL, status=status, attempt=attempt)
+        if delay_sec is None:
+            break
+        policy.wait("GET", URL, delay_sec)
+        attempt += 1
+    return sent
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_is_open_does_not_take_the_trial(self):
+        breaker = retry_policy.CircuitBreaker(failure_threshold=2, reset_sec=0.05)
+        breaker.record_failure("k")
+        self.assertFalse(breaker.is_open("k"))
+        breaker.record_failure("k")
+        self.assertTrue(breaker.is_open("k"))
+        self.assertFalse(breaker.allow("k"))
+        time.sleep(0.06)
+        # half open: looking any number of times leaves the trial to allow()
+        self.assertFalse(breaker.is_open("k"))
+        self.assertFalse(breaker.is_open("k"))
+        self.assertTrue(breaker.allow("k"))
+        self.assertTrue(breaker.is_open("k"))
+        self.assertFalse(breaker.allow("k"))
+        breaker.record_success("k")
+        self.assertFalse(breaker.is_open("k"))
+        self.assertEqual(breaker.open_keys(), [])
+
+    def test_no_threshold_is_never_open(self):
+        breaker = retry_policy.CircuitBreaker(failure_threshold=None)
+        for _ in range(10):
+            breaker.record_failure("k")
+        self.assertFalse(breaker.is_open("k"))
+        self.assertTrue(breaker.allow("k"))
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def policy(self):
+        return retry_policy.RetryPolicy(base_sec=0.0, max_sec=0.0, jitter=0.0,
+                                        budget_ratio=None, breaker_failures=2, breaker_reset_sec=0.05)
+
+    def test_open_half_open_closed_through_a_retry(self):
+        policy = self.policy()
+        key = policy.endpoint_key("GET", URL)
+        # two server failures open the circuit and the retry gives up
+        self.assertEqual(send(policy, [503, 503, 200]), [503, 503])
+        self.assertEqual(policy.breaker.open_keys(), [key])
+        self.assertEqual(send(policy, [200]), [])
+
+        time.sleep(0.06)
+        # half open: a request fails, the retry is the trial and closes the circuit
+        self.assertIsNotNone(policy.retry_delay("GET", URL, status=503, attempt=1))
+        self.assertTrue(policy.before_request("GET", URL))
+        policy.record_result("GET", URL, 200)
+        self.assertEqual(policy.breaker.open_keys(), [])
+        self.assertEqual(policy.breaker.trial_pending, set())
+        self.assertEqual(send(policy, [200]), [200])
+
+    def test_failed_trial_reopens(self):
+        policy = self.policy()
+        key = policy.endpoint_key("GET", URL)
+        send(policy, [503, 503])
+        time.sleep(0.06)
+        self.assertEqual(send(policy, [503, 200]), [503])
+        self.assertEqual(policy.breaker.open_keys(), [key])
+        self.assertEqual(policy.breaker.trial_pending, set())
+        time.sleep(0.06)
+        self.assertEqual(send(policy, [200]), [200])
+        self.assertEqual(policy.breaker.open_keys(), [])
+
+    def test_post_is_not_retried_after_it_may_have_run(self):
+        policy = self.policy()
+        self.assertIsNone(policy.retry_delay("POST", URL, status=500, attempt=1))
+        self.assertIsNotNone(policy.retry_delay("POST", URL, status=503, attempt=1))
+
+
+class StatusHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers each POST with the next status of the server's statuses list.
+    """
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.server.sent.append(status)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSession:
+    proxies_installed = False
+    session_id = None
+    max_timeout_sec = 2
+
+    def __init__(self, lfclient_url=None, policy=None):
+        self.lfclient_url = lfclient_url
+        self.retry_policy = policy
+
+    def get_lfclient_url(self):
+        return self.lfclient_url
+
+    def is_exit_on_error(self):
+        return False
+
+    def get_timeout_sec(self):
+        return 1
+
+    def get_session_id(self):
+        return None
+
+
+class TestJsonPost(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.HTTPServer(("127.0.0.1", 0), StatusHandler)
+        self.server.statuses = []
+        self.server.sent = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, lfclient_url=None):
+        policy = retry_policy.RetryPolicy(base_sec=0.0, max_sec=0.0, jitter=0.0, budget_ratio=None,
+                                          max_attempts=3, breaker_failures=None)
+        if lfclient_url is None:
+            lfclient_url = "http://127.0.0.1:%d" % self.server.server_port
+        return lanforge_api.BaseLFJsonRequest(session_obj=FakeSession(lfclient_url, policy))
+
+    def test_too_many_requests_is_retried(self):
+        self.server.statuses = [429, 200]
+        response = self.request().json_post(url="/cli-json/add_sta", post_data={"shelf": 1}, die_on_error=True)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(self.server.sent, [429, 200])
+
+    def test_client_error_exits(self):
+        self.server.statuses = [400, 200]
+        with self.assertRaises(SystemExit):
+            self.request().json_post(url="/cli-json/add_sta", post_data={"shelf": 1})
+        self.assertEqual(self.server.sent, [400])
+
+    def test_server_error_is_not_retried(self):
+        self.server.statuses = [500, 200]
+        self.assertIsNone(self.request().json_post(url="/cli-json/add_sta", post_data={"shelf": 1}))
+        self.assertEqual(self.server.sent, [500])
+
+    def test_no_connection_is_retried_then_gives_up(self):
+        # nothing listens on the port of a closed server
+        closed = http.server.HTTPServer(("127.0.0.1", 0), StatusHandler)
+        closed_url = "http://127.0.0.1:%d" % closed.server_port
+        closed.server_close()
+        lf_request = self.request(closed_url)
+        self.assertIsNone(lf_request.json_post(url="/cli-json/add_sta", post_data={"shelf": 1}))
+        self.assertEqual(lf_request.get_retry_policy().counters()["retries"], 2)
+        with self.assertRaises(SystemExit):
+            lf_request.json_post(url="/cli-json/add_sta", post_data={"shelf": 1}, die_on_error=True)
+
+
+if __name__ == '__main__':
+    unittest.main()